@@ -316,6 +316,186 @@ EXCLUSION_PATTERNS = [
 # Combined list for backward compatibility
 TGE_KEYWORDS = HIGH_CONFIDENCE_TGE_KEYWORDS + MEDIUM_CONFIDENCE_TGE_KEYWORDS + LOW_CONFIDENCE_TGE_KEYWORDS
 
+# Scoring rules shared by every analyzer. src/rule_pack.py compiles them together
+# with COMPANIES and the keyword lists above into one versioned rule pack; a JSON
+# file named by SCORING_RULES_FILE can override individual sections at runtime.
+SCORING_RULES = {
+    # Weighted phrases (regex, score) for article analysis, counted once each
+    'high_value_phrases': [
+        (r'token\s+generation\s+event', 45),
+        (r'tge\s+(is\s+)?live', 40),
+        (r'airdrop\s+(is\s+)?live', 40),
+        (r'claim\s+(your\s+)?tokens?\s+(now|today)', 40),
+        (r'token\s+launch\s+date', 35),
+        (r'tokens?\s+(are\s+)?(now\s+)?available', 35),
+        (r'trading\s+(is\s+)?(now\s+)?live', 35),
+        (r'claim\s+portal\s+(is\s+)?(now\s+)?live', 40),
+        (r'genesis\s+event', 30),
+        (r'mainnet\s+launch', 30),
+    ],
+
+    # Context-aware exclusions (regex, penalty, label); halved with crypto context
+    'weighted_exclusions': [
+        (r'test\s*net(?!\s+to\s+mainnet)', 50, 'testnet'),  # Don't penalize "testnet to mainnet"
+        (r'game\s+token(?!omics)', 40, 'game_token'),  # Don't penalize "game tokenomics"
+        (r'nft\s+(collection|drop|mint)', 30, 'nft_collection'),
+        (r'price\s+prediction', 35, 'speculation'),
+        (r'technical\s+analysis', 35, 'speculation'),
+        (r'espresso\s+machine', 60, 'coffee_machine'),
+        (r'coffee\s+(shop|bean|brew)', 50, 'coffee_related'),
+        (r'in-game\s+(currency|item|token)', 45, 'gaming'),
+        (r'play-to-earn\s+game', 40, 'gaming'),
+        (r'fabric\s+(textile|cloth|material)', 50, 'physical_goods'),
+    ],
+
+    # Terms that mark an article as crypto-related (substring match)
+    'crypto_terms': [
+        'blockchain', 'crypto', 'defi', 'web3', 'protocol', 'mainnet',
+        'smart contract', 'dapp', 'layer 2', 'rollup'
+    ],
+
+    # Any of these counts as a date mention in an article
+    'date_mentions': [
+        r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}',
+        r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
+        r'\b(next|this)\s+(week|month)',
+        r'\bQ[1-4]\s*2024',
+        r'\b(today|tomorrow|soon)\b',
+    ],
+
+    # Dates that make an alert urgent
+    'urgency_dates': [
+        r'\b(today|tomorrow|tonight)\b',
+        r'\b(this|next)\s+(week|monday|tuesday|wednesday|thursday|friday)\b',
+        r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b',
+        r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}\b',
+    ],
+
+    # Specific dates extracted for temporal scoring
+    'date_extractions': [
+        # Full dates: Jan 15, 2024 or January 15, 2024
+        r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s*\d{4}\b',
+        # Short dates: 01/15/2024 or 01-15-2024
+        r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b',
+        # Relative dates with specific times
+        r'\b(tomorrow|today)\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm|utc|est|pst)?\b',
+        # Quarter mentions: Q1 2024
+        r'\bQ[1-4]\s+\d{4}\b',
+    ],
+
+    # Source reliability tiers, checked in order: [tier, score, domains]
+    'source_tiers': [
+        ('tier_1', 15, ['theblock.co', 'coindesk.com', 'decrypt.co', 'thedefiant.io',
+                        'bankless.com', 'dlnews.com']),
+        ('tier_2', 10, ['cointelegraph.com', 'cryptobriefing.com', 'blockonomi.com',
+                        'bitcoinethereumnews.com', 'u.today']),
+        ('tier_3', 5, ['ambcrypto.com', 'dailycoin.com', 'cryptopotato.com',
+                       'crypto.news', 'trustnodes.com']),
+    ],
+
+    # Temporal relevance indicators
+    'temporal_indicators': {
+        'immediate': [  # +20
+            'now', 'live', 'today', 'just launched', 'available now', 'starts today',
+            'is live', 'has launched', 'now live', 'live now', 'goes live today',
+            'starting now', 'currently live', 'active now', 'open now'
+        ],
+        'near_term': [  # +15
+            'tomorrow', 'this week', 'next week', 'within days', 'in the coming days',
+            'later this week', 'early next week', 'by end of week', 'within 48 hours',
+            'in 24 hours', 'in two days', 'in three days'
+        ],
+        'mid_term': [  # +10
+            'this month', 'next month', 'coming soon', 'Q1', 'Q2', 'Q3', 'Q4',
+            'january', 'february', 'march', 'april', 'may', 'june', 'july',
+            'august', 'september', 'october', 'november', 'december',
+            'end of month', 'mid-month', 'early next month', 'late this month'
+        ],
+        'vague': ['soon', 'upcoming', 'planned', 'to be announced', 'tba'],  # +5
+        'past_tense': [  # -10
+            'launched', 'went live', 'was announced', 'occurred', 'happened',
+            'completed', 'finished', 'concluded', 'ended', 'has ended',
+            'was live', 'had launched', 'already launched', 'previously launched'
+        ],
+    },
+
+    # False positive indicators (patterns that should NOT be in crypto TGE context)
+    'false_positives': {
+        'gaming': ['in-game', 'game token', 'gaming token', 'play-to-earn', 'p2e', 'loot drop', 'nft game'],
+        'coffee': ['espresso machine', 'coffee shop', 'barista', 'cafe', 'brewing', 'coffee bean'],
+        'physical_goods': ['fabric', 'clothing', 'merchandise', 'physical product', 'shipping'],
+        'speculation': ['price prediction', 'technical analysis', 'chart analysis', 'trading signal'],
+        'testing': ['test token', 'mock token', 'demo token', 'sandbox test'],
+        'non_crypto': ['volcano', 'mountain', 'geographic', 'espresso beans']
+    },
+
+    # False positives that need explicit checking (not just presence)
+    'conditional_false_positives': {
+        'testnet': r'\btestnet\b(?!\s+(to|→|->)\s+mainnet)',  # Only if NOT "testnet to mainnet"
+        'devnet': r'\bdevnet\b(?!\s+(to|→|->)\s+mainnet)',
+    },
+
+    # Crypto context indicators (must be present for ambiguous terms)
+    'crypto_context': [
+        'blockchain', 'crypto', 'cryptocurrency', 'protocol', 'defi', 'web3',
+        'mainnet', 'layer 2', 'l2', 'rollup', 'smart contract', 'dapp',
+        'token economics', 'tokenomics', 'airdrop', 'claim', 'staking',
+        'liquidity', 'trading', 'exchange', 'cex', 'dex', 'wallet'
+    ],
+
+    # Keyword analyzer agent categories and weights
+    'keyword_categories': {
+        'high_confidence': {
+            'keywords': [
+                'token generation event', 'tge is live', 'airdrop is live',
+                'claim your tokens', 'token launch date', 'tokens are now available',
+                'trading is now live', 'token distribution', 'claim window'
+            ],
+            'weight': 30
+        },
+        'medium_confidence': {
+            'keywords': [
+                'mainnet launch', 'tokenomics', 'token sale', 'listing',
+                'trading live', 'airdrop announcement', 'token allocation',
+                'token unlock', 'vesting schedule'
+            ],
+            'weight': 15
+        },
+        'low_confidence': {
+            'keywords': [
+                'token', 'airdrop', 'launch', 'tge', 'announcement',
+                'distribution', 'claim', 'whitelist', 'snapshot'
+            ],
+            'weight': 5
+        }
+    },
+
+    # Terms that reduce the keyword analyzer's confidence
+    'weighted_exclusions_by_term': {
+        'testnet': -20,
+        'game token': -15,
+        'nft collection': -15,
+        'price prediction': -10,
+        'technical analysis': -10,
+        'rumor': -10
+    },
+
+    # Tweet keywords (substring match) and their scores
+    'tweet_keywords': {
+        'high_confidence': {
+            'keywords': ['tge', 'token generation event', 'token launch',
+                         'airdrop live', 'claim airdrop', 'token is live'],
+            'weight': 25
+        },
+        'medium_confidence': {
+            'keywords': ['mainnet launch', 'tokenomics', 'token sale',
+                         'listing', 'trading live'],
+            'weight': 15
+        }
+    },
+    'tweet_exclusions': ['test', 'testnet', 'game token', 'nft', 'analysis', 'prediction'],
+}
+
 # Optimized news sources - prioritized for TGE announcement coverage
 NEWS_SOURCES = [
     # TIER 1: Primary sources for TGE announcements and early-stage project coverage
@@ -426,12 +606,24 @@ EMAIL_CONFIG = {
     'smtp_port': int(os.getenv('SMTP_PORT', 587)),
     'email_user': os.getenv('EMAIL_USER'),
     'email_password': os.getenv('EMAIL_PASSWORD'),
-    'recipient_email': os.getenv('RECIPIENT_EMAIL', 'mellis@offchainlabs.com')
+    'recipient_email': os.getenv('RECIPIENT_EMAIL', 'mellis@offchainlabs.com'),
+    # Use STARTTLS on non-SSL ports (disable only for local test servers)
+    'smtp_starttls': os.getenv('SMTP_STARTTLS', 'true').lower() == 'true',
+    'smtp_timeout': int(os.getenv('SMTP_TIMEOUT', 20)),
+    # Seconds a pooled SMTP session may sit idle before a NOOP health check
+    'smtp_noop_interval': int(os.getenv('SMTP_NOOP_INTERVAL', 30)),
+    # Send from a background thread so monitoring cycles never wait on SMTP
+    'background_delivery': os.getenv('EMAIL_BACKGROUND_DELIVERY', 'true').lower() == 'true',
+    # Alerts arriving within this many seconds are coalesced into one digest
+    'digest_window': float(os.getenv('EMAIL_DIGEST_WINDOW', 60))
 }
 
 # Twitter API configuration (Bearer token only for API v2)
 TWITTER_CONFIG = {
-    'bearer_token': os.getenv('TWITTER_BEARER_TOKEN')
+    'bearer_token': os.getenv('TWITTER_BEARER_TOKEN'),
+    # Ingest tweets in real time from the v2 filtered stream instead of
+    # polling search once per monitoring cycle
+    'stream_enabled': os.getenv('TWITTER_STREAM_ENABLED', 'false').lower() == 'true'
 }
 
 # Logging configuration
@@ -450,6 +642,10 @@ SWARM_CONFIG = {
     'memory_enabled': os.getenv('SWARM_MEMORY_ENABLED', 'true').lower() == 'true',
     'rate_limit_coordination': os.getenv('SWARM_RATE_LIMIT_COORD', 'true').lower() == 'true',
     'dedup_coordination': os.getenv('SWARM_DEDUP_COORD', 'true').lower() == 'true',
+    'backend': os.getenv('SWARM_BACKEND', 'memory'),  # memory | redis | cli
+    'write_behind': os.getenv('SWARM_WRITE_BEHIND', 'auto'),  # auto | true | false
+    'flush_interval_ms': int(os.getenv('SWARM_FLUSH_INTERVAL_MS', '250')),
+    'flush_max_entries': int(os.getenv('SWARM_FLUSH_MAX_ENTRIES', '500')),
 }
 
 # Swarm agent definitions (matching safla-swarm-config.yaml)
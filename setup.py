@@ -24,11 +24,14 @@ setup(
         "starlette>=0.28.0,<0.40.0",
         "httpx>=0.25.0",
         "uvicorn>=0.25.0,<0.31.0",
+        "orjson>=3.8.0",
         "pydantic>=2.9.0,<2.10.0",
         "email-validator>=2.0.0",
         "sqlalchemy==2.0.23",
         "alembic==1.13.0",
         "psycopg2-binary==2.9.9",
+        "asyncpg==0.29.0",
+        "aiosqlite==0.19.0",
         "redis==5.0.1",
         "python-jose[cryptography]==3.3.0",
         "bcrypt>=4.0.0",
@@ -9,6 +9,7 @@ from datetime import datetime
 from collections import Counter
 
 from src.agents.base_agent import BaseAgent
+from src.rule_pack import RulePackRef
 
 
 class KeywordAnalyzerAgent(BaseAgent):
@@ -19,62 +20,30 @@ class KeywordAnalyzerAgent(BaseAgent):
     def __init__(self, agent_id: str, config: Dict[str, Any]):
         super().__init__(agent_id, "keyword_analyzer", config)
 
-        # TGE keyword categories with confidence weights
-        self.keyword_categories = {
-            'high_confidence': {
-                'keywords': [
-                    'token generation event', 'tge is live', 'airdrop is live',
-                    'claim your tokens', 'token launch date', 'tokens are now available',
-                    'trading is now live', 'token distribution', 'claim window'
-                ],
-                'weight': 30
-            },
-            'medium_confidence': {
-                'keywords': [
-                    'mainnet launch', 'tokenomics', 'token sale', 'listing',
-                    'trading live', 'airdrop announcement', 'token allocation',
-                    'token unlock', 'vesting schedule'
-                ],
-                'weight': 15
-            },
-            'low_confidence': {
-                'keywords': [
-                    'token', 'airdrop', 'launch', 'tge', 'announcement',
-                    'distribution', 'claim', 'whitelist', 'snapshot'
-                ],
-                'weight': 5
-            }
-        }
+        # Keyword categories and exclusion weights come precompiled from the
+        # rule pack (config.SCORING_RULES) shared with the scrapers
+        self.rules = RulePackRef()
 
-        # Exclusion patterns that reduce confidence
-        self.exclusion_patterns = {
-            'testnet': -20,
-            'game token': -15,
-            'nft collection': -15,
-            'price prediction': -10,
-            'technical analysis': -10,
-            'rumor': -10
+    @property
+    def keyword_categories(self) -> Dict[str, Dict[str, Any]]:
+        """TGE keyword categories with confidence weights"""
+        return {
+            category: {'keywords': list(data['keywords']), 'weight': data['weight']}
+            for category, data in self.rules.get().keyword_categories.items()
         }
 
-        # Compile regex patterns
-        self._compile_patterns()
+    @property
+    def exclusion_patterns(self) -> Dict[str, int]:
+        """Exclusion terms and the (negative) confidence they add"""
+        return {term: weight for term, (_, weight) in self.rules.get().weighted_terms.items()}
 
-    def _compile_patterns(self):
-        """Compile regex patterns for efficient matching"""
-        self.compiled_keywords = {}
+    @property
+    def compiled_keywords(self):
+        return self.rules.get().keyword_categories
 
-        for category, data in self.keyword_categories.items():
-            patterns = [re.compile(r'\b' + re.escape(kw) + r'\b', re.IGNORECASE)
-                       for kw in data['keywords']]
-            self.compiled_keywords[category] = {
-                'patterns': patterns,
-                'weight': data['weight']
-            }
-
-        self.compiled_exclusions = {
-            pattern: (re.compile(r'\b' + re.escape(pattern) + r'\b', re.IGNORECASE), weight)
-            for pattern, weight in self.exclusion_patterns.items()
-        }
+    @property
+    def compiled_exclusions(self):
+        return self.rules.get().weighted_terms
 
     async def _do_initialize(self):
         """Initialize keyword analyzer"""
@@ -278,7 +247,7 @@ class KeywordAnalyzerAgent(BaseAgent):
 
     def _extract_token_symbols(self, text: str) -> List[str]:
         """Extract token symbols ($TOKEN format)"""
-        pattern = re.compile(r'\$[A-Z]{2,10}\b')
+        pattern = self.rules.get().token_pattern
         return list(set(match.group() for match in pattern.finditer(text)))
 
     def _extract_companies(self, text: str, companies: List[Dict]) -> List[str]:
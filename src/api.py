@@ -9,11 +9,13 @@ import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
 from typing import List, Optional, Dict, Any
-from fastapi import FastAPI, Depends, HTTPException, status, Query, WebSocket, WebSocketDisconnect, BackgroundTasks
+from fastapi import FastAPI, Depends, HTTPException, status, Query, Request, WebSocket, WebSocketDisconnect, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, desc, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, desc, and_, or_, select, update
 import uvicorn
 
 from .database import DatabaseManager, CacheManager, init_db, SessionLocal
@@ -21,7 +23,7 @@ from .models import User, Company, Alert, Feed, MonitoringSession, SystemMetrics
 from .schemas import (
     UserCreate, UserUpdate, UserResponse, LoginRequest, Token,
     CompanyCreate, CompanyUpdate, CompanyResponse, CompanyFilter,
-    AlertCreate, AlertUpdate, AlertResponse, AlertFilter, AlertStatistics,
+    AlertCreate, AlertUpdate, AlertResponse, AlertFilter, AlertExportFilter, AlertStatistics, ExportFormat,
     FeedCreate, FeedUpdate, FeedResponse,
     MonitoringSessionResponse, SystemMetricCreate, SystemMetricResponse,
     APIKeyCreate, APIKeyResponse, BulkAlertUpdate, BulkOperationResult,
@@ -30,10 +32,18 @@ from .schemas import (
 from .auth import (
     AuthManager, authenticate_user, create_user, create_api_key,
     get_current_user, get_current_active_user, get_current_admin_user,
-    optional_user, check_rate_limit, create_admin_user_if_not_exists
+    optional_user, check_rate_limit, create_admin_user_if_not_exists,
+    invalidate_api_key, invalidate_user, api_key_usage
 )
 from .seed_data import seed_all_data
+from .serialization import (
+    FastJSONResponse, alert_projection, alert_rows_to_dicts, ndjson_response,
+    iter_ndjson_export, iter_csv_export, iter_parquet_export, gzip_chunks,
+    NDJSON_MEDIA_TYPE, CSV_MEDIA_TYPE, PARQUET_MEDIA_TYPE, PARQUET_AVAILABLE, EXPORT_BATCH_SIZE
+)
 from .middleware_security import setup_security_middleware
+from .cache_decorator import invalidate_alerts_cache, invalidate_statistics_cache
+from .event_broker import BROADCAST_CHANNEL, WORKER_ID, get_event_broker, stop_event_broker
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -45,7 +55,8 @@ app = FastAPI(
     description="Token Generation Event monitoring and alert system",
     version="2.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware - SECURITY: Configure specific origins for production
@@ -66,6 +77,10 @@ app.add_middleware(
 # Setup security middleware (rate limiting, security headers, request logging)
 setup_security_middleware(app)
 
+# Seconds a single WebSocket send may take before the client is dropped
+WEBSOCKET_SEND_TIMEOUT = float(os.getenv('WEBSOCKET_SEND_TIMEOUT', '10'))
+
+
 # WebSocket connection manager
 class ConnectionManager:
     """WebSocket connection manager for real-time updates"""
@@ -96,15 +111,33 @@ class ConnectionManager:
                 del self.user_connections[user_id]
     
     async def broadcast(self, message: dict):
-        """Broadcast message to all connections"""
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except (WebSocketDisconnect, ConnectionError) as e:
-                logger.debug(f"Connection closed during broadcast: {e}")
+        """Broadcast message to all connections on every API worker"""
+        # Local clients are served directly; other workers via the broker
+        await self.deliver_broadcast({"message": message})
+        await get_event_broker().publish(BROADCAST_CHANNEL, {"message": message, "origin": WORKER_ID})
+    
+    async def deliver_broadcast(self, event: dict):
+        """Deliver a published broadcast to this worker's connections concurrently"""
+        if event.get("origin") == WORKER_ID:
+            return
+        
+        message = event["message"]
+        connections = list(self.active_connections)
+        if not connections:
+            return
+        
+        results = await asyncio.gather(
+            *(asyncio.wait_for(connection.send_json(message), timeout=WEBSOCKET_SEND_TIMEOUT)
+              for connection in connections),
+            return_exceptions=True
+        )
+        
+        for connection, result in zip(connections, results):
+            if isinstance(result, (WebSocketDisconnect, ConnectionError, asyncio.TimeoutError)):
+                logger.debug(f"Connection closed during broadcast: {result}")
                 self.disconnect(connection)
-            except Exception as e:
-                logger.error(f"Unexpected error broadcasting message: {e}", exc_info=True)
+            elif isinstance(result, Exception):
+                logger.error(f"Unexpected error broadcasting message: {result}", exc_info=result)
     
     async def send_to_user(self, user_id: int, message: dict):
         """Send message to specific user"""
@@ -134,12 +167,30 @@ async def startup_event():
         with DatabaseManager.get_session() as db:
             create_admin_user_if_not_exists(db)
         
+        # Receive real-time events published by other workers
+        event_broker = get_event_broker()
+        event_broker.subscribe(BROADCAST_CHANNEL, manager.deliver_broadcast)
+        await event_broker.start()
+        
         logger.info("TGE Monitor API started successfully")
     except Exception as e:
         logger.error(f"Failed to initialize application: {e}")
         raise
 
 
+# Shutdown event
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Flush batched API key usage and stop the real-time broker before the worker exits"""
+    try:
+        with DatabaseManager.get_session() as db:
+            api_key_usage.flush(db)
+    except Exception as e:
+        logger.error(f"Failed to flush API key usage on shutdown: {e}")
+    
+    await stop_event_broker()
+
+
 # Health check endpoint
 @app.get("/health", response_model=HealthCheck)
 async def health_check(db: Session = Depends(DatabaseManager.get_db)):
@@ -294,8 +345,10 @@ async def delete_api_key(
             detail="API key not found"
         )
     
+    key_hash, api_key_id = api_key.key_hash, api_key.id
     db.delete(api_key)
     db.commit()
+    invalidate_api_key(key_hash, api_key_id)
     
     return {"message": "API key deleted successfully"}
 
@@ -321,6 +374,7 @@ async def update_current_user(
     
     db.commit()
     db.refresh(current_user)
+    invalidate_user(current_user.id)
     
     return UserResponse.from_orm(current_user)
 
@@ -339,11 +393,11 @@ async def list_users(
 @app.get("/companies", response_model=List[CompanyResponse])
 async def list_companies(
     filters: CompanyFilter = Depends(),
-    db: Session = Depends(DatabaseManager.get_db),
+    db: AsyncSession = Depends(DatabaseManager.get_async_db),
     current_user: Optional[User] = Depends(optional_user)
 ):
     """List companies with optional filtering"""
-    query = db.query(Company)
+    query = select(Company)
     
     if filters.priority:
         query = query.filter(Company.priority == filters.priority)
@@ -357,18 +411,18 @@ async def list_companies(
         else:
             query = query.filter(Company.tokens.is_(None))
     
-    companies = query.offset(filters.offset).limit(filters.limit).all()
+    companies = (await db.scalars(query.offset(filters.offset).limit(filters.limit))).all()
     return [CompanyResponse.from_orm(company) for company in companies]
 
 
 @app.get("/companies/{company_id}", response_model=CompanyResponse)
 async def get_company(
     company_id: int,
-    db: Session = Depends(DatabaseManager.get_db),
+    db: AsyncSession = Depends(DatabaseManager.get_async_db),
     current_user: Optional[User] = Depends(optional_user)
 ):
     """Get company by ID"""
-    company = db.query(Company).filter(Company.id == company_id).first()
+    company = await db.get(Company, company_id)
     if not company:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -450,22 +504,22 @@ async def delete_company(
 async def list_feeds(
     limit: int = Query(100, le=1000),
     offset: int = Query(0, ge=0),
-    db: Session = Depends(DatabaseManager.get_db),
+    db: AsyncSession = Depends(DatabaseManager.get_async_db),
     current_user: Optional[User] = Depends(optional_user)
 ):
     """List feeds (public access)"""
-    feeds = db.query(Feed).offset(offset).limit(limit).all()
+    feeds = (await db.scalars(select(Feed).offset(offset).limit(limit))).all()
     return [FeedResponse.from_orm(feed) for feed in feeds]
 
 
 @app.get("/feeds/{feed_id}", response_model=FeedResponse)
 async def get_feed(
     feed_id: int,
-    db: Session = Depends(DatabaseManager.get_db),
+    db: AsyncSession = Depends(DatabaseManager.get_async_db),
     current_user: Optional[User] = Depends(optional_user)
 ):
     """Get feed by ID (public access)"""
-    feed = db.query(Feed).filter(Feed.id == feed_id).first()
+    feed = await db.get(Feed, feed_id)
     if not feed:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -543,18 +597,8 @@ async def delete_feed(
 
 
 # Alert endpoints
-@app.get("/alerts", response_model=List[AlertResponse])
-async def list_alerts(
-    filters: AlertFilter = Depends(),
-    db: Session = Depends(DatabaseManager.get_db),
-    current_user: Optional[User] = Depends(optional_user)
-):
-    """List alerts with filtering"""
-    check_rate_limit(f"alerts:{current_user.id if current_user else 'anonymous'}", limit=1000, window=3600)
-
-    # Use joinedload to prevent N+1 query problem
-    query = db.query(Alert).options(joinedload(Alert.company))
-    
+def _filter_alert_query(query, filters):
+    """Apply AlertFilter / AlertExportFilter criteria to an alert select"""
     if filters.company_id:
         query = query.filter(Alert.company_id == filters.company_id)
     
@@ -589,18 +633,105 @@ async def list_alerts(
             keyword_filters.append(Alert.content.ilike(f"%{escaped_keyword}%"))
         query = query.filter(or_(*keyword_filters))
     
-    alerts = query.order_by(desc(Alert.created_at)).offset(filters.offset).limit(filters.limit).all()
-    return [AlertResponse.from_orm(alert) for alert in alerts]
+    return query
+
+
+# The projected dicts are returned as-is, so the AlertResponse shape is
+# documented here rather than enforced through response_model
+@app.get("/alerts", responses={
+    200: {
+        "model": List[AlertResponse],
+        "description": "Alerts as a JSON array, or one alert per line with format=ndjson",
+        "content": {NDJSON_MEDIA_TYPE: {}},
+    }
+})
+async def list_alerts(
+    filters: AlertFilter = Depends(),
+    response_format: str = Query("json", alias="format", pattern="^(json|ndjson)$"),
+    db: AsyncSession = Depends(DatabaseManager.get_async_db),
+    current_user: Optional[User] = Depends(optional_user)
+):
+    """List alerts with filtering (format=ndjson streams one alert per line)"""
+    check_rate_limit(f"alerts:{current_user.id if current_user else 'anonymous'}", limit=1000, window=3600)
+
+    # Project columns (alert + joined company) straight into dicts - no ORM
+    # hydration or per-row response model validation on this hot path
+    query = _filter_alert_query(alert_projection(), filters)
+    query = query.order_by(desc(Alert.created_at)).offset(filters.offset).limit(filters.limit)
+    alerts = alert_rows_to_dicts((await db.execute(query)).mappings())
+
+    if response_format == "ndjson":
+        return ndjson_response(alerts)
+    return FastJSONResponse(content=alerts)
+
+
+def _stream_alert_export(query, encoder):
+    """Stream encoded alert rows from a server-side cursor in its own session"""
+    db = SessionLocal()
+    try:
+        result = db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        yield from encoder(result.mappings())
+    finally:
+        db.close()
+
+
+# Declared before /alerts/{alert_id} so "export" is not parsed as an id
+@app.get("/alerts/export")
+async def export_alerts(
+    request: Request,
+    filters: AlertExportFilter = Depends(),
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    current_user: Optional[User] = Depends(optional_user)
+):
+    """Stream a bulk alert export as NDJSON, CSV or Parquet
+    
+    Rows are ordered by alert id and read with a server-side cursor, so memory
+    stays flat regardless of range. To resume an interrupted export, pass the
+    last received alert id as ``cursor``.
+    """
+    check_rate_limit(f"alerts_export:{current_user.id if current_user else 'anonymous'}", limit=60, window=3600)
+    
+    if export_format == ExportFormat.PARQUET and not PARQUET_AVAILABLE:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Parquet export requires pyarrow to be installed"
+        )
+    
+    query = _filter_alert_query(alert_projection(), filters)
+    query = query.filter(Alert.id > filters.cursor).order_by(Alert.id)
+    if filters.limit:
+        query = query.limit(filters.limit)
+    
+    encoder, media_type, extension = {
+        ExportFormat.NDJSON: (iter_ndjson_export, NDJSON_MEDIA_TYPE, "ndjson"),
+        ExportFormat.CSV: (iter_csv_export, CSV_MEDIA_TYPE, "csv"),
+        ExportFormat.PARQUET: (iter_parquet_export, PARQUET_MEDIA_TYPE, "parquet"),
+    }[export_format]
+    
+    headers = {
+        "Content-Disposition": f'attachment; filename="alerts-export.{extension}"',
+        "X-Export-Cursor-Field": "id",
+    }
+    body = _stream_alert_export(query, encoder)
+    
+    # Parquet pages are already compressed
+    accepts_gzip = "gzip" in request.headers.get("accept-encoding", "").lower()
+    if accepts_gzip and export_format != ExportFormat.PARQUET:
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    
+    return StreamingResponse(body, media_type=media_type, headers=headers)
 
 
 @app.get("/alerts/{alert_id}", response_model=AlertResponse)
 async def get_alert(
     alert_id: int,
-    db: Session = Depends(DatabaseManager.get_db),
+    db: AsyncSession = Depends(DatabaseManager.get_async_db),
     current_user: Optional[User] = Depends(optional_user)
 ):
     """Get alert by ID"""
-    alert = db.query(Alert).filter(Alert.id == alert_id).first()
+    alert = await db.get(Alert, alert_id, options=[joinedload(Alert.company)])
     if not alert:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -641,6 +772,71 @@ async def create_alert(
     return AlertResponse.from_orm(alert)
 
 
+# Declared before /alerts/{alert_id} so "bulk" is not parsed as an id
+@app.put("/alerts/bulk", response_model=BulkOperationResult)
+async def bulk_update_alerts(
+    bulk_update: BulkAlertUpdate,
+    db: Session = Depends(DatabaseManager.get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """Bulk update alerts with a single set-based UPDATE"""
+    alert_ids = list(dict.fromkeys(bulk_update.alert_ids))
+    
+    values = {}
+    if bulk_update.status:
+        values[Alert.status] = bulk_update.status.value
+    if bulk_update.urgency_level:
+        values[Alert.urgency_level] = bulk_update.urgency_level.value
+    
+    try:
+        if not alert_ids:
+            updated_ids = set()
+        elif not values:
+            # Nothing to change - just report which ids exist
+            updated_ids = set(db.scalars(select(Alert.id).where(Alert.id.in_(alert_ids))))
+        elif db.get_bind().dialect.update_returning:
+            statement = (
+                update(Alert)
+                .where(Alert.id.in_(alert_ids))
+                .values(values)
+                .returning(Alert.id)
+                .execution_options(synchronize_session=False)
+            )
+            updated_ids = set(db.scalars(statement))
+        else:
+            updated_ids = set(db.scalars(select(Alert.id).where(Alert.id.in_(alert_ids))))
+            db.execute(
+                update(Alert)
+                .where(Alert.id.in_(updated_ids))
+                .values(values)
+                .execution_options(synchronize_session=False)
+            )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Bulk alert update failed: {e}")
+        return BulkOperationResult(
+            success_count=0,
+            error_count=len(alert_ids),
+            errors=[{"alert_id": alert_id, "error": str(e)} for alert_id in alert_ids]
+        )
+    
+    if updated_ids and values:
+        invalidate_alerts_cache()
+        invalidate_statistics_cache()
+    
+    errors = [
+        {"alert_id": alert_id, "error": "Alert not found"}
+        for alert_id in alert_ids if alert_id not in updated_ids
+    ]
+    
+    return BulkOperationResult(
+        success_count=len(updated_ids),
+        error_count=len(errors),
+        errors=errors
+    )
+
+
 @app.put("/alerts/{alert_id}", response_model=AlertResponse)
 async def update_alert(
     alert_id: int,
@@ -666,47 +862,11 @@ async def update_alert(
     return AlertResponse.from_orm(alert)
 
 
-@app.put("/alerts/bulk", response_model=BulkOperationResult)
-async def bulk_update_alerts(
-    bulk_update: BulkAlertUpdate,
-    db: Session = Depends(DatabaseManager.get_db),
-    current_user: User = Depends(get_current_active_user)
-):
-    """Bulk update alerts"""
-    success_count = 0
-    error_count = 0
-    errors = []
-    
-    for alert_id in bulk_update.alert_ids:
-        try:
-            alert = db.query(Alert).filter(Alert.id == alert_id).first()
-            if alert:
-                if bulk_update.status:
-                    alert.status = bulk_update.status
-                if bulk_update.urgency_level:
-                    alert.urgency_level = bulk_update.urgency_level
-                success_count += 1
-            else:
-                error_count += 1
-                errors.append({"alert_id": alert_id, "error": "Alert not found"})
-        except Exception as e:
-            error_count += 1
-            errors.append({"alert_id": alert_id, "error": str(e)})
-    
-    db.commit()
-    
-    return BulkOperationResult(
-        success_count=success_count,
-        error_count=error_count,
-        errors=errors
-    )
-
-
 # Statistics endpoints
 @app.get("/statistics/alerts", response_model=AlertStatistics)
 async def get_alert_statistics(
     days: int = Query(30, ge=1, le=365),
-    db: Session = Depends(DatabaseManager.get_db),
+    db: AsyncSession = Depends(DatabaseManager.get_async_db),
     current_user: Optional[User] = Depends(optional_user)
 ):
     """Get alert statistics"""
@@ -715,38 +875,43 @@ async def get_alert_statistics(
     start_date = end_date - timedelta(days=days)
 
     # Total alerts
-    total_alerts = db.query(Alert).filter(Alert.created_at >= start_date).count()
+    total_alerts = await db.scalar(
+        select(func.count(Alert.id)).filter(Alert.created_at >= start_date)
+    )
 
     # Alerts by source
-    source_stats = db.query(
-        Alert.source,
-        func.count(Alert.id)
-    ).filter(Alert.created_at >= start_date).group_by(Alert.source).all()
+    source_stats = (await db.execute(
+        select(Alert.source, func.count(Alert.id))
+        .filter(Alert.created_at >= start_date)
+        .group_by(Alert.source)
+    )).all()
     alerts_by_source = {source: count for source, count in source_stats}
 
     # Alerts by confidence (group by 10% buckets)
-    confidence_stats = db.query(
-        func.floor(Alert.confidence * 10) / 10,
-        func.count(Alert.id)
-    ).filter(Alert.created_at >= start_date).group_by(
-        func.floor(Alert.confidence * 10) / 10
-    ).all()
+    confidence_bucket = func.floor(Alert.confidence * 10) / 10
+    confidence_stats = (await db.execute(
+        select(confidence_bucket, func.count(Alert.id))
+        .filter(Alert.created_at >= start_date)
+        .group_by(confidence_bucket)
+    )).all()
     alerts_by_confidence = {f"{int(conf*100)}%": count for conf, count in confidence_stats}
 
     # Alerts by urgency
-    urgency_stats = db.query(
-        Alert.urgency_level,
-        func.count(Alert.id)
-    ).filter(Alert.created_at >= start_date).group_by(Alert.urgency_level).all()
+    urgency_stats = (await db.execute(
+        select(Alert.urgency_level, func.count(Alert.id))
+        .filter(Alert.created_at >= start_date)
+        .group_by(Alert.urgency_level)
+    )).all()
     alerts_by_urgency = {urgency or 'none': count for urgency, count in urgency_stats}
 
     # Alerts by company
-    company_stats = db.query(
-        Company.name,
-        func.count(Alert.id)
-    ).join(Alert, Company.id == Alert.company_id).filter(
-        Alert.created_at >= start_date
-    ).group_by(Company.name).limit(20).all()
+    company_stats = (await db.execute(
+        select(Company.name, func.count(Alert.id))
+        .join(Alert, Company.id == Alert.company_id)
+        .filter(Alert.created_at >= start_date)
+        .group_by(Company.name)
+        .limit(20)
+    )).all()
     alerts_by_company = {company: count for company, count in company_stats}
 
     # Recent trend (last 7 days)
@@ -755,9 +920,9 @@ async def get_alert_statistics(
         day = end_date - timedelta(days=i)
         day_start = day.replace(hour=0, minute=0, second=0, microsecond=0)
         day_end = day.replace(hour=23, minute=59, second=59, microsecond=999999)
-        count = db.query(Alert).filter(
-            Alert.created_at.between(day_start, day_end)
-        ).count()
+        count = await db.scalar(
+            select(func.count(Alert.id)).filter(Alert.created_at.between(day_start, day_end))
+        )
         recent_trend[day.strftime("%Y-%m-%d")] = count
 
     return AlertStatistics(
@@ -772,38 +937,42 @@ async def get_alert_statistics(
 
 @app.get("/statistics/system", response_model=SystemStatistics)
 async def get_system_statistics(
-    db: Session = Depends(DatabaseManager.get_db),
+    db: AsyncSession = Depends(DatabaseManager.get_async_db),
     current_user: Optional[User] = Depends(optional_user)
 ):
     """Get system statistics"""
-    total_companies = db.query(Company).count()
-    total_feeds = db.query(Feed).count()
-    active_feeds = db.query(Feed).filter(Feed.is_active == True).count()
-    total_alerts = db.query(Alert).count()
+    total_companies = await db.scalar(select(func.count(Company.id)))
+    total_feeds = await db.scalar(select(func.count(Feed.id)))
+    active_feeds = await db.scalar(select(func.count(Feed.id)).filter(Feed.is_active == True))
+    total_alerts = await db.scalar(select(func.count(Alert.id)))
 
     # Recent alerts
-    alerts_last_24h = db.query(Alert).filter(
-        Alert.created_at >= datetime.now(timezone.utc) - timedelta(hours=24)
-    ).count()
+    alerts_last_24h = await db.scalar(
+        select(func.count(Alert.id)).filter(
+            Alert.created_at >= datetime.now(timezone.utc) - timedelta(hours=24)
+        )
+    )
 
-    alerts_last_7d = db.query(Alert).filter(
-        Alert.created_at >= datetime.now(timezone.utc) - timedelta(days=7)
-    ).count()
+    alerts_last_7d = await db.scalar(
+        select(func.count(Alert.id)).filter(
+            Alert.created_at >= datetime.now(timezone.utc) - timedelta(days=7)
+        )
+    )
 
     # Average confidence
-    avg_confidence_result = db.query(func.avg(Alert.confidence)).scalar()
+    avg_confidence_result = await db.scalar(select(func.avg(Alert.confidence)))
     avg_confidence = float(avg_confidence_result) if avg_confidence_result else 0.0
 
     # Get last monitoring session
-    last_session = db.query(MonitoringSession).order_by(
-        desc(MonitoringSession.start_time)
-    ).first()
+    last_session = await db.scalar(
+        select(MonitoringSession).order_by(desc(MonitoringSession.start_time)).limit(1)
+    )
 
     # Calculate uptime from session history
-    total_sessions = db.query(MonitoringSession).count()
-    failed_sessions = db.query(MonitoringSession).filter(
-        MonitoringSession.status == 'failed'
-    ).count()
+    total_sessions = await db.scalar(select(func.count(MonitoringSession.id)))
+    failed_sessions = await db.scalar(
+        select(func.count(MonitoringSession.id)).filter(MonitoringSession.status == 'failed')
+    )
 
     system_uptime = 100.0
     if total_sessions > 0:
@@ -1050,12 +1219,12 @@ async def trigger_monitoring_cycle(db: Session = Depends(DatabaseManager.get_db)
 @app.get("/monitoring/session/{session_id}")
 async def get_monitoring_session(
     session_id: str,
-    db: Session = Depends(DatabaseManager.get_db)
+    db: AsyncSession = Depends(DatabaseManager.get_async_db)
 ):
     """Get monitoring session results"""
-    session = db.query(MonitoringSession).filter(
-        MonitoringSession.session_id == session_id
-    ).first()
+    session = await db.scalar(
+        select(MonitoringSession).filter(MonitoringSession.session_id == session_id)
+    )
 
     if not session:
         raise HTTPException(
@@ -1069,12 +1238,12 @@ async def get_monitoring_session(
 @app.get("/monitoring/session/{session_id}/progress")
 async def get_monitoring_session_progress(
     session_id: str,
-    db: Session = Depends(DatabaseManager.get_db)
+    db: AsyncSession = Depends(DatabaseManager.get_async_db)
 ):
     """Get real-time progress of monitoring session"""
-    session = db.query(MonitoringSession).filter(
-        MonitoringSession.session_id == session_id
-    ).first()
+    session = await db.scalar(
+        select(MonitoringSession).filter(MonitoringSession.session_id == session_id)
+    )
 
     if not session:
         raise HTTPException(
@@ -1137,12 +1306,12 @@ async def get_monitoring_session_progress(
 @app.get("/monitoring/sessions/recent")
 async def get_recent_monitoring_sessions(
     limit: int = Query(10, le=100),
-    db: Session = Depends(DatabaseManager.get_db)
+    db: AsyncSession = Depends(DatabaseManager.get_async_db)
 ):
     """Get recent monitoring sessions"""
-    sessions = db.query(MonitoringSession).order_by(
-        desc(MonitoringSession.start_time)
-    ).limit(limit).all()
+    sessions = (await db.scalars(
+        select(MonitoringSession).order_by(desc(MonitoringSession.start_time)).limit(limit)
+    )).all()
 
     return [session.to_dict() for session in sessions]
 
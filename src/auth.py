@@ -4,15 +4,17 @@ JWT token-based authentication with API key support
 """
 
 import os
+import time
 import secrets
 import hashlib
+import threading
 import bcrypt
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any, Tuple
 from jose import JWTError, jwt
 from fastapi import HTTPException, status, Depends, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials, APIKeyHeader
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from .database import DatabaseManager
 from .models import User, APIKey
@@ -22,6 +24,8 @@ from .schemas import TokenData
 SECRET_KEY = os.getenv("SECRET_KEY", secrets.token_urlsafe(32))
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+PRINCIPAL_CACHE_TTL = int(os.getenv("PRINCIPAL_CACHE_TTL", "30"))
+API_KEY_USAGE_FLUSH_INTERVAL = int(os.getenv("API_KEY_USAGE_FLUSH_INTERVAL", "60"))
 
 # Security schemes
 security = HTTPBearer()
@@ -191,32 +195,187 @@ def create_api_key(db: Session, user_id: int, name: str, expires_in_days: Option
     return db_api_key, api_key
 
 
+class PrincipalCache:
+    """Short-TTL in-process cache of authenticated principals
+
+    Stores column snapshots rather than ORM instances so cached entries never
+    become bound to (or expired by) a request-scoped session.
+    """
+
+    def __init__(self, ttl: int = PRINCIPAL_CACHE_TTL):
+        self.ttl = ttl
+        self._entries: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached principal entry if it has not expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            return entry[1]
+
+    def set(self, key: str, value: Dict[str, Any]):
+        """Cache a principal entry for the configured TTL"""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, key: str):
+        """Drop a single cached entry"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate_user(self, user_id: int):
+        """Drop every cached entry that resolves to the given user"""
+        with self._lock:
+            stale = [
+                key for key, (_, value) in self._entries.items()
+                if value["user"].get("id") == user_id
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        """Drop all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+
+class APIKeyUsageTracker:
+    """Accumulates API key usage in memory and flushes it in batches"""
+
+    def __init__(self, flush_interval: int = API_KEY_USAGE_FLUSH_INTERVAL):
+        self.flush_interval = flush_interval
+        self._pending: Dict[int, Tuple[int, datetime]] = {}
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, api_key_id: int):
+        """Record a single use of an API key"""
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            count, _ = self._pending.get(api_key_id, (0, now))
+            self._pending[api_key_id] = (count + 1, now)
+
+    def is_due(self) -> bool:
+        """Check whether pending usage should be written out"""
+        return bool(self._pending) and time.monotonic() - self._last_flush >= self.flush_interval
+
+    def discard(self, api_key_id: int):
+        """Forget pending usage for a key that no longer exists"""
+        with self._lock:
+            self._pending.pop(api_key_id, None)
+
+    def flush(self, db: Session) -> int:
+        """Write pending usage counters to the database, returns keys updated"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+
+        if not pending:
+            return 0
+
+        try:
+            for api_key_id, (count, last_used) in pending.items():
+                db.query(APIKey).filter(APIKey.id == api_key_id).update(
+                    {
+                        APIKey.usage_count: APIKey.usage_count + count,
+                        APIKey.last_used: last_used,
+                    },
+                    synchronize_session=False
+                )
+            db.commit()
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.warning(f"Failed to flush API key usage: {e}")
+            db.rollback()
+            # Put the counts back so they are retried on the next flush
+            with self._lock:
+                for api_key_id, (count, last_used) in pending.items():
+                    current_count, current_last_used = self._pending.get(api_key_id, (0, last_used))
+                    self._pending[api_key_id] = (current_count + count, max(last_used, current_last_used))
+            return 0
+
+        return len(pending)
+
+
+# Global principal cache and usage tracker instances
+principal_cache = PrincipalCache()
+api_key_usage = APIKeyUsageTracker()
+
+
+def _snapshot_user(user: User) -> Dict[str, Any]:
+    """Capture the column state of a user for caching"""
+    return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
+
+def _user_from_snapshot(db: Session, snapshot: Dict[str, Any]) -> User:
+    """Rebuild a session-bound user from a cached snapshot without a SELECT"""
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def invalidate_api_key(key_hash: str, api_key_id: Optional[int] = None):
+    """Invalidate a cached API key principal (e.g. on revocation)"""
+    principal_cache.invalidate(f"api_key:{key_hash}")
+    if api_key_id is not None:
+        api_key_usage.discard(api_key_id)
+
+
+def invalidate_user(user_id: int):
+    """Invalidate every cached principal for a user (e.g. on update or deactivation)"""
+    principal_cache.invalidate_user(user_id)
+
+
 def verify_api_key(db: Session, api_key: str) -> Optional[User]:
     """Verify an API key and return the associated user"""
     key_hash = AuthManager.hash_api_key(api_key)
+    cache_key = f"api_key:{key_hash}"
     
-    db_api_key = db.query(APIKey).filter(
-        APIKey.key_hash == key_hash,
-        APIKey.is_active == True
-    ).first()
-    
-    if not db_api_key:
-        return None
-    
-    # Check expiration
-    if db_api_key.expires_at and db_api_key.expires_at < datetime.now(timezone.utc):
-        return None
-    
-    # Get associated user
-    user = db.query(User).filter(User.id == db_api_key.user_id).first()
-    
-    if not user or not user.is_active:
-        return None
-    
-    # Update usage statistics
-    db_api_key.last_used = datetime.now(timezone.utc)
-    db_api_key.usage_count += 1
-    db.commit()
+    cached = principal_cache.get(cache_key)
+    if cached:
+        if cached["expires_at"] and cached["expires_at"] < datetime.now(timezone.utc):
+            principal_cache.invalidate(cache_key)
+            return None
+        user = _user_from_snapshot(db, cached["user"])
+        api_key_id = cached["api_key_id"]
+    else:
+        db_api_key = db.query(APIKey).filter(
+            APIKey.key_hash == key_hash,
+            APIKey.is_active == True
+        ).first()
+        
+        if not db_api_key:
+            return None
+        
+        # Check expiration
+        if db_api_key.expires_at and db_api_key.expires_at < datetime.now(timezone.utc):
+            return None
+        
+        # Get associated user
+        user = db.query(User).filter(User.id == db_api_key.user_id).first()
+        
+        if not user or not user.is_active:
+            return None
+        
+        api_key_id = db_api_key.id
+        principal_cache.set(cache_key, {
+            "api_key_id": api_key_id,
+            "expires_at": db_api_key.expires_at,
+            "user": _snapshot_user(user),
+        })
+    
+    # Usage statistics are batched instead of written on every request
+    api_key_usage.record(api_key_id)
+    if api_key_usage.is_due():
+        api_key_usage.flush(db)
     
     return user
 
@@ -240,6 +399,11 @@ def get_current_user_from_token(
     if token_data is None:
         raise credentials_exception
     
+    cache_key = f"token:{token_data.user_id}"
+    cached = principal_cache.get(cache_key)
+    if cached and cached["user"].get("username") == token_data.username:
+        return _user_from_snapshot(db, cached["user"])
+    
     user = db.query(User).filter(User.id == token_data.user_id).first()
     if user is None:
         raise credentials_exception
@@ -250,6 +414,8 @@ def get_current_user_from_token(
             detail="Inactive user"
         )
     
+    principal_cache.set(cache_key, {"user": _snapshot_user(user)})
+    
     return user
 
 
@@ -1,6 +1,8 @@
 """
 Intelligent Cache Manager for TGE Scraping System
-Provides multi-tier caching with TTL management for optimal performance
+Provides multi-tier caching with TTL management for optimal performance:
+an in-process LRU (L1) in front of an optional Redis store (L2) shared by
+scraper workers, swarm agents and API processes
 
 Performance Targets:
 - 30% reduction in API calls through intelligent caching
@@ -10,8 +12,11 @@ Performance Targets:
 
 import time
 import json
+import zlib
+import struct
 import logging
 import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, Dict, Optional, Tuple
 from datetime import datetime, timedelta, timezone
 from collections import OrderedDict
@@ -20,86 +25,373 @@ import os
 
 logger = logging.getLogger(__name__)
 
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+
+# Share of max_memory_mb each tier may use; article bodies and feeds dominate
+DEFAULT_TIER_BUDGETS = {
+    'rss': 0.3,
+    'twitter_user': 0.05,
+    'article_content': 0.5,
+    'search_results': 0.15,
+}
+
+# Lock stripes per tier so concurrent scraper threads rarely contend
+DEFAULT_STRIPES = int(os.getenv('CACHE_LOCK_STRIPES', 8))
+
+# Failed fetches are remembered this long so every caller doesn't retry a dead URL
+NEGATIVE_TTL = int(os.getenv('CACHE_NEGATIVE_TTL', 60))
+
+# L2 values at least this large are compressed before they are written
+L2_COMPRESS_THRESHOLD = 1024
+
+# After a Redis error the L2 store is bypassed this long instead of timing out every lookup
+L2_RETRY_INTERVAL = 30
+
+# How long a caller waits on another caller's in-flight fetch of the same key
+COALESCE_TIMEOUT = 60
+
+# Entries older than this share of their tier TTL (the soft TTL) are served
+# stale from get_or_fetch while a background refresh replaces them
+SOFT_TTL_RATIO = float(os.getenv('CACHE_SOFT_TTL_RATIO', 0.5))
+REFRESH_WORKERS = int(os.getenv('CACHE_REFRESH_WORKERS', 4))
+
+# Retry schedule for keys whose background refresh failed, and how many such keys are tracked
+REFRESH_BACKOFF_START = 5
+REFRESH_BACKOFF_MAX = 300
+MAX_TRACKED_FAILURES = 4096
+
+# Stored in place of a value for fetches that failed
+NEGATIVE = object()
+
+# L2 payload header: value format, compression, absolute expiry (epoch seconds)
+_L2_HEADER = struct.Struct('>ccd')
+
+
+_PLAIN_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_plain(value: Any) -> bool:
+    """True if value reads back from L2 as the same types (no subclasses, tuples or non-str keys)."""
+    value_type = type(value)
+    if value_type in _PLAIN_SCALARS:
+        return True
+    if value_type is list:
+        return all(_is_plain(item) for item in value)
+    if value_type is dict:
+        return all(type(k) is str and _is_plain(v) for k, v in value.items())
+    return False
+
+
+def encode_payload(value: Any, expires_at: float) -> Optional[bytes]:
+    """
+    Serialize a value for the L2 store (msgpack, or JSON without it).
+
+    Returns None for values that would not read back as the same types
+    (dict subclasses such as FeedParserDict, struct_time, tuples, objects);
+    those stay in L1 only.
+    """
+    if value is NEGATIVE:
+        value_format, body = b'N', b''
+    elif not _is_plain(value):
+        return None
+    else:
+        try:
+            if MSGPACK_AVAILABLE:
+                value_format, body = b'M', msgpack.packb(value, use_bin_type=True)
+            else:
+                value_format, body = b'J', json.dumps(value, separators=(',', ':')).encode()
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    compression = b'-'
+    if len(body) >= L2_COMPRESS_THRESHOLD:
+        if ZSTD_AVAILABLE:
+            body, compression = zstandard.ZstdCompressor(level=3).compress(body), b'Z'
+        else:
+            body, compression = zlib.compress(body, 6), b'z'
+
+    return _L2_HEADER.pack(value_format, compression, expires_at) + body
+
+
+def decode_payload(payload: bytes) -> Tuple[Any, float]:
+    """Inverse of encode_payload; returns (value, expires_at)."""
+    value_format, compression, expires_at = _L2_HEADER.unpack_from(payload)
+    body = payload[_L2_HEADER.size:]
+
+    if compression == b'Z':
+        if not ZSTD_AVAILABLE:
+            raise ValueError("zstandard is required to read this cache entry")
+        body = zstandard.ZstdDecompressor().decompress(body)
+    elif compression == b'z':
+        body = zlib.decompress(body)
+
+    if value_format == b'N':
+        return NEGATIVE, expires_at
+    if value_format == b'M':
+        if not MSGPACK_AVAILABLE:
+            raise ValueError("msgpack is required to read this cache entry")
+        return msgpack.unpackb(body, raw=False, strict_map_key=False), expires_at
+    return json.loads(body), expires_at
+
 
 class CacheEntry:
     """Individual cache entry with metadata."""
 
-    def __init__(self, value: Any, ttl: int):
+    __slots__ = ('value', 'created_at', 'ttl', 'size', 'access_count', 'last_accessed')
+
+    def __init__(self, value: Any, ttl: float, size: int = 0, created_at: Optional[float] = None):
         self.value = value
-        self.created_at = time.time()
+        self.created_at = created_at or time.time()
         self.ttl = ttl
+        self.size = size
         self.access_count = 0
-        self.last_accessed = time.time()
+        self.last_accessed = self.created_at
 
     def is_valid(self) -> bool:
         """Check if cache entry is still valid."""
         return (time.time() - self.created_at) < self.ttl
 
+    def age(self) -> float:
+        return time.time() - self.created_at
+
     def touch(self):
         """Update access metadata."""
         self.access_count += 1
         self.last_accessed = time.time()
 
 
+class CacheStripe:
+    """
+    One lock-protected LRU shard of a tier.
+
+    Entries are kept in access order, so the least recently used entry is
+    always first and eviction is a single popitem(last=False).
+    """
+
+    def __init__(self, max_bytes: int):
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = Lock()
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def remove(self, key: str) -> Optional[CacheEntry]:
+        """Remove an entry; caller holds the lock."""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size_bytes -= entry.size
+        return entry
+
+    def evict_to_fit(self, incoming: int) -> int:
+        """Drop expired entries at the LRU end, then LRU entries, until incoming bytes fit."""
+        evicted = 0
+        while self.entries:
+            key, entry = next(iter(self.entries.items()))
+            if entry.is_valid() and self.size_bytes + incoming <= self.max_bytes:
+                break
+            self.entries.popitem(last=False)
+            self.size_bytes -= entry.size
+            evicted += 1
+        self.evictions += evicted
+        return evicted
+
+
+class CacheTier:
+    """A named cache tier split into lock stripes that share its byte budget."""
+
+    def __init__(self, name: str, max_bytes: int, stripes: int = DEFAULT_STRIPES):
+        self.name = name
+        self.max_bytes = max_bytes
+        self.stripes = [CacheStripe(max_bytes // stripes) for _ in range(stripes)]
+
+    def stripe(self, cache_key: str) -> CacheStripe:
+        # cache_key is a hex digest, so its prefix is uniformly distributed
+        return self.stripes[int(cache_key[:8], 16) % len(self.stripes)]
+
+    def __len__(self) -> int:
+        return sum(len(stripe.entries) for stripe in self.stripes)
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(stripe.size_bytes for stripe in self.stripes)
+
+    def counters(self) -> Dict[str, int]:
+        return {
+            'hits': sum(stripe.hits for stripe in self.stripes),
+            'misses': sum(stripe.misses for stripe in self.stripes),
+            'evictions': sum(stripe.evictions for stripe in self.stripes),
+        }
+
+    def clear(self):
+        for stripe in self.stripes:
+            with stripe.lock:
+                stripe.entries.clear()
+                stripe.size_bytes = 0
+
+
+class RedisCacheBackend:
+    """
+    Shared L2 store in Redis.
+
+    Entries are written with their tier TTL so Redis expires them on its own.
+    Errors are logged and treated as misses, and the store is bypassed for
+    L2_RETRY_INTERVAL after one so an outage costs a single timeout.
+    """
+
+    def __init__(self, client, prefix: str = 'tge:cache:'):
+        self.client = client
+        self.prefix = prefix
+        self._retry_at = 0.0
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs) -> 'RedisCacheBackend':
+        import redis
+        client = redis.Redis.from_url(url, socket_timeout=0.5, socket_connect_timeout=0.5)
+        return cls(client, **kwargs)
+
+    def key(self, tier: str, cache_key: str) -> str:
+        return f"{self.prefix}{tier}:{cache_key}"
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._retry_at
+
+    def _failed(self, operation: str, error: Exception):
+        logger.warning(f"Redis cache {operation} failed, bypassing L2 for {L2_RETRY_INTERVAL}s: {error}")
+        self._retry_at = time.monotonic() + L2_RETRY_INTERVAL
+
+    def get(self, tier: str, cache_key: str) -> Optional[bytes]:
+        if not self.available:
+            return None
+        try:
+            return self.client.get(self.key(tier, cache_key))
+        except Exception as e:
+            self._failed('get', e)
+            return None
+
+    def set(self, tier: str, cache_key: str, payload: bytes, ttl: float) -> bool:
+        if not self.available:
+            return False
+        try:
+            self.client.set(self.key(tier, cache_key), payload, px=max(1, int(ttl * 1000)))
+            return True
+        except Exception as e:
+            self._failed('set', e)
+            return False
+
+    def delete(self, tier: str, cache_key: str) -> bool:
+        if not self.available:
+            return False
+        try:
+            return bool(self.client.delete(self.key(tier, cache_key)))
+        except Exception as e:
+            self._failed('delete', e)
+            return False
+
+    def clear(self, tier: Optional[str] = None):
+        """Delete every entry of a tier (or all tiers) shared through this store."""
+        if not self.available:
+            return
+        try:
+            batch = []
+            for key in self.client.scan_iter(match=f"{self.prefix}{tier or '*'}:*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    self.client.delete(*batch)
+                    batch = []
+            if batch:
+                self.client.delete(*batch)
+        except Exception as e:
+            self._failed('clear', e)
+
+
 class IntelligentCacheManager:
     """
     Multi-tier cache manager with automatic TTL management.
 
     Cache Tiers:
     - RSS Feed Cache: 10-15 minutes TTL
-    - Twitter User Cache: 1 hour TTL
+    - Twitter User Cache: 7 days TTL
     - Article Content Cache: 3 days TTL
     - Search Results Cache: 5 minutes TTL
 
     Performance Features:
-    - LRU eviction for memory management
-    - Automatic cache warming
+    - Per-tier byte budgets with O(1) LRU eviction
+    - Entry sizes measured once, at insertion
+    - Lock striping instead of one global lock
+    - Optional Redis L2 shared across processes (write-through, compressed)
+    - Single-flight fetches and negative caching in get_or_fetch
+    - Stale-while-revalidate between the soft and hard (tier) TTL
     - Hit rate tracking
     - Conditional requests support (ETags, Last-Modified)
     """
 
-    def __init__(self, max_memory_mb: int = 100):
+    def __init__(self, max_memory_mb: int = 100, tier_budgets: Optional[Dict[str, float]] = None,
+                 stripes: int = DEFAULT_STRIPES, l2: Optional[RedisCacheBackend] = None):
         """
         Initialize cache manager.
 
         Args:
             max_memory_mb: Maximum memory to use for caching (in MB)
+            tier_budgets: Share of the memory limit per tier (defaults to DEFAULT_TIER_BUDGETS)
+            stripes: Lock stripes per tier
+            l2: Shared Redis store behind the in-process tiers
         """
         self.max_memory_bytes = max_memory_mb * 1024 * 1024
 
-        # Cache tiers with different TTLs (in seconds)
-        self.rss_cache: Dict[str, CacheEntry] = OrderedDict()  # 10 min TTL
-        self.twitter_user_cache: Dict[str, CacheEntry] = OrderedDict()  # 1 hour TTL
-        self.article_content_cache: Dict[str, CacheEntry] = OrderedDict()  # 3 days TTL
-        self.search_results_cache: Dict[str, CacheEntry] = OrderedDict()  # 5 min TTL
+        # Cache tiers, each with its own byte budget and locks
+        budgets = tier_budgets or DEFAULT_TIER_BUDGETS
+        self.tiers: Dict[str, CacheTier] = {
+            name: CacheTier(name, int(self.max_memory_bytes * share), stripes)
+            for name, share in budgets.items()
+        }
         self.conditional_headers_cache: Dict[str, Dict] = {}  # ETags and Last-Modified
 
         # TTL configurations
         self.ttls = {
             'rss': 600,  # 10 minutes
-            'twitter_user': 3600,  # 1 hour
+            # Handle -> user ID mappings rarely change
+            'twitter_user': int(os.getenv('TWITTER_USER_CACHE_TTL', 604800)),  # 7 days
             'article_content': 259200,  # 3 days
             'search_results': 300,  # 5 minutes
             'conditional_headers': 86400  # 24 hours
         }
 
-        # Performance metrics
-        self.stats = {
-            'hits': 0,
-            'misses': 0,
-            'evictions': 0,
-            'size_bytes': 0,
-            'tier_stats': {
-                'rss': {'hits': 0, 'misses': 0},
-                'twitter_user': {'hits': 0, 'misses': 0},
-                'article_content': {'hits': 0, 'misses': 0},
-                'search_results': {'hits': 0, 'misses': 0}
-            }
-        }
+        # Past its soft TTL an entry is still served by get_or_fetch, but refreshed in the background
+        self.soft_ttls = {tier: ttl * SOFT_TTL_RATIO for tier, ttl in self.ttls.items()}
 
-        # Thread safety
+        # Guards the conditional headers cache; tiers use their own stripe locks
         self.lock = Lock()
 
+        self.l2 = l2
+        self.counters = {
+            'l2_hits': 0, 'negative_hits': 0, 'coalesced': 0, 'fetch_failures': 0,
+            'stale_hits': 0, 'refreshes': 0, 'refresh_failures': 0
+        }
+        self._counters_lock = Lock()
+
+        # In-flight fetches by (tier, key), shared by concurrent get_or_fetch callers,
+        # and (consecutive failures, retry time) for keys whose refresh failed
+        self._inflight: Dict[Tuple[str, str], Future] = {}
+        self._refresh_failures: Dict[Tuple[str, str], Tuple[int, float]] = {}
+        self._inflight_lock = Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+
         # Persistence
         self.persistence_file = 'state/cache_persistence.json'
         self._load_persistent_cache()
@@ -110,53 +402,79 @@ class IntelligentCacheManager:
 
     def _estimate_size(self, value: Any) -> int:
         """Estimate memory size of cached value."""
+        if isinstance(value, (str, bytes)):
+            return len(value)
         try:
             return len(json.dumps(value, default=str).encode())
         except:
             return 1024  # Default estimate
 
-    def _cleanup_expired(self, cache_dict: Dict[str, CacheEntry]):
-        """Remove expired entries from cache."""
-        expired_keys = [k for k, v in cache_dict.items() if not v.is_valid()]
-        for key in expired_keys:
-            del cache_dict[key]
-            self.stats['evictions'] += 1
+    def _tier(self, tier: str) -> Optional[CacheTier]:
+        cache_tier = self.tiers.get(tier)
+        if cache_tier is None:
+            logger.warning(f"Unknown cache tier: {tier}")
+        return cache_tier
 
-    def _enforce_memory_limit(self):
-        """Evict least recently used entries if memory limit exceeded."""
-        if self.stats['size_bytes'] <= self.max_memory_bytes:
-            return
+    def _count(self, counter: str):
+        with self._counters_lock:
+            self.counters[counter] += 1
 
-        # Collect all entries with access times
-        all_entries = []
-        for cache_name, cache_dict in [
-            ('rss', self.rss_cache),
-            ('twitter_user', self.twitter_user_cache),
-            ('article_content', self.article_content_cache),
-            ('search_results', self.search_results_cache)
-        ]:
-            for key, entry in cache_dict.items():
-                all_entries.append((cache_name, key, entry.last_accessed))
-
-        # Sort by last accessed (oldest first)
-        all_entries.sort(key=lambda x: x[2])
-
-        # Evict oldest entries until under limit
-        evicted = 0
-        for cache_name, key, _ in all_entries:
-            if self.stats['size_bytes'] <= self.max_memory_bytes:
-                break
+    def _lookup(self, tier: str, key: str) -> Tuple[bool, Any, float]:
+        """
+        Find a key in L1, then L2; returns (found, value, age in seconds).
 
-            cache_dict = getattr(self, f"{cache_name}_cache")
-            if key in cache_dict:
-                entry = cache_dict[key]
-                self.stats['size_bytes'] -= self._estimate_size(entry.value)
-                del cache_dict[key]
-                evicted += 1
+        value is NEGATIVE for a cached fetch failure. L2 hits are copied into
+        L1 for the rest of their TTL, keeping the age they were written with.
+        """
+        cache_tier = self._tier(tier)
+        if cache_tier is None:
+            return False, None, 0.0
 
-        if evicted > 0:
-            logger.info(f"Evicted {evicted} cache entries to enforce memory limit")
-            self.stats['evictions'] += evicted
+        cache_key = self._generate_key(key)
+        stripe = cache_tier.stripe(cache_key)
+
+        with stripe.lock:
+            entry = stripe.entries.get(cache_key)
+            if entry is not None:
+                if entry.is_valid():
+                    entry.touch()
+                    stripe.hits += 1
+                    # Move to end for LRU
+                    stripe.entries.move_to_end(cache_key)
+                    logger.debug(f"Cache hit: {tier}/{key[:50]}")
+                    return True, entry.value, entry.age()
+
+                # Expired entry
+                stripe.remove(cache_key)
+                stripe.evictions += 1
+
+        if self.l2 is not None:
+            payload = self.l2.get(tier, cache_key)
+            if payload is not None:
+                try:
+                    value, expires_at = decode_payload(payload)
+                except Exception as e:
+                    logger.debug(f"Unreadable L2 entry {tier}/{key[:50]}: {e}")
+                else:
+                    now = time.time()
+                    if expires_at > now:
+                        if value is NEGATIVE:
+                            ttl, created_at = expires_at - now, now
+                        else:
+                            # Values are written with the full tier TTL, which dates them
+                            ttl = self.ttls.get(tier, 600)
+                            created_at = min(expires_at - ttl, now)
+                        self._store_l1(cache_tier, cache_key, value, ttl, created_at=created_at)
+                        with stripe.lock:
+                            stripe.hits += 1
+                        self._count('l2_hits')
+                        logger.debug(f"Cache hit (L2): {tier}/{key[:50]}")
+                        return True, value, now - created_at
+
+        with stripe.lock:
+            stripe.misses += 1
+        logger.debug(f"Cache miss: {tier}/{key[:50]}")
+        return False, None, 0.0
 
     def get(self, tier: str, key: str) -> Optional[Any]:
         """
@@ -169,42 +487,38 @@ class IntelligentCacheManager:
         Returns:
             Cached value or None if not found/expired
         """
-        with self.lock:
-            cache_dict = getattr(self, f"{tier}_cache", None)
-            if cache_dict is None:
-                logger.warning(f"Unknown cache tier: {tier}")
-                return None
-
-            # Cleanup expired entries periodically
-            if len(cache_dict) % 100 == 0:
-                self._cleanup_expired(cache_dict)
+        found, value, _ = self._lookup(tier, key)
+        if not found or value is NEGATIVE:
+            return None
+        return value
 
-            cache_key = self._generate_key(key)
+    def _store_l1(self, cache_tier: CacheTier, cache_key: str, value: Any, ttl: float,
+                  size: Optional[int] = None, created_at: Optional[float] = None) -> bool:
+        stripe = cache_tier.stripe(cache_key)
+        if size is None:
+            # Measured once here, outside the lock; evictions reuse the recorded size
+            size = self._estimate_size(value)
 
-            if cache_key in cache_dict:
-                entry = cache_dict[cache_key]
+        if size > stripe.max_bytes:
+            # Drop any previous value so the key doesn't keep serving it
+            with stripe.lock:
+                stripe.remove(cache_key)
+            logger.debug(f"Not caching {cache_tier.name} entry in L1: {size} bytes exceeds stripe budget")
+            return False
 
-                if entry.is_valid():
-                    entry.touch()
-                    self.stats['hits'] += 1
-                    self.stats['tier_stats'][tier]['hits'] += 1
+        entry = CacheEntry(value, ttl, size, created_at)
 
-                    # Move to end for LRU
-                    cache_dict.move_to_end(cache_key)
+        with stripe.lock:
+            stripe.remove(cache_key)
+            evicted = stripe.evict_to_fit(size)
+            stripe.entries[cache_key] = entry
+            stripe.size_bytes += size
 
-                    logger.debug(f"Cache hit: {tier}/{key[:50]}")
-                    return entry.value
-                else:
-                    # Expired entry
-                    del cache_dict[cache_key]
-                    self.stats['evictions'] += 1
+        if evicted:
+            logger.debug(f"Evicted {evicted} {cache_tier.name} entries to stay within budget")
+        return True
 
-            self.stats['misses'] += 1
-            self.stats['tier_stats'][tier]['misses'] += 1
-            logger.debug(f"Cache miss: {tier}/{key[:50]}")
-            return None
-
-    def set(self, tier: str, key: str, value: Any) -> bool:
+    def set(self, tier: str, key: str, value: Any, size: Optional[int] = None) -> bool:
         """
         Set value in cache tier.
 
@@ -212,62 +526,167 @@ class IntelligentCacheManager:
             tier: Cache tier name
             key: Cache key
             value: Value to cache
+            size: Size in bytes if already known (skips estimation)
 
         Returns:
             True if successfully cached
         """
-        with self.lock:
-            cache_dict = getattr(self, f"{tier}_cache", None)
-            if cache_dict is None:
-                logger.warning(f"Unknown cache tier: {tier}")
-                return False
+        cache_tier = self._tier(tier)
+        if cache_tier is None:
+            return False
 
-            cache_key = self._generate_key(key)
-            ttl = self.ttls.get(tier, 600)
+        cache_key = self._generate_key(key)
+        ttl = self.ttls.get(tier, 600)
+        stored = self._store_l1(cache_tier, cache_key, value, ttl, size)
 
-            entry = CacheEntry(value, ttl)
-            size = self._estimate_size(value)
+        if self.l2 is not None:
+            payload = encode_payload(value, time.time() + ttl)
+            if payload is None:
+                logger.debug(f"Not sharing {tier}/{key[:50]}: value is not serializable")
+            elif self.l2.set(tier, cache_key, payload, ttl):
+                stored = True
 
-            # Update size tracking
-            if cache_key in cache_dict:
-                old_size = self._estimate_size(cache_dict[cache_key].value)
-                self.stats['size_bytes'] -= old_size
+        logger.debug(f"Cache set: {tier}/{key[:50]}")
+        return stored
 
-            self.stats['size_bytes'] += size
-            cache_dict[cache_key] = entry
-
-            # Enforce memory limit
-            self._enforce_memory_limit()
+    def set_negative(self, tier: str, key: str, ttl: Optional[float] = None):
+        """Remember that fetching a key failed, for at most the tier TTL."""
+        cache_tier = self._tier(tier)
+        if cache_tier is None:
+            return
 
-            logger.debug(f"Cache set: {tier}/{key[:50]} (size: {size} bytes)")
-            return True
+        ttl = min(ttl or NEGATIVE_TTL, self.ttls.get(tier, 600))
+        cache_key = self._generate_key(key)
+        self._store_l1(cache_tier, cache_key, NEGATIVE, ttl, size=64)
+        if self.l2 is not None:
+            self.l2.set(tier, cache_key, encode_payload(NEGATIVE, time.time() + ttl), ttl)
 
     def get_or_fetch(self, tier: str, key: str, fetch_func: Callable[[], Any]) -> Tuple[Any, bool]:
         """
         Cache-aside pattern: get from cache or fetch and cache.
 
+        Concurrent misses for the same key share one fetch. A fetch that
+        raises or returns None is cached as a failure for NEGATIVE_TTL and
+        served as None until then.
+
+        Between the tier's soft TTL and its hard TTL the cached value is
+        returned immediately and fetch_func runs in the background to replace
+        it. A failed refresh leaves the last good value in place until the
+        hard TTL and is retried with exponential backoff.
+
         Args:
             tier: Cache tier name
             key: Cache key
             fetch_func: Function to call if cache miss
 
         Returns:
-            Tuple of (value, was_cached)
+            Tuple of (value, was_cached); was_cached is also True when the
+            value came from another caller's in-flight fetch
         """
         # Try cache first
-        cached_value = self.get(tier, key)
-        if cached_value is not None:
-            return cached_value, True
+        found, value, age = self._lookup(tier, key)
+        if found:
+            if value is NEGATIVE:
+                self._count('negative_hits')
+                return None, True
+            soft_ttl = self.soft_ttls.get(tier)
+            if soft_ttl is not None and age >= soft_ttl:
+                self._count('stale_hits')
+                self._schedule_refresh(tier, key, fetch_func)
+            return value, True
+
+        flight_key = (tier, key)
+        with self._inflight_lock:
+            future = self._inflight.get(flight_key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._inflight[flight_key] = future
+
+        if not leader:
+            self._count('coalesced')
+            try:
+                return future.result(timeout=COALESCE_TIMEOUT), True
+            except Exception as e:
+                logger.warning(f"Waiting on in-flight fetch of {tier}/{key[:50]} failed: {e}")
+                return None, False
 
         # Cache miss - fetch and cache
+        return self._fetch(tier, key, fetch_func, future), False
+
+    def _fetch(self, tier: str, key: str, fetch_func: Callable[[], Any], future: Future,
+               refresh: bool = False) -> Any:
+        """Run the fetch owning an in-flight future, cache the outcome and release its waiters."""
+        flight_key = (tier, key)
+        fetched_value = None
         try:
             fetched_value = fetch_func()
-            if fetched_value is not None:
-                self.set(tier, key, fetched_value)
-            return fetched_value, False
         except Exception as e:
             logger.error(f"Error in fetch function: {e}")
-            return None, False
+
+        try:
+            if fetched_value is not None:
+                self.set(tier, key, fetched_value)
+                if refresh:
+                    with self._inflight_lock:
+                        self._refresh_failures.pop(flight_key, None)
+            elif refresh:
+                # Keep serving the stale value rather than caching the failure
+                self._count('refresh_failures')
+                self._record_refresh_failure(flight_key)
+            else:
+                self._count('fetch_failures')
+                self.set_negative(tier, key)
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(flight_key, None)
+            future.set_result(fetched_value)
+
+        return fetched_value
+
+    def _schedule_refresh(self, tier: str, key: str, fetch_func: Callable[[], Any]) -> bool:
+        """Start a background refresh unless one is in flight or the key is backing off."""
+        flight_key = (tier, key)
+        with self._inflight_lock:
+            if flight_key in self._inflight:
+                return False
+            failure = self._refresh_failures.get(flight_key)
+            if failure is not None and time.monotonic() < failure[1]:
+                return False
+            future = Future()
+            self._inflight[flight_key] = future
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=REFRESH_WORKERS, thread_name_prefix='cache-refresh'
+                )
+            executor = self._refresh_executor
+
+        self._count('refreshes')
+        try:
+            executor.submit(self._fetch, tier, key, fetch_func, future, True)
+        except RuntimeError:
+            # Executor already shut down
+            with self._inflight_lock:
+                self._inflight.pop(flight_key, None)
+            future.set_result(None)
+            return False
+
+        logger.debug(f"Refreshing stale cache entry: {tier}/{key[:50]}")
+        return True
+
+    def _record_refresh_failure(self, flight_key: Tuple[str, str]):
+        with self._inflight_lock:
+            failures, _ = self._refresh_failures.pop(flight_key, (0, 0.0))
+            failures += 1
+            delay = min(REFRESH_BACKOFF_START * 2 ** (failures - 1), REFRESH_BACKOFF_MAX)
+            self._refresh_failures[flight_key] = (failures, time.monotonic() + delay)
+            # Oldest failures first; keep the table bounded
+            while len(self._refresh_failures) > MAX_TRACKED_FAILURES:
+                self._refresh_failures.pop(next(iter(self._refresh_failures)))
+
+        tier, key = flight_key
+        logger.warning(f"Refresh of {tier}/{key[:50]} failed {failures} time(s), "
+                       f"serving cached value and retrying in {delay}s")
 
     def get_conditional_headers(self, url: str) -> Dict[str, str]:
         """
@@ -333,20 +752,20 @@ class IntelligentCacheManager:
         Returns:
             True if entry was invalidated
         """
-        with self.lock:
-            cache_dict = getattr(self, f"{tier}_cache", None)
-            if cache_dict is None:
-                return False
+        cache_tier = self.tiers.get(tier)
+        if cache_tier is None:
+            return False
 
-            cache_key = self._generate_key(key)
-            if cache_key in cache_dict:
-                entry = cache_dict[cache_key]
-                self.stats['size_bytes'] -= self._estimate_size(entry.value)
-                del cache_dict[cache_key]
-                logger.debug(f"Invalidated cache: {tier}/{key[:50]}")
-                return True
+        cache_key = self._generate_key(key)
+        stripe = cache_tier.stripe(cache_key)
+        with stripe.lock:
+            removed = stripe.remove(cache_key) is not None
+        if self.l2 is not None:
+            removed = self.l2.delete(tier, cache_key) or removed
 
-            return False
+        if removed:
+            logger.debug(f"Invalidated cache: {tier}/{key[:50]}")
+        return removed
 
     def clear(self, tier: Optional[str] = None):
         """
@@ -355,48 +774,60 @@ class IntelligentCacheManager:
         Args:
             tier: Cache tier to clear, or None for all tiers
         """
-        with self.lock:
-            if tier:
-                cache_dict = getattr(self, f"{tier}_cache", None)
-                if cache_dict:
-                    cache_dict.clear()
-                    logger.info(f"Cleared {tier} cache")
-            else:
-                self.rss_cache.clear()
-                self.twitter_user_cache.clear()
-                self.article_content_cache.clear()
-                self.search_results_cache.clear()
+        if tier:
+            cache_tier = self.tiers.get(tier)
+            if cache_tier:
+                cache_tier.clear()
+                if self.l2 is not None:
+                    self.l2.clear(tier)
+                logger.info(f"Cleared {tier} cache")
+        else:
+            for cache_tier in self.tiers.values():
+                cache_tier.clear()
+            if self.l2 is not None:
+                self.l2.clear()
+            with self.lock:
                 self.conditional_headers_cache.clear()
-                self.stats['size_bytes'] = 0
-                logger.info("Cleared all caches")
+            logger.info("Cleared all caches")
 
     def get_stats(self) -> Dict:
         """Get cache performance statistics."""
-        with self.lock:
-            total_requests = self.stats['hits'] + self.stats['misses']
-            hit_rate = (self.stats['hits'] / total_requests * 100) if total_requests > 0 else 0
-
-            tier_stats = {}
-            for tier_name, tier_data in self.stats['tier_stats'].items():
-                tier_requests = tier_data['hits'] + tier_data['misses']
-                tier_hit_rate = (tier_data['hits'] / tier_requests * 100) if tier_requests > 0 else 0
-                tier_stats[tier_name] = {
-                    'hit_rate': round(tier_hit_rate, 2),
-                    'hits': tier_data['hits'],
-                    'misses': tier_data['misses'],
-                    'size': len(getattr(self, f"{tier_name}_cache"))
-                }
-
-            return {
-                'overall_hit_rate': round(hit_rate, 2),
-                'total_hits': self.stats['hits'],
-                'total_misses': self.stats['misses'],
-                'total_evictions': self.stats['evictions'],
-                'memory_used_mb': round(self.stats['size_bytes'] / (1024 * 1024), 2),
-                'memory_limit_mb': round(self.max_memory_bytes / (1024 * 1024), 2),
-                'tier_stats': tier_stats,
-                'conditional_headers_cached': len(self.conditional_headers_cache)
+        tier_stats = {}
+        hits = misses = evictions = size_bytes = 0
+
+        for tier_name, cache_tier in self.tiers.items():
+            counters = cache_tier.counters()
+            tier_requests = counters['hits'] + counters['misses']
+            tier_hit_rate = (counters['hits'] / tier_requests * 100) if tier_requests > 0 else 0
+            tier_size = cache_tier.size_bytes
+            tier_stats[tier_name] = {
+                'hit_rate': round(tier_hit_rate, 2),
+                'hits': counters['hits'],
+                'misses': counters['misses'],
+                'size': len(cache_tier),
+                'memory_used_mb': round(tier_size / (1024 * 1024), 2),
+                'memory_limit_mb': round(cache_tier.max_bytes / (1024 * 1024), 2)
             }
+            hits += counters['hits']
+            misses += counters['misses']
+            evictions += counters['evictions']
+            size_bytes += tier_size
+
+        total_requests = hits + misses
+        hit_rate = (hits / total_requests * 100) if total_requests > 0 else 0
+
+        return {
+            'overall_hit_rate': round(hit_rate, 2),
+            'total_hits': hits,
+            'total_misses': misses,
+            'total_evictions': evictions,
+            'memory_used_mb': round(size_bytes / (1024 * 1024), 2),
+            'memory_limit_mb': round(self.max_memory_bytes / (1024 * 1024), 2),
+            'tier_stats': tier_stats,
+            'conditional_headers_cached': len(self.conditional_headers_cache),
+            'l2_enabled': self.l2 is not None,
+            **self.counters
+        }
 
     def _load_persistent_cache(self):
         """Load cache from disk for critical data."""
@@ -434,9 +865,16 @@ class IntelligentCacheManager:
         logger.info("Cache manager cleanup started")
 
         # Cleanup all tiers
-        for cache_dict in [self.rss_cache, self.twitter_user_cache,
-                          self.article_content_cache, self.search_results_cache]:
-            self._cleanup_expired(cache_dict)
+        for cache_tier in self.tiers.values():
+            for stripe in cache_tier.stripes:
+                with stripe.lock:
+                    expired = [k for k, entry in stripe.entries.items() if not entry.is_valid()]
+                    for key in expired:
+                        stripe.remove(key)
+                    stripe.evictions += len(expired)
+
+        if self._refresh_executor is not None:
+            self._refresh_executor.shutdown(wait=False)
 
         # Save persistent data
         self.save_persistent_cache()
@@ -448,11 +886,28 @@ class IntelligentCacheManager:
 
 # Global cache instance
 _cache_manager = None
+_l2_backend = None
+_l2_configured = False
+
+
+def get_l2_backend() -> Optional[RedisCacheBackend]:
+    """Shared Redis store from CACHE_REDIS_URL, or None when it is not configured."""
+    global _l2_backend, _l2_configured
+    if not _l2_configured:
+        _l2_configured = True
+        redis_url = os.getenv('CACHE_REDIS_URL')
+        if redis_url:
+            try:
+                _l2_backend = RedisCacheBackend.from_url(redis_url)
+                logger.info("Shared Redis cache (L2) enabled")
+            except Exception as e:
+                logger.warning(f"Could not configure shared Redis cache: {e}")
+    return _l2_backend
 
 
 def get_cache_manager() -> IntelligentCacheManager:
     """Get global cache manager instance."""
     global _cache_manager
     if _cache_manager is None:
-        _cache_manager = IntelligentCacheManager()
+        _cache_manager = IntelligentCacheManager(l2=get_l2_backend())
     return _cache_manager
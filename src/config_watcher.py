@@ -0,0 +1,192 @@
+"""
+Hot reload of monitored companies and feeds
+Polls the config_changes log written by the Company/Feed ORM listeners, so a
+running monitor picks up companies and feeds added, edited or removed through
+the API with one indexed query per poll instead of a restart
+"""
+
+import os
+import time
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set
+
+from .database import DatabaseManager
+from .models import Company, ConfigChange, Feed
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between change-log queries
+CONFIG_POLL_INTERVAL = float(os.getenv('CONFIG_POLL_INTERVAL', 30))
+
+# Changes applied per query; a larger backlog is worked through on later polls
+CONFIG_CHANGE_BATCH = 500
+
+# Company fields the analyzers use (the shape of config.COMPANIES entries)
+COMPANY_FIELDS = ('name', 'aliases', 'tokens', 'exclusions', 'priority', 'status')
+
+
+def company_config(company: Company) -> Dict:
+    """A Company row in the shape of a config.COMPANIES entry."""
+    return {
+        'name': company.name,
+        'aliases': list(company.aliases or []),
+        'tokens': list(company.tokens or []),
+        'exclusions': list(company.exclusions or []),
+        'priority': company.priority or 'MEDIUM',
+        'status': company.status or 'active',
+    }
+
+
+@dataclass
+class ConfigUpdate:
+    """Companies and feeds after a poll, and what changed since the last one."""
+
+    companies: List[Dict]
+    feeds: List[str]
+    watermark: int
+    changed_companies: Set[str] = field(default_factory=set)
+    added_feeds: List[str] = field(default_factory=list)
+    removed_feeds: List[str] = field(default_factory=list)
+
+    @property
+    def companies_changed(self) -> bool:
+        return bool(self.changed_companies)
+
+    @property
+    def feeds_changed(self) -> bool:
+        return bool(self.added_feeds or self.removed_feeds)
+
+
+class ConfigWatcher:
+    """
+    Tracks the database's companies and active feeds for a running monitor.
+
+    The first poll loads everything and remembers the newest change id as
+    the watermark; later polls fetch only change-log rows above it and
+    reload just the companies and feeds they name. When the database has
+    no companies (or no active feeds) the config defaults are used, as
+    when the monitor starts.
+    """
+
+    def __init__(self, default_companies: List[Dict], default_feeds: List[str],
+                 session_factory: Optional[Callable] = None,
+                 poll_interval: float = CONFIG_POLL_INTERVAL):
+        self.default_companies = default_companies
+        self.default_feeds = default_feeds
+        self.session_factory = session_factory or DatabaseManager.get_session
+        self.poll_interval = poll_interval
+        self.watermark: Optional[int] = None
+        self._companies: Dict[int, Dict] = {}
+        self._feeds: Dict[int, str] = {}
+        self._next_poll = 0.0
+
+    @property
+    def companies(self) -> List[Dict]:
+        return list(self._companies.values()) or self.default_companies
+
+    @property
+    def feeds(self) -> List[str]:
+        return list(self._feeds.values()) or self.default_feeds
+
+    def load(self) -> ConfigUpdate:
+        """Load every company and active feed and start watching from the newest change."""
+        before_companies, before_feeds = self.companies, self.feeds
+
+        with self.session_factory() as db:
+            watermark = db.query(ConfigChange.id).order_by(ConfigChange.id.desc()).limit(1).scalar() or 0
+            self._companies = {c.id: company_config(c) for c in db.query(Company).order_by(Company.id)}
+            self._feeds = {
+                f.id: f.url for f in db.query(Feed).filter(Feed.is_active == True).order_by(Feed.id)
+            }
+
+        self.watermark = watermark
+        logger.info(f"Loaded {len(self._companies)} companies and {len(self._feeds)} active feeds "
+                    f"from database (change watermark {watermark})")
+        return self._update(before_companies, before_feeds)
+
+    def poll(self, force: bool = False) -> Optional[ConfigUpdate]:
+        """
+        Apply changes recorded since the last poll.
+
+        Returns None when nothing changed (or the poll interval has not
+        passed), otherwise the current companies and feeds and what changed.
+        """
+        now = time.monotonic()
+        if not force and now < self._next_poll:
+            return None
+        self._next_poll = now + self.poll_interval
+
+        if self.watermark is None:
+            update = self.load()
+            return update if update.companies_changed or update.feeds_changed else None
+
+        before_companies, before_feeds = self.companies, self.feeds
+        with self.session_factory() as db:
+            changes = (
+                db.query(ConfigChange)
+                .filter(ConfigChange.id > self.watermark)
+                .order_by(ConfigChange.id)
+                .limit(CONFIG_CHANGE_BATCH)
+                .all()
+            )
+            if not changes:
+                return None
+
+            company_ids = {c.entity_id for c in changes if c.entity == 'company'}
+            feed_ids = {c.entity_id for c in changes if c.entity == 'feed'}
+
+            # Current rows decide the outcome, so repeated edits collapse into one
+            if company_ids:
+                rows = {c.id: c for c in db.query(Company).filter(Company.id.in_(company_ids))}
+                for company_id in company_ids:
+                    if company_id in rows:
+                        self._companies[company_id] = company_config(rows[company_id])
+                    else:
+                        self._companies.pop(company_id, None)
+                self._companies = dict(sorted(self._companies.items()))
+
+            if feed_ids:
+                rows = {f.id: f for f in db.query(Feed).filter(Feed.id.in_(feed_ids))}
+                for feed_id in feed_ids:
+                    feed = rows.get(feed_id)
+                    if feed is not None and feed.is_active:
+                        self._feeds[feed_id] = feed.url
+                    else:
+                        self._feeds.pop(feed_id, None)
+                self._feeds = dict(sorted(self._feeds.items()))
+
+        self.watermark = changes[-1].id
+        update = self._update(before_companies, before_feeds)
+        logger.info(f"Applied {len(changes)} config changes (watermark {self.watermark}): "
+                    f"{len(update.changed_companies)} companies changed, "
+                    f"{len(update.added_feeds)} feeds added, {len(update.removed_feeds)} removed")
+        return update
+
+    def _update(self, before_companies: List[Dict], before_feeds: List[str]) -> ConfigUpdate:
+        companies, feeds = self.companies, self.feeds
+
+        before = {c['name']: c for c in before_companies}
+        after = {c['name']: c for c in companies}
+        changed = {name for name in before.keys() | after.keys()
+                   if _matching_fields(before.get(name)) != _matching_fields(after.get(name))}
+
+        before_feed_set, feed_set = set(before_feeds), set(feeds)
+        return ConfigUpdate(
+            companies=companies,
+            feeds=feeds,
+            watermark=self.watermark or 0,
+            changed_companies=changed,
+            added_feeds=[url for url in feeds if url not in before_feed_set],
+            removed_feeds=[url for url in before_feeds if url not in feed_set],
+        )
+
+
+def _matching_fields(company: Optional[Dict]) -> Optional[tuple]:
+    if company is None:
+        return None
+    return tuple(
+        tuple(value) if isinstance(value, list) else value
+        for value in (company.get(name, [] if name in ('aliases', 'tokens', 'exclusions') else None)
+                      for name in COMPANY_FIELDS)
+    )
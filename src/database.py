@@ -1,15 +1,23 @@
 """
 Database configuration and connection management for TGE Monitor
 PostgreSQL with SQLAlchemy ORM for enhanced data persistence
+
+Engines and the Redis client are created by factories on first use rather
+than at import, so CLI modes and workers that never touch the database or
+cache don't pay for connection setup. The module attributes ``engine``,
+``async_engine``, ``AsyncSessionLocal`` and ``redis_client`` remain available
+and resolve through those factories.
 """
 
 import os
+import asyncio
 import logging
+import threading
 from sqlalchemy import create_engine, MetaData
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
-from typing import Generator
+from typing import Generator, AsyncGenerator, Optional
 import redis
 from contextlib import contextmanager
 
@@ -27,9 +35,10 @@ if not DATABASE_URL:
 # Redis configuration for caching
 REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
 
-# SQLAlchemy setup with optimized connection pooling
-# Configure engine based on database type (PostgreSQL vs SQLite)
-if 'sqlite' in DATABASE_URL.lower():
+IS_SQLITE = 'sqlite' in DATABASE_URL.lower()
+
+# Configuration is validated at import so misconfiguration still fails fast
+if IS_SQLITE:
     logger.warning("=" * 80)
     logger.warning("SQLite database detected")
     logger.warning("SQLite is NOT recommended for production!")
@@ -43,16 +52,29 @@ if 'sqlite' in DATABASE_URL.lower():
             "Please configure PostgreSQL via DATABASE_URL environment variable."
         )
 
-    # SQLite configuration (for testing/development only)
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-        echo=False
-    )
-else:
+_engine = None
+_async_engine = None
+_async_sessionmaker = None
+_async_configured = False
+_redis_client = None
+_redis_configured = False
+_engine_lock = threading.Lock()
+_redis_lock = threading.Lock()
+
+
+def _create_engine():
+    """Create the sync engine with pooling tuned for the database type."""
+    if IS_SQLITE:
+        # SQLite configuration (for testing/development only)
+        return create_engine(
+            DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+            echo=False
+        )
+
     # PostgreSQL configuration (for production)
-    engine = create_engine(
+    return create_engine(
         DATABASE_URL,
         # Connection pool configuration for high performance
         pool_size=20,              # Base pool size for concurrent connections
@@ -70,17 +92,166 @@ else:
         }
     )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+def get_engine():
+    """Return the sync engine, creating it on first use."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = _create_engine()
+                SessionLocal.configure(bind=_engine)
+    return _engine
+
+
+class LazySessionmaker(sessionmaker):
+    """sessionmaker that creates the engine when the first session is opened."""
+
+    def __call__(self, **local_kw):
+        if self.kw.get('bind') is None and 'bind' not in local_kw:
+            get_engine()
+        return super().__call__(**local_kw)
+
+
+SessionLocal = LazySessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
-# Redis client
-try:
-    redis_client = redis.from_url(REDIS_URL, decode_responses=True)
-    redis_client.ping()  # Test connection
-    logger.info("Redis connection established")
-except Exception as e:
-    logger.warning(f"Redis connection failed: {e}. Caching will be disabled.")
-    redis_client = None
+
+def get_async_database_url(url: str) -> Optional[str]:
+    """Map a sync DATABASE_URL onto its async driver equivalent (asyncpg/aiosqlite)"""
+    if url.startswith(('postgresql://', 'postgresql+psycopg2://', 'postgres://')):
+        # asyncpg takes "ssl" rather than libpq's "sslmode" (same mode names)
+        return 'postgresql+asyncpg://' + url.split('://', 1)[1].replace('sslmode=', 'ssl=')
+    if url.startswith('sqlite://'):
+        # An in-memory SQLite database is private to its engine, so an async
+        # engine would see a different (empty) database than the sync one
+        if ':memory:' in url or url in ('sqlite://', 'sqlite:///'):
+            return None
+        return 'sqlite+aiosqlite://' + url.split('://', 1)[1]
+    return None
+
+
+ASYNC_DATABASE_URL = get_async_database_url(DATABASE_URL)
+
+
+def get_async_sessionmaker():
+    """
+    Return the async sessionmaker for non-blocking reads from FastAPI endpoints,
+    configuring the async engine on first use.
+
+    Returns None when the async driver (asyncpg / aiosqlite) is not installed
+    or the URL is unsupported; callers then run the sync session in a worker
+    thread.
+    """
+    global _async_engine, _async_sessionmaker, _async_configured
+    if _async_configured:
+        return _async_sessionmaker
+
+    with _engine_lock:
+        if _async_configured:
+            return _async_sessionmaker
+        if ASYNC_DATABASE_URL and os.getenv('ASYNC_DATABASE_ENABLED', 'true').lower() == 'true':
+            try:
+                from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+                if ASYNC_DATABASE_URL.startswith('sqlite'):
+                    _async_engine = create_async_engine(ASYNC_DATABASE_URL, echo=False)
+                else:
+                    _async_engine = create_async_engine(
+                        ASYNC_DATABASE_URL,
+                        pool_size=20,
+                        max_overflow=10,
+                        pool_timeout=30,
+                        pool_recycle=3600,
+                        pool_pre_ping=True,
+                        echo=False,
+                        execution_options={
+                            "isolation_level": "READ COMMITTED"
+                        }
+                    )
+
+                _async_sessionmaker = async_sessionmaker(
+                    _async_engine,
+                    class_=AsyncSession,
+                    autoflush=False,
+                    expire_on_commit=False
+                )
+                logger.info("Async database engine configured")
+            except ImportError as e:
+                logger.warning(f"Async database driver unavailable ({e}). Using threaded sync sessions.")
+                _async_engine = None
+                _async_sessionmaker = None
+        _async_configured = True
+    return _async_sessionmaker
+
+
+class ThreadedSession:
+    """Async facade over a sync Session that runs each statement in a worker thread
+
+    Exposes the subset of the AsyncSession API used by the read endpoints so they
+    never block the event loop, even without an async driver installed.
+    """
+
+    def __init__(self, session):
+        self.sync_session = session
+
+    async def execute(self, statement, *args, **kwargs):
+        """Execute a statement and return a buffered result"""
+        frozen = await asyncio.to_thread(
+            lambda: self.sync_session.execute(statement, *args, **kwargs).freeze()
+        )
+        return frozen()
+
+    async def scalar(self, statement, *args, **kwargs):
+        """Execute a statement and return the first column of the first row"""
+        return await asyncio.to_thread(self.sync_session.scalar, statement, *args, **kwargs)
+
+    async def scalars(self, statement, *args, **kwargs):
+        """Execute a statement and return scalar results"""
+        result = await self.execute(statement, *args, **kwargs)
+        return result.scalars()
+
+    async def get(self, entity, ident, **kwargs):
+        """Get an instance by primary key"""
+        return await asyncio.to_thread(self.sync_session.get, entity, ident, **kwargs)
+
+    async def close(self):
+        """Close the underlying sync session"""
+        await asyncio.to_thread(self.sync_session.close)
+
+
+def get_redis_client():
+    """Return the Redis client, connecting on first use; None when Redis is unreachable."""
+    global _redis_client, _redis_configured
+    if _redis_configured:
+        return _redis_client
+
+    with _redis_lock:
+        if not _redis_configured:
+            try:
+                client = redis.from_url(REDIS_URL, decode_responses=True)
+                client.ping()  # Test connection
+                _redis_client = client
+                logger.info("Redis connection established")
+            except Exception as e:
+                logger.warning(f"Redis connection failed: {e}. Caching will be disabled.")
+                _redis_client = None
+            _redis_configured = True
+    return _redis_client
+
+
+def __getattr__(name: str):
+    # Lazily created connections, kept importable under their historical names
+    if name == 'engine':
+        return get_engine()
+    if name == 'AsyncSessionLocal':
+        return get_async_sessionmaker()
+    if name == 'async_engine':
+        get_async_sessionmaker()
+        return _async_engine
+    if name == 'redis_client':
+        return get_redis_client()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class DatabaseManager:
@@ -95,6 +266,20 @@ class DatabaseManager:
         finally:
             db.close()
     
+    @staticmethod
+    async def get_async_db() -> AsyncGenerator:
+        """Get async database session dependency for FastAPI read endpoints"""
+        async_session_factory = get_async_sessionmaker()
+        if async_session_factory is not None:
+            async with async_session_factory() as db:
+                yield db
+        else:
+            db = ThreadedSession(SessionLocal())
+            try:
+                yield db
+            finally:
+                await db.close()
+    
     @staticmethod
     @contextmanager
     def get_session():
@@ -109,7 +294,7 @@ class DatabaseManager:
     def create_tables():
         """Create all database tables"""
         try:
-            Base.metadata.create_all(bind=engine)
+            Base.metadata.create_all(bind=get_engine())
             logger.info("Database tables created successfully")
         except Exception as e:
             logger.error(f"Failed to create database tables: {e}")
@@ -119,7 +304,7 @@ class DatabaseManager:
     def drop_tables():
         """Drop all database tables (use with caution)"""
         try:
-            Base.metadata.drop_all(bind=engine)
+            Base.metadata.drop_all(bind=get_engine())
             logger.info("Database tables dropped successfully")
         except Exception as e:
             logger.error(f"Failed to drop database tables: {e}")
@@ -129,7 +314,7 @@ class DatabaseManager:
     def check_connection():
         """Check database connectivity"""
         try:
-            with engine.connect() as conn:
+            with get_engine().connect() as conn:
                 from sqlalchemy import text
                 conn.execute(text("SELECT 1"))
             return True
@@ -144,6 +329,7 @@ class CacheManager:
     @staticmethod
     def get(key: str) -> str:
         """Get value from cache"""
+        redis_client = get_redis_client()
         if not redis_client:
             return None
         try:
@@ -155,6 +341,7 @@ class CacheManager:
     @staticmethod
     def set(key: str, value: str, expire: int = 3600):
         """Set value in cache with expiration"""
+        redis_client = get_redis_client()
         if not redis_client:
             return False
         try:
@@ -166,6 +353,7 @@ class CacheManager:
     @staticmethod
     def delete(key: str):
         """Delete key from cache"""
+        redis_client = get_redis_client()
         if not redis_client:
             return False
         try:
@@ -177,6 +365,7 @@ class CacheManager:
     @staticmethod
     def exists(key: str) -> bool:
         """Check if key exists in cache"""
+        redis_client = get_redis_client()
         if not redis_client:
             return False
         try:
@@ -188,6 +377,7 @@ class CacheManager:
     @staticmethod
     def get_keys(pattern: str = "*"):
         """Get all keys matching pattern"""
+        redis_client = get_redis_client()
         if not redis_client:
             return []
         try:
@@ -218,6 +408,7 @@ if __name__ == "__main__":
         print("✗ Database connection failed")
     
     print("Testing Redis connection...")
+    redis_client = get_redis_client()
     if redis_client and redis_client.ping():
         print("✓ Redis connection successful")
     else:
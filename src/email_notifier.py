@@ -2,9 +2,16 @@
 Email Notification System for Crypto TGE Alerts
 """
 
+import hashlib
+import json
 import smtplib
 import logging
+import threading
 import time
+from collections import OrderedDict, deque
+from functools import lru_cache
+from html import escape
+from string import Formatter
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timezone
@@ -13,6 +20,584 @@ from typing import List, Dict, Optional
 from config import EMAIL_CONFIG, COMPANIES, TGE_KEYWORDS  # COMPANIES/KEYWORDS used in footer
 
 
+# -------------------------
+# Precompiled email templates
+# -------------------------
+class CompiledTemplate:
+    """
+    str.format-style template parsed once into literal text and field slots.
+
+    render() fills the slots with a single join instead of re-parsing the
+    template or concatenating strings. Field values are inserted verbatim,
+    so callers sanitize them first.
+    """
+
+    def __init__(self, source: str):
+        self._parts = []
+        for literal, field, _, _ in Formatter().parse(source):
+            if literal:
+                self._parts.append((True, literal))
+            if field is not None:
+                self._parts.append((False, field))
+
+    def render(self, fields: Dict) -> str:
+        return "".join(value if is_literal else str(fields[value]) for is_literal, value in self._parts)
+
+
+# Rendered per-alert fragments kept for reuse across digests and re-sends
+FRAGMENT_CACHE_SIZE = 2048
+
+EMAIL_HEAD_TEMPLATE = CompiledTemplate("""        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <style>
+                body {{
+                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+                    line-height: 1.6;
+                    color: #2c3e50;
+                    max-width: 800px;
+                    margin: 0 auto;
+                    padding: 20px;
+                    background-color: #f8f9fa;
+                }}
+                .container {{
+                    background-color: white;
+                    border-radius: 12px;
+                    padding: 30px;
+                    box-shadow: 0 4px 20px rgba(0,0,0,0.08);
+                    border: 1px solid #e9ecef;
+                }}
+                .header {{
+                    text-align: center;
+                    border-bottom: 2px solid #007bff;
+                    padding-bottom: 25px;
+                    margin-bottom: 30px;
+                }}
+                .header h1 {{
+                    color: #007bff;
+                    margin: 0 0 10px 0;
+                    font-size: 28px;
+                    font-weight: 700;
+                }}
+                .header p {{
+                    margin: 5px 0;
+                    color: #6c757d;
+                }}
+                .alert-section {{
+                    margin-bottom: 35px;
+                    border: 1px solid #dee2e6;
+                    border-radius: 10px;
+                    overflow: hidden;
+                    box-shadow: 0 2px 8px rgba(0,0,0,0.04);
+                }}
+                .alert-header {{
+                    background: linear-gradient(135deg, #007bff 0%, #0056b3 100%);
+                    color: white;
+                    padding: 15px 20px;
+                    font-weight: 700;
+                    font-size: 16px;
+                }}
+                .alert-content {{ padding: 20px; }}
+                .alert-item {{
+                    border-bottom: 1px solid #f1f3f4;
+                    padding: 20px 0;
+                    transition: background-color 0.2s ease;
+                }}
+                .alert-item:last-child {{ border-bottom: none; }}
+                .alert-item:hover {{ background-color: #f8f9fa; }}
+                .alert-title {{
+                    font-size: 16px;
+                    font-weight: 600;
+                    color: #1a365d;
+                    margin-bottom: 8px;
+                    line-height: 1.4;
+                }}
+                .alert-meta {{
+                    font-size: 13px;
+                    color: #718096;
+                    margin-bottom: 12px;
+                }}
+                .companies, .keywords, .tokens, .score {{
+                    padding: 6px 12px;
+                    border-radius: 6px;
+                    margin: 4px 6px 4px 0;
+                    display: inline-block;
+                    font-size: 12px;
+                    font-weight: 500;
+                }}
+                .companies {{
+                    background-color: #e3f2fd;
+                    color: #1565c0;
+                    border: 1px solid #bbdefb;
+                }}
+                .keywords {{
+                    background-color: #fff8e1;
+                    color: #ef6c00;
+                    border: 1px solid #ffcc02;
+                }}
+                .tokens {{
+                    background-color: #f3e5f5;
+                    color: #7b1fa2;
+                    border: 1px solid #ce93d8;
+                }}
+                .score {{
+                    background-color: #e8f5e8;
+                    color: #2e7d32;
+                    border: 1px solid #c8e6c9;
+                    font-weight: 600;
+                }}
+                .tweet-content {{
+                    background: #f8f9fa;
+                    padding: 16px;
+                    border-radius: 8px;
+                    border-left: 4px solid #007bff;
+                    margin: 12px 0;
+                    font-style: italic;
+                    color: #495057;
+                }}
+                .summary-content {{
+                    background-color: #f8f9fa;
+                    padding: 16px;
+                    border-radius: 8px;
+                    border-left: 4px solid #28a745;
+                    font-size: 14px;
+                    color: #495057;
+                    line-height: 1.5;
+                }}
+                .footer {{
+                    text-align: center;
+                    margin-top: 30px;
+                    padding-top: 20px;
+                    border-top: 2px solid #e9ecef;
+                    color: #6c757d;
+                    font-size: 13px;
+                }}
+                .link {{
+                    color: #007bff;
+                    text-decoration: none;
+                    font-weight: 500;
+                    padding: 8px 16px;
+                    background-color: #f8f9fa;
+                    border: 1px solid #dee2e6;
+                    border-radius: 6px;
+                    display: inline-block;
+                    margin: 8px 0;
+                    transition: all 0.2s ease;
+                }}
+                .link:hover {{
+                    background-color: #007bff;
+                    color: white;
+                    text-decoration: none;
+                }}
+                @media only screen and (max-width: 600px) {{
+                    body {{ padding: 10px; }}
+                    .container {{ padding: 20px; }}
+                    .alert-content {{ padding: 15px; }}
+                    .companies, .keywords, .score {{
+                        display: block;
+                        margin: 4px 0;
+                    }}
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>🚀 Crypto TGE Monitor Alert</h1>
+                    <p>Token Generation Event Detection Report</p>
+                    <p><strong>{ts}</strong></p>
+                    {rl_banner}
+                </div>
+                
+                <div style="background-color: #e3f2fd; border: 2px solid #1976d2; border-radius: 8px; padding: 20px; margin: 20px 0;">
+                    <h2 style="margin-top: 0; color: #1976d2;">📋 Alert Summary</h2>
+                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px;">
+                        <div>
+                            <strong>Total Alerts:</strong> {total_count}<br>
+                            <strong>News Alerts:</strong> {news_count}<br>
+                            <strong>Twitter Alerts:</strong> {twitter_count}
+                        </div>
+                        <div>
+                            <strong>Companies Detected:</strong> {company_count}<br>
+                            <strong>High Priority:</strong> {high_priority_count}<br>
+                            <strong>High Confidence Alerts:</strong> {high_confidence_count}
+                        </div>
+                    </div>
+                    {companies_line}
+                    {high_priority_line}
+                </div>
+""")
+
+RATE_LIMIT_BANNER = (
+    '<div style="background:#fff3cd;border:1px solid #ffeeba;padding:10px;'
+    'border-radius:6px;margin-bottom:16px;">'
+    '⚠️ Twitter/API rate limiting detected this cycle — results may be partial.'
+    '</div>'
+)
+
+COMPANIES_LINE = CompiledTemplate(
+    '<div style="margin-top: 15px;"><strong>🏢 Companies:</strong> {companies}</div>'
+)
+HIGH_PRIORITY_LINE = CompiledTemplate(
+    '<div style="margin-top: 10px;"><strong>🚨 High Priority Companies:</strong> '
+    '<span style="color: #d32f2f; font-weight: bold;">{companies}</span></div>'
+)
+
+SECTION_OPEN_TEMPLATE = CompiledTemplate("""
+                <div class="alert-section">
+                    <div class="alert-header">{heading} ({count} found)</div>
+                    <div class="alert-content">
+""")
+SECTION_CLOSE = "</div></div>"
+
+COMPANY_TAG = CompiledTemplate('<span class="companies" title="Priority: {priority}">🏢 {name}</span>')
+KEYWORD_TAG = CompiledTemplate('<span class="keywords" title="Strategy: {strategy}">🔑 {name}</span>')
+TOKEN_TAG = CompiledTemplate('<span class="tokens" title="Token Symbol">🪙 {name}</span>')
+SCORE_TAG = CompiledTemplate('<span class="score" title="Strategy: {strategy}">📊 {confidence}% confidence</span>')
+NONE_DETECTED = '<span style="color: #666;">None detected</span>'
+
+MATCH_REASONS_TEMPLATE = CompiledTemplate("""
+                    <div style="margin: 8px 0; padding: 8px; background-color: #e8f5e9; border-left: 4px solid #4caf50; border-radius: 4px;">
+                        <strong>✅ Match Reasons:</strong>
+                        <ul style="margin: 4px 0; padding-left: 20px;">
+                    {reasons}</ul></div>""")
+
+NEWS_ITEM_TEMPLATE = CompiledTemplate("""
+                        <div class="alert-item">
+                            <div class="alert-title">{title}</div>
+                            <div class="company-info" style="margin: 8px 0; padding: 8px; background-color: #f0f8ff; border-left: 4px solid #007bff; border-radius: 4px;">
+                                <strong>🎯 Detected Companies:</strong> {companies}
+                            </div>
+                            <div class="alert-meta">
+                                <strong>Source:</strong> {source_name} |
+                                <strong>Published:</strong> {published}
+                            </div>
+                            <div><a href="{link}" class="link" target="_blank" rel="noopener noreferrer">Read Full Article →</a></div>
+                            <div class="keyword-info" style="margin: 8px 0; padding: 8px; background-color: #fff8e1; border-left: 4px solid #ffa000; border-radius: 4px;">
+                                <strong>🔍 Triggering Keywords:</strong> {keywords}
+                                {token_line}
+                            </div>
+                            <div style="margin-top: 8px;">{score}</div>
+                            {match_reasons}
+                            <div class="summary-content" style="margin-top: 12px;">
+                                {summary}
+                            </div>
+                        </div>
+""")
+
+TWEET_ITEM_TEMPLATE = CompiledTemplate("""
+                        <div class="alert-item">
+                            <div class="alert-title">@{screen_name} - {user_name}</div>
+                            <div class="company-info" style="margin: 8px 0; padding: 8px; background-color: #f0f8ff; border-left: 4px solid #007bff; border-radius: 4px;">
+                                <strong>🎯 Detected Companies:</strong> {companies}
+                            </div>
+                            <div class="alert-meta">
+                                <strong>Posted:</strong> {posted} |
+                                <strong>Engagement:</strong> {retweets} RTs, {likes} Likes |
+                                <strong>Followers:</strong> {followers}
+                            </div>
+                            <div><a href="{url}" class="link" target="_blank" rel="noopener noreferrer">View Tweet →</a></div>
+                            <div class="tweet-content">{text}</div>
+                            <div class="keyword-info" style="margin: 8px 0; padding: 8px; background-color: #fff8e1; border-left: 4px solid #ffa000; border-radius: 4px;">
+                                <strong>🔍 Triggering Keywords:</strong> {keywords}
+                                {token_line}
+                            </div>
+                            <div style="margin-top: 8px;">{score}</div>
+                            {match_reasons}
+                        </div>
+""")
+
+FOOTER_TEMPLATE = CompiledTemplate("""
+                <div class="footer">
+                    <p>This alert was generated by the Crypto TGE Monitor system.</p>
+                    <p>Monitor configured for {company_count} companies and {keyword_count} TGE keywords.</p>
+                    <p>Last updated: {updated}</p>
+                </div>
+            </div>
+        </body>
+        </html>
+        """)
+
+
+@lru_cache(maxsize=4096)
+def sanitize_label(value: str) -> str:
+    """Sanitize a short label that repeats across alerts (company, keyword, match reason)."""
+    from utils import sanitize_text
+    return sanitize_text(value, max_length=1024 * 1024, escape_html=True)
+
+
+class SMTPConnectionPool:
+    """
+    Keeps one authenticated SMTP session open and reuses it across sends.
+
+    The EHLO/STARTTLS/login handshake runs once per session instead of once
+    per email. A session idle for longer than ``noop_interval`` is checked
+    with NOOP before reuse and replaced if the server has dropped it.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: str,
+        password: str,
+        timeout: float = 20,
+        noop_interval: float = 30,
+        starttls: bool = True,
+        logger: Optional[logging.Logger] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.timeout = timeout
+        self.noop_interval = noop_interval
+        self.starttls = starttls
+        self.logger = logger or logging.getLogger("email_notifier")
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+        self.stats = {
+            'connections': 0,
+            'reused': 0,
+            'noop_failures': 0,
+            'messages_sent': 0
+        }
+
+    @property
+    def connected(self) -> bool:
+        return self._server is not None
+
+    def _connect(self) -> smtplib.SMTP:
+        use_ssl = str(self.port) == "465"
+        if use_ssl:
+            server = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+
+        try:
+            server.set_debuglevel(0)
+            code, hello = server.ehlo()
+            self.logger.debug("SMTP EHLO: %s %s", code, hello)
+
+            if not use_ssl and self.starttls:
+                code, resp = server.starttls()
+                self.logger.debug("SMTP STARTTLS: %s %s", code, resp)
+                code, hello = server.ehlo()
+                self.logger.debug("SMTP EHLO (post-TLS): %s %s", code, hello)
+
+            server.login(self.user, self.password)
+        except Exception:
+            self._close_server(server)
+            raise
+
+        self.stats['connections'] += 1
+        self.logger.info("SMTP session opened to %s:%s (SSL=%s) for %s",
+                         self.host, self.port, use_ssl, self.user)
+        return server
+
+    @staticmethod
+    def _close_server(server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
+
+    def _reset(self):
+        if self._server is not None:
+            self._close_server(self._server)
+            self._server = None
+
+    def _is_alive(self, server: smtplib.SMTP) -> bool:
+        try:
+            code, _ = server.noop()
+            return code == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _acquire(self) -> smtplib.SMTP:
+        server = self._server
+        if server is not None and time.monotonic() - self._last_used >= self.noop_interval:
+            if not self._is_alive(server):
+                self.stats['noop_failures'] += 1
+                self.logger.debug("Pooled SMTP session failed NOOP check; reconnecting")
+                self._reset()
+                server = None
+
+        if server is None:
+            server = self._server = self._connect()
+        else:
+            self.stats['reused'] += 1
+        return server
+
+    def sendmail(self, from_addr: str, to_addrs: List[str], message: str) -> Dict:
+        """
+        Send one message to all recipients in a single SMTP transaction.
+
+        Returns the refused-recipients dict from smtplib.
+        """
+        with self._lock:
+            server = self._acquire()
+            try:
+                refused = server.sendmail(from_addr, to_addrs, message)
+            except smtplib.SMTPServerDisconnected:
+                # The server closed the session between health checks; a fresh
+                # session gets one immediate retry before the caller's backoff
+                self._reset()
+                server = self._server = self._connect()
+                refused = server.sendmail(from_addr, to_addrs, message)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException):
+                # Transaction-level rejection: smtplib has already sent RSET,
+                # so the session itself is still usable
+                raise
+            except Exception:
+                self._reset()
+                raise
+
+            self._last_used = time.monotonic()
+            self.stats['messages_sent'] += 1
+            return refused
+
+    def close(self):
+        """Close the pooled session."""
+        with self._lock:
+            self._reset()
+
+
+class EmailDeliveryQueue:
+    """
+    Background sender for EmailNotifier.
+
+    Queued messages are delivered in order by one daemon thread. TGE alerts
+    are not sent individually: alerts arriving within ``digest_window``
+    seconds of the first pending alert are coalesced into a single digest.
+    """
+
+    def __init__(self, notifier: "EmailNotifier", digest_window: float = 60):
+        self.notifier = notifier
+        self.digest_window = digest_window
+        self.logger = notifier.logger
+        self._cond = threading.Condition()
+        self._messages = deque()
+        self._news_alerts: List[Dict] = []
+        self._twitter_alerts: List[Dict] = []
+        self._meta: Dict = {}
+        self._digest_due: Optional[float] = None
+        self._busy = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {
+            'messages_queued': 0,
+            'alerts_queued': 0,
+            'digests_sent': 0,
+            'failed': 0
+        }
+
+    @property
+    def pending(self) -> int:
+        """Messages and digest alerts not yet handed to SMTP."""
+        with self._cond:
+            return len(self._messages) + len(self._news_alerts) + len(self._twitter_alerts)
+
+    def _idle(self) -> bool:
+        return not self._messages and self._digest_due is None and not self._busy
+
+    def _start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="email-delivery", daemon=True)
+            self._thread.start()
+
+    def submit(self, subject: str, html: str, text: Optional[str] = None) -> bool:
+        """Queue a single email for background delivery."""
+        with self._cond:
+            if self._closed:
+                return False
+            self._messages.append((subject, html, text))
+            self.stats['messages_queued'] += 1
+            self._start()
+            self._cond.notify_all()
+        return True
+
+    def add_alerts(self, news_alerts: List[Dict], twitter_alerts: List[Dict], meta: Optional[Dict] = None) -> bool:
+        """Add alerts to the pending digest, opening a new digest window if needed."""
+        with self._cond:
+            if self._closed:
+                return False
+            if self._digest_due is None:
+                self._digest_due = time.monotonic() + self.digest_window
+            self._news_alerts.extend(news_alerts)
+            self._twitter_alerts.extend(twitter_alerts)
+            # Flags such as twitter_rate_limited stay set once any cycle reports them
+            self._meta.update({k: v for k, v in (meta or {}).items() if v})
+            self.stats['alerts_queued'] += len(news_alerts) + len(twitter_alerts)
+            self._start()
+            self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send the pending digest now and wait until everything queued is delivered."""
+        with self._cond:
+            if self._digest_due is not None:
+                self._digest_due = time.monotonic()
+            self._cond.notify_all()
+            return self._cond.wait_for(self._idle, timeout)
+
+    def close(self, timeout: Optional[float] = 30) -> bool:
+        """Deliver what is pending and stop the sender thread."""
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return flushed
+
+    def _next_job(self):
+        # Called with self._cond held; blocks until there is work or the queue closes
+        while True:
+            if self._messages:
+                return self._messages.popleft()
+            if self._digest_due is not None and time.monotonic() >= self._digest_due:
+                job = (self._news_alerts, self._twitter_alerts, self._meta)
+                self._news_alerts, self._twitter_alerts, self._meta = [], [], {}
+                self._digest_due = None
+                return job
+            if self._closed:
+                return None
+            timeout = None if self._digest_due is None else self._digest_due - time.monotonic()
+            self._cond.wait(timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                job = self._next_job()
+                if job is None:
+                    return
+                self._busy = True
+
+            is_digest = isinstance(job[0], list)
+            try:
+                if is_digest:
+                    sent = self.notifier._send_alert_digest(*job)
+                else:
+                    sent = self.notifier._send_email(*job)
+            except Exception as e:
+                self.logger.error("Background email delivery failed: %s", e, exc_info=True)
+                sent = False
+
+            with self._cond:
+                if not sent:
+                    self.stats['failed'] += 1
+                elif is_digest:
+                    self.stats['digests_sent'] += 1
+                self._busy = False
+                self._cond.notify_all()
+
+
 class EmailNotifier:
     """Class for sending email notifications about TGE events."""
 
@@ -36,6 +621,27 @@ class EmailNotifier:
             else:
                 self.enabled = True
 
+        self.recipients = [
+            addr.strip() for addr in (self.recipient_email or "").split(",") if addr.strip()
+        ]
+        self._fragment_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._fragment_lock = threading.Lock()
+        self.pool: Optional[SMTPConnectionPool] = None
+        self.delivery: Optional[EmailDeliveryQueue] = None
+        if self.enabled:
+            self.pool = SMTPConnectionPool(
+                self.smtp_server,
+                self.smtp_port,
+                self.email_user,
+                self.email_password,
+                timeout=EMAIL_CONFIG.get('smtp_timeout', 20),
+                noop_interval=EMAIL_CONFIG.get('smtp_noop_interval', 30),
+                starttls=EMAIL_CONFIG.get('smtp_starttls', True),
+                logger=self.logger,
+            )
+            if EMAIL_CONFIG.get('background_delivery', True):
+                self.delivery = EmailDeliveryQueue(self, EMAIL_CONFIG.get('digest_window', 60))
+
     def setup_logging(self):
         """Setup logging configuration."""
         self.logger = logging.getLogger("email_notifier")
@@ -91,7 +697,8 @@ class EmailNotifier:
         """Sanitize URLs for safe inclusion in emails."""
         from utils import validate_and_sanitize_url
         sanitized = validate_and_sanitize_url(url)
-        return sanitized if sanitized else "#"
+        # Escaped for use inside a quoted href attribute
+        return escape(sanitized, quote=True) if sanitized else "#"
 
     def _validate_email_config(self) -> bool:
         """Validate email configuration."""
@@ -136,89 +743,56 @@ class EmailNotifier:
         return bool(re.match(pattern, email)) and len(email) <= 254
 
     # -------------------------
-    # Low-level send helper (with detailed SMTP logging)
+    # Low-level send helper (pooled SMTP session)
     # -------------------------
-    def _send_email(self, subject: str, html: str, text: Optional[str] = None, max_retries: int = 3) -> bool:
+    def _send_email(
+        self,
+        subject: str,
+        html: str,
+        text: Optional[str] = None,
+        max_retries: int = 3,
+        sanitize_html: bool = True,
+    ) -> bool:
         if not self.enabled:
             self.logger.warning("Email notifications disabled - configuration incomplete")
             return False
 
         # Sanitize inputs to prevent header injection
         subject = self._sanitize_header(subject)
-        # Don't escape HTML in the main HTML content (it's already properly formatted)
-        html = self._sanitize_content(html, escape_html=False)
+        if sanitize_html:
+            # Don't escape HTML in the main HTML content (it's already properly formatted).
+            # Template-rendered bodies skip this pass: their fields were sanitized on insertion.
+            html = self._sanitize_content(html, escape_html=False)
         if text:
             text = self._sanitize_content(text, escape_html=True)
 
         # Build MIME message (HTML + optional plain text)
         msg = MIMEMultipart('alternative')
         msg['From'] = self.email_user
-        msg['To'] = self.recipient_email
+        msg['To'] = ", ".join(self.recipients)
         msg['Subject'] = subject
         if text:
             msg.attach(MIMEText(text, 'plain', 'utf-8'))
         msg.attach(MIMEText(html, 'html', 'utf-8'))
 
-        # Retry logic for email sending
+        if not self.recipients:
+            self.logger.error("No valid recipient email addresses found")
+            return False
+        message = msg.as_string()
+
+        # Retry logic for email sending; the pool reconnects after a failure
         for attempt in range(max_retries):
             try:
-                use_ssl = str(self.smtp_port) == "465"
-                if use_ssl:
-                    server = smtplib.SMTP_SSL(self.smtp_server, self.smtp_port, timeout=20)
-                else:
-                    server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=20)
-
-                try:
-                    # Disable debug logging in production (only enable for troubleshooting)
-                    server.set_debuglevel(0)
-                    self.logger.info("Connecting to SMTP %s:%s (SSL=%s) [attempt %d/%d]", 
-                                   self.smtp_server, self.smtp_port, use_ssl, attempt + 1, max_retries)
-
-                    # EHLO before auth (and before STARTTLS on 587)
-                    code, hello = server.ehlo()
-                    self.logger.info("SMTP EHLO: %s %s", code, hello)
-
-                    if not use_ssl:
-                        # 587 path: STARTTLS upgrade
-                        code, resp = server.starttls()
-                        self.logger.info("SMTP STARTTLS: %s %s", code, resp)
-                        code, hello2 = server.ehlo()
-                        self.logger.info("SMTP EHLO (post-TLS): %s %s", code, hello2)
-
-                    # Login
-                    server.login(self.email_user, self.email_password)
-                    self.logger.info("SMTP login OK for %s", self.email_user)
-
-                    # Support multiple recipients separated by commas
-                    from_addr = self.email_user
-                    to_addrs = []
-                    for addr in self.recipient_email.split(","):
-                        addr = addr.strip()
-                        if addr and self._validate_email(addr):
-                            to_addrs.append(addr)
-                        elif addr:
-                            self.logger.warning("Invalid email address skipped: %s", addr)
-                    
-                    if not to_addrs:
-                        self.logger.error("No valid recipient email addresses found")
-                        return False
-
-                    # Use sendmail so we can inspect refused recipients
-                    refused = server.sendmail(from_addr, to_addrs, msg.as_string())
-
-                    if refused:
-                        # Dict of {recipient: (code, resp)} for failures
-                        self.logger.error("SMTP refused recipients: %s", refused)
-                        return False
-
-                    self.logger.info("Email accepted by SMTP server for: %s", to_addrs)
-                    return True
-
-                finally:
-                    try:
-                        server.quit()
-                    except Exception:
-                        server.close()
+                # All recipients go in one SMTP transaction
+                refused = self.pool.sendmail(self.email_user, self.recipients, message)
+
+                if refused:
+                    # Dict of {recipient: (code, resp)} for failures
+                    self.logger.error("SMTP refused recipients: %s", refused)
+                    return False
+
+                self.logger.info("Email accepted by SMTP server for: %s", self.recipients)
+                return True
 
             except smtplib.SMTPAuthenticationError as e:
                 self.logger.error("SMTP authentication failed (attempt %d/%d): %s", attempt + 1, max_retries, e)
@@ -261,15 +835,75 @@ class EmailNotifier:
             self.logger.warning("Email notifications disabled - configuration incomplete")
             return False
 
-        # Even if there are no alerts, return True (pipeline shouldn’t error on “nothing found”)
-        if not news_alerts and not twitter_alerts:
-            self.logger.info("No TGE alerts to send")
-            return True
+        # Even if there are no alerts, return True (pipeline shouldn’t error on “nothing found”)
+        if not news_alerts and not twitter_alerts:
+            self.logger.info("No TGE alerts to send")
+            return True
+
+        if self.delivery is not None:
+            # Coalesced into the pending digest and sent by the background thread
+            return self.delivery.add_alerts(news_alerts, twitter_alerts, meta)
+        return self._send_alert_digest(news_alerts, twitter_alerts, meta or {})
+
+    def send_tge_alerts(
+        self,
+        alerts: List[Dict],
+        high_priority_count: int = 0,
+        medium_priority_count: int = 0,
+    ) -> bool:
+        """
+        Send alerts produced by a monitoring cycle.
+
+        Cycle alerts are flat dicts ({'source', 'title', 'content', 'url',
+        'confidence', 'analysis'}); they are mapped onto the news/Twitter
+        shapes the email template renders and handed to send_tge_alert_email.
+        """
+        news_alerts, twitter_alerts = [], []
+        for alert in alerts:
+            analysis = alert.get('analysis') or {}
+            match_details = alert.get('match_details') or {
+                'matched_companies': analysis.get('matched_companies', []),
+                'matched_keywords': analysis.get('matched_keywords', []),
+                'confidence_score': round(alert.get('confidence', 0) * 100),
+            }
+            if alert.get('source') == 'twitter':
+                twitter_alerts.append({
+                    'tweet': {'text': alert.get('content', ''), 'url': alert.get('url')},
+                    'match_details': match_details,
+                })
+            else:
+                news_alerts.append({
+                    'title': alert.get('title'),
+                    'link': alert.get('url'),
+                    'summary': alert.get('content'),
+                    'match_details': match_details,
+                })
+        return self.send_tge_alert_email(news_alerts, twitter_alerts)
 
-        meta = meta or {}
+    def _send_alert_digest(self, news_alerts: List[Dict], twitter_alerts: List[Dict], meta: Dict) -> bool:
+        """Render and send one email covering all given alerts."""
         subject = self._generate_email_subject(news_alerts, twitter_alerts, meta)
         body = self._generate_email_body(news_alerts, twitter_alerts, meta)
-        return self._send_email(subject, body)
+        return self._send_email(subject, body, sanitize_html=False)
+
+    def _dispatch(self, subject: str, html: str, text: Optional[str] = None) -> bool:
+        """Queue an email for background delivery, or send it now if the queue is off."""
+        if self.delivery is not None:
+            return self.delivery.submit(subject, html, text)
+        return self._send_email(subject, html, text)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Send any pending digest now and wait for queued emails to be delivered."""
+        if self.delivery is None:
+            return True
+        return self.delivery.flush(timeout)
+
+    def close(self, timeout: Optional[float] = 30):
+        """Deliver pending emails and close the pooled SMTP session."""
+        if self.delivery is not None:
+            self.delivery.close(timeout)
+        if self.pool is not None:
+            self.pool.close()
 
     def send_test_email(self) -> bool:
         """
@@ -326,7 +960,7 @@ class EmailNotifier:
             </body>
             </html>
             """
-            return self._send_email(subject, html)
+            return self._dispatch(subject, html)
         except Exception as e:
             self.logger.error("Failed to send weekly summary email: %s", e, exc_info=True)
             return False
@@ -395,390 +1029,165 @@ class EmailNotifier:
             "source_name": alert.get("source") or "",
         }
 
+    def _alert_fingerprint(self, alert: Dict) -> bytes:
+        payload = json.dumps(alert, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+
+    def _render_alert_fragment(self, kind: str, alert: Dict) -> str:
+        """Render one alert's HTML, reusing the cached fragment for an unchanged alert."""
+        key = (kind, self._alert_fingerprint(alert))
+        with self._fragment_lock:
+            fragment = self._fragment_cache.get(key)
+            if fragment is not None:
+                self._fragment_cache.move_to_end(key)
+                return fragment
+
+        if kind == 'news':
+            fragment = self._render_news_item(alert)
+        else:
+            fragment = self._render_tweet_item(alert)
+
+        with self._fragment_lock:
+            self._fragment_cache[key] = fragment
+            if len(self._fragment_cache) > FRAGMENT_CACHE_SIZE:
+                self._fragment_cache.popitem(last=False)
+        return fragment
+
+    @staticmethod
+    def _format_timestamp(value) -> str:
+        if not isinstance(value, datetime):
+            return 'Unknown'
+        try:
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return value.strftime('%Y-%m-%d %H:%M UTC')
+        except Exception:
+            return escape(str(value))
+
+    def _match_fields(self, match_details: Dict) -> Dict[str, str]:
+        """Sanitized template fields for the match details shared by news and Twitter alerts."""
+        priority = escape(str(match_details.get('priority_level', 'UNKNOWN')), quote=True)
+        strategy = escape(str(match_details.get('match_strategy', 'unknown')), quote=True)
+        confidence = escape(str(match_details.get('confidence_score', 0)))
+
+        companies = ''.join(
+            COMPANY_TAG.render({'priority': priority, 'name': sanitize_label(str(c))})
+            for c in sorted(match_details.get('matched_companies', []))
+        )
+        keywords = ''.join(
+            KEYWORD_TAG.render({'strategy': strategy, 'name': sanitize_label(str(k))})
+            for k in sorted(match_details.get('matched_keywords', []))
+        )
+        tokens = ''.join(
+            TOKEN_TAG.render({'name': sanitize_label(str(t))})
+            for t in sorted(match_details.get('matched_tokens', []))
+        )
+
+        reasons = match_details.get('match_reasons', [])
+        if reasons:
+            match_reasons = MATCH_REASONS_TEMPLATE.render({
+                'reasons': ''.join(f'<li>{sanitize_label(str(reason))}</li>' for reason in reasons)
+            })
+        else:
+            match_reasons = ''
+
+        return {
+            'companies': companies or NONE_DETECTED,
+            'keywords': keywords or NONE_DETECTED,
+            'token_line': f'<br><strong>🪙 Token Symbols:</strong> {tokens}' if tokens else '',
+            'score': SCORE_TAG.render({'strategy': strategy, 'confidence': confidence}),
+            'match_reasons': match_reasons,
+        }
+
+    def _render_news_item(self, alert: Dict) -> str:
+        art = self._news_item_from_alert(alert)
+        fields = self._match_fields(alert.get('match_details', {}))
+        fields.update({
+            'title': self._sanitize_content(art.get('title') or 'Untitled'),
+            'source_name': self._sanitize_content(art.get('source_name') or ''),
+            'published': self._format_timestamp(art.get('published')),
+            'link': self._sanitize_url(art.get('link')),
+            'summary': self._clean_summary(art.get('summary') or ''),
+        })
+        return NEWS_ITEM_TEMPLATE.render(fields)
+
+    def _render_tweet_item(self, alert: Dict) -> str:
+        tweet = alert.get('tweet', {})
+        user = tweet.get('user', {})
+        fields = self._match_fields(alert.get('match_details', {}))
+        fields.update({
+            'screen_name': self._sanitize_content(str(user.get('screen_name', 'unknown'))),
+            'user_name': self._sanitize_content(str(user.get('name', 'Unknown'))),
+            'posted': self._format_timestamp(tweet.get('created_at')),
+            'retweets': escape(str(tweet.get('retweet_count', 0))),
+            'likes': escape(str(tweet.get('favorite_count', 0))),
+            'followers': f"{user.get('followers_count', 0):,}",
+            'url': self._sanitize_url(tweet.get('url')),
+            'text': self._sanitize_content(tweet.get('text', '')),
+        })
+        return TWEET_ITEM_TEMPLATE.render(fields)
+
     def _generate_email_body(
         self,
         news_alerts: List[Dict],
         twitter_alerts: List[Dict],
         meta: Dict
     ) -> str:
-        ts = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
-        rl_banner = ""
-        if meta.get("twitter_rate_limited"):
-            rl_banner = (
-                '<div style="background:#fff3cd;border:1px solid #ffeeba;padding:10px;'
-                'border-radius:6px;margin-bottom:16px;">'
-                '⚠️ Twitter/API rate limiting detected this cycle — results may be partial.'
-                '</div>'
-            )
+        """
+        Render the alert email from the precompiled templates.
+
+        Every field is sanitized as it is inserted, so the finished body does
+        not need another sanitization pass before sending.
+        """
+        now = datetime.now(timezone.utc)
 
         # Create alert summary
         all_companies = set()
         high_priority_companies = set()
-        all_keywords = set()
         high_confidence_count = 0
-        
+
         for alert in (news_alerts + twitter_alerts):
             details = alert.get('match_details', {})
             all_companies.update(details.get('matched_companies', []))
             if details.get('priority_level') == 'HIGH':
                 high_priority_companies.update(details.get('matched_companies', []))
-            all_keywords.update(details.get('matched_keywords', []))
             if details.get('confidence_score', 0) >= 80:
                 high_confidence_count += 1
-        
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-                    line-height: 1.6;
-                    color: #2c3e50;
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 20px;
-                    background-color: #f8f9fa;
-                }}
-                .container {{
-                    background-color: white;
-                    border-radius: 12px;
-                    padding: 30px;
-                    box-shadow: 0 4px 20px rgba(0,0,0,0.08);
-                    border: 1px solid #e9ecef;
-                }}
-                .header {{
-                    text-align: center;
-                    border-bottom: 2px solid #007bff;
-                    padding-bottom: 25px;
-                    margin-bottom: 30px;
-                }}
-                .header h1 {{
-                    color: #007bff;
-                    margin: 0 0 10px 0;
-                    font-size: 28px;
-                    font-weight: 700;
-                }}
-                .header p {{
-                    margin: 5px 0;
-                    color: #6c757d;
-                }}
-                .alert-section {{
-                    margin-bottom: 35px;
-                    border: 1px solid #dee2e6;
-                    border-radius: 10px;
-                    overflow: hidden;
-                    box-shadow: 0 2px 8px rgba(0,0,0,0.04);
-                }}
-                .alert-header {{
-                    background: linear-gradient(135deg, #007bff 0%, #0056b3 100%);
-                    color: white;
-                    padding: 15px 20px;
-                    font-weight: 700;
-                    font-size: 16px;
-                }}
-                .alert-content {{ padding: 20px; }}
-                .alert-item {{
-                    border-bottom: 1px solid #f1f3f4;
-                    padding: 20px 0;
-                    transition: background-color 0.2s ease;
-                }}
-                .alert-item:last-child {{ border-bottom: none; }}
-                .alert-item:hover {{ background-color: #f8f9fa; }}
-                .alert-title {{
-                    font-size: 16px;
-                    font-weight: 600;
-                    color: #1a365d;
-                    margin-bottom: 8px;
-                    line-height: 1.4;
-                }}
-                .alert-meta {{
-                    font-size: 13px;
-                    color: #718096;
-                    margin-bottom: 12px;
-                }}
-                .companies, .keywords, .tokens, .score {{
-                    padding: 6px 12px;
-                    border-radius: 6px;
-                    margin: 4px 6px 4px 0;
-                    display: inline-block;
-                    font-size: 12px;
-                    font-weight: 500;
-                }}
-                .companies {{
-                    background-color: #e3f2fd;
-                    color: #1565c0;
-                    border: 1px solid #bbdefb;
-                }}
-                .keywords {{
-                    background-color: #fff8e1;
-                    color: #ef6c00;
-                    border: 1px solid #ffcc02;
-                }}
-                .tokens {{
-                    background-color: #f3e5f5;
-                    color: #7b1fa2;
-                    border: 1px solid #ce93d8;
-                }}
-                .score {{
-                    background-color: #e8f5e8;
-                    color: #2e7d32;
-                    border: 1px solid #c8e6c9;
-                    font-weight: 600;
-                }}
-                .tweet-content {{
-                    background: #f8f9fa;
-                    padding: 16px;
-                    border-radius: 8px;
-                    border-left: 4px solid #007bff;
-                    margin: 12px 0;
-                    font-style: italic;
-                    color: #495057;
-                }}
-                .summary-content {{
-                    background-color: #f8f9fa;
-                    padding: 16px;
-                    border-radius: 8px;
-                    border-left: 4px solid #28a745;
-                    font-size: 14px;
-                    color: #495057;
-                    line-height: 1.5;
-                }}
-                .footer {{
-                    text-align: center;
-                    margin-top: 30px;
-                    padding-top: 20px;
-                    border-top: 2px solid #e9ecef;
-                    color: #6c757d;
-                    font-size: 13px;
-                }}
-                .link {{
-                    color: #007bff;
-                    text-decoration: none;
-                    font-weight: 500;
-                    padding: 8px 16px;
-                    background-color: #f8f9fa;
-                    border: 1px solid #dee2e6;
-                    border-radius: 6px;
-                    display: inline-block;
-                    margin: 8px 0;
-                    transition: all 0.2s ease;
-                }}
-                .link:hover {{
-                    background-color: #007bff;
-                    color: white;
-                    text-decoration: none;
-                }}
-                @media only screen and (max-width: 600px) {{
-                    body {{ padding: 10px; }}
-                    .container {{ padding: 20px; }}
-                    .alert-content {{ padding: 15px; }}
-                    .companies, .keywords, .score {{
-                        display: block;
-                        margin: 4px 0;
-                    }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🚀 Crypto TGE Monitor Alert</h1>
-                    <p>Token Generation Event Detection Report</p>
-                    <p><strong>{ts}</strong></p>
-                    {rl_banner}
-                </div>
-                
-                <div style="background-color: #e3f2fd; border: 2px solid #1976d2; border-radius: 8px; padding: 20px; margin: 20px 0;">
-                    <h2 style="margin-top: 0; color: #1976d2;">📋 Alert Summary</h2>
-                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px;">
-                        <div>
-                            <strong>Total Alerts:</strong> {len(news_alerts) + len(twitter_alerts)}<br>
-                            <strong>News Alerts:</strong> {len(news_alerts)}<br>
-                            <strong>Twitter Alerts:</strong> {len(twitter_alerts)}
-                        </div>
-                        <div>
-                            <strong>Companies Detected:</strong> {len(all_companies)}<br>
-                            <strong>High Priority:</strong> {len(high_priority_companies)}<br>
-                            <strong>High Confidence Alerts:</strong> {high_confidence_count}
-                        </div>
-                    </div>
-                    {f'<div style="margin-top: 15px;"><strong>🏢 Companies:</strong> {", ".join(sorted(all_companies))}</div>' if all_companies else ''}
-                    {f'<div style="margin-top: 10px;"><strong>🚨 High Priority Companies:</strong> <span style="color: #d32f2f; font-weight: bold;">{", ".join(sorted(high_priority_companies))}</span></div>' if high_priority_companies else ''}
-                </div>
-        """
+
+        def company_list(names):
+            return ", ".join(sanitize_label(str(name)) for name in sorted(names))
+
+        parts = [EMAIL_HEAD_TEMPLATE.render({
+            'ts': now.strftime('%Y-%m-%d %H:%M UTC'),
+            'rl_banner': RATE_LIMIT_BANNER if meta.get("twitter_rate_limited") else '',
+            'total_count': len(news_alerts) + len(twitter_alerts),
+            'news_count': len(news_alerts),
+            'twitter_count': len(twitter_alerts),
+            'company_count': len(all_companies),
+            'high_priority_count': len(high_priority_companies),
+            'high_confidence_count': high_confidence_count,
+            'companies_line': COMPANIES_LINE.render({'companies': company_list(all_companies)})
+            if all_companies else '',
+            'high_priority_line': HIGH_PRIORITY_LINE.render({'companies': company_list(high_priority_companies)})
+            if high_priority_companies else '',
+        })]
 
         # News section
         if news_alerts:
-            html += f"""
-                <div class="alert-section">
-                    <div class="alert-header">📰 News Alerts ({len(news_alerts)} found)</div>
-                    <div class="alert-content">
-            """
-            for alert in news_alerts:
-                art = self._news_item_from_alert(alert)
-                pubs = art.get('published')
-                if isinstance(pubs, datetime):
-                    try:
-                        if pubs.tzinfo is None:
-                            pubs = pubs.replace(tzinfo=timezone.utc)
-                        pub_str = pubs.strftime('%Y-%m-%d %H:%M UTC')
-                    except Exception:
-                        pub_str = str(pubs)
-                else:
-                    pub_str = 'Unknown'
-
-                # Extract match details for enhanced display
-                match_details = alert.get('match_details', {})
-                companies = match_details.get('matched_companies', [])
-                keywords = match_details.get('matched_keywords', [])
-                tokens = match_details.get('matched_tokens', [])
-                confidence = match_details.get('confidence_score', 0)
-                strategy = match_details.get('match_strategy', 'unknown')
-                priority = match_details.get('priority_level', 'UNKNOWN')
-                match_reasons = match_details.get('match_reasons', [])
-
-                # Generate company tags with priority indicators
-                comps = ''.join(f'<span class="companies" title="Priority: {priority}">🏢 {c}</span>'
-                                for c in sorted(companies))
-
-                # Generate keyword tags with strategy info
-                keys = ''.join(f'<span class="keywords" title="Strategy: {strategy}">🔑 {k}</span>'
-                               for k in sorted(keywords))
-
-                # Add token tags if any
-                token_tags = ''.join(f'<span class="tokens" title="Token Symbol">🪙 {t}</span>'
-                                   for t in sorted(tokens)) if tokens else ''
-
-                # Enhanced confidence score with strategy info
-                score = f'<span class="score" title="Strategy: {strategy}">📊 {confidence}% confidence</span>'
-                
-                # Format match reasons
-                match_reasons_html = ''
-                if match_reasons:
-                    match_reasons_html = '''
-                    <div style="margin: 8px 0; padding: 8px; background-color: #e8f5e9; border-left: 4px solid #4caf50; border-radius: 4px;">
-                        <strong>✅ Match Reasons:</strong>
-                        <ul style="margin: 4px 0; padding-left: 20px;">
-                    '''
-                    for reason in match_reasons:
-                        match_reasons_html += f'<li>{self._sanitize_content(reason)}</li>'
-                    match_reasons_html += '</ul></div>'
-
-                html += f"""
-                        <div class="alert-item">
-                            <div class="alert-title">{self._sanitize_content(art.get('title') or 'Untitled')}</div>
-                            <div class="company-info" style="margin: 8px 0; padding: 8px; background-color: #f0f8ff; border-left: 4px solid #007bff; border-radius: 4px;">
-                                <strong>🎯 Detected Companies:</strong> {comps or '<span style="color: #666;">None detected</span>'}
-                            </div>
-                            <div class="alert-meta">
-                                <strong>Source:</strong> {self._sanitize_content(art.get('source_name',''))} |
-                                <strong>Published:</strong> {pub_str}
-                            </div>
-                            <div><a href="{self._sanitize_url(art.get('link'))}" class="link" target="_blank" rel="noopener noreferrer">Read Full Article →</a></div>
-                            <div class="keyword-info" style="margin: 8px 0; padding: 8px; background-color: #fff8e1; border-left: 4px solid #ffa000; border-radius: 4px;">
-                                <strong>🔍 Triggering Keywords:</strong> {keys or '<span style="color: #666;">None detected</span>'}
-                                {f'<br><strong>🪙 Token Symbols:</strong> {token_tags}' if token_tags else ''}
-                            </div>
-                            <div style="margin-top: 8px;">{score}</div>
-                            {match_reasons_html}
-                            <div class="summary-content" style="margin-top: 12px;">
-                                {self._clean_summary(art.get('summary') or '')}
-                            </div>
-                        </div>
-                """
-            html += "</div></div>"
+            parts.append(SECTION_OPEN_TEMPLATE.render({'heading': '📰 News Alerts', 'count': len(news_alerts)}))
+            parts.extend(self._render_alert_fragment('news', alert) for alert in news_alerts)
+            parts.append(SECTION_CLOSE)
 
         # Twitter section
         if twitter_alerts:
-            html += f"""
-                <div class="alert-section">
-                    <div class="alert-header">🐦 Twitter Alerts ({len(twitter_alerts)} found)</div>
-                    <div class="alert-content">
-            """
-            for alert in twitter_alerts:
-                tweet = alert.get('tweet', {})
-                ts_t = tweet.get('created_at')
-                if isinstance(ts_t, datetime):
-                    try:
-                        if ts_t.tzinfo is None:
-                            ts_t = ts_t.replace(tzinfo=timezone.utc)
-                        ts_str = ts_t.strftime('%Y-%m-%d %H:%M UTC')
-                    except Exception:
-                        ts_str = str(ts_t)
-                else:
-                    ts_str = 'Unknown'
-
-                # Extract match details for Twitter alerts
-                match_details = alert.get('match_details', {})
-                companies = match_details.get('matched_companies', [])
-                keywords = match_details.get('matched_keywords', [])
-                tokens = match_details.get('matched_tokens', [])
-                confidence = match_details.get('confidence_score', 0)
-                strategy = match_details.get('match_strategy', 'unknown')
-                priority = match_details.get('priority_level', 'UNKNOWN')
-                match_reasons = match_details.get('match_reasons', [])
-
-                # Generate company tags
-                comps = ''.join(f'<span class="companies" title="Priority: {priority}">🏢 {c}</span>'
-                                for c in sorted(companies))
-
-                # Generate keyword tags
-                keys = ''.join(f'<span class="keywords" title="Strategy: {strategy}">🔑 {k}</span>'
-                               for k in sorted(keywords))
-
-                # Add token tags if any
-                token_tags = ''.join(f'<span class="tokens" title="Token Symbol">🪙 {t}</span>'
-                                   for t in sorted(tokens)) if tokens else ''
-
-                # Enhanced confidence score
-                score = f'<span class="score" title="Strategy: {strategy}">📊 {confidence}% confidence</span>'
-                
-                # Format match reasons for Twitter
-                match_reasons_html = ''
-                if match_reasons:
-                    match_reasons_html = '''
-                    <div style="margin: 8px 0; padding: 8px; background-color: #e8f5e9; border-left: 4px solid #4caf50; border-radius: 4px;">
-                        <strong>✅ Match Reasons:</strong>
-                        <ul style="margin: 4px 0; padding-left: 20px;">
-                    '''
-                    for reason in match_reasons:
-                        match_reasons_html += f'<li>{self._sanitize_content(reason)}</li>'
-                    match_reasons_html += '</ul></div>'
-
-                html += f"""
-                        <div class="alert-item">
-                            <div class="alert-title">@{tweet.get('user',{}).get('screen_name','unknown')} - {tweet.get('user',{}).get('name','Unknown')}</div>
-                            <div class="company-info" style="margin: 8px 0; padding: 8px; background-color: #f0f8ff; border-left: 4px solid #007bff; border-radius: 4px;">
-                                <strong>🎯 Detected Companies:</strong> {comps or '<span style="color: #666;">None detected</span>'}
-                            </div>
-                            <div class="alert-meta">
-                                <strong>Posted:</strong> {ts_str} |
-                                <strong>Engagement:</strong> {tweet.get('retweet_count',0)} RTs, {tweet.get('favorite_count',0)} Likes |
-                                <strong>Followers:</strong> {tweet.get('user',{}).get('followers_count',0):,}
-                            </div>
-                            <div><a href="{self._sanitize_url(tweet.get('url'))}" class="link" target="_blank" rel="noopener noreferrer">View Tweet →</a></div>
-                            <div class="tweet-content">{self._sanitize_content(tweet.get('text',''))}</div>
-                            <div class="keyword-info" style="margin: 8px 0; padding: 8px; background-color: #fff8e1; border-left: 4px solid #ffa000; border-radius: 4px;">
-                                <strong>🔍 Triggering Keywords:</strong> {keys or '<span style="color: #666;">None detected</span>'}
-                                {f'<br><strong>🪙 Token Symbols:</strong> {token_tags}' if token_tags else ''}
-                            </div>
-                            <div style="margin-top: 8px;">{score}</div>
-                            {match_reasons_html}
-                        </div>
-                """
-            html += "</div></div>"
+            parts.append(SECTION_OPEN_TEMPLATE.render({'heading': '🐦 Twitter Alerts', 'count': len(twitter_alerts)}))
+            parts.extend(self._render_alert_fragment('twitter', alert) for alert in twitter_alerts)
+            parts.append(SECTION_CLOSE)
 
         # Footer
-        html += f"""
-                <div class="footer">
-                    <p>This alert was generated by the Crypto TGE Monitor system.</p>
-                    <p>Monitor configured for {len(COMPANIES)} companies and {len(TGE_KEYWORDS)} TGE keywords.</p>
-                    <p>Last updated: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        return html
+        parts.append(FOOTER_TEMPLATE.render({
+            'company_count': len(COMPANIES),
+            'keyword_count': len(TGE_KEYWORDS),
+            'updated': now.strftime('%Y-%m-%d %H:%M:%S UTC'),
+        }))
+        return "".join(parts)
@@ -14,72 +14,19 @@ from dateutil import parser as date_parser
 import calendar
 
 
-class EnhancedTGEScoring:
-    """Advanced scoring system for TGE content analysis."""
-
-    # Source reliability tiers
-    TIER_1_SOURCES = [
-        'theblock.co', 'coindesk.com', 'decrypt.co', 'thedefiant.io',
-        'bankless.com', 'dlnews.com'
-    ]  # +15 points
-
-    TIER_2_SOURCES = [
-        'cointelegraph.com', 'cryptobriefing.com', 'blockonomi.com',
-        'bitcoinethereumnews.com', 'u.today'
-    ]  # +10 points
-
-    TIER_3_SOURCES = [
-        'ambcrypto.com', 'dailycoin.com', 'cryptopotato.com',
-        'crypto.news', 'trustnodes.com'
-    ]  # +5 points
-
-    # Temporal relevance indicators (significantly expanded)
-    IMMEDIATE_INDICATORS = [
-        'now', 'live', 'today', 'just launched', 'available now', 'starts today',
-        'is live', 'has launched', 'now live', 'live now', 'goes live today',
-        'starting now', 'currently live', 'active now', 'open now'
-    ]  # +20
-    NEAR_TERM = [
-        'tomorrow', 'this week', 'next week', 'within days', 'in the coming days',
-        'later this week', 'early next week', 'by end of week', 'within 48 hours',
-        'in 24 hours', 'in two days', 'in three days'
-    ]  # +15
-    MID_TERM = [
-        'this month', 'next month', 'coming soon', 'Q1', 'Q2', 'Q3', 'Q4',
-        'january', 'february', 'march', 'april', 'may', 'june', 'july',
-        'august', 'september', 'october', 'november', 'december',
-        'end of month', 'mid-month', 'early next month', 'late this month'
-    ]  # +10
-    VAGUE_TIMING = ['soon', 'upcoming', 'planned', 'to be announced', 'tba']  # +5
-    PAST_TENSE = [
-        'launched', 'went live', 'was announced', 'occurred', 'happened',
-        'completed', 'finished', 'concluded', 'ended', 'has ended',
-        'was live', 'had launched', 'already launched', 'previously launched'
-    ]  # -10
-
-    # False positive indicators (patterns that should NOT be in crypto TGE context)
-    FALSE_POSITIVE_PATTERNS = {
-        'gaming': ['in-game', 'game token', 'gaming token', 'play-to-earn', 'p2e', 'loot drop', 'nft game'],
-        'coffee': ['espresso machine', 'coffee shop', 'barista', 'cafe', 'brewing', 'coffee bean'],
-        'physical_goods': ['fabric', 'clothing', 'merchandise', 'physical product', 'shipping'],
-        'speculation': ['price prediction', 'technical analysis', 'chart analysis', 'trading signal'],
-        'testing': ['test token', 'mock token', 'demo token', 'sandbox test'],
-        'non_crypto': ['volcano', 'mountain', 'geographic', 'espresso beans']
-    }
+try:
+    from .rule_pack import RulePackRef
+except ImportError:
+    from rule_pack import RulePackRef
 
-    # Patterns that need explicit checking (not just presence)
-    CONDITIONAL_FALSE_POSITIVES = {
-        'testnet': r'\btestnet\b(?!\s+(to|→|->)\s+mainnet)',  # Only if NOT "testnet to mainnet"
-        'devnet': r'\bdevnet\b(?!\s+(to|→|->)\s+mainnet)',
-    }
 
-    # Crypto context indicators (must be present for ambiguous terms)
-    CRYPTO_CONTEXT = [
-        'blockchain', 'crypto', 'cryptocurrency', 'protocol', 'defi', 'web3',
-        'mainnet', 'layer 2', 'l2', 'rollup', 'smart contract', 'dapp',
-        'token economics', 'tokenomics', 'airdrop', 'claim', 'staking',
-        'liquidity', 'trading', 'exchange', 'cex', 'dex', 'wallet'
-    ]
+class EnhancedTGEScoring:
+    """
+    Advanced scoring system for TGE content analysis.
+
+    Source tiers, temporal indicators, false positive and crypto context terms
+    live in config.SCORING_RULES and are compiled once into the shared rule pack.
+    """
 
     def __init__(self, fuzzy_match_threshold: float = 0.85, confidence_threshold: float = 0.65):
         """
@@ -92,58 +39,37 @@ class EnhancedTGEScoring:
         self.fuzzy_match_threshold = fuzzy_match_threshold
         self.confidence_threshold = confidence_threshold
 
-        # Compile patterns for efficiency
-        self._compile_patterns()
+        # Compiled temporal, context and date patterns
+        self.rules = RulePackRef()
 
-    def _compile_patterns(self):
-        """Compile regex patterns for temporal and content analysis."""
-        # Immediate indicators
-        self.immediate_pattern = re.compile(
-            r'\b(' + '|'.join(re.escape(term) for term in self.IMMEDIATE_INDICATORS) + r')\b',
-            re.IGNORECASE
-        )
+    @property
+    def immediate_pattern(self) -> re.Pattern:
+        return self.rules.get().temporal_patterns['immediate']
 
-        # Near-term indicators
-        self.near_term_pattern = re.compile(
-            r'\b(' + '|'.join(re.escape(term) for term in self.NEAR_TERM) + r')\b',
-            re.IGNORECASE
-        )
+    @property
+    def near_term_pattern(self) -> re.Pattern:
+        return self.rules.get().temporal_patterns['near_term']
 
-        # Mid-term indicators
-        self.mid_term_pattern = re.compile(
-            r'\b(' + '|'.join(re.escape(term) for term in self.MID_TERM) + r')\b',
-            re.IGNORECASE
-        )
+    @property
+    def mid_term_pattern(self) -> re.Pattern:
+        return self.rules.get().temporal_patterns['mid_term']
 
-        # Vague timing
-        self.vague_timing_pattern = re.compile(
-            r'\b(' + '|'.join(re.escape(term) for term in self.VAGUE_TIMING) + r')\b',
-            re.IGNORECASE
-        )
+    @property
+    def vague_timing_pattern(self) -> re.Pattern:
+        return self.rules.get().temporal_patterns['vague']
 
-        # Past tense
-        self.past_tense_pattern = re.compile(
-            r'\b(' + '|'.join(re.escape(term) for term in self.PAST_TENSE) + r')\b',
-            re.IGNORECASE
-        )
+    @property
+    def past_tense_pattern(self) -> re.Pattern:
+        return self.rules.get().temporal_patterns['past_tense']
 
-        # Crypto context pattern
-        self.crypto_context_pattern = re.compile(
-            r'\b(' + '|'.join(re.escape(term) for term in self.CRYPTO_CONTEXT) + r')\b',
-            re.IGNORECASE
-        )
+    @property
+    def crypto_context_pattern(self) -> re.Pattern:
+        return self.rules.get().crypto_context_pattern
 
-        # Date patterns for extraction
-        self.date_patterns = [
-            # Full dates: Jan 15, 2024 or January 15, 2024
-            re.compile(r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2},?\s*\d{4}\b', re.IGNORECASE),
-            # Short dates: 01/15/2024 or 01-15-2024
-            re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{4}\b'),
-            # Relative dates with specific times
-            re.compile(r'\b(tomorrow|today)\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm|utc|est|pst)?\b', re.IGNORECASE),
-            # Quarter mentions: Q1 2024
-            re.compile(r'\bQ[1-4]\s+\d{4}\b', re.IGNORECASE),
-        ]
+    @property
+    def date_patterns(self) -> Tuple[re.Pattern, ...]:
+        """Date patterns for extraction."""
+        return self.rules.get().date_extraction_patterns
 
     def get_source_reliability_score(self, url: str, source_type: str = "news") -> Tuple[int, str]:
         """
@@ -164,21 +90,8 @@ class EnhancedTGEScoring:
             domain = urlparse(url).netloc.lower()
             domain = domain.replace('www.', '')
 
-            # Check tiers
-            for tier1 in self.TIER_1_SOURCES:
-                if tier1 in domain:
-                    return 15, "tier_1"
-
-            for tier2 in self.TIER_2_SOURCES:
-                if tier2 in domain:
-                    return 10, "tier_2"
-
-            for tier3 in self.TIER_3_SOURCES:
-                if tier3 in domain:
-                    return 5, "tier_3"
-
-            # Unknown source - neutral
-            return 0, "unknown"
+            # Check tiers; unknown sources are neutral
+            return self.rules.get().source_tier(domain)
 
         except Exception:
             return 0, "invalid_url"
@@ -571,39 +484,40 @@ class EnhancedTGEScoring:
         matched_patterns = []
         text_lower = text.lower()
 
+        rules = self.rules.get()
+
         # Check if crypto context is present
-        has_crypto_context = bool(self.crypto_context_pattern.search(text))
+        crypto_matches = len(rules.crypto_context_pattern.findall(text))
+        has_crypto_context = crypto_matches > 0
 
         # Check conditional patterns first (testnet, devnet)
-        for term, pattern in self.CONDITIONAL_FALSE_POSITIVES.items():
-            if re.search(pattern, text_lower, re.IGNORECASE):
+        for term, pattern in rules.conditional_false_positives:
+            if pattern.search(text_lower):
                 matched_patterns.append(f"testing:{term}")
                 penalty -= 50  # Hard penalty for standalone testnet/devnet
 
         # Check standard false positive patterns
-        for category, patterns in self.FALSE_POSITIVE_PATTERNS.items():
-            for pattern in patterns:
-                if pattern.lower() in text_lower:
-                    matched_patterns.append(f"{category}:{pattern}")
-
-                    # Apply different penalties based on category and context
-                    if category == 'testing':
-                        penalty -= 50  # Hard penalty for test tokens
-                    elif category == 'speculation':
-                        penalty -= 30  # High penalty for speculation
-                    elif category in ['gaming', 'coffee', 'physical_goods', 'non_crypto']:
-                        if has_crypto_context:
-                            penalty -= 10  # Light penalty if crypto context exists
-                        else:
-                            penalty -= 40  # Heavy penalty without crypto context
+        for category, pattern in rules.false_positive_terms:
+            if pattern in text_lower:
+                matched_patterns.append(f"{category}:{pattern}")
+
+                # Apply different penalties based on category and context
+                if category == 'testing':
+                    penalty -= 50  # Hard penalty for test tokens
+                elif category == 'speculation':
+                    penalty -= 30  # High penalty for speculation
+                elif category in ['gaming', 'coffee', 'physical_goods', 'non_crypto']:
+                    if has_crypto_context:
+                        penalty -= 10  # Light penalty if crypto context exists
+                    else:
+                        penalty -= 40  # Heavy penalty without crypto context
 
         # Additional checks for ambiguous terms (only if no strong crypto context)
-        if not has_crypto_context or len(self.crypto_context_pattern.findall(text)) < 2:
+        if crypto_matches < 2:
             ambiguous_terms = ['token', 'cal', 'espresso']
             for term in ambiguous_terms:
                 if term in text_lower:
                     # Check density of crypto terms
-                    crypto_matches = len(self.crypto_context_pattern.findall(text))
                     word_count = len(text_lower.split())
                     crypto_density = crypto_matches / max(word_count, 1)
 
@@ -0,0 +1,217 @@
+"""
+Real-time event broker for TGE Monitor
+Publishes alert and system-status events once and delivers them to the
+WebSocket clients of every API worker (Redis pub/sub across workers and
+servers, in-memory for a single process and tests)
+"""
+
+import os
+import json
+import socket
+import asyncio
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .database import REDIS_URL, get_redis_client
+from .serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+# Pub/sub channels
+ALERTS_CHANNEL = "tge:realtime:alerts"
+SYSTEM_STATUS_CHANNEL = "tge:realtime:system_status"
+BROADCAST_CHANNEL = "tge:realtime:broadcast"
+
+# Identifies this worker process in published events
+WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+EventHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class EventBroker:
+    """Base broker: channel subscriptions and local dispatch"""
+
+    name = "base"
+
+    def __init__(self):
+        self._handlers: Dict[str, List[EventHandler]] = {}
+        self.stats = {
+            'published': 0,
+            'delivered': 0,
+            'handler_errors': 0
+        }
+
+    def subscribe(self, channel: str, handler: EventHandler):
+        """Register a local handler for events published on channel (once per handler)"""
+        handlers = self._handlers.setdefault(channel, [])
+        if handler not in handlers:
+            handlers.append(handler)
+
+    @property
+    def channels(self) -> List[str]:
+        return list(self._handlers)
+
+    async def publish(self, channel: str, event: Dict[str, Any]):
+        """Publish an event to every worker subscribed to channel"""
+        raise NotImplementedError
+
+    async def start(self):
+        """Start receiving events (no-op for in-process brokers)"""
+
+    async def stop(self):
+        """Stop receiving events"""
+
+    async def _dispatch(self, channel: str, event: Dict[str, Any]):
+        for handler in self._handlers.get(channel, ()):
+            try:
+                await handler(event)
+                self.stats['delivered'] += 1
+            except Exception as e:
+                self.stats['handler_errors'] += 1
+                logger.error(f"Real-time event handler failed on {channel}: {e}")
+
+
+class InMemoryBroker(EventBroker):
+    """Single-process broker that dispatches published events directly"""
+
+    name = "memory"
+
+    async def publish(self, channel: str, event: Dict[str, Any]):
+        self.stats['published'] += 1
+        await self._dispatch(channel, event)
+
+
+class RedisBroker(EventBroker):
+    """Redis pub/sub broker shared by all API workers and servers"""
+
+    name = "redis"
+
+    # Seconds to wait before resubscribing after a Redis error
+    RECONNECT_DELAY = 5
+
+    def __init__(self, url: str = REDIS_URL, client=None):
+        super().__init__()
+        if client is None:
+            import redis.asyncio as redis_asyncio
+            client = redis_asyncio.from_url(url)
+        self.client = client
+        self._listener_task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+
+    @property
+    def listening(self) -> bool:
+        return self._listener_task is not None and not self._listener_task.done()
+
+    async def publish(self, channel: str, event: Dict[str, Any]):
+        self.stats['published'] += 1
+
+        try:
+            await self.client.publish(channel, dumps(event))
+        except Exception as e:
+            logger.warning(f"Redis publish on {channel} failed ({e}). Delivering locally only.")
+            await self._dispatch(channel, event)
+            return
+
+        # Without a running listener this worker never receives its own
+        # event back from Redis, so its handlers are called directly
+        if not self.listening:
+            await self._dispatch(channel, event)
+
+    async def start(self):
+        if self.listening or not self._handlers:
+            return
+        self._listener_task = asyncio.create_task(self._listen())
+        await self._ready.wait()
+        logger.info(f"Real-time broker subscribed to {', '.join(self.channels)}")
+
+    async def stop(self):
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener_task = None
+        self._ready.clear()
+        try:
+            await self.client.aclose()
+        except Exception:
+            pass
+
+    async def _listen(self):
+        while True:
+            pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.subscribe(*self.channels)
+                self._ready.set()
+                async for message in pubsub.listen():
+                    if message.get('type') != 'message':
+                        continue
+                    channel = message['channel']
+                    if isinstance(channel, bytes):
+                        channel = channel.decode('utf-8')
+                    await self._dispatch(channel, json.loads(message['data']))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Real-time broker connection lost: {e}. Resubscribing in {self.RECONNECT_DELAY}s")
+                # Unblock start() even if the first subscribe failed
+                self._ready.set()
+                await asyncio.sleep(self.RECONNECT_DELAY)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+
+def create_event_broker(backend: Optional[str] = None) -> EventBroker:
+    """
+    Create the real-time broker.
+
+    Args:
+        backend: "redis", "memory" or "auto" (default: REALTIME_BROKER env var,
+            else "auto" - Redis when it is reachable)
+    """
+    backend = (backend or os.getenv('REALTIME_BROKER', 'auto')).lower()
+
+    if backend == 'auto':
+        backend = 'redis' if get_redis_client() is not None else 'memory'
+
+    if backend == 'redis':
+        try:
+            return RedisBroker(os.getenv('REALTIME_REDIS_URL', REDIS_URL))
+        except Exception as e:
+            logger.warning(f"Redis real-time broker unavailable ({e}). Using in-memory broker.")
+
+    return InMemoryBroker()
+
+
+# Broker shared by the WebSocket managers of this worker, created on first use
+# so importing the API does not connect to Redis
+_event_broker: Optional[EventBroker] = None
+_event_broker_lock = threading.Lock()
+
+
+def get_event_broker() -> EventBroker:
+    """Return this worker's broker, creating it on first use."""
+    global _event_broker
+    if _event_broker is None:
+        with _event_broker_lock:
+            if _event_broker is None:
+                _event_broker = create_event_broker()
+    return _event_broker
+
+
+async def stop_event_broker():
+    """Stop this worker's broker if one was created."""
+    if _event_broker is not None:
+        await _event_broker.stop()
+
+
+def __getattr__(name: str):
+    # Kept importable under its historical name
+    if name == 'event_broker':
+        return get_event_broker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,330 @@
+"""
+Incremental RSS/Atom feed parsing
+Parses a feed response entry by entry as the body arrives, so a scraper can stop
+reading once it has the entries it needs instead of downloading and parsing the
+whole document. Documents the streaming parser cannot handle (malformed XML,
+unknown formats) are parsed by feedparser from the bytes read so far.
+"""
+
+import os
+import time
+import calendar
+import logging
+from datetime import datetime, timezone
+from email.utils import parsedate_tz, mktime_tz
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+from xml.etree import ElementTree
+
+try:
+    from .lazy_imports import lazy_import
+except ImportError:
+    from lazy_imports import lazy_import
+
+feedparser = lazy_import('feedparser')
+
+logger = logging.getLogger(__name__)
+
+# Hard cap on the bytes read from one feed response
+FEED_MAX_BYTES = int(os.getenv('FEED_MAX_BYTES', 2 * 1024 * 1024))
+
+# Entries looked at per feed
+FEED_MAX_ENTRIES = int(os.getenv('FEED_MAX_ENTRIES', 50))
+
+# Consecutive already-known entries after which the rest of a feed is skipped
+FEED_KNOWN_RUN = int(os.getenv('FEED_KNOWN_RUN', 5))
+
+# Seconds before a feed's newest entry that are still checked against its seen
+# ids, for entries published (or edited) late
+FEED_WATERMARK_OVERLAP = float(os.getenv('FEED_WATERMARK_OVERLAP', 6 * 3600))
+
+# Ids kept for entries without a date, whose age can't be compared
+FEED_WATERMARK_UNDATED = 500
+
+FEED_CHUNK_SIZE = 16 * 1024
+
+ENTRY_TAGS = {'item', 'entry'}
+CONTAINER_TAGS = {'channel', 'feed'}
+PUBLISHED_TAGS = ('pubDate', 'published', 'issued', 'date')
+UPDATED_TAGS = ('updated', 'modified')
+
+
+def _local(tag) -> str:
+    """Tag name without its namespace."""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def _text(element) -> str:
+    return ''.join(element.itertext()).strip()
+
+
+def parse_feed_date(value: str) -> Optional[time.struct_time]:
+    """RFC 822 or ISO 8601 date as a UTC struct_time (feedparser's *_parsed shape)."""
+    if not value:
+        return None
+    parsed = parsedate_tz(value)
+    if parsed:
+        try:
+            return time.gmtime(mktime_tz(parsed))
+        except (OverflowError, ValueError):
+            return None
+    try:
+        moment = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc).timetuple()
+
+
+def entry_from_element(element) -> Dict:
+    """A feedparser-style entry dict from an RSS <item> or Atom <entry> element."""
+    fields: Dict[str, str] = {}
+    link = ''
+    guid_is_link = True
+
+    for child in element:
+        name = _local(child.tag)
+        if name == 'link':
+            href = child.get('href')
+            if href is None:
+                link = link or (child.text or '').strip()
+            elif not link and child.get('rel', 'alternate') == 'alternate':
+                link = href.strip()
+        elif name not in fields:
+            fields[name] = _text(child)
+            if name == 'guid':
+                guid_is_link = child.get('isPermaLink', 'true').lower() != 'false'
+
+    guid = fields.get('guid') or fields.get('id', '')
+    if not link and guid_is_link and guid.startswith(('http://', 'https://')):
+        link = guid
+
+    published = next((fields[tag] for tag in PUBLISHED_TAGS if fields.get(tag)), '')
+    updated = next((fields[tag] for tag in UPDATED_TAGS if fields.get(tag)), '')
+
+    return {
+        'id': guid,
+        'link': link,
+        'title': fields.get('title', ''),
+        'summary': fields.get('description') or fields.get('summary') or fields.get('encoded') or fields.get('content', ''),
+        'published': published,
+        'published_parsed': parse_feed_date(published),
+        'updated': updated,
+        'updated_parsed': parse_feed_date(updated),
+    }
+
+
+def entry_timestamp(entry) -> Optional[float]:
+    """Epoch seconds an entry was published (or last updated), if it says."""
+    parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+    if not parsed:
+        return None
+    try:
+        return float(calendar.timegm(parsed))
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+ENTRY_FIELDS = ('id', 'link', 'title', 'summary', 'published', 'updated')
+
+
+def plain_entry(entry) -> Dict:
+    """
+    An entry as plain JSON-compatible data, so it can be shared through the
+    cache's L2 store: the fields the scrapers read, with dates as 9-item lists
+    (usable wherever a struct_time is, e.g. calendar.timegm).
+    """
+    plain = {name: entry.get(name) or '' for name in ENTRY_FIELDS}
+    for name in ('published_parsed', 'updated_parsed'):
+        parsed = entry.get(name)
+        plain[name] = list(parsed) if parsed else None
+    return plain
+
+
+def new_entries(entries: Iterable[Dict], max_entries: int = FEED_MAX_ENTRIES,
+                is_known: Optional[Callable[[Dict], bool]] = None,
+                known_run: int = FEED_KNOWN_RUN) -> Iterator[Dict]:
+    """
+    Entries for which ``is_known`` is false (not seen yet, newer than a
+    watermark); ``known_run`` known entries in a row end the feed and at most
+    ``max_entries`` entries are looked at.
+    """
+    run = 0
+    for looked_at, entry in enumerate(entries, 1):
+        if is_known is not None and is_known(entry):
+            run += 1
+            if run >= known_run:
+                logger.debug(f"Stopping after {run} known entries in a row")
+                return
+        else:
+            run = 0
+            yield entry
+        if looked_at >= max_entries:
+            return
+
+
+class FeedWatermark:
+    """
+    What has been processed from one feed: the newest entry's published time
+    and the ids (guid, else link) of the entries seen since shortly before it.
+
+    Entries published more than ``overlap`` seconds before the newest one are
+    treated as processed; newer ones only when their id has been seen. The
+    state is a small JSON-serialisable dict stored with the feed stats.
+    """
+
+    def __init__(self, state: Optional[Dict] = None, overlap: float = FEED_WATERMARK_OVERLAP):
+        state = state or {}
+        self.published: Optional[float] = state.get('published')
+        self.ids: Dict[str, Optional[float]] = dict(state.get('ids', {}))
+        self.overlap = overlap
+
+    @staticmethod
+    def entry_id(entry) -> str:
+        return entry.get('id') or entry.get('link') or ''
+
+    def is_known(self, entry) -> bool:
+        key = self.entry_id(entry)
+        if key and key in self.ids:
+            return True
+        published = entry_timestamp(entry)
+        return (published is not None and self.published is not None
+                and published < self.published - self.overlap)
+
+    def add(self, entry):
+        """Record an entry as processed."""
+        key = self.entry_id(entry)
+        if not key:
+            return
+        published = entry_timestamp(entry)
+        # Re-inserted so undated ids are kept most recently seen last
+        self.ids.pop(key, None)
+        self.ids[key] = published
+        if published is not None and (self.published is None or published > self.published):
+            self.published = published
+
+    def to_dict(self) -> Dict:
+        """State to persist, without ids that have fallen behind the overlap window."""
+        undated = set([k for k, v in self.ids.items() if v is None][-FEED_WATERMARK_UNDATED:])
+        ids = {
+            k: v for k, v in self.ids.items()
+            if k in undated or (v is not None and v >= self.published - self.overlap)
+        }
+        return {'published': self.published, 'ids': ids}
+
+
+class FeedStream:
+    """
+    Entries of one feed response, parsed while its body is read.
+
+    Reading stops when the consumer stops iterating, when ``max_bytes`` have
+    been read (the entries completed so far are kept) or at the end of the
+    body. When the body is not an RSS/Atom document the streaming parser
+    understands, the bytes read are handed to feedparser instead and its
+    entries are yielded from where the streaming parser left off.
+    """
+
+    def __init__(self, response, max_bytes: int = FEED_MAX_BYTES,
+                 chunk_size: int = FEED_CHUNK_SIZE):
+        self.response = response
+        self.max_bytes = max_bytes
+        self.chunk_size = chunk_size
+        self.title: Optional[str] = None
+        self.bytes_read = 0
+        self.entries_read = 0
+        self.truncated = False
+        self.fallback = False
+        self._body: List[bytes] = []
+        self._chunk_iter = None
+
+    def _chunks(self) -> Iterator[bytes]:
+        if self._chunk_iter is None:
+            self._chunk_iter = iter(self.response.iter_content(self.chunk_size))
+        for chunk in self._chunk_iter:
+            if not chunk:
+                continue
+            remaining = self.max_bytes - self.bytes_read
+            if len(chunk) >= remaining:
+                chunk = chunk[:remaining]
+                self.truncated = True
+            self.bytes_read += len(chunk)
+            self._body.append(chunk)
+            yield chunk
+            if self.truncated:
+                logger.warning(f"Feed body exceeded {self.max_bytes} bytes, "
+                               f"using the entries read so far: {getattr(self.response, 'url', '')}")
+                return
+
+    def __iter__(self) -> Iterator[Dict]:
+        parser = ElementTree.XMLPullParser(events=('start', 'end'))
+        stack = []
+        in_container = False
+        in_entry = 0
+        recognised = False
+
+        try:
+            for chunk in self._chunks():
+                parser.feed(chunk)
+                for event, element in parser.read_events():
+                    name = _local(element.tag)
+                    if event == 'start':
+                        stack.append(element)
+                        if name in CONTAINER_TAGS and not in_entry:
+                            in_container = recognised = True
+                        elif name in ENTRY_TAGS:
+                            in_entry += 1
+                        continue
+
+                    stack.pop()
+                    if name in ENTRY_TAGS and in_entry:
+                        in_entry -= 1
+                        if in_entry:
+                            continue
+                        entry = entry_from_element(element)
+                        # Drop the parsed entry so memory stays flat on large feeds
+                        if stack:
+                            stack[-1].remove(element)
+                        self.entries_read += 1
+                        yield entry
+                    elif name == 'title' and in_container and not in_entry and self.title is None:
+                        self.title = _text(element)
+            if not self.truncated:
+                parser.close()
+        except ElementTree.ParseError as e:
+            logger.debug(f"Streaming parse failed ({e}), falling back to feedparser")
+            recognised = False
+
+        if not recognised:
+            yield from self._fallback_entries()
+
+    def _fallback_entries(self) -> Iterator[Dict]:
+        """Parse the (capped) body with feedparser, skipping entries already yielded."""
+        self.fallback = True
+        for _ in self._chunks():
+            pass
+        feed = feedparser.parse(b''.join(self._body))
+        if feed.bozo and not feed.entries:
+            raise Exception(f"Feed parsing error: {feed.bozo_exception}")
+        if self.title is None:
+            self.title = feed.feed.get('title')
+        for entry in feed.entries[self.entries_read:]:
+            self.entries_read += 1
+            yield entry
+
+    def entries(self, max_entries: int = FEED_MAX_ENTRIES,
+                is_known: Optional[Callable[[Dict], bool]] = None,
+                known_run: int = FEED_KNOWN_RUN) -> Iterator[Dict]:
+        """
+        New entries (see ``new_entries``), newest-first feeds read only as far
+        as needed.
+        """
+        try:
+            yield from new_entries(self, max_entries, is_known, known_run)
+        finally:
+            self.close()
+
+    def close(self):
+        """Release the connection; any unread part of the body is never downloaded."""
+        close = getattr(self.response, 'close', None)
+        if close is not None:
+            close()
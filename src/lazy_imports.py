@@ -0,0 +1,47 @@
+"""
+Deferred imports for heavy optional-path dependencies
+Lets modules keep their usual module-level names (``feedparser.parse``,
+``Article(url)``) while the import cost is paid on first use instead of at
+startup, so CLI modes and API workers that never scrape start quickly
+"""
+
+import importlib
+from typing import Any, Callable
+
+
+class LazyModule:
+    """
+    Stand-in for a module that is imported on first attribute access.
+
+    Attributes set on the stand-in (e.g. by unittest.mock.patch) shadow the
+    real module's, so patch('pkg.mod.feedparser.parse') keeps working.
+    Concurrent first use is safe: importlib serialises the import itself.
+    """
+
+    def __init__(self, name: str):
+        self.__dict__['_lazy_name'] = name
+
+    def _load(self):
+        return importlib.import_module(self._lazy_name)
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self._load(), attribute)
+
+    def __repr__(self) -> str:
+        return f"<lazy module {self._lazy_name!r}>"
+
+
+def lazy_import(name: str) -> LazyModule:
+    """Return a stand-in for module name that imports it on first use."""
+    return LazyModule(name)
+
+
+def lazy_callable(module_name: str, attribute: str) -> Callable:
+    """Return a function that imports module_name on first call and calls its attribute."""
+
+    def call(*args, **kwargs):
+        return getattr(importlib.import_module(module_name), attribute)(*args, **kwargs)
+
+    call.__name__ = call.__qualname__ = attribute
+    call.__doc__ = f"Lazily imported {module_name}.{attribute}"
+    return call
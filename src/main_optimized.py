@@ -31,6 +31,7 @@ from config import (
 from .twitter_monitor_optimized import OptimizedTwitterMonitor
 from .news_scraper_optimized import OptimizedNewsScraper
 from .email_notifier import EmailNotifier
+from .rule_pack import get_rule_pack
 
 # Import swarm coordination
 from .swarm_integration import SwarmCoordinationHooks
@@ -38,6 +39,7 @@ from .swarm_integration import SwarmCoordinationHooks
 # Import database models for saving alerts
 from .database import DatabaseManager
 from .models import Alert, Company, Feed, MonitoringSession
+from .config_watcher import ConfigUpdate, ConfigWatcher
 
 # Configure logging
 def setup_logging():
@@ -62,10 +64,21 @@ def setup_logging():
 logger = setup_logging()
 
 
+# Marks a subsystem that has not been constructed yet (None means disabled)
+_NOT_CREATED = object()
+
+
 class OptimizedCryptoTGEMonitor:
     """Enhanced TGE monitoring system with optimized detection capabilities."""
 
-    def __init__(self, swarm_enabled: bool = None):
+    def __init__(self, swarm_enabled: bool = None, lazy: bool = False):
+        """
+        Args:
+            swarm_enabled: Override SWARM_CONFIG['enabled']
+            lazy: Construct the news scraper and Twitter monitor on first use
+                instead of here, so modes that never scrape (test, status)
+                skip loading feeds from the database and the Twitter client
+        """
         logger.info("Initializing CryptoTGEMonitor...")
 
         # Initialize swarm coordination
@@ -82,40 +95,17 @@ class OptimizedCryptoTGEMonitor:
         logger.info("Initializing email notifier...")
         self.email_notifier = EmailNotifier()  # No config needed - reads EMAIL_CONFIG internally
 
-        # Load feed URLs from database instead of config.py
-        logger.info("Loading feeds from database...")
-        feed_urls = self._load_feeds_from_database()
-        logger.info(f"Loaded {len(feed_urls)} feeds from database")
-
-        logger.info("Initializing news scraper...")
-        self.news_scraper = OptimizedNewsScraper(COMPANIES, TGE_KEYWORDS, feed_urls)
-        logger.info("News scraper initialized")
-
-        # Pass swarm hooks to scrapers
-        if hasattr(self.news_scraper, 'set_swarm_hooks'):
-            self.news_scraper.set_swarm_hooks(self.swarm_hooks)
-
-        # Initialize Twitter monitor if configured
-        logger.info("Checking Twitter configuration...")
-        self.twitter_monitor = None
-        if TWITTER_CONFIG['bearer_token'] and not os.getenv('DISABLE_TWITTER'):
-            try:
-                logger.info("Initializing Twitter monitor...")
-                self.twitter_monitor = OptimizedTwitterMonitor(
-                    TWITTER_CONFIG['bearer_token'],
-                    COMPANIES,
-                    TGE_KEYWORDS
-                )
-
-                # Pass swarm hooks to Twitter monitor
-                if hasattr(self.twitter_monitor, 'set_swarm_hooks'):
-                    self.twitter_monitor.set_swarm_hooks(self.swarm_hooks)
+        # Companies and feeds start from config and follow database edits
+        # between cycles (see refresh_config)
+        self.companies = COMPANIES
+        self.config_watcher = ConfigWatcher(COMPANIES, NEWS_SOURCES)
 
-                logger.info("Twitter monitoring enabled with optimizations")
-            except Exception as e:
-                logger.error(f"Failed to initialize Twitter monitor: {str(e)}")
-        else:
-            logger.info("Twitter monitoring disabled")
+        self._news_scraper = _NOT_CREATED
+        self._twitter_monitor = _NOT_CREATED
+        self.twitter_stream = None
+        if not lazy:
+            self._news_scraper = self._create_news_scraper()
+            self._twitter_monitor = self._create_twitter_monitor()
 
         # State management
         logger.info("Loading monitor state...")
@@ -148,6 +138,66 @@ class OptimizedCryptoTGEMonitor:
         # Progress callback for real-time updates
         self.progress_callback = None
     
+    def _create_news_scraper(self) -> OptimizedNewsScraper:
+        # Load feed URLs from database instead of config.py
+        logger.info("Loading feeds from database...")
+        feed_urls = self._load_feeds_from_database()
+        logger.info(f"Loaded {len(feed_urls)} feeds from database")
+
+        logger.info("Initializing news scraper...")
+        news_scraper = OptimizedNewsScraper(self.companies, TGE_KEYWORDS, feed_urls)
+        logger.info("News scraper initialized")
+
+        # Pass swarm hooks to scrapers
+        if hasattr(news_scraper, 'set_swarm_hooks'):
+            news_scraper.set_swarm_hooks(self.swarm_hooks)
+        return news_scraper
+
+    def _create_twitter_monitor(self) -> Optional[OptimizedTwitterMonitor]:
+        # Initialize Twitter monitor if configured
+        logger.info("Checking Twitter configuration...")
+        if not TWITTER_CONFIG['bearer_token'] or os.getenv('DISABLE_TWITTER'):
+            logger.info("Twitter monitoring disabled")
+            return None
+
+        try:
+            logger.info("Initializing Twitter monitor...")
+            twitter_monitor = OptimizedTwitterMonitor(
+                TWITTER_CONFIG['bearer_token'],
+                self.companies,
+                TGE_KEYWORDS
+            )
+
+            # Pass swarm hooks to Twitter monitor
+            if hasattr(twitter_monitor, 'set_swarm_hooks'):
+                twitter_monitor.set_swarm_hooks(self.swarm_hooks)
+
+            logger.info("Twitter monitoring enabled with optimizations")
+            return twitter_monitor
+        except Exception as e:
+            logger.error(f"Failed to initialize Twitter monitor: {str(e)}")
+            return None
+
+    @property
+    def news_scraper(self) -> OptimizedNewsScraper:
+        if self._news_scraper is _NOT_CREATED:
+            self._news_scraper = self._create_news_scraper()
+        return self._news_scraper
+
+    @news_scraper.setter
+    def news_scraper(self, news_scraper):
+        self._news_scraper = news_scraper
+
+    @property
+    def twitter_monitor(self) -> Optional[OptimizedTwitterMonitor]:
+        if self._twitter_monitor is _NOT_CREATED:
+            self._twitter_monitor = self._create_twitter_monitor()
+        return self._twitter_monitor
+
+    @twitter_monitor.setter
+    def twitter_monitor(self, twitter_monitor):
+        self._twitter_monitor = twitter_monitor
+
     def load_state(self) -> Dict:
         """Load monitor state."""
         try:
@@ -192,28 +242,67 @@ class OptimizedCryptoTGEMonitor:
             logger.error(f"Error loading feeds from database: {str(e)}, falling back to config")
             return NEWS_SOURCES
 
+    def refresh_config(self) -> bool:
+        """
+        Apply company and feed changes made in the database since the last poll.
+
+        Feeds are added to or removed from the news scraper's list; changed
+        companies are pushed to the scrapers, whose rule packs recompile only
+        the affected patterns. Returns True when anything changed.
+        """
+        try:
+            update = self.config_watcher.poll()
+            return update is not None and self._apply_config_update(update)
+        except Exception as e:
+            logger.error(f"Error applying config changes: {str(e)}")
+            return False
+
+    def _apply_config_update(self, update: ConfigUpdate) -> bool:
+        news_scraper = self._news_scraper if self._news_scraper is not _NOT_CREATED else None
+        twitter_monitor = self._twitter_monitor if self._twitter_monitor is not _NOT_CREATED else None
+        changed = False
+
+        if news_scraper is not None and set(update.feeds) != set(news_scraper.news_sources):
+            current = set(news_scraper.news_sources)
+            added = [url for url in update.feeds if url not in current]
+            removed = len(current - set(update.feeds))
+            news_scraper.news_sources = list(update.feeds)
+            logger.info(f"Feed list updated: {len(added)} added, {removed} removed")
+            changed = True
+
+        if update.companies_changed:
+            logger.info(f"Companies updated: {', '.join(sorted(update.changed_companies))}")
+            self.companies = update.companies
+            self.compile_matching_patterns()
+            if news_scraper is not None:
+                news_scraper.update_companies(self.companies)
+            if twitter_monitor is not None:
+                twitter_monitor.update_companies(self.companies)
+                if self.twitter_stream is not None:
+                    self.twitter_stream.rules = twitter_monitor.compile_stream_rules()
+                    try:
+                        self.twitter_stream.sync_rules()
+                    except Exception as e:
+                        logger.error(f"Error syncing stream rules after company update: {str(e)}")
+            changed = True
+
+        return changed
+
     def compile_matching_patterns(self):
-        """Compile regex patterns for enhanced matching."""
+        """Take matching patterns from the shared, precompiled rule pack."""
+        rules = get_rule_pack(self.companies, TGE_KEYWORDS)
+
         # Company patterns with word boundaries
-        self.company_patterns = {}
-        for company in COMPANIES:
-            terms = [company['name']] + company.get('aliases', [])
-            pattern = r'\b(' + '|'.join(re.escape(term) for term in terms) + r')\b'
-            self.company_patterns[company['name']] = re.compile(pattern, re.IGNORECASE)
+        self.company_patterns = dict(rules.company_patterns)
         
         # Token symbol pattern
-        self.token_pattern = re.compile(r'\$[A-Z]{2,10}\b')
+        self.token_pattern = rules.token_pattern
         
         # Date patterns for urgency detection
-        self.date_patterns = [
-            re.compile(r'\b(today|tomorrow|tonight)\b', re.IGNORECASE),
-            re.compile(r'\b(this|next)\s+(week|monday|tuesday|wednesday|thursday|friday)\b', re.IGNORECASE),
-            re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'),
-            re.compile(r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}\b', re.IGNORECASE)
-        ]
+        self.date_patterns = list(rules.urgency_date_patterns)
         
         # Exclusion patterns
-        self.exclusion_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in EXCLUSION_PATTERNS]
+        self.exclusion_patterns = list(rules.exclusion_patterns)
     
     def enhanced_content_analysis(self, text: str, source_type: str = "unknown") -> Tuple[bool, float, Dict]:
         """
@@ -238,7 +327,7 @@ class OptimizedCryptoTGEMonitor:
             info['confidence'] += 15
             
             # Check if symbols match company tokens
-            for company in COMPANIES:
+            for company in self.companies:
                 for token in company.get('tokens', []):
                     if f"${token.upper()}" in token_matches:
                         info['matched_companies'].append(company['name'])
@@ -253,7 +342,7 @@ class OptimizedCryptoTGEMonitor:
                 info['confidence'] += 20
                 
                 # Get company priority
-                company_data = next((c for c in COMPANIES if c['name'] == company_name), None)
+                company_data = next((c for c in self.companies if c['name'] == company_name), None)
                 if company_data and company_data.get('priority') == 'HIGH':
                     info['confidence'] += 10
                     info['strategy'].append('high_priority_company')
@@ -328,7 +417,7 @@ class OptimizedCryptoTGEMonitor:
         if info['matched_companies']:
             high_priority_companies = [c for c in info['matched_companies'] 
                                      if any(comp['name'] == c and comp.get('priority') == 'HIGH' 
-                                           for comp in COMPANIES)]
+                                           for comp in self.companies)]
             if high_priority_companies:
                 threshold -= 10  # Lower threshold for high-priority companies
         
@@ -606,6 +695,9 @@ class OptimizedCryptoTGEMonitor:
             'errors_encountered': 0
         }
 
+        # Pick up companies and feeds added or edited since the last cycle
+        self.refresh_config()
+
         # Pre-task hook
         task_id = self.swarm_hooks.pre_task("TGE monitoring cycle - news and Twitter scraping")
 
@@ -625,8 +717,8 @@ class OptimizedCryptoTGEMonitor:
                 # News scraping
                 futures.append(executor.submit(self.news_scraper.fetch_all_articles, timeout=120))
 
-                # Twitter monitoring
-                if self.twitter_monitor:
+                # Twitter monitoring (the filtered stream delivers tweets between cycles)
+                if self.twitter_monitor and self.twitter_stream is None:
                     futures.append(executor.submit(self.twitter_monitor.fetch_all_tweets, timeout=60))
 
                 # Process results
@@ -897,6 +989,32 @@ class OptimizedCryptoTGEMonitor:
         except Exception as e:
             logger.error(f"Error sending weekly summary: {str(e)}")
     
+    def start_twitter_stream(self) -> bool:
+        """Start pushing tweets from the Twitter filtered stream into alert processing."""
+        if self.twitter_monitor is None or self.twitter_stream is not None:
+            return False
+
+        try:
+            self.twitter_stream = self.twitter_monitor.create_filtered_stream(self._handle_stream_tweet)
+        except Exception as e:
+            logger.error(f"Failed to start Twitter filtered stream: {str(e)}")
+            return False
+
+        self.twitter_stream.start_background()
+        logger.info(f"Twitter filtered stream started with {len(self.twitter_stream.rules)} rules; "
+                    f"per-cycle Twitter polling disabled")
+        return True
+
+    def _handle_stream_tweet(self, tweet: Dict):
+        """Analyze a streamed tweet and alert on it without waiting for the next cycle."""
+        alerts = self.process_alerts([tweet], 'twitter')
+        if not alerts:
+            return
+
+        logger.info(f"Real-time TGE alert from filtered stream: tweet {tweet['id']}")
+        self.save_alerts_to_database(alerts)
+        self.email_notifier.send_tge_alerts(alerts)
+
     def run_continuous(self):
         """Run continuous monitoring with weekly schedule."""
         self.running = True
@@ -911,6 +1029,10 @@ class OptimizedCryptoTGEMonitor:
         # Schedule weekly summary (30 minutes after monitoring)
         schedule.every().monday.at("08:30").do(self.send_weekly_summary)
         
+        # Real-time Twitter ingestion replaces per-cycle Twitter polling
+        if TWITTER_CONFIG.get('stream_enabled'):
+            self.start_twitter_stream()
+
         # Run initial cycle
         logger.info("Running initial monitoring cycle")
         self.run_monitoring_cycle()
@@ -930,8 +1052,13 @@ class OptimizedCryptoTGEMonitor:
         """Graceful shutdown."""
         logger.info("Shutting down TGE monitor")
         self.running = False
+        if self.twitter_stream is not None:
+            self.twitter_stream.stop()
         self.save_state()
 
+        # Deliver any pending alert digest before exiting
+        self.email_notifier.close()
+
         # End swarm session
         if self.swarm_hooks.enabled:
             self.swarm_hooks.session_end(export_metrics=True)
@@ -950,8 +1077,8 @@ def main():
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
-    # Initialize monitor
-    monitor = OptimizedCryptoTGEMonitor()
+    # Initialize monitor; scrapers are built on first use, so test/status skip them
+    monitor = OptimizedCryptoTGEMonitor(lazy=True)
     
     # Signal handling
     def signal_handler(sig, frame):
@@ -966,6 +1093,7 @@ def main():
     if args.mode == 'once':
         logger.info("Running single monitoring cycle")
         monitor.run_monitoring_cycle()
+        monitor.email_notifier.flush()
     elif args.mode == 'continuous':
         monitor.run_continuous()
     elif args.mode == 'test':
@@ -3,7 +3,7 @@ SQLAlchemy models for TGE Monitor database
 Enhanced data models with relationships and indexing
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, JSON, ForeignKey, Index
+from sqlalchemy import Column, Integer, String, DateTime, Float, Text, Boolean, JSON, ForeignKey, Index, event, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -219,6 +219,57 @@ class Feed(Base):
         }
 
 
+class ConfigChange(Base):
+    """
+    Change log of monitored companies and feeds.
+
+    Rows are written by the ORM listeners below in the same transaction as
+    the change itself; running monitors poll for ids above their watermark
+    (see config_watcher.py) instead of reloading every company and feed.
+    """
+    __tablename__ = "config_changes"
+
+    id = Column(Integer, primary_key=True, index=True)
+    entity = Column(String(20), nullable=False)   # company, feed
+    entity_id = Column(Integer, nullable=False)
+    action = Column(String(10), nullable=False)   # upsert, delete
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "entity": self.entity,
+            "entity_id": self.entity_id,
+            "action": self.action,
+            "created_at": self.created_at.isoformat() if self.created_at else None
+        }
+
+
+# Columns that change what a monitor matches or fetches; updates to anything
+# else (feed statistics, timestamps) are not recorded
+COMPANY_WATCHED_FIELDS = ('name', 'aliases', 'tokens', 'priority', 'status', 'exclusions')
+FEED_WATCHED_FIELDS = ('name', 'url', 'type', 'priority', 'is_active')
+
+
+def _record_config_change(entity: str, action: str, watched_fields: tuple = ()):
+    def listener(mapper, connection, target):
+        if watched_fields:
+            attrs = inspect(target).attrs
+            if not any(attrs[field].history.has_changes() for field in watched_fields):
+                return
+        connection.execute(
+            ConfigChange.__table__.insert().values(entity=entity, entity_id=target.id, action=action)
+        )
+    return listener
+
+
+for _model, _entity, _fields in ((Company, 'company', COMPANY_WATCHED_FIELDS),
+                                 (Feed, 'feed', FEED_WATCHED_FIELDS)):
+    event.listen(_model, 'after_insert', _record_config_change(_entity, 'upsert'))
+    event.listen(_model, 'after_update', _record_config_change(_entity, 'upsert', _fields))
+    event.listen(_model, 'after_delete', _record_config_change(_entity, 'delete'))
+
+
 class MonitoringSession(Base):
     """Monitoring session model for tracking runs"""
     __tablename__ = "monitoring_sessions"
@@ -5,20 +5,51 @@ Enhanced with full article content extraction, parallel processing, and smart pr
 
 import os
 import json
-import feedparser
 import requests
 import logging
+import threading
 from typing import Dict, List, Optional, Tuple, Set
 from datetime import datetime, timedelta, timezone
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urljoin, parse_qsl, urlencode, urlunparse
 import hashlib
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from collections import defaultdict
 import re
-from bs4 import BeautifulSoup
-from newspaper import Article
-import nltk
+
+try:
+    from .cache_manager import get_cache_manager
+    from .feed_stream import FeedStream, FeedWatermark, new_entries, plain_entry
+    from .lazy_imports import lazy_callable, lazy_import
+    from .rule_pack import RulePackRef
+    from .session_manager import ACCEPT_ENCODING, HOST_POOL_MAXSIZE, get_session_manager
+except ImportError:
+    from cache_manager import get_cache_manager
+    from feed_stream import FeedStream, FeedWatermark, new_entries, plain_entry
+    from lazy_imports import lazy_callable, lazy_import
+    from rule_pack import RulePackRef
+    from session_manager import ACCEPT_ENCODING, HOST_POOL_MAXSIZE, get_session_manager
+
+# Parsing and extraction libraries (nltk alone takes ~0.3s) are imported on first use
+feedparser = lazy_import('feedparser')
+BeautifulSoup = lazy_callable('bs4', 'BeautifulSoup')
+Article = lazy_callable('newspaper', 'Article')
+
+# How long seen URLs are kept as a cross-feed safety net behind the feed watermarks
+SEEN_URLS_HORIZON = timedelta(hours=float(os.getenv('SEEN_URLS_HORIZON_HOURS', 72)))
+
+# Query parameters that only track where a click came from, stripped on every domain
+TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    '_hsenc', '_hsmi', 'mkt_tok', 'ref', 'ref_src', 'cmpid', 'ncid', 'sr_share', 'guccounter',
+})
+TRACKING_PREFIXES = ('utm_',)
+
+# AMP variants of a page: ?amp, ?outputType=amp and a trailing /amp path segment
+AMP_PATH = re.compile(r'/amp/?$', re.IGNORECASE)
+
+CANONICAL_LINK = re.compile(r'<link\b[^>]*\brel=["\']?canonical\b[^>]*>', re.IGNORECASE)
+LINK_HREF = re.compile(r'\bhref=["\']?([^"\'\s>]+)', re.IGNORECASE)
 
 # Configure logging first
 logging.basicConfig(level=logging.INFO)
@@ -27,6 +58,7 @@ logger = logging.getLogger(__name__)
 # Download required NLTK data for article extraction
 # Use timeout and non-blocking mode to prevent initialization hang
 def _download_nltk_data():
+    import nltk
     try:
         nltk.data.find('tokenizers/punkt')
     except LookupError:
@@ -35,10 +67,20 @@ def _download_nltk_data():
         except Exception as e:
             logger.warning(f"NLTK punkt download failed (non-critical): {e}")
 
-# Run in background to avoid blocking
-import threading
-nltk_thread = threading.Thread(target=_download_nltk_data, daemon=True)
-nltk_thread.start()
+_nltk_lock = threading.Lock()
+nltk_thread = None
+
+
+def ensure_nltk_data():
+    """Start the background NLTK data check once, when article extraction is first needed."""
+    global nltk_thread
+    if nltk_thread is None:
+        with _nltk_lock:
+            if nltk_thread is None:
+                # Run in background to avoid blocking
+                nltk_thread = threading.Thread(target=_download_nltk_data, daemon=True)
+                nltk_thread.start()
+    return nltk_thread
 
 
 class OptimizedNewsScraper:
@@ -64,6 +106,10 @@ class OptimizedNewsScraper:
         # Performance tracking
         self.feed_stats = self.state.get('feed_stats', {})
         self.session = self._create_session()
+        # Article pages go through the shared, size-capped client
+        self.http = get_session_manager()
+        # Feeds and extracted articles shared with other scraper threads and workers
+        self.shared_cache = get_cache_manager()
         
         # Article extraction patterns
         self.article_patterns = {
@@ -77,10 +123,18 @@ class OptimizedNewsScraper:
         self.url_normalizers = self._compile_url_normalizers()
         self.content_cleaners = self._compile_content_cleaners()
 
+        # Relevance rules are compiled once and shared with the other analyzers
+        self.rules = RulePackRef(companies, keywords)
+
     def set_swarm_hooks(self, swarm_hooks):
         """Set swarm coordination hooks for multi-agent coordination."""
         self.swarm_hooks = swarm_hooks
         logger.info("Swarm hooks enabled for news scraper")
+
+    def update_companies(self, companies: List[Dict]):
+        """Match against a new company list from the next analysis on."""
+        self.companies = companies
+        self.rules.update(companies, self.keywords)
         
     def load_state(self) -> Dict:
         """Load persistent state with feed statistics."""
@@ -109,11 +163,15 @@ class OptimizedNewsScraper:
                     cutoff = (datetime.now(timezone.utc) - timedelta(days=3)).isoformat()
                     cache['articles'] = {k: v for k, v in cache.get('articles', {}).items() 
                                        if v.get('cached_at', '') > cutoff}
+                    cache['aliases'] = {k: v for k, v in cache.get('aliases', {}).items()
+                                        if v in cache['articles']}
+                    cache['content_index'] = {k: v for k, v in cache.get('content_index', {}).items()
+                                              if v.get('indexed_at', '') > cutoff}
                     return cache
         except Exception as e:
             logger.error(f"Error loading cache: {str(e)}")
         
-        return {'articles': {}, 'summaries': {}}
+        return {'articles': {}, 'summaries': {}, 'aliases': {}, 'content_index': {}}
     
     def save_state(self):
         """Save persistent state."""
@@ -139,15 +197,15 @@ class OptimizedNewsScraper:
             'User-Agent': 'Mozilla/5.0 (compatible; TGEMonitor/1.0; +https://example.com/bot)',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Cache-Control': 'no-cache',
             'Pragma': 'no-cache'
         })
         
-        # Increase connection pool size
+        # One pool per feed host, each kept small
         adapter = requests.adapters.HTTPAdapter(
             pool_connections=20,
-            pool_maxsize=20,
+            pool_maxsize=HOST_POOL_MAXSIZE,
             max_retries=requests.adapters.Retry(
                 total=3,
                 backoff_factor=0.3,
@@ -180,6 +238,7 @@ class OptimizedNewsScraper:
     
     def normalize_url(self, url: str) -> str:
         """Normalize URL for deduplication."""
+        url = self._strip_tracking(url)
         parsed = urlparse(url)
         domain = parsed.netloc.lower()
         
@@ -191,6 +250,67 @@ class OptimizedNewsScraper:
         # Default normalization
         return url.rstrip('/')
     
+    def _strip_tracking(self, url: str) -> str:
+        """Drop tracking parameters, AMP markers and the fragment from a URL."""
+        parsed = urlparse(url)
+        query = parse_qsl(parsed.query, keep_blank_values=True)
+        kept = [
+            (key, value) for key, value in query
+            if not (key.lower() in TRACKING_PARAMS or key.lower().startswith(TRACKING_PREFIXES)
+                    or key.lower() == 'amp' or (key.lower() == 'outputtype' and value.lower() == 'amp'))
+        ]
+        path = AMP_PATH.sub('', parsed.path) or parsed.path
+        if len(kept) == len(query) and path == parsed.path and not parsed.fragment:
+            return url
+        return urlunparse(parsed._replace(path=path, query=urlencode(kept), fragment=''))
+
+    def _canonical_url(self, html: str, url: str) -> Optional[str]:
+        """The page's <link rel=canonical> target when it names another article URL."""
+        match = CANONICAL_LINK.search(html[:200_000])
+        href = LINK_HREF.search(match.group(0)) if match else None
+        if not href:
+            return None
+        canonical = urljoin(url, href.group(1))
+        parsed = urlparse(canonical)
+        # Pages canonicalised to a site's home page are not copies of one article
+        if parsed.scheme not in ('http', 'https') or not parsed.path.strip('/'):
+            return None
+        canonical = self.normalize_url(canonical)
+        return canonical if canonical != url else None
+
+    def _article_key(self, url: str) -> str:
+        """Article cache key for a URL, following recorded redirects and canonical links."""
+        key = hashlib.sha256(url.encode()).hexdigest()
+        aliases = self.cache.setdefault('aliases', {})
+        for _ in range(3):
+            target = aliases.get(key)
+            if target is None or target == key:
+                break
+            key = target
+        return key
+
+    def _add_alias(self, url: str, target_url: str):
+        key = hashlib.sha256(url.encode()).hexdigest()
+        target = self._article_key(target_url)
+        if target != key:
+            self.cache.setdefault('aliases', {})[key] = target
+
+    def content_hash(self, content: str) -> str:
+        """Hash of extracted article text, ignoring case and whitespace."""
+        return hashlib.sha256(' '.join(content.lower().split()).encode()).hexdigest()
+
+    def _index_content(self, url: str, content: str) -> str:
+        """Record content under its hash; returns the URL it was first seen at."""
+        entry = self.cache.setdefault('content_index', {}).setdefault(self.content_hash(content), {
+            'url': url,
+            'indexed_at': datetime.now(timezone.utc).isoformat()
+        })
+        return entry['url']
+
+    def is_duplicate_content(self, url: str, content: str) -> bool:
+        """Whether the same text was already seen (and scored) under another URL."""
+        return self._index_content(url, content) != url
+
     def fetch_article_content(self, url: str) -> Optional[str]:
         """Fetch and extract full article content."""
         # Check swarm shared cache first (if enabled)
@@ -204,16 +324,38 @@ class OptimizedNewsScraper:
                 if cached_content:
                     return cached_content
 
-        # Check local cache
-        cache_key = hashlib.sha256(url.encode()).hexdigest()
+        # Check local cache (syndicated copies resolve to the canonical article)
+        cache_key = self._article_key(url)
         if cache_key in self.cache['articles']:
             logger.debug(f"Using cached content for: {url}")
             return self.cache['articles'][cache_key]['content']
-        
+
+        # Callers asking for the same URL share one download and extraction, and
+        # a failed URL is remembered briefly instead of being retried by each
+        content, _ = self.shared_cache.get_or_fetch(
+            'article_content', url, lambda: self._extract_article(url))
+        return content
+
+    def _extract_article(self, url: str) -> Optional[str]:
+        """Download and extract an article; None if that fails or leaves no text."""
         try:
-            # Use newspaper3k for general article extraction with timeout
+            ensure_nltk_data()
+            # Download through the shared client (compressed, capped, HTML only),
+            # then let newspaper3k extract the article from that HTML
+            html = self._download_html(url)
+
+            # A redirect or canonical link may point at an article already extracted
+            canonical_url = self._canonical_url(html, url)
+            if canonical_url:
+                self._add_alias(url, canonical_url)
+            cache_key = self._article_key(url)
+            if cache_key in self.cache['articles']:
+                logger.debug(f"Using cached content of canonical article for: {url}")
+                self.save_cache()
+                return self.cache['articles'][cache_key]['content']
+
             article = Article(url)
-            article.download()  # Note: newspaper3k doesn't support timeout directly
+            article.download(input_html=html)
             article.parse()
             
             # Get the main content
@@ -224,7 +366,7 @@ class OptimizedNewsScraper:
                 domain = urlparse(url).netloc.lower()
                 for pattern, extractor in self.article_patterns.items():
                     if pattern in domain:
-                        custom_content = extractor(url)
+                        custom_content = extractor(url, html)
                         if custom_content and len(custom_content) > len(content):
                             content = custom_content
             
@@ -238,6 +380,7 @@ class OptimizedNewsScraper:
                     'cached_at': datetime.now(timezone.utc).isoformat(),
                     'length': len(content)
                 }
+                self._index_content(url, content)
                 self.save_cache()
 
                 # Also cache in swarm shared memory (if enabled)
@@ -265,17 +408,26 @@ class OptimizedNewsScraper:
                         memory_key=f"swarm/shared/articles/{cache_key}"
                     )
 
-            return content
+            return content or None
             
         except Exception as e:
             logger.debug(f"Error fetching article {url}: {str(e)}")
             return None
     
-    def _extract_medium_article(self, url: str) -> Optional[str]:
+    def _download_html(self, url: str) -> str:
+        """Article page HTML; non-HTML responses are rejected before their body is read."""
+        response = self.http.fetch(url, session_type='article', timeout=10)
+        response.raise_for_status()
+        # Remember where the URL redirects so the next lookup skips the download
+        final_url = self.normalize_url(response.url)
+        if final_url != url:
+            self._add_alias(url, final_url)
+        return response.text
+
+    def _extract_medium_article(self, url: str, html: Optional[str] = None) -> Optional[str]:
         """Custom extractor for Medium articles."""
         try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(html if html is not None else self._download_html(url), 'html.parser')
             
             # Find article content
             article_tags = soup.find_all(['article', 'main'])
@@ -294,11 +446,10 @@ class OptimizedNewsScraper:
         
         return None
     
-    def _extract_mirror_article(self, url: str) -> Optional[str]:
+    def _extract_mirror_article(self, url: str, html: Optional[str] = None) -> Optional[str]:
         """Custom extractor for Mirror.xyz articles."""
         try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(html if html is not None else self._download_html(url), 'html.parser')
             
             # Find main content div
             content_div = soup.find('div', {'class': re.compile(r'prose', re.I)})
@@ -309,11 +460,10 @@ class OptimizedNewsScraper:
         
         return None
     
-    def _extract_substack_article(self, url: str) -> Optional[str]:
+    def _extract_substack_article(self, url: str, html: Optional[str] = None) -> Optional[str]:
         """Custom extractor for Substack articles."""
         try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(html if html is not None else self._download_html(url), 'html.parser')
             
             # Find post content
             content_div = soup.find('div', {'class': 'post-content'})
@@ -324,11 +474,10 @@ class OptimizedNewsScraper:
         
         return None
     
-    def _extract_ghost_article(self, url: str) -> Optional[str]:
+    def _extract_ghost_article(self, url: str, html: Optional[str] = None) -> Optional[str]:
         """Custom extractor for Ghost blog articles."""
         try:
-            response = self.session.get(url, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(html if html is not None else self._download_html(url), 'html.parser')
             
             # Find post content
             content = soup.find(['article', 'main', 'div'], {'class': re.compile(r'post-content|article-content', re.I)})
@@ -365,16 +514,11 @@ class OptimizedNewsScraper:
         
         # Combine title and content for analysis
         full_text = f"{title}\n{content}".lower()
-        
+        rules = self.rules.get()
+
         # Company detection with context
         for company in self.companies:
-            company_pattern = re.compile(
-                r'\b(' + '|'.join(re.escape(term.lower()) for term in 
-                                [company['name']] + company.get('aliases', [])) + r')\b',
-                re.IGNORECASE
-            )
-            
-            matches = list(company_pattern.finditer(full_text))
+            matches = list(rules.company_patterns[company['name']].finditer(full_text))
             if matches:
                 relevance_info['matched_companies'].append(company['name'])
                 relevance_info['confidence'] += 25
@@ -387,37 +531,21 @@ class OptimizedNewsScraper:
                     relevance_info['context_snippets'].append(snippet)
         
         # Enhanced keyword matching with weighted scoring
-        high_value_phrases = [
-            (r'token generation event', 45),
-            (r'tge\s+(is\s+)?live', 40),
-            (r'airdrop\s+(is\s+)?live', 40),
-            (r'claim\s+(your\s+)?tokens?\s+(now|today)', 40),
-            (r'token\s+launch\s+date', 35),
-            (r'tokens?\s+(are\s+)?(now\s+)?available', 35),
-            (r'trading\s+(is\s+)?(now\s+)?live', 35),
-            (r'claim\s+portal\s+(is\s+)?(now\s+)?live', 40),
-            (r'genesis\s+event', 30),
-            (r'mainnet\s+launch', 30)
-        ]
-
-        for phrase_pattern, score in high_value_phrases:
-            matches = re.finditer(phrase_pattern, full_text, re.IGNORECASE)
-            for match in matches:
+        for phrase_pattern, score in rules.high_value_phrases:
+            match = phrase_pattern.search(full_text)
+            if match:  # Count each pattern only once
                 relevance_info['matched_keywords'].append(match.group(0))
                 relevance_info['confidence'] += score
                 relevance_info['signals'].append('high_value_phrase')
-                break  # Count each pattern only once
 
         # General keyword matching (from self.keywords)
-        for keyword in self.keywords:
-            keyword_pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            if re.search(keyword_pattern, full_text):
-                relevance_info['matched_keywords'].append(keyword)
-                # Lower confidence for general keywords vs high-value phrases
-                relevance_info['confidence'] += 15
+        for keyword in rules.match_keywords(full_text):
+            relevance_info['matched_keywords'].append(keyword)
+            # Lower confidence for general keywords vs high-value phrases
+            relevance_info['confidence'] += 15
 
         # Token symbol detection
-        token_patterns = re.findall(r'\$[A-Z]{2,10}\b', content)
+        token_patterns = rules.token_pattern.findall(content)
         if token_patterns:
             # Check if any match company tokens
             for company in self.companies:
@@ -427,43 +555,15 @@ class OptimizedNewsScraper:
                         relevance_info['signals'].append(f'token_symbol_{token}')
         
         # Date proximity analysis
-        date_patterns = [
-            r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}',
-            r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}',
-            r'\b(next|this)\s+(week|month)',
-            r'\bQ[1-4]\s*2024',
-            r'\b(today|tomorrow|soon)\b'
-        ]
-        
-        for pattern in date_patterns:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                relevance_info['signals'].append('date_mentioned')
-                relevance_info['confidence'] += 10
-                break
+        if rules.date_mention_pattern.search(full_text):
+            relevance_info['signals'].append('date_mentioned')
+            relevance_info['confidence'] += 10
         
         # Enhanced exclusion patterns with context awareness
-        exclusions = [
-            (r'test\s*net(?!\s+to\s+mainnet)', 50, 'testnet'),  # Don't penalize "testnet to mainnet"
-            (r'game\s+token(?!omics)', 40, 'game_token'),  # Don't penalize "game tokenomics"
-            (r'nft\s+(collection|drop|mint)', 30, 'nft_collection'),
-            (r'price\s+prediction', 35, 'speculation'),
-            (r'technical\s+analysis', 35, 'speculation'),
-            (r'espresso\s+machine', 60, 'coffee_machine'),
-            (r'coffee\s+(shop|bean|brew)', 50, 'coffee_related'),
-            (r'in-game\s+(currency|item|token)', 45, 'gaming'),
-            (r'play-to-earn\s+game', 40, 'gaming'),
-            (r'fabric\s+(textile|cloth|material)', 50, 'physical_goods')
-        ]
-
-        # Check for crypto context
-        crypto_terms = [
-            'blockchain', 'crypto', 'defi', 'web3', 'protocol', 'mainnet',
-            'smart contract', 'dapp', 'layer 2', 'rollup'
-        ]
-        has_crypto_context = any(term in full_text for term in crypto_terms)
+        has_crypto_context = bool(rules.crypto_terms_pattern.search(full_text))
 
-        for pattern, penalty, label in exclusions:
-            if re.search(pattern, full_text, re.IGNORECASE):
+        for pattern, penalty, label in rules.weighted_exclusions:
+            if pattern.search(full_text):
                 # Reduce penalty if crypto context present
                 actual_penalty = penalty // 2 if has_crypto_context else penalty
                 relevance_info['confidence'] -= actual_penalty
@@ -518,21 +618,19 @@ class OptimizedNewsScraper:
                     'last_success': None
                 }
             
-            # Fetch and parse feed
-            response = self.session.get(feed_url, timeout=10)
-            feed = feedparser.parse(response.content)
+            # One download per feed per cache TTL, shared by every scraper
+            feed, _ = self.shared_cache.get_or_fetch('rss', feed_url, lambda: self._fetch_feed(feed_url))
+            if feed is None:
+                raise Exception("feed could not be fetched or parsed")
+            watermark = FeedWatermark(self.feed_stats[feed_key].get('watermark'))
             
-            if feed.bozo:
-                raise Exception(f"Feed parsing error: {feed.bozo_exception}")
-            
-            # Process entries
+            # Process entries newer than the feed's watermark
             entries_processed = 0
-            for entry in feed.entries[:50]:  # Limit entries per feed
+            for entry in new_entries(feed['entries'],
+                                     is_known=lambda e: watermark.is_known(e) or self._is_known_entry(e)):
                 try:
                     # Extract basic info
                     url = self.normalize_url(entry.get('link', ''))
-                    if not url or url in self.state['seen_urls']:
-                        continue
                     
                     title = entry.get('title', '')
                     summary = entry.get('summary', '')
@@ -544,12 +642,16 @@ class OptimizedNewsScraper:
                     
                     if not has_potential:
                         # Skip articles that clearly aren't relevant
+                        watermark.add(entry)
                         continue
                     
                     # Fetch full article content
                     content = self.fetch_article_content(url)
                     
-                    if content:
+                    if content and self.is_duplicate_content(url, content):
+                        # Same text under another URL (syndicated copy, mirror) is scored once
+                        logger.debug(f"Skipping duplicate content: {url}")
+                    elif content:
                         # Analyze full content
                         is_relevant, confidence, info = self.analyze_content_relevance(content, title)
 
@@ -564,7 +666,7 @@ class OptimizedNewsScraper:
                                 'source': feed_url,
                                 'confidence': confidence,
                                 'relevance_info': info,
-                                'feed_title': feed.feed.get('title', 'Unknown'),
+                                'feed_title': feed['title'] or 'Unknown',
                                 'meets_min_confidence': True
                             })
 
@@ -572,6 +674,7 @@ class OptimizedNewsScraper:
                             self.feed_stats[feed_key]['tge_found'] += 1
                     
                     # Mark as seen
+                    watermark.add(entry)
                     self.state['seen_urls'][url] = datetime.now(timezone.utc).isoformat()
                     entries_processed += 1
                     
@@ -579,11 +682,14 @@ class OptimizedNewsScraper:
                     logger.debug(f"Error processing entry: {str(e)}")
                     continue
             
+            self.feed_stats[feed_key]['watermark'] = watermark.to_dict()
+            
             # Update success stats
             self.feed_stats[feed_key]['success_count'] += 1
             self.feed_stats[feed_key]['last_success'] = datetime.now(timezone.utc).isoformat()
             
-            logger.info(f"Processed {entries_processed} entries from {feed.feed.get('title', feed_url)}")
+            logger.info(f"Processed {entries_processed} entries from {feed['title'] or feed_url} "
+                        f"({len(feed['entries'])} in feed)")
             
         except Exception as e:
             logger.error(f"Error processing feed {feed_url}: {str(e)}")
@@ -591,6 +697,30 @@ class OptimizedNewsScraper:
         
         return articles
     
+    def _fetch_feed(self, feed_url: str) -> Dict:
+        """
+        A feed's title and first FEED_MAX_ENTRIES entries as plain data, so the
+        cached copy can be shared through L2 and filtered by each reader's watermark.
+        """
+        response = self.session.get(feed_url, timeout=10, stream=True)
+        feed = FeedStream(response)
+        entries = [plain_entry(entry) for entry in feed.entries()]
+        logger.debug(f"Fetched {len(entries)} entries from {feed_url} ({feed.bytes_read} bytes)")
+        return {'title': feed.title, 'entries': entries}
+
+    def _is_known_entry(self, entry: Dict) -> bool:
+        """Entries without a link or seen recently (by any feed) are not processed again."""
+        url = self.normalize_url(entry.get('link', ''))
+        return not url or url in self.state['seen_urls']
+
+    def prune_seen_urls(self):
+        """Keep only recently seen URLs; per-feed watermarks decide what is new."""
+        cutoff = (datetime.now(timezone.utc) - SEEN_URLS_HORIZON).isoformat()
+        seen_urls = self.state['seen_urls']
+        self.state['seen_urls'] = {url: seen for url, seen in seen_urls.items() if seen > cutoff}
+        if len(seen_urls) != len(self.state['seen_urls']):
+            logger.debug(f"Pruned {len(seen_urls) - len(self.state['seen_urls'])} seen URLs")
+
     def prioritize_feeds(self) -> List[str]:
         """Prioritize feeds based on historical performance."""
         feed_scores = []
@@ -651,6 +781,7 @@ class OptimizedNewsScraper:
         
         # Save state
         self.state['feed_stats'] = self.feed_stats
+        self.prune_seen_urls()
         self.state['last_full_scan'] = datetime.now(timezone.utc).isoformat()
         self.save_state()
         
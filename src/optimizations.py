@@ -10,6 +10,11 @@ from functools import lru_cache
 from collections import defaultdict
 import logging
 
+try:
+    from .rule_pack import get_rule_pack
+except ImportError:
+    from rule_pack import get_rule_pack
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,92 +33,35 @@ class OptimizedPatternMatcher:
         self.companies = companies
         self.keywords = keywords
 
-        # Pre-compile all patterns at initialization
-        self.company_patterns = self._compile_company_patterns()
+        # Patterns come precompiled from the rule pack shared with the scrapers
+        rules = get_rule_pack(companies, keywords)
+        self.rules = rules
+        self.company_patterns = rules.company_patterns
         self.keyword_patterns = self._compile_keyword_patterns()
-        self.token_pattern = re.compile(r'\$[A-Z]{2,10}\b')
-
-        # Date patterns compiled once
-        self.date_patterns = [
-            re.compile(r'\b(today|tomorrow|tonight)\b', re.IGNORECASE),
-            re.compile(r'\b(this|next)\s+(week|monday|tuesday|wednesday|thursday|friday)\b', re.IGNORECASE),
-            re.compile(r'\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b'),
-            re.compile(r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}\b', re.IGNORECASE)
-        ]
-
-        # Exclusion patterns with context
-        self.exclusion_patterns = [
-            (re.compile(r'test\s*net(?!\s+to\s+mainnet)', re.IGNORECASE), 50, 'testnet'),
-            (re.compile(r'game\s+token(?!omics)', re.IGNORECASE), 40, 'game_token'),
-            (re.compile(r'nft\s+(collection|drop|mint)', re.IGNORECASE), 30, 'nft_collection'),
-            (re.compile(r'price\s+prediction', re.IGNORECASE), 35, 'speculation'),
-            (re.compile(r'in-game\s+(currency|item|token)', re.IGNORECASE), 45, 'gaming'),
-        ]
-
-        # Crypto context detector
-        self.crypto_context_pattern = re.compile(
-            r'\b(blockchain|crypto|defi|web3|protocol|mainnet|smart\s+contract|dapp|layer\s*2|rollup)\b',
-            re.IGNORECASE
-        )
+        self.token_pattern = rules.token_pattern
+        self.date_patterns = rules.urgency_date_patterns
+        self.exclusion_patterns = rules.weighted_exclusions
+        self.crypto_context_pattern = rules.crypto_terms_word_pattern
 
-        logger.info(f"Initialized OptimizedPatternMatcher with {len(self.company_patterns)} companies")
-
-    def _compile_company_patterns(self) -> Dict[str, re.Pattern]:
-        """
-        Compile optimized company patterns.
-
-        Optimizations:
-        - Sort terms by length (longest first) for better matching
-        - Use case-insensitive flag efficiently
-        - Pre-escape all terms
-        """
-        patterns = {}
-        for company in self.companies:
-            # Get all name variations
-            terms = [company['name']] + company.get('aliases', [])
-
-            # Sort by length descending for better matching order
-            terms = sorted(terms, key=len, reverse=True)
-
-            # Build optimized alternation pattern
-            escaped_terms = [re.escape(term) for term in terms]
-            pattern_str = r'\b(' + '|'.join(escaped_terms) + r')\b'
-
-            patterns[company['name']] = re.compile(pattern_str, re.IGNORECASE)
-
-        return patterns
+        logger.info(f"Initialized OptimizedPatternMatcher with {len(self.company_patterns)} companies "
+                    f"(rule pack {rules.version})")
 
     def _compile_keyword_patterns(self) -> Dict[str, tuple]:
         """
-        Compile keyword patterns with weighted confidence scores.
+        Keyword patterns with weighted confidence scores, matched against
+        lowercased text.
 
         Returns dict of {keyword: (compiled_pattern, confidence_score)}
         """
         patterns = {}
 
         # High-value phrases with patterns and scores
-        high_value = [
-            (r'token\s+generation\s+event', 45),
-            (r'tge\s+(is\s+)?live', 40),
-            (r'airdrop\s+(is\s+)?live', 40),
-            (r'claim\s+(your\s+)?tokens?\s+(now|today)', 40),
-            (r'token\s+launch\s+date', 35),
-            (r'tokens?\s+(are\s+)?(now\s+)?available', 35),
-            (r'trading\s+(is\s+)?(now\s+)?live', 35),
-            (r'claim\s+portal\s+(is\s+)?(now\s+)?live', 40),
-            (r'genesis\s+event', 30),
-            (r'mainnet\s+launch', 30),
-        ]
-
-        for pattern_str, score in high_value:
-            pattern = re.compile(pattern_str, re.IGNORECASE)
-            patterns[pattern_str] = (pattern, score)
+        for pattern, score in self.rules.high_value_phrases:
+            patterns[pattern.pattern] = (pattern, score)
 
         # Medium-value keywords
-        for keyword in self.keywords:
+        for keyword, pattern, _ in self.rules.keywords:
             if keyword not in patterns:
-                pattern_str = r'\b' + re.escape(keyword) + r'\b'
-                pattern = re.compile(pattern_str, re.IGNORECASE)
                 patterns[keyword] = (pattern, 15)  # Lower score for general keywords
 
         return patterns
@@ -168,14 +116,13 @@ class OptimizedPatternMatcher:
         )
 
         for keyword, (pattern, score) in sorted_patterns:
-            if pattern.search(text):
+            match = pattern.search(text_lower)
+            if match:
                 matched.append(keyword)
                 confidence += score
 
                 # Store positions for proximity analysis
-                match = pattern.search(text)
-                if match:
-                    positions[keyword] = [match.start()]
+                positions[keyword] = [match.start()]
 
                 # Early termination if threshold reached
                 if confidence >= confidence_threshold:
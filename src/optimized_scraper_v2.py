@@ -302,7 +302,7 @@ class PerformanceOptimizedTwitterMonitor:
 
     New Features:
     - Predictive rate limit management
-    - User info caching (1 hour TTL)
+    - User info caching (7 day TTL)
     - Tweet deduplication caching
     - Exponential backoff with jitter
     - Performance metrics tracking
@@ -362,7 +362,7 @@ class PerformanceOptimizedTwitterMonitor:
                             for user in users.data:
                                 user_map[f"@{user.username}"] = user.id
 
-                                # Cache for 1 hour
+                                # Cached for the twitter_user tier TTL
                                 cache_key = f"twitter_user_{user.username}"
                                 self.cache_manager.set('twitter_user', cache_key, user.id)
 
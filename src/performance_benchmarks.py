@@ -186,7 +186,8 @@ class BenchmarkSuite:
             ("websocket_performance", self.benchmark_websocket_performance),
             ("concurrent_processing", self.benchmark_concurrent_processing),
             ("memory_efficiency", self.benchmark_memory_efficiency),
-            ("rate_limiting", self.benchmark_rate_limiting)
+            ("rate_limiting", self.benchmark_rate_limiting),
+            ("alert_serialization", self.benchmark_alert_serialization)
         ]
         
         for benchmark_name, benchmark_func in benchmarks:
@@ -462,6 +463,73 @@ class BenchmarkSuite:
         
         return self._calculate_benchmark_result("rate_limiting", operations, errors)
     
+    async def benchmark_alert_serialization(self) -> BenchmarkResult:
+        """Benchmark per-alert JSON serialization: ORM/response-model path vs row projection + orjson"""
+        from fastapi.encoders import jsonable_encoder
+        from .models import Alert, Company
+        from .schemas import AlertResponse
+        from .serialization import ALERT_FIELDS, COMPANY_FIELDS, alert_row_to_dict, dumps
+        
+        operations = []
+        errors = []
+        page_size = 1000
+        now = datetime.now(timezone.utc)
+        
+        company = Company(
+            id=1, name="Benchmark Labs", aliases=["BL"], tokens=["BLB"], priority="HIGH",
+            status="active", exclusions=None, created_at=now, updated_at=now
+        )
+        analysis_data = {
+            "matched_keywords": ["tge", "airdrop", "mainnet"],
+            "scores": {"keyword": 0.8, "company": 0.9, "context": 0.7},
+            "signals": [{"type": "token_symbol", "value": "$BLB", "weight": 0.3} for _ in range(5)]
+        }
+        alerts = [
+            Alert(
+                id=i, title=f"Benchmark Labs TGE announcement {i}", content="x" * 500,
+                source="news", source_url=f"https://example.com/{i}", confidence=0.85,
+                company_id=1, company=company, keywords_matched=["tge", "airdrop"],
+                tokens_mentioned=["BLB"], analysis_data=analysis_data, sentiment_score=0.4,
+                urgency_level="high", status="active", created_at=now, updated_at=now
+            )
+            for i in range(page_size)
+        ]
+        rows = [
+            {
+                **{field: getattr(alert, field) for field in ALERT_FIELDS},
+                **{f"company__{field}": getattr(company, field) for field in COMPANY_FIELDS}
+            }
+            for alert in alerts
+        ]
+        
+        def serialize_response_model():
+            payload = [jsonable_encoder(AlertResponse.from_orm(alert)) for alert in alerts]
+            return json.dumps(payload).encode("utf-8")
+        
+        def serialize_row_projection():
+            return dumps([alert_row_to_dict(row) for row in rows])
+        
+        for operation_name, serialize in (
+            ("serialize_response_model", serialize_response_model),
+            ("serialize_row_projection", serialize_row_projection)
+        ):
+            for i in range(10):
+                try:
+                    with self.profiler.profile_operation(operation_name, iteration=i, alerts=page_size):
+                        serialize()
+                    operations.append((operation_name, True, self.profiler.metrics[-1].duration))
+                except Exception as e:
+                    operations.append((operation_name, False, 0))
+                    errors.append(str(e))
+        
+        for operation_name in ("serialize_response_model", "serialize_row_projection"):
+            durations = [duration for name, ok, duration in operations if name == operation_name and ok]
+            if durations:
+                per_alert_us = statistics.mean(durations) / page_size * 1_000_000
+                logger.info(f"{operation_name}: {per_alert_us:.2f} µs per alert")
+        
+        return self._calculate_benchmark_result("alert_serialization", operations, errors)
+    
     def _calculate_benchmark_result(self, test_name: str, operations: List[tuple], errors: List[str]) -> BenchmarkResult:
         """Calculate benchmark result from operations"""
         if not operations:
@@ -66,8 +66,8 @@ class AdvancedRateLimiter:
         # Import redis_client from database module if not provided
         if redis_client is None:
             try:
-                from .database import redis_client as db_redis_client
-                self.redis_client = db_redis_client
+                from .database import get_redis_client
+                self.redis_client = get_redis_client()
             except ImportError:
                 logger.warning("Redis client not available, using local cache only")
                 self.redis_client = None
@@ -0,0 +1,349 @@
+"""
+Precompiled, versioned rule pack for TGE relevance scoring
+Compiles companies, keywords and config.SCORING_RULES into one immutable set
+of regexes that every analyzer shares. Packs are keyed by a hash of their
+source, so each distinct rule set is compiled once per process, and a JSON
+override file is hot-reloaded by swapping in a freshly compiled pack
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# Optional JSON file whose top-level keys replace SCORING_RULES sections,
+# and how often (seconds) it is checked for changes
+RULES_FILE = os.getenv('SCORING_RULES_FILE', '')
+RULES_CHECK_INTERVAL = float(os.getenv('SCORING_RULES_CHECK_INTERVAL', 5))
+
+# Compiled packs kept for distinct companies/keywords combinations
+MAX_CACHED_PACKS = 8
+
+TOKEN_PATTERN = r'\$[A-Z]{2,10}\b'
+WORD_PATTERN = re.compile(r'\w+')
+
+# Patterns are shared between packs, so rebuilding a pack after a company or
+# rule edit only compiles the patterns that actually changed
+_compile = lru_cache(maxsize=4096)(re.compile)
+
+
+def _bounded_alternation(terms, longest_first: bool = False) -> str:
+    if longest_first:
+        terms = sorted(terms, key=len, reverse=True)
+    return r'\b(' + '|'.join(re.escape(term) for term in terms) + r')\b'
+
+
+def _freeze(mapping: Dict) -> Mapping:
+    return MappingProxyType(dict(mapping))
+
+
+@dataclass(frozen=True)
+class RulePack:
+    """
+    Immutable compiled rules. Analyzers hold a reference to a pack and never
+    modify it; a reload builds a new pack instead.
+    """
+
+    version: str
+    company_patterns: Mapping[str, re.Pattern]
+    company_tokens: Mapping[str, Tuple[str, ...]]
+    token_pattern: re.Pattern
+    keywords: Tuple[Tuple[str, re.Pattern, Optional[str]], ...]
+    exclusion_patterns: Tuple[re.Pattern, ...]
+    high_value_phrases: Tuple[Tuple[re.Pattern, int], ...]
+    weighted_exclusions: Tuple[Tuple[re.Pattern, int, str], ...]
+    crypto_terms_pattern: re.Pattern
+    crypto_terms_word_pattern: re.Pattern
+    date_mention_pattern: re.Pattern
+    urgency_date_patterns: Tuple[re.Pattern, ...]
+    date_extraction_patterns: Tuple[re.Pattern, ...]
+    source_tiers: Tuple[Tuple[str, int, Tuple[str, ...]], ...]
+    temporal_patterns: Mapping[str, re.Pattern]
+    false_positive_terms: Tuple[Tuple[str, str], ...]
+    conditional_false_positives: Tuple[Tuple[str, re.Pattern], ...]
+    crypto_context_pattern: re.Pattern
+    keyword_categories: Mapping[str, Mapping]
+    weighted_terms: Mapping[str, Tuple[re.Pattern, int]]
+    tweet_keywords: Tuple[Tuple[str, int, str], ...]
+    tweet_exclusions: Tuple[str, ...]
+
+    def match_keywords(self, text: str) -> List[str]:
+        """
+        Keywords found as whole words in lowercased text, in keyword order.
+
+        Only keywords whose leading word occurs in the text are searched, so
+        most of a long keyword list costs a set lookup instead of a scan.
+        """
+        words: Set[str] = set(WORD_PATTERN.findall(text))
+        return [
+            keyword for keyword, pattern, first_word in self.keywords
+            if (first_word is None or first_word in words) and pattern.search(text)
+        ]
+
+    def source_tier(self, domain: str) -> Tuple[int, str]:
+        """Reliability (score, tier) of the first tier listing a part of domain."""
+        for tier, score, domains in self.source_tiers:
+            if any(known in domain for known in domains):
+                return score, tier
+        return 0, "unknown"
+
+
+def compile_rule_pack(source: Dict, version: str) -> RulePack:
+    """Compile a rule source (see build_rule_source) into a RulePack."""
+    rules = source['rules']
+    companies = source['companies']
+
+    keywords = []
+    for keyword in source['keywords']:
+        lowered = keyword.lower()
+        leading = WORD_PATTERN.match(lowered)
+        keywords.append((keyword, _compile(r'\b' + re.escape(lowered) + r'\b'),
+                         leading.group(0) if leading else None))
+
+    keyword_categories = {
+        category: _freeze({
+            'patterns': tuple(_compile(r'\b' + re.escape(kw) + r'\b', re.IGNORECASE)
+                              for kw in data['keywords']),
+            'keywords': tuple(data['keywords']),
+            'weight': data['weight'],
+        })
+        for category, data in rules['keyword_categories'].items()
+    }
+
+    tweet_keywords = tuple(
+        (keyword, data['weight'], f"{category}_keyword")
+        for category, data in rules['tweet_keywords'].items()
+        for keyword in data['keywords']
+    )
+
+    return RulePack(
+        version=version,
+        company_patterns=_freeze({
+            company['name']: _compile(
+                _bounded_alternation([company['name']] + list(company.get('aliases', [])),
+                                     longest_first=True),
+                re.IGNORECASE
+            )
+            for company in companies
+        }),
+        company_tokens=_freeze({
+            company['name']: tuple(company.get('tokens', [])) for company in companies
+        }),
+        token_pattern=_compile(TOKEN_PATTERN),
+        keywords=tuple(keywords),
+        exclusion_patterns=tuple(_compile(pattern, re.IGNORECASE)
+                                 for pattern in source['exclusion_patterns']),
+        high_value_phrases=tuple((_compile(pattern, re.IGNORECASE), score)
+                                 for pattern, score in rules['high_value_phrases']),
+        weighted_exclusions=tuple((_compile(pattern, re.IGNORECASE), penalty, label)
+                                  for pattern, penalty, label in rules['weighted_exclusions']),
+        crypto_terms_pattern=_compile('|'.join(re.escape(term) for term in rules['crypto_terms'])),
+        crypto_terms_word_pattern=_compile(
+            r'\b(' + '|'.join(r'\s*'.join(re.escape(word) for word in term.split())
+                              for term in rules['crypto_terms']) + r')\b',
+            re.IGNORECASE
+        ),
+        date_mention_pattern=_compile('|'.join(f"(?:{pattern})" for pattern in rules['date_mentions']),
+                                      re.IGNORECASE),
+        urgency_date_patterns=tuple(_compile(pattern, re.IGNORECASE)
+                                    for pattern in rules['urgency_dates']),
+        date_extraction_patterns=tuple(_compile(pattern, re.IGNORECASE)
+                                       for pattern in rules['date_extractions']),
+        source_tiers=tuple((tier, score, tuple(domains))
+                           for tier, score, domains in rules['source_tiers']),
+        temporal_patterns=_freeze({
+            name: _compile(_bounded_alternation(terms), re.IGNORECASE)
+            for name, terms in rules['temporal_indicators'].items()
+        }),
+        false_positive_terms=tuple((category, term.lower())
+                                   for category, terms in rules['false_positives'].items()
+                                   for term in terms),
+        conditional_false_positives=tuple((term, _compile(pattern, re.IGNORECASE))
+                                          for term, pattern in rules['conditional_false_positives'].items()),
+        crypto_context_pattern=_compile(_bounded_alternation(rules['crypto_context']), re.IGNORECASE),
+        keyword_categories=_freeze(keyword_categories),
+        weighted_terms=_freeze({
+            term: (_compile(r'\b' + re.escape(term) + r'\b', re.IGNORECASE), weight)
+            for term, weight in rules['weighted_exclusions_by_term'].items()
+        }),
+        tweet_keywords=tweet_keywords,
+        tweet_exclusions=tuple(rules['tweet_exclusions']),
+    )
+
+
+class _RuleState:
+    """Current base rules (config plus override file) and compiled pack cache."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.rules: Optional[Dict] = None
+        self.generation = 0
+        self.file_signature = None
+        self.next_check = 0.0
+        self.packs: 'OrderedDict[str, RulePack]' = OrderedDict()
+
+
+_state = _RuleState()
+
+
+def _load_rules() -> Tuple[Dict, Optional[Tuple]]:
+    """SCORING_RULES with the override file applied, and the file's (mtime, size)."""
+    rules = dict(config.SCORING_RULES)
+    if not RULES_FILE:
+        return rules, None
+
+    try:
+        stat = os.stat(RULES_FILE)
+    except OSError:
+        return rules, None
+
+    signature = (stat.st_mtime_ns, stat.st_size)
+    try:
+        with open(RULES_FILE, 'r') as f:
+            overrides = json.load(f)
+    except (OSError, ValueError) as e:
+        # Keep the last good rules until the file is fixed
+        logger.error(f"Could not read scoring rules from {RULES_FILE}: {str(e)}")
+        return _state.rules or rules, signature
+
+    for section, value in overrides.items():
+        if section in rules:
+            rules[section] = value
+        else:
+            logger.warning(f"Ignoring unknown scoring rules section '{section}' in {RULES_FILE}")
+    return rules, signature
+
+
+def reload_rules(force: bool = True) -> int:
+    """
+    Re-read SCORING_RULES and the override file, returning the rules generation.
+
+    The generation only advances when the rules actually changed; analyzers
+    pick up the new pack on their next call. Without force, the override
+    file is checked at most every RULES_CHECK_INTERVAL seconds.
+    """
+    now = time.monotonic()
+    if not force and _state.rules is not None and now < _state.next_check:
+        return _state.generation
+
+    with _state.lock:
+        if not force and _state.rules is not None:
+            if now < _state.next_check:
+                return _state.generation
+            _state.next_check = now + RULES_CHECK_INTERVAL
+            signature = None
+            if RULES_FILE:
+                try:
+                    stat = os.stat(RULES_FILE)
+                    signature = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    pass
+            if signature == _state.file_signature:
+                return _state.generation
+
+        rules, signature = _load_rules()
+        _state.file_signature = signature
+        _state.next_check = now + RULES_CHECK_INTERVAL
+        if rules != _state.rules:
+            if _state.rules is not None:
+                logger.info("Scoring rules changed, recompiling rule pack")
+            _state.rules = rules
+            _state.generation += 1
+        return _state.generation
+
+
+def rules_generation() -> int:
+    """Current rules generation, checking the override file for changes."""
+    return reload_rules(force=False)
+
+
+def build_rule_source(companies: Optional[List[Dict]] = None,
+                      keywords: Optional[List[str]] = None) -> Dict:
+    """Everything a pack is compiled from; defaults to config COMPANIES and TGE_KEYWORDS."""
+    rules_generation()
+    return {
+        'companies': config.COMPANIES if companies is None else companies,
+        'keywords': config.TGE_KEYWORDS if keywords is None else keywords,
+        'exclusion_patterns': config.EXCLUSION_PATTERNS,
+        'rules': _state.rules,
+    }
+
+
+def rule_source_version(source: Dict) -> str:
+    """Content hash identifying a rule source."""
+    canonical = json.dumps(source, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def get_rule_pack(companies: Optional[List[Dict]] = None,
+                  keywords: Optional[List[str]] = None) -> RulePack:
+    """
+    Shared compiled pack for companies and keywords under the current rules.
+
+    Identical sources hash to the same version and return the same pack
+    object, so analyzers built from the same configuration share one set of
+    compiled patterns.
+    """
+    source = build_rule_source(companies, keywords)
+    version = rule_source_version(source)
+
+    with _state.lock:
+        pack = _state.packs.get(version)
+        if pack is not None:
+            _state.packs.move_to_end(version)
+            return pack
+
+    started = time.perf_counter()
+    pack = compile_rule_pack(source, version)
+    logger.debug(f"Compiled rule pack {version} in {(time.perf_counter() - started) * 1000:.1f}ms")
+
+    with _state.lock:
+        # Another thread may have compiled the same version meanwhile; keep the first
+        pack = _state.packs.setdefault(version, pack)
+        _state.packs.move_to_end(version)
+        while len(_state.packs) > MAX_CACHED_PACKS:
+            _state.packs.popitem(last=False)
+    return pack
+
+
+class RulePackRef:
+    """
+    An analyzer's handle on the shared pack for its companies and keywords.
+
+    get() is cheap: the source is only re-hashed when the rules generation
+    changes, i.e. after a reload that actually altered the rules.
+    """
+
+    def __init__(self, companies: Optional[List[Dict]] = None,
+                 keywords: Optional[List[str]] = None):
+        self.companies = companies
+        self.keywords = keywords
+        self._pack: Optional[RulePack] = None
+        self._generation = -1
+
+    def get(self) -> RulePack:
+        generation = rules_generation()
+        pack = self._pack
+        if pack is None or self._generation != generation:
+            pack = get_rule_pack(self.companies, self.keywords)
+            self._pack, self._generation = pack, generation
+        return pack
+
+    def update(self, companies: Optional[List[Dict]] = None,
+               keywords: Optional[List[str]] = None):
+        """Point the handle at new companies/keywords; the pack is rebuilt on next get()."""
+        self.companies = companies
+        self.keywords = keywords
+        self._pack = None
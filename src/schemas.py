@@ -38,6 +38,13 @@ class AlertStatus(str, Enum):
     FALSE_POSITIVE = "false_positive"
 
 
+class ExportFormat(str, Enum):
+    """Bulk export format enumeration"""
+    NDJSON = "ndjson"
+    CSV = "csv"
+    PARQUET = "parquet"
+
+
 # User schemas
 class UserBase(BaseModel):
     """Base user schema"""
@@ -316,6 +323,28 @@ class AlertFilter(BaseModel):
         return self
 
 
+class AlertExportFilter(BaseModel):
+    """Alert export filtering schema (keyset-paginated by alert id)"""
+    company_id: Optional[int] = None
+    source: Optional[SourceType] = None
+    min_confidence: Optional[float] = Field(None, ge=0.0, le=1.0)
+    max_confidence: Optional[float] = Field(None, ge=0.0, le=1.0)
+    urgency_level: Optional[UrgencyLevel] = None
+    status: Optional[AlertStatus] = None
+    from_date: Optional[datetime] = None
+    to_date: Optional[datetime] = None
+    keywords: Optional[List[str]] = None
+    cursor: int = Field(default=0, ge=0)  # Resume after this alert id
+    limit: Optional[int] = Field(default=None, ge=1)
+
+    @model_validator(mode='after')
+    def convert_none_to_list_keywords(self):
+        """Convert None to empty list for compatibility"""
+        if self.keywords is None:
+            self.keywords = []
+        return self
+
+
 class CompanyFilter(BaseModel):
     """Company filtering schema"""
     priority: Optional[Priority] = None
@@ -0,0 +1,277 @@
+"""
+Fast JSON serialization for TGE Monitor API responses
+orjson-backed responses, row-to-dict projection and streaming exports
+(NDJSON, CSV, Parquet)
+"""
+
+import csv
+import io
+import json
+import logging
+import zlib
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import select
+
+from .models import Alert, Company
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+    logger.info("orjson not installed - falling back to the standard JSON encoder")
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+    PARQUET_AVAILABLE = True
+except ImportError:
+    pyarrow = None
+    PARQUET_AVAILABLE = False
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+
+# Rows per Parquet row group / output flush
+EXPORT_BATCH_SIZE = 1000
+
+# Company fields that the response schema turns from NULL into an empty list
+_COMPANY_LIST_FIELDS = ("aliases", "tokens", "exclusions")
+
+ALERT_FIELDS = (
+    "id", "title", "content", "source", "source_url", "confidence", "company_id",
+    "keywords_matched", "tokens_mentioned", "analysis_data", "sentiment_score",
+    "urgency_level", "status", "created_at", "updated_at",
+)
+
+COMPANY_FIELDS = (
+    "id", "name", "aliases", "tokens", "priority", "status", "website",
+    "twitter_handle", "description", "exclusions", "created_at", "updated_at",
+)
+
+
+def _default(obj: Any) -> Any:
+    """Fallback encoder for types the standard json module cannot handle"""
+    if isinstance(obj, datetime) and obj.utcoffset() == timedelta(0):
+        # UTC is written as "Z", the way pydantic (and orjson's OPT_UTC_Z) do
+        return obj.isoformat()[:-6] + "Z"
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if hasattr(obj, "value"):  # Enum
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize an object to JSON bytes using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with ``dumps``, byte-compatible with pydantic's JSON output"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def alert_projection():
+    """Select statement projecting alert and company columns without ORM hydration"""
+    alert_columns = [getattr(Alert, field).label(field) for field in ALERT_FIELDS]
+    company_columns = [
+        getattr(Company, field).label(f"company__{field}") for field in COMPANY_FIELDS
+    ]
+    return select(*alert_columns, *company_columns).outerjoin(
+        Company, Alert.company_id == Company.id
+    )
+
+
+def alert_row_to_dict(row: Mapping[str, Any]) -> Dict[str, Any]:
+    """Convert a projected alert row into the AlertResponse JSON shape"""
+    alert = {field: row[field] for field in ALERT_FIELDS}
+
+    if row["company__id"] is None:
+        alert["company"] = None
+    else:
+        company = {field: row[f"company__{field}"] for field in COMPANY_FIELDS}
+        for field in _COMPANY_LIST_FIELDS:
+            if company[field] is None:
+                company[field] = []
+        alert["company"] = company
+
+    return alert
+
+
+def alert_rows_to_dicts(rows: Iterable[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """Convert projected alert rows into response dicts"""
+    return [alert_row_to_dict(row) for row in rows]
+
+
+async def ndjson_lines(items: Iterable[Any]) -> AsyncIterator[bytes]:
+    """Encode items as newline-delimited JSON, one line per item"""
+    for item in items:
+        yield dumps(item) + b"\n"
+
+
+def ndjson_response(items: Iterable[Any], headers: Optional[Dict[str, str]] = None) -> StreamingResponse:
+    """Stream items to the client as NDJSON"""
+    return StreamingResponse(ndjson_lines(items), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+
+# Flat export columns: alert fields plus the company name
+EXPORT_FIELDS = ALERT_FIELDS + ("company_name",)
+
+
+def alert_row_to_export_record(row: Mapping[str, Any]) -> Dict[str, Any]:
+    """Flatten a projected alert row for tabular exports (CSV/Parquet)
+
+    JSON columns are encoded as JSON text so every column has a scalar type.
+    """
+    record = {}
+    for field in ALERT_FIELDS:
+        value = row[field]
+        if isinstance(value, (dict, list)):
+            value = dumps(value).decode("utf-8")
+        record[field] = value
+    record["company_name"] = row["company__name"]
+    return record
+
+
+def iter_ndjson_export(rows: Iterable[Mapping[str, Any]]) -> Iterator[bytes]:
+    """Encode projected alert rows as NDJSON, flushing every EXPORT_BATCH_SIZE rows"""
+    lines = []
+    for row in rows:
+        lines.append(dumps(alert_row_to_dict(row)))
+        if len(lines) >= EXPORT_BATCH_SIZE:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+def iter_csv_export(rows: Iterable[Mapping[str, Any]]) -> Iterator[bytes]:
+    """Encode projected alert rows as CSV, flushing every EXPORT_BATCH_SIZE rows"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+
+    pending = 0
+    for row in rows:
+        record = alert_row_to_export_record(row)
+        for field in ("created_at", "updated_at"):
+            if record[field] is not None:
+                record[field] = record[field].isoformat()
+        writer.writerow(record)
+        pending += 1
+        if pending >= EXPORT_BATCH_SIZE:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class _ChunkSink:
+    """Write-only file object that hands written bytes back to the caller"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.closed = False
+        self._position = 0
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self.chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def _parquet_schema():
+    """Arrow schema for the flat alert export"""
+    return pyarrow.schema([
+        ("id", pyarrow.int64()),
+        ("title", pyarrow.string()),
+        ("content", pyarrow.string()),
+        ("source", pyarrow.string()),
+        ("source_url", pyarrow.string()),
+        ("confidence", pyarrow.float64()),
+        ("company_id", pyarrow.int64()),
+        ("keywords_matched", pyarrow.string()),
+        ("tokens_mentioned", pyarrow.string()),
+        ("analysis_data", pyarrow.string()),
+        ("sentiment_score", pyarrow.float64()),
+        ("urgency_level", pyarrow.string()),
+        ("status", pyarrow.string()),
+        ("created_at", pyarrow.timestamp("us", tz="UTC")),
+        ("updated_at", pyarrow.timestamp("us", tz="UTC")),
+        ("company_name", pyarrow.string()),
+    ])
+
+
+def iter_parquet_export(rows: Iterable[Mapping[str, Any]]) -> Iterator[bytes]:
+    """Encode projected alert rows as Parquet, one row group per EXPORT_BATCH_SIZE rows"""
+    if not PARQUET_AVAILABLE:
+        raise RuntimeError("Parquet export requires pyarrow")
+
+    schema = _parquet_schema()
+    sink = _ChunkSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema)
+
+    def write_batch(batch):
+        writer.write_table(pyarrow.Table.from_pylist(batch, schema=schema))
+        return sink.drain()
+
+    try:
+        batch = []
+        for row in rows:
+            batch.append(alert_row_to_export_record(row))
+            if len(batch) >= EXPORT_BATCH_SIZE:
+                chunk = write_batch(batch)
+                batch = []
+                if chunk:
+                    yield chunk
+        if batch:
+            chunk = write_batch(batch)
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def gzip_chunks(chunks: Iterable[bytes], level: int = 6) -> Iterator[bytes]:
+    """Gzip-compress a byte stream incrementally"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -7,11 +7,15 @@ Performance Targets:
 - 50 concurrent connections pool
 - Sub-100ms connection establishment
 - Automatic retry with exponential backoff
+- Size-capped, content-type checked body reads (fetch)
 """
 
+import os
 import logging
+import importlib.util
 import time
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Tuple
+from urllib.parse import urlparse
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
@@ -20,6 +24,46 @@ from threading import Lock
 
 logger = logging.getLogger(__name__)
 
+try:
+    import brotli  # noqa: F401 - urllib3 and httpx decode br when it is installed
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+# httpx (imported when the first HTTP/2 client is built) needs h2 for HTTP/2
+HTTP2_AVAILABLE = all(importlib.util.find_spec(name) is not None for name in ('h2', 'httpx'))
+
+# Encodings every session can decode; zstd is only requested by fetch(), which decodes it
+ACCEPT_ENCODING = 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+
+# Hard cap on decoded body bytes read by fetch(); longer bodies are cut off
+MAX_RESPONSE_BYTES = int(os.getenv('SCRAPER_MAX_RESPONSE_BYTES', 5 * 1024 * 1024))
+
+# Connections kept per host; scrapers rarely need more than a few to one site
+HOST_POOL_MAXSIZE = int(os.getenv('SCRAPER_HOST_POOL_SIZE', 4))
+
+# Use HTTP/2 (one multiplexed connection per host) when h2 is installed
+HTTP2_ENABLED = os.getenv('SCRAPER_HTTP2', 'true').lower() == 'true'
+
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+FETCH_CHUNK_SIZE = 64 * 1024
+
+
+class ContentRejected(requests.RequestException):
+    """Response refused before its body was read (content type not accepted)."""
+
 
 class ConnectionMetrics:
     """Track connection pool metrics."""
@@ -32,6 +76,11 @@ class ConnectionMetrics:
         self.timeout_count = 0
         self.error_count = 0
         self.total_request_time = 0.0
+        self.bytes_received = 0
+        self.bytes_decoded = 0
+        self.truncated_count = 0
+        self.rejected_count = 0
+        self.http2_requests = 0
         self.lock = Lock()
 
     def record_request(self, duration: float, reused: bool = False):
@@ -59,6 +108,22 @@ class ConnectionMetrics:
         with self.lock:
             self.error_count += 1
 
+    def record_transfer(self, wire_bytes: int, decoded_bytes: int,
+                        truncated: bool = False, http2: bool = False):
+        """Record a body read by fetch(): bytes on the wire and after decompression."""
+        with self.lock:
+            self.bytes_received += wire_bytes
+            self.bytes_decoded += decoded_bytes
+            if truncated:
+                self.truncated_count += 1
+            if http2:
+                self.http2_requests += 1
+
+    def record_rejected(self):
+        """Record a response abandoned because of its content type."""
+        with self.lock:
+            self.rejected_count += 1
+
     def get_stats(self) -> Dict:
         """Get connection metrics."""
         with self.lock:
@@ -73,7 +138,13 @@ class ConnectionMetrics:
                 'retry_count': self.retry_count,
                 'timeout_count': self.timeout_count,
                 'error_count': self.error_count,
-                'avg_request_duration_ms': round(avg_duration * 1000, 2)
+                'avg_request_duration_ms': round(avg_duration * 1000, 2),
+                'bytes_received': self.bytes_received,
+                'bytes_decoded': self.bytes_decoded,
+                'compression_ratio': round(self.bytes_decoded / self.bytes_received, 2) if self.bytes_received else 0,
+                'truncated_count': self.truncated_count,
+                'rejected_count': self.rejected_count,
+                'http2_requests': self.http2_requests
             }
 
 
@@ -89,10 +160,10 @@ class OptimizedHTTPAdapter(HTTPAdapter):
         start_time = time.time()
 
         try:
-            # Check if connection is being reused
-            # This is a heuristic based on connection pool state
-            pool_key = self.get_connection(request.url, None).pool.pool
-            reused = pool_key.qsize() > 0
+            # Check if connection is being reused: the host's pool holds an
+            # open connection (urllib3 pre-fills free slots with None)
+            idle = self.get_connection(request.url, kwargs.get('proxies')).pool
+            reused = idle is not None and any(conn is not None for conn in list(idle.queue))
 
             response = super().send(request, **kwargs)
             duration = time.time() - start_time
@@ -108,12 +179,55 @@ class OptimizedHTTPAdapter(HTTPAdapter):
             raise
 
 
+class FetchedResponse:
+    """Status, headers and (capped, decoded) body of a fetch()."""
+
+    def __init__(self, url: str, status_code: int, headers, content: bytes,
+                 truncated: bool = False, http_version: str = 'HTTP/1.1'):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.truncated = truncated
+        self.http_version = http_version
+
+    @property
+    def encoding(self) -> str:
+        for param in self.headers.get('Content-Type', '').split(';')[1:]:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'charset' and value.strip():
+                return value.strip().strip('"\'')
+        return 'utf-8'
+
+    @property
+    def text(self) -> str:
+        try:
+            return self.content.decode(self.encoding, errors='replace')
+        except LookupError:
+            return self.content.decode('utf-8', errors='replace')
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} error for url: {self.url}")
+
+
+def _zstd_chunks(chunks: Iterator[bytes]) -> Iterator[bytes]:
+    """Decode a zstd body (urllib3 1.x passes it through undecoded)."""
+    decoder = zstandard.ZstdDecompressor().decompressobj()
+    for chunk in chunks:
+        data = decoder.decompress(chunk)
+        if data:
+            yield data
+
+
 class SharedSessionManager:
     """
     Shared session manager with optimized connection pooling.
 
     Features:
-    - Connection pool size: 50 connections
+    - Per-host connection pools (HOST_POOL_MAXSIZE, host_pool_sizes overrides)
+    - HTTP/2 multiplexing for fetch() when h2 is installed
+    - Compressed (gzip/deflate, br and zstd when available), size-capped reads
     - Connection reuse >80% target
     - Automatic retry with exponential backoff + jitter
     - Request timeout management
@@ -124,26 +238,38 @@ class SharedSessionManager:
     def __init__(
         self,
         pool_connections: int = 50,
-        pool_maxsize: int = 50,
+        pool_maxsize: int = HOST_POOL_MAXSIZE,
         max_retries: int = 3,
         backoff_factor: float = 0.5,
-        timeout: int = 30
+        timeout: int = 30,
+        host_pool_sizes: Optional[Dict[str, int]] = None,
+        http2: bool = HTTP2_ENABLED,
+        max_response_bytes: int = MAX_RESPONSE_BYTES
     ):
         """
         Initialize session manager.
 
         Args:
-            pool_connections: Number of connection pools to cache
-            pool_maxsize: Maximum number of connections in pool
+            pool_connections: Number of connection pools (hosts) to cache
+            pool_maxsize: Maximum number of connections kept per host
             max_retries: Maximum retry attempts
             backoff_factor: Backoff multiplier between retries
             timeout: Default request timeout in seconds
+            host_pool_sizes: Per-host pool_maxsize overrides, e.g. {'medium.com': 8}
+            http2: Send fetch() requests over HTTP/2 when h2 is installed
+            max_response_bytes: Default body cap for fetch()
         """
         self.pool_connections = pool_connections
         self.pool_maxsize = pool_maxsize
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.default_timeout = timeout
+        self.host_pool_sizes = host_pool_sizes or {}
+        self.http2 = http2
+        self.max_response_bytes = max_response_bytes
+        self._http2_client = None
+        self._http2_hosts = set()
+        self._http2_lock = Lock()
 
         # Metrics
         self.metrics = ConnectionMetrics()
@@ -191,12 +317,24 @@ class SharedSessionManager:
         session.mount('http://', adapter)
         session.mount('https://', adapter)
 
+        # Hosts scraped heavily get their own, larger pools
+        for host, maxsize in self.host_pool_sizes.items():
+            host_adapter = OptimizedHTTPAdapter(
+                metrics=self.metrics,
+                pool_connections=1,
+                pool_maxsize=maxsize,
+                max_retries=retry_strategy,
+                pool_block=False
+            )
+            session.mount(f'http://{host}/', host_adapter)
+            session.mount(f'https://{host}/', host_adapter)
+
         # Optimized headers
         session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Connection': 'keep-alive',
             'Cache-Control': 'max-age=0'
         })
@@ -273,6 +411,130 @@ class SharedSessionManager:
         """Convenience method for HEAD requests."""
         return self.request('HEAD', url, session_type, **kwargs)
 
+    def fetch(
+        self,
+        url: str,
+        session_type: str = 'article',
+        accept: Optional[Tuple[str, ...]] = HTML_CONTENT_TYPES,
+        max_bytes: Optional[int] = None,
+        timeout: Optional[int] = None,
+        headers: Optional[Dict] = None
+    ) -> FetchedResponse:
+        """
+        GET a page, reading at most max_bytes of decoded body.
+
+        The body is streamed: a Content-Type not starting with one of
+        ``accept`` raises ContentRejected before any of it is read, and a
+        longer body is cut off (``truncated``) and its connection dropped.
+        HTTPS requests go over HTTP/2 when h2 is installed.
+
+        Args:
+            url: URL to fetch
+            session_type: Session whose headers and timeout to use
+            accept: Accepted content types (None accepts any)
+            max_bytes: Body cap (defaults to max_response_bytes)
+            timeout: Custom timeout
+            headers: Extra request headers
+
+        Returns:
+            FetchedResponse with the (possibly truncated) body
+        """
+        max_bytes = max_bytes or self.max_response_bytes
+        headers = dict(headers or {})
+        if ZSTD_AVAILABLE:
+            headers.setdefault('Accept-Encoding', ACCEPT_ENCODING + ', zstd')
+
+        client = self._get_http2_client() if url.startswith('https://') else None
+        if client is not None:
+            return self._fetch_http2(client, url, session_type, accept, max_bytes, timeout, headers)
+
+        response = self.request('GET', url, session_type, timeout=timeout, stream=True, headers=headers)
+        try:
+            self._check_content_type(url, response.headers, accept)
+            chunks = response.iter_content(FETCH_CHUNK_SIZE)
+            if response.headers.get('Content-Encoding', '').lower() == 'zstd':
+                chunks = _zstd_chunks(chunks)
+            content, truncated = self._read_capped(url, chunks, max_bytes)
+            tell = getattr(response.raw, 'tell', None)
+            wire_bytes = tell() if callable(tell) else len(content)
+        finally:
+            response.close()
+
+        self.metrics.record_transfer(wire_bytes, len(content), truncated)
+        return FetchedResponse(response.url or url, response.status_code, response.headers,
+                               content, truncated)
+
+    def _fetch_http2(self, client, url, session_type, accept, max_bytes, timeout, headers) -> FetchedResponse:
+        import httpx
+
+        session = self.get_session(session_type)
+        request_headers = dict(session.headers)
+        request_headers.update(headers)
+        if timeout is None:
+            timeout = getattr(session, 'timeout', self.default_timeout)
+
+        start_time = time.time()
+        try:
+            with client.stream('GET', url, headers=request_headers, timeout=timeout,
+                               follow_redirects=True) as response:
+                self._check_content_type(url, response.headers, accept)
+                content, truncated = self._read_capped(url, response.iter_bytes(FETCH_CHUNK_SIZE), max_bytes)
+                wire_bytes = response.num_bytes_downloaded
+        except httpx.TimeoutException as e:
+            self.metrics.record_timeout()
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            self.metrics.record_error()
+            raise requests.ConnectionError(str(e)) from e
+
+        # One multiplexed connection per host: every request after the first reuses it
+        host = urlparse(url).netloc
+        with self._http2_lock:
+            reused = host in self._http2_hosts
+            self._http2_hosts.add(host)
+        http2 = response.http_version == 'HTTP/2'
+        self.metrics.record_request(time.time() - start_time, reused)
+        self.metrics.record_transfer(wire_bytes, len(content), truncated, http2=http2)
+        return FetchedResponse(str(response.url), response.status_code, response.headers,
+                               content, truncated, response.http_version)
+
+    def _get_http2_client(self):
+        """The shared HTTP/2 client, built on first use (None when disabled or h2 is missing)."""
+        if not self.http2:
+            return None
+        if self._http2_client is None and HTTP2_AVAILABLE:
+            with self._http2_lock:
+                if self._http2_client is None:
+                    import httpx
+                    transport = httpx.HTTPTransport(
+                        http2=True,
+                        retries=self.max_retries,
+                        limits=httpx.Limits(max_connections=self.pool_connections,
+                                            max_keepalive_connections=self.pool_connections)
+                    )
+                    self._http2_client = httpx.Client(http2=True, transport=transport)
+                    logger.info("HTTP/2 client initialized for fetch()")
+        return self._http2_client
+
+    def _check_content_type(self, url: str, headers, accept: Optional[Tuple[str, ...]]):
+        if not accept:
+            return
+        content_type = headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        if content_type and not content_type.startswith(tuple(accept)):
+            self.metrics.record_rejected()
+            raise ContentRejected(f"Not fetching {content_type} body of {url}")
+
+    @staticmethod
+    def _read_capped(url: str, chunks: Iterator[bytes], max_bytes: int) -> Tuple[bytes, bool]:
+        body = bytearray()
+        for chunk in chunks:
+            body.extend(chunk)
+            if len(body) > max_bytes:
+                del body[max_bytes:]
+                logger.warning(f"Response body over {max_bytes} bytes, truncated: {url}")
+                return bytes(body), True
+        return bytes(body), False
+
     def get_metrics(self) -> Dict:
         """Get connection pool metrics."""
         return self.metrics.get_stats()
@@ -286,6 +548,10 @@ class SharedSessionManager:
             except Exception as e:
                 logger.warning(f"Error closing {session_name} session: {e}")
 
+        if self._http2_client is not None:
+            self._http2_client.close()
+            self._http2_client = None
+
         # Log final metrics
         final_metrics = self.get_metrics()
         logger.info(f"Session manager final metrics: {final_metrics}")
@@ -1,34 +1,458 @@
 """
 Swarm Coordination Integration Module
 Provides claude-flow swarm coordination hooks for multi-agent orchestration
+Hook traffic goes through a pluggable backend: in-process memory (single node),
+Redis (multi-node) or the claude-flow CLI (compatibility)
 """
 
 import os
 import json
+import time
 import logging
 import subprocess
 import asyncio
-from typing import Dict, List, Optional, Any
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime, timezone
 from functools import wraps
 import hashlib
 
+try:
+    import redis
+except ImportError:
+    redis = None
+
 logger = logging.getLogger(__name__)
 
 
+# ========== Coordination Backends ==========
+
+class SwarmMemoryBackend:
+    """
+    Storage/transport for swarm hook traffic.
+
+    Backends store serialized memory values with a TTL and record lifecycle
+    hooks (pre-task, post-task, notify, ...). Values are always strings so every
+    backend round-trips the same representation.
+    """
+
+    name = "base"
+
+    def store(self, key: str, value: str, ttl: int) -> bool:
+        raise NotImplementedError
+
+    def retrieve(self, key: str) -> Optional[str]:
+        raise NotImplementedError
+
+    def exists(self, key: str) -> bool:
+        return self.retrieve(key) is not None
+
+    def run_hook(self, hook_name: str, params: Dict[str, str]) -> bool:
+        raise NotImplementedError
+
+    async def store_async(self, key: str, value: str, ttl: int) -> bool:
+        return self.store(key, value, ttl)
+
+    async def run_hook_async(self, hook_name: str, params: Dict[str, str]) -> bool:
+        return self.run_hook(hook_name, params)
+
+    def store_many(self, items: Dict[str, Tuple[str, int]]) -> bool:
+        """Store a batch of key -> (value, ttl) entries"""
+        results = [self.store(key, value, ttl) for key, (value, ttl) in items.items()]
+        return all(results)
+
+    def run_hooks(self, hooks: List[Tuple[str, Dict[str, str]]]) -> bool:
+        """Run a batch of (hook_name, params) hooks in order"""
+        results = [self.run_hook(hook_name, params) for hook_name, params in hooks]
+        return all(results)
+
+
+class InProcessMemoryBackend(SwarmMemoryBackend):
+    """Dict-backed memory for single-node runs (no I/O, microsecond hooks)"""
+
+    name = "memory"
+
+    # Expired entries are swept once every this many stores
+    SWEEP_INTERVAL = 1024
+
+    def __init__(self, max_events: int = 1000):
+        self._data: Dict[str, Tuple[str, float]] = {}
+        self._lock = threading.Lock()
+        self._stores_since_sweep = 0
+        self.events = deque(maxlen=max_events)
+
+    def store(self, key: str, value: str, ttl: int) -> bool:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._stores_since_sweep += 1
+            if self._stores_since_sweep >= self.SWEEP_INTERVAL:
+                self._sweep()
+        return True
+
+    def retrieve(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def run_hook(self, hook_name: str, params: Dict[str, str]) -> bool:
+        self.events.append((hook_name, params, time.time()))
+        return True
+
+    def _sweep(self):
+        """Drop expired entries (caller holds the lock)"""
+        now = time.monotonic()
+        expired = [key for key, (_, expires_at) in self._data.items() if expires_at <= now]
+        for key in expired:
+            del self._data[key]
+        self._stores_since_sweep = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisMemoryBackend(SwarmMemoryBackend):
+    """Redis-backed memory shared by agents on multiple nodes"""
+
+    name = "redis"
+
+    # TTL for task hashes and the per-session event log
+    EVENT_TTL = 86400
+
+    def __init__(self, client, session_id: str, max_events: int = 1000):
+        self.client = client
+        self.max_events = max_events
+        self.events_key = f"swarm/sessions/{session_id}/events"
+        self.tasks_prefix = f"swarm/sessions/{session_id}/tasks"
+
+    @classmethod
+    def from_url(cls, url: str, session_id: str) -> "RedisMemoryBackend":
+        if redis is None:
+            raise RuntimeError("redis package is not installed")
+        client = redis.from_url(url, decode_responses=True)
+        client.ping()
+        return cls(client, session_id)
+
+    def store(self, key: str, value: str, ttl: int) -> bool:
+        try:
+            self.client.set(key, value, ex=ttl)
+            return True
+        except Exception as e:
+            logger.warning(f"Swarm memory store failed for {key}: {e}")
+            return False
+
+    def retrieve(self, key: str) -> Optional[str]:
+        try:
+            return self.client.get(key)
+        except Exception as e:
+            logger.warning(f"Swarm memory retrieve failed for {key}: {e}")
+            return None
+
+    def exists(self, key: str) -> bool:
+        try:
+            return bool(self.client.exists(key))
+        except Exception as e:
+            logger.warning(f"Swarm memory exists check failed for {key}: {e}")
+            return False
+
+    def run_hook(self, hook_name: str, params: Dict[str, str]) -> bool:
+        return self.run_hooks([(hook_name, params)])
+
+    def store_many(self, items: Dict[str, Tuple[str, int]]) -> bool:
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for key, (value, ttl) in items.items():
+                pipe.set(key, value, ex=ttl)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Swarm memory batch store failed ({len(items)} keys): {e}")
+            return False
+
+    def run_hooks(self, hooks: List[Tuple[str, Dict[str, str]]]) -> bool:
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            events = []
+            for hook_name, params in hooks:
+                task_id = params.get('task_id')
+                if task_id:
+                    task_key = f"{self.tasks_prefix}/{task_id}"
+                    pipe.hset(task_key, mapping={'last_hook': hook_name, **params})
+                    pipe.expire(task_key, self.EVENT_TTL)
+                events.append(json.dumps({'hook': hook_name, 'params': params, 'timestamp': time.time()}))
+            pipe.rpush(self.events_key, *events)
+            pipe.ltrim(self.events_key, -self.max_events, -1)
+            pipe.expire(self.events_key, self.EVENT_TTL)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Swarm hooks {[hook_name for hook_name, _ in hooks]} failed: {e}")
+            return False
+
+
+class CLIMemoryBackend(SwarmMemoryBackend):
+    """Compatibility backend that shells out to the claude-flow CLI for every hook"""
+
+    name = "cli"
+
+    def __init__(self, command: str):
+        self.command = command
+
+    def _build_command(self, hook_name: str, params: Dict[str, str]) -> str:
+        cmd = [self.command, 'hooks', hook_name]
+        for key, value in params.items():
+            cmd.extend([f"--{key.replace('_', '-')}", value])
+        return ' '.join(cmd)
+
+    def store(self, key: str, value: str, ttl: int) -> bool:
+        return self.run_hook('memory-store', {'key': key, 'value': value, 'ttl': str(ttl)})
+
+    async def store_async(self, key: str, value: str, ttl: int) -> bool:
+        return await self.run_hook_async('memory-store', {'key': key, 'value': value, 'ttl': str(ttl)})
+
+    def retrieve(self, key: str) -> Optional[str]:
+        try:
+            result = subprocess.run(
+                f"{self.command} hooks memory-retrieve --key {key}",
+                shell=True,
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+
+            if result.returncode == 0 and result.stdout:
+                return result.stdout
+
+            return None
+
+        except Exception as e:
+            logger.error(f"Error retrieving memory {key}: {str(e)}")
+            return None
+
+    def run_hook(self, hook_name: str, params: Dict[str, str]) -> bool:
+        try:
+            result = subprocess.run(
+                self._build_command(hook_name, params),
+                shell=True,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+
+            if result.returncode == 0:
+                logger.debug(f"Hook {hook_name} executed successfully")
+                return True
+            else:
+                logger.warning(f"Hook {hook_name} failed: {result.stderr}")
+                return False
+
+        except subprocess.TimeoutExpired:
+            logger.warning(f"Hook {hook_name} timed out")
+            return False
+        except Exception as e:
+            logger.error(f"Error executing hook {hook_name}: {str(e)}")
+            return False
+
+    async def run_hook_async(self, hook_name: str, params: Dict[str, str]) -> bool:
+        try:
+            process = await asyncio.create_subprocess_shell(
+                self._build_command(hook_name, params),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+
+            if process.returncode == 0:
+                logger.debug(f"Hook {hook_name} executed successfully")
+                return True
+            else:
+                logger.warning(f"Hook {hook_name} failed: {stderr.decode()}")
+                return False
+
+        except asyncio.TimeoutError:
+            logger.warning(f"Hook {hook_name} timed out")
+            return False
+        except Exception as e:
+            logger.error(f"Error executing hook {hook_name}: {str(e)}")
+            return False
+
+
+class SwarmWriteBuffer:
+    """
+    Write-behind buffer for swarm coordination traffic.
+
+    Memory writes and fire-and-forget hooks (notify, post-edit) are queued and
+    flushed to the backend in batches by a background thread every
+    flush_interval seconds or as soon as max_entries are pending. Writes to the
+    same key coalesce (last write wins), so e.g. only the latest rate-limit
+    state per service reaches the backend.
+    """
+
+    def __init__(self, backend: SwarmMemoryBackend, flush_interval: float = 0.25, max_entries: int = 500):
+        self.backend = backend
+        self.flush_interval = flush_interval
+        self.max_entries = max_entries
+
+        self._stores: Dict[str, Tuple[str, int]] = {}
+        self._hooks: List[Tuple[str, Dict[str, str]]] = []
+        # Batch currently being written, still visible to readers
+        self._inflight: Dict[str, Tuple[str, int]] = {}
+
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+        self.stats = {'flushes': 0, 'writes': 0, 'coalesced': 0, 'flushed_entries': 0}
+
+    def store(self, key: str, value: str, ttl: int):
+        """Queue a memory write (replaces any pending write to the same key)"""
+        with self._lock:
+            if self._stores.pop(key, None) is not None:
+                self.stats['coalesced'] += 1
+            self._stores[key] = (value, ttl)
+            self.stats['writes'] += 1
+            pending = len(self._stores) + len(self._hooks)
+        self._schedule(pending)
+
+    def hook(self, hook_name: str, params: Dict[str, str]):
+        """Queue a fire-and-forget hook"""
+        with self._lock:
+            self._hooks.append((hook_name, params))
+            self.stats['writes'] += 1
+            pending = len(self._stores) + len(self._hooks)
+        self._schedule(pending)
+
+    def pending_value(self, key: str) -> Optional[str]:
+        """Value written for key but not yet flushed to the backend, if any"""
+        with self._lock:
+            entry = self._stores.get(key) or self._inflight.get(key)
+        return entry[0] if entry else None
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._stores) + len(self._hooks)
+
+    def flush(self) -> int:
+        """
+        Write all pending entries to the backend.
+
+        Returns:
+            Number of entries flushed
+        """
+        with self._flush_lock:
+            with self._lock:
+                stores, self._stores = self._stores, {}
+                hooks, self._hooks = self._hooks, []
+                self._inflight = stores
+
+            if not stores and not hooks:
+                return 0
+
+            try:
+                if stores:
+                    self.backend.store_many(stores)
+                if hooks:
+                    self.backend.run_hooks(hooks)
+            except Exception as e:
+                logger.warning(f"Swarm write-behind flush failed: {e}")
+            finally:
+                with self._lock:
+                    self._inflight = {}
+
+            flushed = len(stores) + len(hooks)
+            self.stats['flushes'] += 1
+            self.stats['flushed_entries'] += flushed
+            logger.debug(f"Flushed {flushed} swarm coordination entries")
+            return flushed
+
+    def close(self):
+        """Stop the background thread and flush what is left"""
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.flush()
+
+    def _schedule(self, pending: int):
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._stopped = False
+                    self._wake.clear()
+                    self._thread = threading.Thread(
+                        target=self._run, name="swarm-write-behind", daemon=True
+                    )
+                    self._thread.start()
+        if pending >= self.max_entries:
+            self._wake.set()
+
+    def _run(self):
+        while not self._stopped:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+def create_swarm_backend(backend: str, session_id: str, claude_flow_cmd: str) -> SwarmMemoryBackend:
+    """
+    Create a coordination backend by name.
+
+    Args:
+        backend: "memory", "redis" or "cli"
+        session_id: Swarm session (namespaces Redis task/event keys)
+        claude_flow_cmd: CLI command for the "cli" backend
+
+    Returns:
+        Backend instance (falls back to in-process memory if Redis is unreachable)
+    """
+    backend = (backend or 'memory').lower()
+
+    if backend == 'cli':
+        return CLIMemoryBackend(claude_flow_cmd)
+
+    if backend == 'redis':
+        url = os.getenv('SWARM_REDIS_URL') or os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+        try:
+            return RedisMemoryBackend.from_url(url, session_id)
+        except Exception as e:
+            logger.warning(f"Swarm Redis backend unavailable ({e}). Using in-process memory.")
+            return InProcessMemoryBackend()
+
+    if backend != 'memory':
+        logger.warning(f"Unknown swarm backend '{backend}'. Using in-process memory.")
+    return InProcessMemoryBackend()
+
+
 class SwarmCoordinationHooks:
     """
     Claude-flow coordination hooks wrapper for TGE scraping system.
     Enables multi-agent orchestration with shared memory and coordination.
     """
 
-    def __init__(self, enabled: bool = None, session_id: str = None):
+    def __init__(self, enabled: bool = None, session_id: str = None,
+                 backend: Union[str, SwarmMemoryBackend, None] = None,
+                 write_behind: bool = None):
         """
         Initialize swarm coordination hooks.
 
         Args:
             enabled: Enable/disable swarm coordination (default: check env var)
             session_id: Unique session identifier for this swarm instance
+            backend: Backend name ("memory"/"redis"/"cli") or instance
+                (default: SWARM_BACKEND env var, else "memory")
+            write_behind: Buffer memory writes and notifications and flush them
+                in the background (default: SWARM_WRITE_BEHIND env var, else on
+                for every backend except in-process memory)
         """
         # Check if swarm coordination is enabled
         self.enabled = enabled if enabled is not None else os.getenv('SWARM_ENABLED', 'false').lower() == 'true'
@@ -51,13 +475,39 @@ class SwarmCoordinationHooks:
         # Command configuration
         self.claude_flow_cmd = os.getenv('CLAUDE_FLOW_CMD', 'npx claude-flow@alpha')
 
+        # Coordination backend (only connected when swarm is enabled)
+        if isinstance(backend, SwarmMemoryBackend):
+            self.backend = backend
+        elif self.enabled:
+            self.backend = create_swarm_backend(
+                backend or os.getenv('SWARM_BACKEND', 'memory'),
+                self.session_id,
+                self.claude_flow_cmd
+            )
+        else:
+            self.backend = None
+
+        # Write-behind buffer keeps coordination writes off the fetch path
+        self.write_buffer = None
+        if self.backend is not None:
+            if write_behind is None:
+                setting = os.getenv('SWARM_WRITE_BEHIND', 'auto').lower()
+                write_behind = self.backend.name != 'memory' if setting == 'auto' else setting == 'true'
+            if write_behind:
+                self.write_buffer = SwarmWriteBuffer(
+                    self.backend,
+                    flush_interval=int(os.getenv('SWARM_FLUSH_INTERVAL_MS', '250')) / 1000,
+                    max_entries=int(os.getenv('SWARM_FLUSH_MAX_ENTRIES', '500'))
+                )
+
         logger.info(f"Swarm coordination {'ENABLED' if self.enabled else 'DISABLED'}")
         if self.enabled:
-            logger.info(f"Session: {self.session_id}, Agent: {self.agent_id}, Role: {self.agent_role}")
+            logger.info(f"Session: {self.session_id}, Agent: {self.agent_id}, Role: {self.agent_role}, "
+                        f"Backend: {self.backend.name}")
 
     def _run_hook(self, hook_name: str, **kwargs) -> bool:
         """
-        Execute a claude-flow hook command.
+        Execute a coordination hook through the configured backend.
 
         Args:
             hook_name: Name of the hook to execute
@@ -70,70 +520,41 @@ class SwarmCoordinationHooks:
             logger.debug(f"Swarm disabled, skipping hook: {hook_name}")
             return True
 
-        try:
-            # Build command
-            cmd = [self.claude_flow_cmd, 'hooks', hook_name]
-
-            # Add parameters
-            for key, value in kwargs.items():
-                param_key = f"--{key.replace('_', '-')}"
-                cmd.extend([param_key, str(value)])
-
-            # Execute command
-            result = subprocess.run(
-                ' '.join(cmd),
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode == 0:
-                logger.debug(f"Hook {hook_name} executed successfully")
-                return True
-            else:
-                logger.warning(f"Hook {hook_name} failed: {result.stderr}")
-                return False
-
-        except subprocess.TimeoutExpired:
-            logger.warning(f"Hook {hook_name} timed out")
-            return False
-        except Exception as e:
-            logger.error(f"Error executing hook {hook_name}: {str(e)}")
-            return False
+        params = {key: str(value) for key, value in kwargs.items()}
+        return self.backend.run_hook(hook_name, params)
 
     async def _run_hook_async(self, hook_name: str, **kwargs) -> bool:
         """Async version of _run_hook."""
         if not self.enabled:
             return True
 
-        try:
-            cmd = [self.claude_flow_cmd, 'hooks', hook_name]
-            for key, value in kwargs.items():
-                param_key = f"--{key.replace('_', '-')}"
-                cmd.extend([param_key, str(value)])
+        params = {key: str(value) for key, value in kwargs.items()}
+        return await self.backend.run_hook_async(hook_name, params)
 
-            process = await asyncio.create_subprocess_shell(
-                ' '.join(cmd),
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
+    def _queue_hook(self, hook_name: str, **kwargs) -> bool:
+        """Run a fire-and-forget hook through the write-behind buffer when enabled."""
+        if self.write_buffer is None:
+            return self._run_hook(hook_name, **kwargs)
 
-            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+        self.write_buffer.hook(hook_name, {key: str(value) for key, value in kwargs.items()})
+        return True
 
-            if process.returncode == 0:
-                logger.debug(f"Hook {hook_name} executed successfully")
-                return True
-            else:
-                logger.warning(f"Hook {hook_name} failed: {stderr.decode()}")
-                return False
+    def _store(self, full_key: str, value_str: str, ttl: int):
+        if self.write_buffer is not None:
+            self.write_buffer.store(full_key, value_str, ttl)
+        else:
+            self.backend.store(full_key, value_str, ttl)
 
-        except asyncio.TimeoutError:
-            logger.warning(f"Hook {hook_name} timed out")
-            return False
-        except Exception as e:
-            logger.error(f"Error executing hook {hook_name}: {str(e)}")
-            return False
+    def flush(self) -> int:
+        """
+        Flush buffered coordination writes to the backend.
+
+        Returns:
+            Number of entries flushed
+        """
+        if self.write_buffer is None:
+            return 0
+        return self.write_buffer.flush()
 
     # ========== Pre/Post Task Hooks ==========
 
@@ -202,6 +623,8 @@ class SwarmCoordinationHooks:
         # Build metrics string for hook
         metrics_str = json.dumps(metrics) if metrics else "{}"
 
+        # Make the task's buffered writes visible before reporting completion
+        self.flush()
         self._run_hook('post-task', task_id=task_id, status=status, metrics=metrics_str)
 
         logger.info(f"Completed task: {task_id} - {status}")
@@ -224,6 +647,8 @@ class SwarmCoordinationHooks:
             self.task_metrics[task_id] = metrics
 
         metrics_str = json.dumps(metrics) if metrics else "{}"
+        if self.write_buffer is not None:
+            await asyncio.to_thread(self.flush)
         await self._run_hook_async('post-task', task_id=task_id, status=status, metrics=metrics_str)
 
         logger.info(f"Completed task: {task_id} - {status}")
@@ -254,7 +679,7 @@ class SwarmCoordinationHooks:
         else:
             value_str = str(value)
 
-        self._run_hook('memory-store', key=full_key, value=value_str, ttl=ttl)
+        self._store(full_key, value_str, ttl)
 
         logger.debug(f"Stored in memory: {full_key} (TTL: {ttl}s)")
 
@@ -271,7 +696,10 @@ class SwarmCoordinationHooks:
         else:
             value_str = str(value)
 
-        await self._run_hook_async('memory-store', key=full_key, value=value_str, ttl=ttl)
+        if self.write_buffer is not None:
+            self.write_buffer.store(full_key, value_str, ttl)
+        else:
+            await self.backend.store_async(full_key, value_str, ttl)
         logger.debug(f"Stored in memory: {full_key} (TTL: {ttl}s)")
 
     def memory_retrieve(self, key: str, shared: bool = False) -> Optional[Any]:
@@ -291,27 +719,17 @@ class SwarmCoordinationHooks:
         prefix = self.shared_memory_prefix if shared else self.memory_prefix
         full_key = f"{prefix}/{key}"
 
-        try:
-            result = subprocess.run(
-                f"{self.claude_flow_cmd} hooks memory-retrieve --key {full_key}",
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-
-            if result.returncode == 0 and result.stdout:
-                # Try to parse as JSON
-                try:
-                    return json.loads(result.stdout)
-                except json.JSONDecodeError:
-                    return result.stdout.strip()
-
+        value = self.write_buffer.pending_value(full_key) if self.write_buffer else None
+        if value is None:
+            value = self.backend.retrieve(full_key)
+        if value is None:
             return None
 
-        except Exception as e:
-            logger.error(f"Error retrieving memory {full_key}: {str(e)}")
-            return None
+        # Try to parse as JSON
+        try:
+            return json.loads(value)
+        except json.JSONDecodeError:
+            return value.strip()
 
     # ========== Post-Edit Hooks ==========
 
@@ -340,7 +758,7 @@ class SwarmCoordinationHooks:
             'agent': self.agent_id
         }
 
-        self._run_hook('post-edit', file=file_path, memory_key=memory_key)
+        self._queue_hook('post-edit', file=file_path, memory_key=memory_key)
 
         # Also store in memory for coordination
         self.memory_store(f"edits/{file_path}", edit_metadata, ttl=600, shared=True)
@@ -363,7 +781,10 @@ class SwarmCoordinationHooks:
             'agent': self.agent_id
         }
 
-        await self._run_hook_async('post-edit', file=file_path, memory_key=memory_key)
+        if self.write_buffer is not None:
+            self._queue_hook('post-edit', file=file_path, memory_key=memory_key)
+        else:
+            await self._run_hook_async('post-edit', file=file_path, memory_key=memory_key)
         await self.memory_store_async(f"edits/{file_path}", edit_metadata, ttl=600, shared=True)
 
         logger.debug(f"Post-edit hook: {file_path} - {operation}")
@@ -381,7 +802,7 @@ class SwarmCoordinationHooks:
         if not self.enabled:
             return
 
-        self._run_hook('notify', message=message, level=level)
+        self._queue_hook('notify', message=message, level=level)
         logger.debug(f"Swarm notification ({level}): {message}")
 
     async def notify_async(self, message: str, level: str = "info"):
@@ -389,7 +810,10 @@ class SwarmCoordinationHooks:
         if not self.enabled:
             return
 
-        await self._run_hook_async('notify', message=message, level=level)
+        if self.write_buffer is not None:
+            self._queue_hook('notify', message=message, level=level)
+        else:
+            await self._run_hook_async('notify', message=message, level=level)
         logger.debug(f"Swarm notification ({level}): {message}")
 
     # ========== Session Management ==========
@@ -407,6 +831,8 @@ class SwarmCoordinationHooks:
         if not self.enabled:
             return
 
+        if self.write_buffer is not None:
+            self.write_buffer.close()
         self._run_hook('session-end', session_id=self.session_id, export_metrics=str(export_metrics).lower())
         logger.info(f"Ended swarm session: {self.session_id}")
 
@@ -490,8 +916,10 @@ class SwarmCoordinationHooks:
         if not self.enabled:
             return False
 
-        key = f"dedup/{content_hash}"
-        return self.memory_retrieve(key, shared=True) is not None
+        full_key = f"{self.shared_memory_prefix}/dedup/{content_hash}"
+        if self.write_buffer is not None and self.write_buffer.pending_value(full_key) is not None:
+            return True
+        return self.backend.exists(full_key)
 
 
 # ========== Decorator Utilities ==========
@@ -5,16 +5,50 @@ Enhanced with rate limit management, batch operations, and advanced search strat
 
 import os
 import json
-import tweepy
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from collections import defaultdict
 import time
 from threading import Lock
 import re
 from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
+try:
+    from .twitter_stream import FilteredStream, MAX_RULE_LENGTH, MAX_RULES
+except ImportError:
+    from twitter_stream import FilteredStream, MAX_RULE_LENGTH, MAX_RULES
+
+try:
+    from .cache_manager import IntelligentCacheManager, get_l2_backend
+except ImportError:
+    from cache_manager import IntelligentCacheManager, get_l2_backend
+
+try:
+    from .lazy_imports import lazy_import
+    from .rule_pack import RulePackRef
+except ImportError:
+    from lazy_imports import lazy_import
+    from rule_pack import RulePackRef
+
+# The tweepy client is only needed once a monitor is constructed
+tweepy = lazy_import('tweepy')
+
+try:
+    from .twitter_query_planner import (
+        ANNOUNCER_TERMS, KEY_ANNOUNCER_ACCOUNTS, QUERY_FILTERS, TGE_QUERY_TERMS, TOKEN_ACTION_TERMS,
+        SEARCH_CONCURRENCY, SEARCH_MAX_PAGES, SEARCH_PAGE_BUDGET, SEARCH_QUERY_BUDGET,
+        SEARCH_RATE_LIMIT, SEARCH_RATE_RESERVE, SEARCH_RATE_WINDOW, SEARCH_WINDOW_DAYS,
+        PlannedQuery, TwitterQueryPlanner, company_query_term, pack_query_terms, tweet_id_timestamp
+    )
+except ImportError:
+    from twitter_query_planner import (
+        ANNOUNCER_TERMS, KEY_ANNOUNCER_ACCOUNTS, QUERY_FILTERS, TGE_QUERY_TERMS, TOKEN_ACTION_TERMS,
+        SEARCH_CONCURRENCY, SEARCH_MAX_PAGES, SEARCH_PAGE_BUDGET, SEARCH_QUERY_BUDGET,
+        SEARCH_RATE_LIMIT, SEARCH_RATE_RESERVE, SEARCH_RATE_WINDOW, SEARCH_WINDOW_DAYS,
+        PlannedQuery, TwitterQueryPlanner, company_query_term, pack_query_terms, tweet_id_timestamp
+    )
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,6 +68,12 @@ class OptimizedTwitterMonitor:
         self.cache = self.load_cache()
         self.rate_limits = defaultdict(dict)
         self.rate_limit_lock = Lock()
+        self.cache_lock = Lock()
+        # twitter_user tier for handle -> ID resolution, shared with other
+        # processes through the Redis L2 when CACHE_REDIS_URL is set
+        self.cache_manager = IntelligentCacheManager(
+            max_memory_mb=1, tier_budgets={'twitter_user': 1.0}, l2=get_l2_backend()
+        )
 
         # Swarm coordination hooks (optional, set via set_swarm_hooks)
         self.swarm_hooks = None
@@ -41,14 +81,26 @@ class OptimizedTwitterMonitor:
         # Initialize Twitter client
         self._init_client()
         
-        # Compile regex patterns for better matching
-        self.token_pattern = re.compile(r'\$[A-Z]{2,10}\b')  # Match $TOKEN patterns
-        self.company_patterns = self._compile_company_patterns()
+        # Matching rules come from the shared, precompiled rule pack
+        self.rules = RulePackRef(companies, keywords)
+
+        # Rotates search coverage across cycles; statistics persist with the state
+        self.query_planner = TwitterQueryPlanner(companies, state=self.state.get('query_planner'))
+
+    def set_cache_manager(self, cache_manager: IntelligentCacheManager):
+        """Use a shared cache manager for user ID resolution."""
+        self.cache_manager = cache_manager
 
     def set_swarm_hooks(self, swarm_hooks):
         """Set swarm coordination hooks for multi-agent coordination."""
         self.swarm_hooks = swarm_hooks
         logger.info("Swarm hooks enabled for Twitter monitor")
+
+    def update_companies(self, companies: List[Dict]):
+        """Match and search for a new company list; search statistics are kept."""
+        self.companies = companies
+        self.rules.update(companies, self.keywords)
+        self.query_planner.set_companies(companies)
         
     def _init_client(self):
         """Initialize Twitter API v2 client with error handling."""
@@ -59,17 +111,19 @@ class OptimizedTwitterMonitor:
             logger.error(f"Failed to initialize Twitter client: {str(e)}")
             raise
             
+    @property
+    def company_patterns(self) -> Dict[str, re.Pattern]:
+        """Word-bounded name/alias pattern per company."""
+        return self.rules.get().company_patterns
+
+    @property
+    def token_pattern(self) -> re.Pattern:
+        """Pattern for $TOKEN symbols."""
+        return self.rules.get().token_pattern
+
     def _compile_company_patterns(self) -> Dict[str, re.Pattern]:
-        """Compile regex patterns for company matching."""
-        patterns = {}
-        for company in self.companies:
-            # Create pattern with company name and aliases
-            terms = [company['name']] + company.get('aliases', [])
-            # Escape special characters and create case-insensitive pattern
-            escaped_terms = [re.escape(term) for term in terms]
-            pattern = '|'.join(escaped_terms)
-            patterns[company['name']] = re.compile(pattern, re.IGNORECASE)
-        return patterns
+        """Company patterns from the shared rule pack (compiled once per rule set)."""
+        return dict(self.company_patterns)
     
     def load_state(self) -> Dict:
         """Load persistent state with enhanced structure."""
@@ -83,6 +137,8 @@ class OptimizedTwitterMonitor:
         return {
             'since_ids': {},
             'user_id_cache': {},
+            'user_id_resolved_at': {},
+            'list_members': None,
             'list_id': None,
             'last_full_scan': None,
             'rate_limit_resets': {},
@@ -117,7 +173,7 @@ class OptimizedTwitterMonitor:
     def save_cache(self):
         """Save tweet cache."""
         try:
-            with open(self.cache_file, 'w') as f:
+            with self.cache_lock, open(self.cache_file, 'w') as f:
                 json.dump(self.cache, f, indent=2)
         except Exception as e:
             logger.error(f"Error saving cache: {str(e)}")
@@ -165,15 +221,31 @@ class OptimizedTwitterMonitor:
                     logger.debug(f"Coordinated rate limit for twitter/{endpoint}: {limit_info['remaining']}/{limit_info['limit']}")
     
     def batch_lookup_users(self, handles: List[str]) -> Dict[str, str]:
-        """Batch lookup user IDs to minimize API calls."""
+        """
+        Resolve handles to user IDs with as few lookups as possible.
+
+        IDs are served from the cache manager's twitter_user tier, then from
+        the persisted state while they are younger than the tier's TTL, and
+        only the rest are looked up (100 per request). If a lookup fails the
+        last known IDs are used so list membership is not pruned by mistake.
+        """
         user_map = {}
         handles_to_lookup = []
+        ttl = self.cache_manager.ttls['twitter_user']
+        resolved_at = self.state.setdefault('user_id_resolved_at', {})
+        now = time.time()
         
         # Check cache first
         for handle in handles:
             clean_handle = handle.strip('@')
-            if clean_handle in self.state['user_id_cache']:
-                user_map[handle] = self.state['user_id_cache'][clean_handle]
+            user_id = self.cache_manager.get('twitter_user', f"twitter_user_{clean_handle}")
+            if user_id is None and clean_handle in self.state['user_id_cache']:
+                # IDs persisted before resolution times were tracked count as fresh
+                if now - resolved_at.setdefault(clean_handle, now) < ttl:
+                    user_id = self.state['user_id_cache'][clean_handle]
+                    self.cache_manager.set('twitter_user', f"twitter_user_{clean_handle}", user_id)
+            if user_id is not None:
+                user_map[handle] = user_id
             else:
                 handles_to_lookup.append(clean_handle)
         
@@ -188,107 +260,260 @@ class OptimizedTwitterMonitor:
                         for user in users.data:
                             user_map[f"@{user.username}"] = user.id
                             self.state['user_id_cache'][user.username] = user.id
+                            resolved_at[user.username] = now
+                            self.cache_manager.set('twitter_user', f"twitter_user_{user.username}", user.id)
                     
-                    # Small delay to avoid hitting rate limits
-                    time.sleep(0.1)
-                    
-                self.save_state()
             except Exception as e:
                 logger.error(f"Error in batch user lookup: {str(e)}")
+                for clean_handle in handles_to_lookup:
+                    if clean_handle in self.state['user_id_cache']:
+                        user_map[f"@{clean_handle}"] = self.state['user_id_cache'][clean_handle]
+
+            self.save_state()
         
         return user_map
     
     def create_or_update_list(self, user_ids: List[str]) -> Optional[str]:
-        """Create or update a Twitter list for efficient timeline monitoring."""
+        """
+        Create the monitoring list if needed and reconcile its members.
+
+        Membership is diffed against the snapshot in state['list_members'],
+        so only added or removed accounts cost API calls and an unchanged
+        account set costs none. The snapshot is seeded from the API once
+        for lists created before snapshots were kept.
+        """
         try:
             list_id = self.state.get('list_id')
             
             # Create list if it doesn't exist
             if not list_id:
-                # Get authenticated user ID
-                me = self.client.get_me()
-                if me.data:
-                    list_response = self.client.create_list(
-                        name="TGE_Monitor_List",
-                        description="Automated list for TGE monitoring",
-                        private=True
-                    )
-                    if list_response.data:
-                        list_id = list_response.data['id']
-                        self.state['list_id'] = list_id
-                        self.save_state()
+                list_response = self.client.create_list(
+                    name="TGE_Monitor_List",
+                    description="Automated list for TGE monitoring",
+                    private=True
+                )
+                if not list_response.data:
+                    return None
+                list_id = list_response.data['id']
+                self.state['list_id'] = list_id
+                self.state['list_members'] = []
+                self.save_state()
             
-            # Add members to list
-            if list_id:
-                # Twitter allows adding up to 100 members at once
-                for i in range(0, len(user_ids), 100):
-                    batch = user_ids[i:i+100]
+            if self.state.get('list_members') is None:
+                self.state['list_members'] = self._fetch_list_member_ids(list_id)
+
+            current = set(self.state['list_members'])
+            desired = {str(user_id) for user_id in user_ids}
+            to_add = sorted(desired - current)
+            to_remove = sorted(current - desired)
+            if not to_add and not to_remove:
+                return list_id
+
+            try:
+                for user_id in to_add:
                     try:
-                        self.client.add_list_member(id=list_id, user_id=batch)
-                        time.sleep(0.5)
+                        self.client.add_list_member(id=list_id, user_id=user_id)
+                        current.add(user_id)
+                    except tweepy.TooManyRequests:
+                        raise
                     except Exception as e:
-                        logger.error(f"Error adding members to list: {str(e)}")
-                
-                return list_id
+                        logger.error(f"Error adding member {user_id} to list: {str(e)}")
+                for user_id in to_remove:
+                    try:
+                        self.client.remove_list_member(id=list_id, user_id=user_id)
+                        current.discard(user_id)
+                    except tweepy.TooManyRequests:
+                        raise
+                    except Exception as e:
+                        logger.error(f"Error removing member {user_id} from list: {str(e)}")
+            except tweepy.TooManyRequests:
+                logger.warning("Rate limit hit while updating list members; resuming next cycle")
+
+            logger.info(f"List membership reconciled: {len(to_add)} to add, {len(to_remove)} to remove, "
+                        f"{len(current)} members")
+            self.state['list_members'] = sorted(current)
+            self.save_state()
+            return list_id
                 
         except Exception as e:
             logger.error(f"Error managing Twitter list: {str(e)}")
         
         return None
+
+    def _fetch_list_member_ids(self, list_id: str) -> List[str]:
+        """Current member IDs of a list, following pagination."""
+        member_ids = []
+        pagination_token = None
+        while True:
+            response = self.client.get_list_members(
+                id=list_id, max_results=100, pagination_token=pagination_token
+            )
+            member_ids.extend(str(user.id) for user in response.data or [])
+            meta = getattr(response, 'meta', None)
+            pagination_token = meta.get('next_token') if isinstance(meta, dict) else None
+            if not pagination_token:
+                return member_ids
     
-    def search_tge_tweets(self) -> List[Dict]:
-        """Enhanced search for TGE-related tweets with smart query construction."""
-        tweets = []
-        
-        # Group companies by priority
-        high_priority = [c for c in self.companies if c.get('priority') == 'HIGH']
-        other_companies = [c for c in self.companies if c.get('priority') != 'HIGH']
-        
-        # Search strategies
-        search_queries = []
-        
-        # Strategy 1: High-priority companies with strong TGE keywords
-        if high_priority:
-            company_terms = []
-            for company in high_priority[:5]:  # Limit to avoid query length issues
-                terms = [f'"{company["name"]}"'] + [f'"{alias}"' for alias in company.get('aliases', [])]
-                company_terms.append(f"({' OR '.join(terms)})")
-            
-            tge_terms = '("TGE" OR "token launch" OR "token generation event" OR "airdrop live")'
-            query = f"({' OR '.join(company_terms)}) {tge_terms} -is:retweet lang:en"
-            search_queries.append(query)
-        
-        # Strategy 2: Token symbol mentions with action words
+    _company_query_term = staticmethod(company_query_term)
+
+    def _token_symbols(self) -> List[str]:
+        """$SYMBOL terms for every company token."""
         token_symbols = []
         for company in self.companies:
             for token in company.get('tokens', []):
                 if token and len(token) >= 2:
                     token_symbols.append(f"${token}")
-        
-        if token_symbols:
-            symbols_query = f"({' OR '.join(token_symbols[:10])}) (launching OR live OR airdrop OR trading)"
-            search_queries.append(f"{symbols_query} -is:retweet lang:en")
-        
-        # Strategy 3: Generic TGE announcements from key accounts
-        key_accounts = ["@CoinList", "@BinanceLabs", "@a16zcrypto", "@multicoincap"]
-        announcer_query = f'({" OR ".join(key_accounts)}) ("TGE" OR "token launch" OR "token sale")'
-        search_queries.append(f"{announcer_query} -is:retweet lang:en")
-        
-        # Execute searches
-        for query in search_queries[:3]:  # Limit to avoid rate limits
-            try:
-                if not self.check_rate_limit('search'):
-                    continue
-                
-                logger.info(f"Searching: {query[:100]}...")
+        return list(dict.fromkeys(token_symbols))
+
+    def _search_budget(self) -> int:
+        """
+        Number of searches to spend this cycle.
+
+        Capped by the remaining requests in the current rate-limit window,
+        minus a small reserve; the window is tracked locally until the API
+        reports its own limits.
+        """
+        with self.rate_limit_lock:
+            limit_info = self.rate_limits.get('search')
+            if not limit_info or time.time() >= limit_info.get('reset', 0):
+                limit_info = {
+                    'limit': SEARCH_RATE_LIMIT,
+                    'remaining': SEARCH_RATE_LIMIT,
+                    'reset': time.time() + SEARCH_RATE_WINDOW
+                }
+                self.rate_limits['search'] = limit_info
+            spendable = limit_info.get('remaining', 0) - SEARCH_RATE_RESERVE
+        return max(0, min(SEARCH_QUERY_BUDGET, spendable))
+
+    def _consume_search_request(self):
+        with self.rate_limit_lock:
+            limit_info = self.rate_limits['search']
+            limit_info['remaining'] = max(0, limit_info.get('remaining', 1) - 1)
+
+    def _claim_search_page(self, allowance: Dict[str, int]) -> bool:
+        """Take one follow-up page from the cycle's allowance and the rate-limit window."""
+        with self.rate_limit_lock:
+            limit_info = self.rate_limits['search']
+            if allowance['pages'] <= 0 or limit_info.get('remaining', 0) <= SEARCH_RATE_RESERVE:
+                return False
+            allowance['pages'] -= 1
+            limit_info['remaining'] -= 1
+            return True
+
+    def _search_since_id(self, planned: PlannedQuery) -> Optional[int]:
+        """
+        since_id for a planned query: the oldest watermark among its subjects.
+
+        Watermarks are kept per subject because packed queries change shape
+        from cycle to cycle. A subject never searched before, or a watermark
+        outside the recent-search window, means searching the full window.
+        """
+        cutoff = time.time() - SEARCH_WINDOW_DAYS * 86400 + 60
+        watermarks = []
+        for unit in planned.units:
+            since_id = self.state['since_ids'].get(f"search_{unit.key}")
+            if not since_id or tweet_id_timestamp(since_id) < cutoff:
+                return None
+            watermarks.append(int(since_id))
+        return min(watermarks) if watermarks else None
+
+    def _run_search_query(self, planned: PlannedQuery, since_id: Optional[int],
+                          allowance: Dict[str, int]) -> Tuple[List, Optional[int]]:
+        """
+        Fetch every page of one query that the budget allows; returns (tweets, newest_id).
+
+        newest_id is only returned once every page since since_id has been read.
+        When pagination stops early (page budget, rate limit, error) it is None,
+        so the watermark stays put and the unread pages are searched again next
+        cycle instead of being skipped.
+        """
+        results = []
+        newest_id = None
+        next_token = None
+        pages = 0
+        complete = False
+
+        try:
+            while True:
+                if pages == 0:
+                    # Later pages are claimed from the allowance before the loop comes round
+                    if not self.check_rate_limit('search'):
+                        break
+                    self._consume_search_request()
+
                 search_results = self.client.search_recent_tweets(
-                    query=query,
-                    max_results=50,
+                    query=planned.query,
+                    max_results=100,
+                    since_id=since_id,
+                    next_token=next_token,
                     tweet_fields=['created_at', 'author_id', 'public_metrics', 'entities']
                 )
-                
-                if search_results.data:
-                    for tweet in search_results.data:
+                pages += 1
+
+                page = search_results.data or []
+                results.extend(page)
+                if page and newest_id is None:
+                    newest_id = max(int(tweet.id) for tweet in page)
+
+                meta = getattr(search_results, 'meta', None)
+                next_token = meta.get('next_token') if isinstance(meta, dict) else None
+                if not next_token:
+                    complete = True
+                    break
+                if pages >= SEARCH_MAX_PAGES or not self._claim_search_page(allowance):
+                    logger.info(f"Search page budget reached after {pages} pages: {planned.query[:60]}...")
+                    break
+
+        except tweepy.TooManyRequests as e:
+            logger.warning("Rate limit hit during search")
+            self.update_rate_limit('search', e.response)
+        except Exception as e:
+            logger.error(f"Error in search: {str(e)}")
+
+        return results, newest_id if complete else None
+
+    def search_tge_tweets(self) -> List[Dict]:
+        """
+        Search for TGE-related tweets with the queries the planner ranks highest.
+
+        Every company, alias and token symbol is packed into length-limited
+        queries; the rate-limit budget is spent on the highest-yield ones and
+        the rest rotate in on later cycles. Queries run concurrently, resume
+        from per-subject since_id watermarks and follow result pages while
+        the cycle's page allowance lasts.
+        """
+        tweets = []
+        planned_queries = self.query_planner.plan(self._search_budget())
+        if not planned_queries:
+            self.state['query_planner'] = self.query_planner.to_state()
+            self.save_state()
+            return tweets
+
+        # First pages are covered by the planned budget; follow-up pages share what is left
+        with self.rate_limit_lock:
+            spare = (self.rate_limits['search'].get('remaining', 0) - SEARCH_RATE_RESERVE
+                     - len(planned_queries))
+        allowance = {'pages': max(0, min(SEARCH_PAGE_BUDGET, spare))}
+
+        with ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY) as executor:
+            futures = []
+            for planned in planned_queries:
+                since_id = self._search_since_id(planned)
+                logger.info(f"Searching ({len(planned.units)} {planned.group}, since_id={since_id}): "
+                            f"{planned.query[:100]}...")
+                futures.append((planned, executor.submit(self._run_search_query, planned, since_id, allowance)))
+
+            for planned, future in futures:
+                results, newest_id = future.result()
+                self.query_planner.record_results(planned, [tweet.text for tweet in results])
+
+                if newest_id is not None:
+                    for unit in planned.units:
+                        key = f"search_{unit.key}"
+                        self.state['since_ids'][key] = max(int(self.state['since_ids'].get(key) or 0), newest_id)
+
+                with self.cache_lock:
+                    for tweet in results:
                         # Check if we've seen this tweet
                         if tweet.id not in self.cache['tweets']:
                             tweets.append({
@@ -305,19 +530,66 @@ class OptimizedTwitterMonitor:
                                 'timestamp': datetime.now(timezone.utc).isoformat(),
                                 'text_hash': hash(tweet.text)
                             }
-                
-                # Small delay between searches
-                time.sleep(1)
-                
-            except tweepy.TooManyRequests:
-                logger.warning("Rate limit hit during search")
-                break
-            except Exception as e:
-                logger.error(f"Error in search: {str(e)}")
         
+        self.state['query_planner'] = self.query_planner.to_state()
+        self.save_state()
         self.save_cache()
         return tweets
     
+    def compile_stream_rules(
+        self,
+        max_rule_length: int = MAX_RULE_LENGTH,
+        max_rules: int = MAX_RULES,
+    ) -> List[Dict[str, str]]:
+        """
+        Compile the search strategies into filtered-stream rules.
+
+        Unlike the per-cycle searches, the rules cover every company (high
+        priority first), alias and token symbol, packed into as few rules as
+        the rule length limit allows.
+        """
+        companies = sorted(self.companies, key=lambda company: company.get('priority') != 'HIGH')
+        rule_groups = [
+            ('companies', pack_query_terms(
+                [self._company_query_term(company) for company in companies],
+                f"{TGE_QUERY_TERMS} {QUERY_FILTERS}", max_rule_length)),
+            ('tokens', pack_query_terms(
+                self._token_symbols(), f"{TOKEN_ACTION_TERMS} {QUERY_FILTERS}", max_rule_length)),
+            ('announcers', pack_query_terms(
+                KEY_ANNOUNCER_ACCOUNTS, f"{ANNOUNCER_TERMS} {QUERY_FILTERS}", max_rule_length)),
+        ]
+
+        rules = [
+            {'value': value, 'tag': f"tge-{name}-{i}"}
+            for name, values in rule_groups
+            for i, value in enumerate(values, 1)
+        ]
+        if len(rules) > max_rules:
+            logger.warning(f"Compiled {len(rules)} stream rules but only {max_rules} are allowed; "
+                           f"dropping {len(rules) - max_rules}")
+            rules = rules[:max_rules]
+        return rules
+
+    def create_filtered_stream(self, on_tweet: Callable[[Dict], None], **kwargs) -> FilteredStream:
+        """
+        Create a filtered stream that pushes new matching tweets to on_tweet.
+
+        Tweets already seen through search or the list timeline are skipped
+        via the shared tweet cache. Extra kwargs go to FilteredStream.
+        """
+        def handle_tweet(tweet: Dict):
+            with self.cache_lock:
+                if tweet['id'] in self.cache['tweets']:
+                    return
+                self.cache['tweets'][tweet['id']] = {
+                    'timestamp': datetime.now(timezone.utc).isoformat(),
+                    'text_hash': hash(tweet['text'])
+                }
+            on_tweet(tweet)
+            self.save_cache()
+
+        return FilteredStream(self.bearer_token, self.compile_stream_rules(), handle_tweet, **kwargs)
+
     def monitor_list_timeline(self, list_id: str) -> List[Dict]:
         """Monitor Twitter list timeline for efficiency."""
         tweets = []
@@ -370,8 +642,10 @@ class OptimizedTwitterMonitor:
             'signals': []
         }
         
+        rules = self.rules.get()
+
         # Check for token symbols
-        token_matches = self.token_pattern.findall(tweet['text'])
+        token_matches = rules.token_pattern.findall(tweet['text'])
         if token_matches:
             relevance_info['token_symbols'] = token_matches
             relevance_info['confidence'] += 20
@@ -379,7 +653,7 @@ class OptimizedTwitterMonitor:
         
         # Check for company mentions
         for company in self.companies:
-            pattern = self.company_patterns[company['name']]
+            pattern = rules.company_patterns[company['name']]
             if pattern.search(text):
                 relevance_info['matched_companies'].append(company['name'])
                 relevance_info['confidence'] += 30
@@ -391,22 +665,11 @@ class OptimizedTwitterMonitor:
                         relevance_info['signals'].append('company_token_match')
         
         # Check for TGE keywords with weighted scoring
-        high_confidence_keywords = ['tge', 'token generation event', 'token launch', 
-                                  'airdrop live', 'claim airdrop', 'token is live']
-        medium_confidence_keywords = ['mainnet launch', 'tokenomics', 'token sale', 
-                                    'listing', 'trading live']
-        
-        for keyword in high_confidence_keywords:
-            if keyword in text:
-                relevance_info['matched_keywords'].append(keyword)
-                relevance_info['confidence'] += 25
-                relevance_info['signals'].append('high_confidence_keyword')
-        
-        for keyword in medium_confidence_keywords:
+        for keyword, score, signal in rules.tweet_keywords:
             if keyword in text:
                 relevance_info['matched_keywords'].append(keyword)
-                relevance_info['confidence'] += 15
-                relevance_info['signals'].append('medium_confidence_keyword')
+                relevance_info['confidence'] += score
+                relevance_info['signals'].append(signal)
         
         # Check engagement metrics for viral potential
         metrics = tweet.get('metrics', {})
@@ -418,8 +681,7 @@ class OptimizedTwitterMonitor:
                 relevance_info['signals'].append('high_engagement')
         
         # Apply exclusion patterns
-        exclusions = ['test', 'testnet', 'game token', 'nft', 'analysis', 'prediction']
-        for exclusion in exclusions:
+        for exclusion in rules.tweet_exclusions:
             if exclusion in text:
                 relevance_info['confidence'] -= 20
                 relevance_info['signals'].append(f'exclusion_{exclusion}')
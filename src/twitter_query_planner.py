@@ -0,0 +1,236 @@
+"""
+Rate-limit-budgeted query planning for Twitter recent search
+Packs every company, alias, token symbol and announcer account into as few
+search queries as the query length limit allows, and spends each cycle's
+search budget on the queries most likely to find TGE announcements
+"""
+
+import os
+import re
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Query building blocks shared by recent search and filtered-stream rules
+TGE_QUERY_TERMS = '("TGE" OR "token launch" OR "token generation event" OR "airdrop live")'
+TOKEN_ACTION_TERMS = '(launching OR live OR airdrop OR trading)'
+ANNOUNCER_TERMS = '("TGE" OR "token launch" OR "token sale")'
+KEY_ANNOUNCER_ACCOUNTS = ["@CoinList", "@BinanceLabs", "@a16zcrypto", "@multicoincap"]
+QUERY_FILTERS = '-is:retweet lang:en'
+
+GROUP_SUFFIXES = {
+    'companies': f"{TGE_QUERY_TERMS} {QUERY_FILTERS}",
+    'tokens': f"{TOKEN_ACTION_TERMS} {QUERY_FILTERS}",
+    'announcers': f"{ANNOUNCER_TERMS} {QUERY_FILTERS}",
+}
+
+# Recent search accepts 512-character queries on the Basic tier (1024 on Pro)
+MAX_QUERY_LENGTH = int(os.getenv('TWITTER_MAX_QUERY_LENGTH', 512))
+
+# Search requests spent per cycle, and the recent-search window they are
+# accounted against until the API reports its own rate-limit headers
+SEARCH_QUERY_BUDGET = int(os.getenv('TWITTER_SEARCH_QUERY_BUDGET', 5))
+SEARCH_RATE_LIMIT = int(os.getenv('TWITTER_SEARCH_RATE_LIMIT', 60))
+SEARCH_RATE_WINDOW = 900
+SEARCH_RATE_RESERVE = int(os.getenv('TWITTER_SEARCH_RATE_RESERVE', 2))
+
+# Pagination and concurrency: extra result pages a query may follow, extra
+# pages shared by all queries in a cycle, and queries run at once
+SEARCH_MAX_PAGES = int(os.getenv('TWITTER_SEARCH_MAX_PAGES', 3))
+SEARCH_PAGE_BUDGET = int(os.getenv('TWITTER_SEARCH_PAGE_BUDGET', 5))
+SEARCH_CONCURRENCY = int(os.getenv('TWITTER_SEARCH_CONCURRENCY', 3))
+
+# Recent search only reaches back seven days; older since_id watermarks are dropped
+SEARCH_WINDOW_DAYS = 7
+TWITTER_EPOCH_MS = 1288834974657
+
+PRIORITY_WEIGHTS = {'HIGH': 3.0, 'MEDIUM': 2.0, 'LOW': 1.0}
+
+# Weight of older outcomes in a unit's hit rate after each search
+HIT_RATE_DECAY = 0.8
+
+
+def _pack(terms: List[str], suffix: str, max_length: int) -> List[List[int]]:
+    """Greedily group term indices so each "(t1 OR t2 ...) suffix" fits max_length."""
+    groups: List[List[int]] = []
+    current: List[int] = []
+    current_length = 0
+    overhead = len(f"() {suffix}")
+
+    for index, term in enumerate(terms):
+        if overhead + len(term) > max_length:
+            logger.warning(f"Query term too long for a {max_length}-character query, skipping: {term[:60]}")
+            continue
+        added_length = len(term) + (len(' OR ') if current else 0)
+        if current and overhead + current_length + added_length > max_length:
+            groups.append(current)
+            current, current_length, added_length = [], 0, len(term)
+        current.append(index)
+        current_length += added_length
+
+    if current:
+        groups.append(current)
+    return groups
+
+
+def pack_query_terms(terms: List[str], suffix: str, max_length: int) -> List[str]:
+    """
+    Pack OR-terms into as few queries of the form "(t1 OR t2 ...) suffix" as
+    fit within max_length characters.
+    """
+    return [
+        f"({' OR '.join(terms[i] for i in group)}) {suffix}"
+        for group in _pack(terms, suffix, max_length)
+    ]
+
+
+def tweet_id_timestamp(tweet_id: int) -> float:
+    """Creation time (epoch seconds) encoded in a snowflake tweet ID."""
+    return ((int(tweet_id) >> 22) + TWITTER_EPOCH_MS) / 1000
+
+
+def company_query_term(company: Dict) -> str:
+    """OR-group of a company's quoted name and aliases."""
+    terms = [f'"{company["name"]}"'] + [f'"{alias}"' for alias in company.get('aliases', [])]
+    return f"({' OR '.join(terms)})"
+
+
+@dataclass
+class QueryUnit:
+    """One searchable subject: a company, a token symbol or an announcer account."""
+
+    key: str
+    term: str
+    group: str
+    weight: float
+    pattern: re.Pattern
+
+
+@dataclass
+class PlannedQuery:
+    """A packed search query and the units it covers."""
+
+    query: str
+    group: str
+    units: List[QueryUnit] = field(default_factory=list)
+    score: float = 0.0
+
+
+class TwitterQueryPlanner:
+    """
+    Plans recent-search queries under a per-cycle request budget.
+
+    Each unit is scored by company priority, its decayed hit rate and the
+    number of cycles since it was last searched, so high-yield subjects are
+    searched most often while everything else rotates in over time.
+    Statistics round-trip through to_state() and the state argument so
+    rotation survives restarts.
+    """
+
+    def __init__(self, companies: List[Dict], max_query_length: int = MAX_QUERY_LENGTH,
+                 state: Optional[Dict] = None):
+        self.max_query_length = max_query_length
+        self.units = self._build_units(companies)
+        state = state or {}
+        self.cycle = state.get('cycle', 0)
+        self.stats: Dict[str, Dict[str, float]] = state.get('units', {})
+
+    def set_companies(self, companies: List[Dict]):
+        """Rebuild the units for a new company list; statistics of unchanged units carry over."""
+        self.units = self._build_units(companies)
+        keys = {unit.key for unit in self.units}
+        self.stats = {key: stats for key, stats in self.stats.items() if key in keys}
+
+    @staticmethod
+    def _build_units(companies: List[Dict]) -> List[QueryUnit]:
+        units = []
+        seen_tokens = set()
+
+        for company in companies:
+            weight = PRIORITY_WEIGHTS.get(company.get('priority'), 1.0)
+            names = [company['name']] + company.get('aliases', [])
+            units.append(QueryUnit(
+                key=f"company:{company['name']}",
+                term=company_query_term(company),
+                group='companies',
+                weight=weight,
+                pattern=re.compile('|'.join(re.escape(name) for name in names), re.IGNORECASE),
+            ))
+            for token in company.get('tokens', []):
+                if token and len(token) >= 2 and token.upper() not in seen_tokens:
+                    seen_tokens.add(token.upper())
+                    units.append(QueryUnit(
+                        key=f"token:{token.upper()}",
+                        term=f"${token}",
+                        group='tokens',
+                        weight=weight,
+                        pattern=re.compile(rf'\${re.escape(token)}\b', re.IGNORECASE),
+                    ))
+
+        for account in KEY_ANNOUNCER_ACCOUNTS:
+            units.append(QueryUnit(
+                key=f"announcer:{account}",
+                term=account,
+                group='announcers',
+                weight=PRIORITY_WEIGHTS['MEDIUM'],
+                pattern=re.compile(re.escape(account), re.IGNORECASE),
+            ))
+        return units
+
+    def unit_score(self, unit: QueryUnit) -> float:
+        stats = self.stats.get(unit.key, {})
+        searches = stats.get('searches', 0.0)
+        hit_rate = stats.get('hits', 0.0) / searches if searches else 0.5
+        last_cycle = stats.get('last_cycle')
+        staleness = self.cycle + 1 if last_cycle is None else self.cycle - last_cycle
+        return unit.weight * (1.0 + hit_rate) * (1 + max(staleness, 0))
+
+    def plan(self, budget: int) -> List[PlannedQuery]:
+        """
+        Return at most budget queries, highest expected yield first.
+
+        Units are packed in score order within each group, so the first
+        query of a group always carries its best units. Queries rank by
+        their most urgent unit; because a unit's score grows with every
+        cycle it waits, each subject is eventually searched.
+        """
+        self.cycle += 1
+        if budget <= 0:
+            return []
+
+        candidates = []
+        for group, suffix in GROUP_SUFFIXES.items():
+            units = sorted(
+                (unit for unit in self.units if unit.group == group),
+                key=self.unit_score,
+                reverse=True,
+            )
+            for indices in _pack([unit.term for unit in units], suffix, self.max_query_length):
+                packed = [units[i] for i in indices]
+                candidates.append(PlannedQuery(
+                    query=f"({' OR '.join(unit.term for unit in packed)}) {suffix}",
+                    group=group,
+                    units=packed,
+                    score=max(self.unit_score(unit) for unit in packed),
+                ))
+
+        candidates.sort(key=lambda planned: (planned.score, len(planned.units)), reverse=True)
+        selected = candidates[:budget]
+        logger.info(f"Planned {len(selected)} of {len(candidates)} search queries "
+                    f"covering {sum(len(p.units) for p in selected)} of {len(self.units)} subjects")
+        return selected
+
+    def record_results(self, planned: PlannedQuery, texts: Iterable[str]):
+        """Update each unit's hit rate from the tweet texts its query returned."""
+        texts = [text for text in texts if isinstance(text, str)]
+        for unit in planned.units:
+            hit = any(unit.pattern.search(text) for text in texts)
+            stats = self.stats.setdefault(unit.key, {'searches': 0.0, 'hits': 0.0})
+            stats['searches'] = stats['searches'] * HIT_RATE_DECAY + 1
+            stats['hits'] = stats['hits'] * HIT_RATE_DECAY + (1 if hit else 0)
+            stats['last_cycle'] = self.cycle
+
+    def to_state(self) -> Dict:
+        return {'cycle': self.cycle, 'units': self.stats}
@@ -0,0 +1,277 @@
+"""
+Twitter API v2 filtered stream for TGE Monitor
+Keeps the server-side stream rules in sync with the monitored companies and
+delivers matching tweets as they are posted, reconnecting with the backoff
+schedule Twitter documents for streaming clients
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+API_BASE = os.getenv('TWITTER_API_BASE', 'https://api.twitter.com/2')
+
+# Rule limits for the Basic access tier (Pro allows 1024 characters, 1000 rules)
+MAX_RULE_LENGTH = int(os.getenv('TWITTER_STREAM_MAX_RULE_LENGTH', 512))
+MAX_RULES = int(os.getenv('TWITTER_STREAM_MAX_RULES', 25))
+
+# Twitter sends a keep-alive newline every 20s; 90s of silence means a stalled connection
+STALL_TIMEOUT = 90
+CONNECT_TIMEOUT = 10
+
+TWEET_FIELDS = 'created_at,author_id,public_metrics,entities'
+
+
+class StreamDisconnected(Exception):
+    """The stream connection failed or ended and should be re-established."""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class FilteredStream:
+    """
+    Long-running consumer of the v2 filtered stream.
+
+    Args:
+        bearer_token: App bearer token
+        rules: Desired stream rules as {'value': ..., 'tag': ...} dicts
+        on_tweet: Called with each matching tweet (same shape as search results)
+        api_base: API root; point at a local stand-in to replay recorded streams
+        session: Optional requests session
+    """
+
+    # Reconnect backoff: linear for network errors, exponential for HTTP errors
+    # and from one minute for rate limiting
+    NETWORK_BACKOFF_STEP = 0.25
+    NETWORK_BACKOFF_MAX = 16
+    HTTP_BACKOFF_START = 5
+    HTTP_BACKOFF_MAX = 320
+    RATE_LIMIT_BACKOFF_START = 60
+    RATE_LIMIT_BACKOFF_MAX = 960
+
+    def __init__(
+        self,
+        bearer_token: str,
+        rules: List[Dict[str, str]],
+        on_tweet: Callable[[Dict], None],
+        api_base: str = API_BASE,
+        session: Optional[requests.Session] = None,
+    ):
+        self.rules = rules
+        self.on_tweet = on_tweet
+        self.api_base = api_base.rstrip('/')
+        self.session = session or requests.Session()
+        self.session.headers['Authorization'] = f"Bearer {bearer_token}"
+        self._stop = threading.Event()
+        self._response: Optional[requests.Response] = None
+        self.stats = {
+            'connections': 0,
+            'reconnects': 0,
+            'tweets': 0,
+            'keepalives': 0,
+            'errors': 0,
+            'last_tweet_at': None
+        }
+
+    @property
+    def rules_url(self) -> str:
+        return f"{self.api_base}/tweets/search/stream/rules"
+
+    @property
+    def stream_url(self) -> str:
+        return f"{self.api_base}/tweets/search/stream"
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    # ---------- Rules ----------
+
+    def get_rules(self) -> List[Dict]:
+        """Return the rules currently installed on the stream."""
+        response = self.session.get(self.rules_url, timeout=CONNECT_TIMEOUT)
+        response.raise_for_status()
+        return response.json().get('data') or []
+
+    def sync_rules(self) -> Dict[str, int]:
+        """
+        Reconcile installed rules with the desired rules.
+
+        Only rules whose value changed are deleted or added, so restarts with
+        an unchanged company list cost a single GET.
+        """
+        installed = self.get_rules()
+        desired = {rule['value']: rule for rule in self.rules}
+
+        stale_ids = [rule['id'] for rule in installed if rule['value'] not in desired]
+        installed_values = {rule['value'] for rule in installed}
+        missing = [rule for value, rule in desired.items() if value not in installed_values]
+
+        if stale_ids:
+            response = self.session.post(
+                self.rules_url, json={'delete': {'ids': stale_ids}}, timeout=CONNECT_TIMEOUT
+            )
+            response.raise_for_status()
+
+        if missing:
+            response = self.session.post(self.rules_url, json={'add': missing}, timeout=CONNECT_TIMEOUT)
+            response.raise_for_status()
+            for error in response.json().get('errors', []):
+                logger.warning(f"Stream rule rejected: {error.get('title')} {error.get('value', '')}")
+
+        logger.info(f"Stream rules synced: {len(missing)} added, {len(stale_ids)} deleted, "
+                    f"{len(desired)} active")
+        return {'added': len(missing), 'deleted': len(stale_ids)}
+
+    # ---------- Streaming ----------
+
+    def run(self, max_connections: Optional[int] = None):
+        """
+        Sync rules and consume the stream until stop() is called.
+
+        Args:
+            max_connections: Stop after this many connections (used to replay
+                a recorded stream once)
+        """
+        failures = 0
+
+        try:
+            self.sync_rules()
+        except Exception as e:
+            logger.error(f"Failed to sync stream rules: {e}")
+
+        while not self.stopped:
+            if max_connections is not None and self.stats['connections'] >= max_connections:
+                break
+            if self.stats['connections']:
+                self.stats['reconnects'] += 1
+
+            try:
+                if self._connect_and_consume():
+                    # The connection was healthy before it dropped; restart the backoff schedule
+                    failures = 0
+                failure_kind = 'network'
+            except StreamDisconnected as e:
+                self.stats['errors'] += 1
+                failure_kind = 'rate_limit' if e.status_code == 429 else 'http'
+                logger.warning(f"Filtered stream disconnected: {e}")
+            except (requests.RequestException, OSError) as e:
+                self.stats['errors'] += 1
+                failure_kind = 'network'
+                logger.warning(f"Filtered stream connection error: {e}")
+
+            if self.stopped or (max_connections is not None and self.stats['connections'] >= max_connections):
+                break
+
+            failures += 1
+            delay = self.backoff_delay(failure_kind, failures)
+            logger.info(f"Reconnecting to filtered stream in {delay:.2f}s")
+            self._stop.wait(delay)
+
+    def stop(self):
+        """Stop consuming; unblocks a connection waiting for data."""
+        self._stop.set()
+        response = self._response
+        if response is not None:
+            try:
+                response.close()
+            except Exception:
+                pass
+
+    def backoff_delay(self, kind: str, attempt: int) -> float:
+        """Reconnect delay for the given failure kind and consecutive attempt."""
+        if kind == 'rate_limit':
+            return min(self.RATE_LIMIT_BACKOFF_START * 2 ** (attempt - 1), self.RATE_LIMIT_BACKOFF_MAX)
+        if kind == 'http':
+            return min(self.HTTP_BACKOFF_START * 2 ** (attempt - 1), self.HTTP_BACKOFF_MAX)
+        return min(self.NETWORK_BACKOFF_STEP * attempt, self.NETWORK_BACKOFF_MAX)
+
+    def _connect_and_consume(self) -> bool:
+        """Open one stream connection and deliver tweets until it ends; True if data arrived."""
+        response = self.session.get(
+            self.stream_url,
+            params={'tweet.fields': TWEET_FIELDS},
+            stream=True,
+            timeout=(CONNECT_TIMEOUT, STALL_TIMEOUT),
+        )
+        self.stats['connections'] += 1
+
+        if response.status_code != 200:
+            response.close()
+            raise StreamDisconnected(f"HTTP {response.status_code}", response.status_code)
+
+        self._response = response
+        received = False
+        try:
+            for line in response.iter_lines():
+                if self.stopped:
+                    break
+                received = True
+                if not line:
+                    self.stats['keepalives'] += 1
+                    continue
+                self._handle_line(line)
+        finally:
+            self._response = None
+            response.close()
+        return received
+
+    def _handle_line(self, line: bytes):
+        try:
+            payload = json.loads(line)
+        except ValueError:
+            logger.debug(f"Skipping malformed stream line: {line[:100]!r}")
+            return
+
+        if 'data' not in payload:
+            for error in payload.get('errors', []):
+                logger.warning(f"Filtered stream error: {error.get('title')}: {error.get('detail', '')}")
+            return
+
+        tweet = self.parse_tweet(payload)
+        self.stats['tweets'] += 1
+        self.stats['last_tweet_at'] = time.time()
+        try:
+            self.on_tweet(tweet)
+        except Exception as e:
+            logger.error(f"Stream tweet handler failed for tweet {tweet['id']}: {e}")
+
+    @staticmethod
+    def parse_tweet(payload: Dict) -> Dict:
+        """Convert a stream payload into the tweet dict used by the rest of the monitor."""
+        data = payload['data']
+        tweet_id = int(data['id'])
+
+        created_at = data.get('created_at')
+        if created_at:
+            try:
+                created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+            except ValueError:
+                pass
+
+        return {
+            'id': tweet_id,
+            'text': data.get('text', ''),
+            'author_id': data.get('author_id'),
+            'created_at': created_at,
+            'metrics': data.get('public_metrics', {}),
+            'url': f"https://twitter.com/i/web/status/{tweet_id}",
+            'source': 'filtered_stream',
+            'matching_rules': [rule.get('tag') for rule in payload.get('matching_rules', [])]
+        }
+
+    def start_background(self) -> threading.Thread:
+        """Run the stream in a daemon thread."""
+        thread = threading.Thread(target=self.run, name="twitter-filtered-stream", daemon=True)
+        thread.start()
+        return thread
@@ -9,8 +9,10 @@ import time
 import logging
 import functools
 import hashlib
+import html
 import json
 import os
+import re
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional, Union
 import requests
@@ -184,6 +186,22 @@ def validate_email(email: str) -> bool:
     return re.match(pattern, email) is not None
 
 
+# Patterns used by sanitize_text, compiled once at import
+_CONTROL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+_INVISIBLE_CHARS_RE = re.compile(r'[\u200b-\u200f\u202a-\u202e\u2060-\u2064\ufeff]')
+_DANGEROUS_TEXT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for pattern in (
+        r'<\s*script[^>]*>.*?<\s*/\s*script\s*>',
+        r'javascript\s*:',
+        r'vbscript\s*:',
+        r'data\s*:',
+        r'on\w+\s*=',  # onclick, onload, etc.
+    )
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
 def sanitize_text(text: str, max_length: int = 1000, escape_html: bool = True) -> str:
     """
     Enhanced sanitize text with comprehensive security protections.
@@ -199,37 +217,26 @@ def sanitize_text(text: str, max_length: int = 1000, escape_html: bool = True) -
     if not text or not isinstance(text, str):
         return ""
     
-    import re
-    import html
-    
     # Remove null bytes and other dangerous characters
     text = text.replace('\x00', '')
     
     # Remove control characters (except tabs, newlines, carriage returns)
-    text = re.sub(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]', '', text)
+    text = _CONTROL_CHARS_RE.sub('', text)
     
     # Remove potentially dangerous Unicode characters
     # Remove zero-width characters that could be used for obfuscation
-    text = re.sub(r'[\u200b-\u200f\u202a-\u202e\u2060-\u2064\ufeff]', '', text)
+    text = _INVISIBLE_CHARS_RE.sub('', text)
     
     # Remove script injection patterns (basic protection)
-    dangerous_patterns = [
-        r'<\s*script[^>]*>.*?<\s*/\s*script\s*>',
-        r'javascript\s*:',
-        r'vbscript\s*:',
-        r'data\s*:',
-        r'on\w+\s*=',  # onclick, onload, etc.
-    ]
-    
-    for pattern in dangerous_patterns:
-        text = re.sub(pattern, '', text, flags=re.IGNORECASE | re.DOTALL)
+    for pattern in _DANGEROUS_TEXT_PATTERNS:
+        text = pattern.sub('', text)
     
     # Escape HTML entities for security if requested
     if escape_html:
         text = html.escape(text, quote=True)
     
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
     
     # Limit length with intelligent truncation
     if len(text) > max_length:
@@ -3,24 +3,34 @@ WebSocket service for real-time TGE alert notifications
 Enhanced WebSocket management with authentication and room-based subscriptions
 """
 
+import os
 import json
 import asyncio
 import logging
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Set, Optional, Any
+from typing import Callable, Dict, List, Set, Optional, Any
 from fastapi import WebSocket, WebSocketDisconnect, Depends, HTTPException, status
 from fastapi.security import HTTPBearer
 from sqlalchemy.orm import Session
-import jwt
 from enum import Enum
 
 from .database import DatabaseManager
 from .models import User, Alert, Company
 from .auth import AuthManager
 from .schemas import AlertNotification, WebSocketMessage
+from .event_broker import ALERTS_CHANNEL, SYSTEM_STATUS_CHANNEL, EventBroker, get_event_broker
 
 logger = logging.getLogger(__name__)
 
+# Outbound fan-out tuning
+OUTBOUND_QUEUE_SIZE = int(os.getenv('WEBSOCKET_OUTBOUND_QUEUE_SIZE', '100'))
+SEND_TIMEOUT = float(os.getenv('WEBSOCKET_SEND_TIMEOUT', '10'))
+
+# Alerts at or above this confidence match HIGH_CONFIDENCE subscriptions
+HIGH_CONFIDENCE_THRESHOLD = 0.7
+
 # WebSocket message types
 class MessageType(str, Enum):
     ALERT = "alert"
@@ -44,10 +54,58 @@ class SubscriptionType(str, Enum):
     SYSTEM_STATUS = "system_status"
 
 
+def encode_message(message_type: MessageType, data: Any) -> str:
+    """Serialize a WebSocket message envelope to JSON text"""
+    message = WebSocketMessage(
+        type=message_type.value,
+        data=data,
+        timestamp=datetime.now(timezone.utc)
+    )
+    return message.json()
+
+
+def build_alert_notification(alert: Alert) -> Dict[str, Any]:
+    """Build the alert notification payload sent to clients"""
+    notification = AlertNotification(
+        alert_id=alert.id,
+        title=alert.title,
+        company_name=alert.company.name if alert.company else None,
+        confidence=alert.confidence,
+        urgency_level=alert.urgency_level,
+        source=alert.source,
+        created_at=alert.created_at
+    )
+    return notification.dict()
+
+
+@dataclass(frozen=True)
+class AlertRoutingKey:
+    """Alert fields used to match subscribers, carried with published alert events"""
+    id: int
+    company_id: Optional[int]
+    confidence: float
+    source: str
+
+
+def build_alert_event(alert: Alert) -> Dict[str, Any]:
+    """Build a broker event for an alert: routing fields plus the serialized message"""
+    source = getattr(alert.source, 'value', alert.source)
+    return {
+        "routing": {
+            "id": alert.id,
+            "company_id": alert.company_id,
+            "confidence": alert.confidence,
+            "source": source
+        },
+        "message": encode_message(MessageType.ALERT, build_alert_notification(alert))
+    }
+
+
 class WebSocketConnection:
     """Individual WebSocket connection with user context and subscriptions"""
     
-    def __init__(self, websocket: WebSocket, user: Optional[User] = None):
+    def __init__(self, websocket: WebSocket, user: Optional[User] = None,
+                 max_queue_size: int = OUTBOUND_QUEUE_SIZE):
         self.websocket = websocket
         self.user = user
         self.user_id = user.id if user else None
@@ -58,16 +116,21 @@ class WebSocketConnection:
         self.company_filters: Set[int] = set()  # Company IDs to filter
         self.confidence_threshold: float = 0.0
         self.source_filters: Set[str] = set()
+        
+        # Bounded outbound queue drained by a per-connection sender task, so a
+        # slow client never delays broadcasts to other clients
+        self.max_queue_size = max_queue_size
+        self._outbound: deque = deque()
+        self._coalesced: Dict[str, list] = {}
+        self._outbound_ready = asyncio.Event()
+        self._sender_task: Optional[asyncio.Task] = None
+        self.closed = False
+        self.messages_dropped = 0
     
     async def send_message(self, message_type: MessageType, data: Any):
         """Send message to WebSocket client"""
         try:
-            message = WebSocketMessage(
-                type=message_type.value,
-                data=data,
-                timestamp=datetime.now(timezone.utc)
-            )
-            await self.websocket.send_text(message.json())
+            await self.websocket.send_text(encode_message(message_type, data))
         except Exception as e:
             logger.error(f"Failed to send WebSocket message: {e}")
             raise WebSocketDisconnect()
@@ -78,18 +141,71 @@ class WebSocketConnection:
         if not self._should_send_alert(alert):
             return
         
-        # Create notification
-        notification = AlertNotification(
-            alert_id=alert.id,
-            title=alert.title,
-            company_name=alert.company.name if alert.company else None,
-            confidence=alert.confidence,
-            urgency_level=alert.urgency_level,
-            source=alert.source,
-            created_at=alert.created_at
-        )
+        await self.send_message(MessageType.ALERT, build_alert_notification(alert))
+    
+    def queue_text(self, text: str, coalesce_key: Optional[str] = None) -> bool:
+        """
+        Queue pre-serialized text for delivery by the sender task.
+        
+        Messages with a coalesce_key replace any undelivered message with the
+        same key instead of taking another queue slot.
+        
+        Returns:
+            False if the queue is full (slow consumer) or the connection is closed
+        """
+        if self.closed:
+            return False
+        
+        if coalesce_key is not None and coalesce_key in self._coalesced:
+            self._coalesced[coalesce_key][1] = text
+            return True
+        
+        if len(self._outbound) >= self.max_queue_size:
+            self.messages_dropped += 1
+            return False
         
-        await self.send_message(MessageType.ALERT, notification.dict())
+        item = [coalesce_key, text]
+        self._outbound.append(item)
+        if coalesce_key is not None:
+            self._coalesced[coalesce_key] = item
+        self._outbound_ready.set()
+        return True
+    
+    def start_sender(self, on_error: Optional[Callable[["WebSocketConnection"], None]] = None):
+        """Start the outbound sender task (idempotent)"""
+        if self._sender_task is None and not self.closed:
+            self._sender_task = asyncio.create_task(self._sender_loop(on_error))
+    
+    def stop_sender(self):
+        """Stop the sender task and discard undelivered messages"""
+        self.closed = True
+        if self._sender_task is not None:
+            self._sender_task.cancel()
+            self._sender_task = None
+        self._outbound.clear()
+        self._coalesced.clear()
+    
+    @property
+    def queue_depth(self) -> int:
+        return len(self._outbound)
+    
+    async def _sender_loop(self, on_error: Optional[Callable[["WebSocketConnection"], None]]):
+        try:
+            while not self.closed:
+                await self._outbound_ready.wait()
+                self._outbound_ready.clear()
+                while self._outbound:
+                    coalesce_key, text = self._outbound.popleft()
+                    if coalesce_key is not None:
+                        self._coalesced.pop(coalesce_key, None)
+                    await asyncio.wait_for(self.websocket.send_text(text), timeout=SEND_TIMEOUT)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.info(f"WebSocket sender stopped for user_id={self.user_id}: {e}")
+            self.closed = True
+            if on_error is not None:
+                on_error(self)
     
     def _should_send_alert(self, alert: Alert) -> bool:
         """Check if alert should be sent based on user's subscriptions and filters"""
@@ -109,7 +225,7 @@ class WebSocketConnection:
         if SubscriptionType.ALL_ALERTS.value in self.subscriptions:
             return True
         
-        if SubscriptionType.HIGH_CONFIDENCE.value in self.subscriptions and alert.confidence >= 0.7:
+        if SubscriptionType.HIGH_CONFIDENCE.value in self.subscriptions and alert.confidence >= HIGH_CONFIDENCE_THRESHOLD:
             return True
         
         if SubscriptionType.COMPANY_SPECIFIC.value in self.subscriptions and alert.company_id:
@@ -143,6 +259,83 @@ class WebSocketConnection:
         self.last_ping = datetime.now(timezone.utc)
 
 
+class SubscriptionIndex:
+    """Inverted indexes from subscription type, company and source to connections"""
+    
+    def __init__(self):
+        self.by_subscription: Dict[str, Set[WebSocketConnection]] = {}
+        self.by_company: Dict[int, Set[WebSocketConnection]] = {}
+        self.by_source: Dict[str, Set[WebSocketConnection]] = {}
+        # Connections without a company/source filter accept any company/source
+        self.any_company: Set[WebSocketConnection] = set()
+        self.any_source: Set[WebSocketConnection] = set()
+        self._indexed: Dict[WebSocketConnection, tuple] = {}
+    
+    def update(self, connection: WebSocketConnection):
+        """(Re)index a connection after its subscriptions or filters change"""
+        self.remove(connection)
+        
+        subscriptions = frozenset(connection.subscriptions)
+        companies = frozenset(connection.company_filters)
+        sources = frozenset(connection.source_filters)
+        
+        for subscription in subscriptions:
+            self.by_subscription.setdefault(subscription, set()).add(connection)
+        for company_id in companies:
+            self.by_company.setdefault(company_id, set()).add(connection)
+        for source in sources:
+            self.by_source.setdefault(source, set()).add(connection)
+        if not companies:
+            self.any_company.add(connection)
+        if not sources:
+            self.any_source.add(connection)
+        
+        self._indexed[connection] = (subscriptions, companies, sources)
+    
+    def remove(self, connection: WebSocketConnection):
+        """Drop a connection from every index"""
+        entry = self._indexed.pop(connection, None)
+        if entry is None:
+            return
+        
+        subscriptions, companies, sources = entry
+        for index, keys in ((self.by_subscription, subscriptions),
+                            (self.by_company, companies),
+                            (self.by_source, sources)):
+            for key in keys:
+                members = index.get(key)
+                if members is not None:
+                    members.discard(connection)
+                    if not members:
+                        del index[key]
+        self.any_company.discard(connection)
+        self.any_source.discard(connection)
+    
+    def subscribers(self, subscription: str) -> Set[WebSocketConnection]:
+        return set(self.by_subscription.get(subscription, ()))
+    
+    def match_alert(self, alert: Alert) -> Set[WebSocketConnection]:
+        """Connections that should receive an alert"""
+        empty = set()
+        company_id = alert.company_id
+        company_matches = self.by_company.get(company_id, empty) if company_id else empty
+        source_matches = self.by_source.get(alert.source, empty)
+        
+        candidates = set(self.by_subscription.get(SubscriptionType.ALL_ALERTS.value, empty))
+        if alert.confidence >= HIGH_CONFIDENCE_THRESHOLD:
+            candidates |= self.by_subscription.get(SubscriptionType.HIGH_CONFIDENCE.value, empty)
+        candidates |= self.by_subscription.get(SubscriptionType.COMPANY_SPECIFIC.value, empty) & company_matches
+        candidates |= self.by_subscription.get(SubscriptionType.SOURCE_SPECIFIC.value, empty) & source_matches
+        if not candidates:
+            return candidates
+        
+        candidates &= self.any_company | company_matches
+        candidates &= self.any_source | source_matches
+        
+        # Confidence thresholds and subscription precedence are per connection
+        return {connection for connection in candidates if connection._should_send_alert(alert)}
+
+
 class WebSocketManager:
     """Advanced WebSocket connection manager with authentication and rooms"""
     
@@ -150,12 +343,15 @@ class WebSocketManager:
         self.connections: List[WebSocketConnection] = []
         self.user_connections: Dict[int, List[WebSocketConnection]] = {}
         self.rooms: Dict[str, Set[WebSocketConnection]] = {}
+        self.index = SubscriptionIndex()
         self.stats = {
             'total_connections': 0,
             'active_connections': 0,
             'authenticated_connections': 0,
             'messages_sent': 0,
-            'alerts_broadcast': 0
+            'alerts_broadcast': 0,
+            'messages_dropped': 0,
+            'slow_consumers_dropped': 0
         }
     
     async def connect(self, websocket: WebSocket, user: Optional[User] = None) -> WebSocketConnection:
@@ -164,6 +360,7 @@ class WebSocketManager:
         
         connection = WebSocketConnection(websocket, user)
         self.connections.append(connection)
+        self.index.update(connection)
         
         # Track user connections
         if user:
@@ -184,11 +381,16 @@ class WebSocketManager:
             "server_time": datetime.now(timezone.utc).isoformat()
         })
         
+        connection.start_sender(self._handle_send_failure)
+        
         return connection
     
     def disconnect(self, connection: WebSocketConnection):
         """Remove WebSocket connection"""
         try:
+            connection.stop_sender()
+            self.index.remove(connection)
+            
             if connection in self.connections:
                 self.connections.remove(connection)
                 self.stats['active_connections'] -= 1
@@ -274,6 +476,7 @@ class WebSocketManager:
             
             if action == 'subscribe':
                 connection.add_subscription(subscription_type, **filters)
+                self.index.update(connection)
                 
                 # Add to room if applicable
                 room_name = f"subscription_{subscription_type}"
@@ -289,6 +492,7 @@ class WebSocketManager:
                 
             elif action == 'unsubscribe':
                 connection.remove_subscription(subscription_type)
+                self.index.update(connection)
                 
                 # Remove from room
                 room_name = f"subscription_{subscription_type}"
@@ -309,63 +513,97 @@ class WebSocketManager:
                 "code": "SUBSCRIPTION_ERROR"
             })
     
+    def _handle_send_failure(self, connection: WebSocketConnection):
+        """Sender task callback for connections whose socket failed"""
+        self.disconnect(connection)
+    
+    async def _close_slow_consumer(self, connection: WebSocketConnection):
+        try:
+            await connection.websocket.close(code=1008, reason="Slow consumer")
+        except Exception:
+            pass
+    
+    def _fan_out(self, connections, text: str, coalesce_key: Optional[str] = None) -> int:
+        """
+        Queue one serialized message for many connections without awaiting sends.
+        
+        Connections whose outbound queue is full are dropped as slow consumers
+        (coalescable messages never fill a queue twice).
+        
+        Returns:
+            Number of connections the message was queued for
+        """
+        queued = 0
+        
+        for connection in list(connections):
+            connection.start_sender(self._handle_send_failure)
+            if connection.queue_text(text, coalesce_key):
+                queued += 1
+                continue
+            
+            self.stats['messages_dropped'] += 1
+            if not connection.closed:
+                self.stats['slow_consumers_dropped'] += 1
+                logger.warning(f"Dropping slow WebSocket consumer: user_id={connection.user_id} "
+                               f"(queue depth {connection.queue_depth})")
+                self.disconnect(connection)
+                asyncio.create_task(self._close_slow_consumer(connection))
+        
+        self.stats['messages_sent'] += queued
+        return queued
+    
     async def broadcast_alert(self, alert: Alert):
-        """Broadcast alert to all relevant connections"""
+        """Broadcast alert to all relevant connections of this worker"""
+        if not self.connections:
+            return
+        
+        await self.deliver_alert_event(build_alert_event(alert))
+    
+    async def deliver_alert_event(self, event: Dict[str, Any]):
+        """Deliver a published alert event to matching local connections"""
         if not self.connections:
             return
         
+        routing = AlertRoutingKey(**event["routing"])
+        recipients = self.index.match_alert(routing)
         broadcast_count = 0
         
-        for connection in self.connections.copy():  # Copy to avoid modification during iteration
-            try:
-                await connection.send_alert(alert)
-                broadcast_count += 1
-            except WebSocketDisconnect:
-                self.disconnect(connection)
-            except Exception as e:
-                logger.error(f"Error broadcasting alert to connection: {e}")
+        if recipients:
+            # The message was serialized once by the publisher
+            broadcast_count = self._fan_out(recipients, event["message"])
         
         self.stats['alerts_broadcast'] += 1
-        self.stats['messages_sent'] += broadcast_count
         
-        logger.info(f"Broadcasted alert {alert.id} to {broadcast_count} connections")
+        logger.info(f"Broadcasted alert {routing.id} to {broadcast_count} connections")
     
     async def send_to_user(self, user_id: int, message_type: MessageType, data: Any):
         """Send message to specific user's connections"""
         if user_id not in self.user_connections:
             return
         
-        for connection in self.user_connections[user_id].copy():
-            try:
-                await connection.send_message(message_type, data)
-            except WebSocketDisconnect:
-                self.disconnect(connection)
-            except Exception as e:
-                logger.error(f"Error sending message to user {user_id}: {e}")
+        self._fan_out(self.user_connections[user_id], encode_message(message_type, data))
     
     async def send_to_room(self, room_name: str, message_type: MessageType, data: Any):
         """Send message to all connections in a room"""
         if room_name not in self.rooms:
             return
         
-        for connection in self.rooms[room_name].copy():
-            try:
-                await connection.send_message(message_type, data)
-            except WebSocketDisconnect:
-                self.disconnect(connection)
-            except Exception as e:
-                logger.error(f"Error sending message to room {room_name}: {e}")
+        self._fan_out(self.rooms[room_name], encode_message(message_type, data))
     
     async def broadcast_system_status(self, status_data: Dict[str, Any]):
-        """Broadcast system status update"""
-        for connection in self.connections.copy():
-            if SubscriptionType.SYSTEM_STATUS.value in connection.subscriptions:
-                try:
-                    await connection.send_message(MessageType.SYSTEM_STATUS, status_data)
-                except WebSocketDisconnect:
-                    self.disconnect(connection)
-                except Exception as e:
-                    logger.error(f"Error broadcasting system status: {e}")
+        """Broadcast system status update to connections of this worker"""
+        await self.deliver_system_status_event({
+            "message": encode_message(MessageType.SYSTEM_STATUS, status_data)
+        })
+    
+    async def deliver_system_status_event(self, event: Dict[str, Any]):
+        """Deliver a published system status event to local subscribers"""
+        recipients = self.index.subscribers(SubscriptionType.SYSTEM_STATUS.value)
+        if not recipients:
+            return
+        
+        # Only the latest undelivered status matters to a client
+        self._fan_out(recipients, event["message"], coalesce_key=MessageType.SYSTEM_STATUS.value)
     
     async def send_heartbeat(self):
         """Send heartbeat to all connections"""
@@ -374,13 +612,11 @@ class WebSocketManager:
             "active_connections": self.stats['active_connections']
         }
         
-        for connection in self.connections.copy():
-            try:
-                await connection.send_message(MessageType.HEARTBEAT, heartbeat_data)
-            except WebSocketDisconnect:
-                self.disconnect(connection)
-            except Exception as e:
-                logger.error(f"Error sending heartbeat: {e}")
+        self._fan_out(
+            self.connections,
+            encode_message(MessageType.HEARTBEAT, heartbeat_data),
+            coalesce_key=MessageType.HEARTBEAT.value
+        )
     
     async def cleanup_stale_connections(self):
         """Remove stale connections that haven't pinged recently"""
@@ -406,7 +642,8 @@ class WebSocketManager:
         return {
             **self.stats,
             "rooms": {room: len(connections) for room, connections in self.rooms.items()},
-            "subscriptions": self._get_subscription_stats()
+            "subscriptions": self._get_subscription_stats(),
+            "max_outbound_queue_depth": max((c.queue_depth for c in self.connections), default=0)
         }
     
     def _get_subscription_stats(self) -> Dict[str, int]:
@@ -424,6 +661,14 @@ class WebSocketManager:
 websocket_manager = WebSocketManager()
 
 
+def subscribe_event_handlers() -> EventBroker:
+    """Deliver broker events to this worker's connections; returns the broker"""
+    event_broker = get_event_broker()
+    event_broker.subscribe(ALERTS_CHANNEL, websocket_manager.deliver_alert_event)
+    event_broker.subscribe(SYSTEM_STATUS_CHANNEL, websocket_manager.deliver_system_status_event)
+    return event_broker
+
+
 # WebSocket message handler
 async def handle_websocket_message(connection: WebSocketConnection, message_data: Dict[str, Any]):
     """Handle incoming WebSocket message"""
@@ -475,6 +720,12 @@ async def handle_websocket_message(connection: WebSocketConnection, message_data
 # Background tasks
 async def websocket_background_tasks():
     """Background tasks for WebSocket management"""
+    # Every worker delivers broker events to its own connections
+    try:
+        await subscribe_event_handlers().start()
+    except Exception as e:
+        logger.error(f"Failed to start real-time event broker: {e}")
+    
     while True:
         try:
             # Send heartbeat every 30 seconds
@@ -492,17 +743,19 @@ async def websocket_background_tasks():
 
 # Integration with alert system
 async def notify_new_alert(alert: Alert):
-    """Notify WebSocket clients of new alert"""
+    """Notify WebSocket clients of new alert on every worker"""
     try:
-        await websocket_manager.broadcast_alert(alert)
+        await subscribe_event_handlers().publish(ALERTS_CHANNEL, build_alert_event(alert))
     except Exception as e:
         logger.error(f"Failed to notify WebSocket clients of new alert: {e}")
 
 
 async def notify_system_status(status_data: Dict[str, Any]):
-    """Notify WebSocket clients of system status change"""
+    """Notify WebSocket clients of system status change on every worker"""
     try:
-        await websocket_manager.broadcast_system_status(status_data)
+        await subscribe_event_handlers().publish(SYSTEM_STATUS_CHANNEL, {
+            "message": encode_message(MessageType.SYSTEM_STATUS, status_data)
+        })
     except Exception as e:
         logger.error(f"Failed to notify WebSocket clients of system status: {e}")
 
@@ -0,0 +1,17 @@
+"""
+Pytest configuration shared by all test suites
+"""
+
+import sys
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache_manager(monkeypatch):
+    """Each test gets its own global cache manager, so cached feeds and articles don't leak between tests."""
+    # src/ is on sys.path in some tests, so the module can be loaded under either name
+    for name in ('cache_manager', 'src.cache_manager'):
+        module = sys.modules.get(name)
+        if module is not None:
+            monkeypatch.setattr(module, '_cache_manager', None)
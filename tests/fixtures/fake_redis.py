@@ -0,0 +1,75 @@
+"""
+In-memory stand-in for the synchronous redis-py client
+Implements the key/value subset the shared cache uses, with expiry
+"""
+
+import fnmatch
+import threading
+import time
+
+import redis
+
+
+class FakeRedis:
+    """
+    Thread-safe fake of redis.Redis for GET/SET/DELETE/SCAN.
+
+    Set ``fail`` to make every call raise ConnectionError, e.g. to simulate
+    an outage. ``calls`` counts commands by name.
+    """
+
+    def __init__(self):
+        self.data = {}
+        self.fail = False
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def _command(self, name):
+        self.calls[name] = self.calls.get(name, 0) + 1
+        if self.fail:
+            raise redis.ConnectionError("fake redis unavailable")
+
+    def _live(self, key):
+        value, expires_at = self.data.get(key, (None, None))
+        if expires_at is not None and time.time() >= expires_at:
+            del self.data[key]
+            return None
+        return value
+
+    @staticmethod
+    def _key(key):
+        return key.encode() if isinstance(key, str) else key
+
+    def get(self, name):
+        with self._lock:
+            self._command('get')
+            return self._live(self._key(name))
+
+    def set(self, name, value, ex=None, px=None):
+        with self._lock:
+            self._command('set')
+            expires_at = None
+            if px is not None:
+                expires_at = time.time() + px / 1000
+            elif ex is not None:
+                expires_at = time.time() + ex
+            if isinstance(value, str):
+                value = value.encode()
+            self.data[self._key(name)] = (value, expires_at)
+            return True
+
+    def delete(self, *names):
+        with self._lock:
+            self._command('delete')
+            removed = 0
+            for name in names:
+                removed += self.data.pop(self._key(name), None) is not None
+            return removed
+
+    def scan_iter(self, match=None, count=None):
+        with self._lock:
+            self._command('scan')
+            keys = [key for key in self.data if self._live(key) is not None]
+        for key in keys:
+            if match is None or fnmatch.fnmatchcase(key.decode(), match):
+                yield key
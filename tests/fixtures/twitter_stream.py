@@ -0,0 +1,100 @@
+"""
+Local stand-in for the Twitter v2 filtered-stream endpoints
+Serves stream rules and replays a recorded stream file over HTTP
+"""
+
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+RECORDED_STREAM = os.path.join(os.path.dirname(__file__), 'twitter_stream_sample.ndjson')
+
+
+class LocalTwitterAPI:
+    """
+    Minimal filtered-stream server for tests.
+
+    Every stream connection replays the recorded file and then closes.
+    Statuses queued in ``stream_statuses`` are returned (without a body) by
+    the next connections instead, e.g. [429] to simulate rate limiting.
+    """
+
+    def __init__(self, recording: str = RECORDED_STREAM, rules=None):
+        with open(recording, 'rb') as f:
+            self.lines = f.read().splitlines()
+        self.rules = list(rules or [])
+        self.rule_requests = []
+        self.stream_statuses = []
+        self.stream_connections = 0
+        self._next_rule_id = 1
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self._thread = None
+
+    @property
+    def api_base(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/2"
+
+    def add_rule(self, value: str, tag: str = None) -> dict:
+        rule = {'id': str(self._next_rule_id), 'value': value, 'tag': tag}
+        self._next_rule_id += 1
+        self.rules.append(rule)
+        return rule
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler(self):
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send_json(self, payload, status=200):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path.startswith('/2/tweets/search/stream/rules'):
+                    self._send_json({'data': api.rules, 'meta': {'result_count': len(api.rules)}})
+                elif self.path.startswith('/2/tweets/search/stream'):
+                    api.stream_connections += 1
+                    if api.stream_statuses:
+                        self._send_json({'title': 'Error'}, status=api.stream_statuses.pop(0))
+                        return
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Connection', 'close')
+                    self.end_headers()
+                    for line in api.lines:
+                        self.wfile.write(line + b'\r\n')
+                        self.wfile.flush()
+                else:
+                    self._send_json({'title': 'Not Found'}, status=404)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                payload = json.loads(self.rfile.read(length) or b'{}')
+                api.rule_requests.append(payload)
+
+                if 'delete' in payload:
+                    ids = set(payload['delete']['ids'])
+                    api.rules = [rule for rule in api.rules if rule['id'] not in ids]
+                    self._send_json({'meta': {'summary': {'deleted': len(ids)}}})
+                else:
+                    added = [api.add_rule(rule['value'], rule.get('tag')) for rule in payload.get('add', [])]
+                    self._send_json({'data': added, 'meta': {'summary': {'created': len(added)}}})
+
+        return Handler
@@ -0,0 +1,67 @@
+"""
+WebSocket Test Doubles
+Fake WebSocket, alert objects and helpers for real-time fan-out tests
+"""
+
+import asyncio
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+
+class FakeWebSocket:
+    """Minimal WebSocket double recording sent frames"""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+        self.fail = False
+        self._gate = asyncio.Event()
+        self._gate.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        await self._gate.wait()
+        if self.fail:
+            raise ConnectionError("socket closed")
+        self.sent.append(json.loads(text))
+
+    async def close(self, code=1000, reason=None):
+        self.closed = True
+
+    def block(self):
+        """Stall every following send until release()"""
+        self._gate.clear()
+
+    def release(self):
+        self._gate.set()
+
+    def messages(self, message_type):
+        return [message for message in self.sent if message["type"] == message_type]
+
+
+def make_alert(alert_id=1, confidence=0.9, company_id=7, source="news"):
+    return SimpleNamespace(
+        id=alert_id,
+        title=f"Alert {alert_id}",
+        company=SimpleNamespace(name="Caldera") if company_id else None,
+        company_id=company_id,
+        confidence=confidence,
+        urgency_level="high",
+        source=source,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+async def drain():
+    """Let sender tasks run"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def subscribe(manager, websocket, subscription, **filters):
+    connection = await manager.connect(websocket)
+    await manager.handle_subscription(connection, {"type": subscription, "filters": filters})
+    return connection
@@ -39,7 +39,8 @@ class TestCacheHitRate(unittest.TestCase):
         cache_misses = 0
 
         # First pass - all misses
-        with patch('news_scraper_optimized.Article') as mock_article_class:
+        with patch('news_scraper_optimized.Article') as mock_article_class, \
+                patch.object(scraper, '_download_html', return_value="<html></html>"):
             mock_article = Mock()
             # Content must be >100 chars to be cached (see line 222 in news_scraper_optimized.py)
             mock_article.text = "This is article content that is significantly longer than one hundred characters so it will be properly cached by the system"
@@ -77,7 +78,8 @@ class TestCacheHitRate(unittest.TestCase):
 
         urls = [f"https://example.com/article{i%20}" for i in range(100)]  # 20 unique, repeated 5x
 
-        with patch('news_scraper_optimized.Article') as mock_article_class:
+        with patch('news_scraper_optimized.Article') as mock_article_class, \
+                patch.object(scraper, '_download_html', return_value="<html></html>"):
             mock_article = Mock()
             # Content must be >100 chars to be cached
             mock_article.text = "This is article content that is significantly longer than one hundred characters so it will be properly cached by the system"
@@ -126,7 +128,8 @@ class TestCachePerformanceImpact(unittest.TestCase):
         url = "https://example.com/article"
 
         # Uncached access
-        with patch('news_scraper_optimized.Article') as mock_article_class:
+        with patch('news_scraper_optimized.Article') as mock_article_class, \
+                patch.object(scraper, '_download_html', return_value="<html></html>"):
             mock_article = Mock()
             # Content must be >100 chars to be cached
             mock_article.text = "This is article content that is significantly longer than one hundred characters so it will be properly cached by the system"
@@ -163,7 +166,8 @@ class TestCachePerformanceImpact(unittest.TestCase):
 
         urls = [f"https://example.com/article{i%10}" for i in range(50)]  # 10 unique URLs, 5x each
 
-        with patch('news_scraper_optimized.Article') as mock_article_class:
+        with patch('news_scraper_optimized.Article') as mock_article_class, \
+                patch.object(scraper, '_download_html', return_value="<html></html>"):
             mock_article = Mock()
             # Content must be >100 chars to be cached
             mock_article.text = "This is article content that is significantly longer than one hundred characters so it will be properly cached by the system"
@@ -0,0 +1,91 @@
+"""
+Performance Tests for Cold Start
+Measure entry point import times with `python -X importtime` and check that
+heavy dependencies and connections are deferred until first use
+"""
+
+import unittest
+import sys
+import os
+import subprocess
+import tempfile
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+# Cumulative import budget per entry point in milliseconds (about 2.5x the
+# measured time); IMPORT_BUDGET_SCALE stretches them on slow CI runners
+IMPORT_BUDGETS_MS = {
+    'src.news_scraper_optimized': 250,
+    'src.twitter_monitor_optimized': 400,
+    'src.database': 800,
+    'src.main_optimized': 1250,
+    'src.api': 3500,
+}
+BUDGET_SCALE = float(os.getenv('IMPORT_BUDGET_SCALE', 1.0))
+
+# Loaded only once articles are extracted, feeds parsed or tweets searched
+DEFERRED_MODULES = ['nltk', 'newspaper', 'bs4', 'feedparser', 'tweepy']
+
+
+def run_import(module, check=''):
+    """Import module in a fresh interpreter; returns (cumulative import ms, stdout)."""
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    env.setdefault('DATABASE_URL', 'sqlite:///./import_time.db')
+    with tempfile.TemporaryDirectory() as cwd:
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f"import {module}\n{check}"],
+            cwd=cwd, env=env, capture_output=True, text=True, timeout=120
+        )
+    if result.returncode != 0:
+        raise AssertionError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        parts = line.split('|')
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000, result.stdout
+    raise AssertionError(f"No importtime entry for {module}")
+
+
+class TestImportTime(unittest.TestCase):
+    """Test entry point import times stay within budget"""
+
+    def test_entry_points_within_budget(self):
+        """Test each entry point imports within its cold-start budget"""
+        for module, budget_ms in IMPORT_BUDGETS_MS.items():
+            with self.subTest(module=module):
+                elapsed_ms, _ = run_import(module)
+                self.assertLess(elapsed_ms, budget_ms * BUDGET_SCALE,
+                                f"{module} took {elapsed_ms:.0f}ms to import")
+
+    def test_heavy_dependencies_deferred(self):
+        """Test importing the monitor does not load parsing or Twitter libraries"""
+        _, output = run_import(
+            'src.main_optimized',
+            f"import sys; print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+        )
+
+        self.assertEqual(output.strip(), '')
+
+    def test_connections_created_on_first_use(self):
+        """Test importing the database module opens no engine or Redis connection"""
+        _, output = run_import(
+            'src.database',
+            "import src.database as db; print(db._engine is None, db._redis_configured, db._async_configured)"
+        )
+
+        self.assertEqual(output.split(), ['True', 'False', 'False'])
+
+    def test_api_import_opens_no_connections(self):
+        """Test importing the API creates no engine, Redis connection or event broker"""
+        _, output = run_import(
+            'src.api',
+            "import src.database as db, src.event_broker as eb; "
+            "print(db._engine is None, db._redis_configured, db._async_configured, eb._event_broker is None)"
+        )
+
+        self.assertEqual(output.split(), ['True', 'False', 'False', 'True'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -167,7 +167,8 @@ class TestScrapingSpeed(unittest.TestCase):
         url = "https://example.com/article"
 
         # First access - cache miss
-        with patch('news_scraper_optimized.Article') as mock_article_class:
+        with patch('news_scraper_optimized.Article') as mock_article_class, \
+                patch.object(scraper, '_download_html', return_value="<html></html>"):
             mock_article = Mock()
             # Content must be >100 chars to be cached
             mock_article.text = "This is article content that is significantly longer than one hundred characters so it will be properly cached by the system"
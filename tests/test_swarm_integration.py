@@ -9,11 +9,15 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
 import json
+import threading
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from swarm_integration import SwarmCoordinationHooks, get_swarm_hooks, initialize_swarm
+from swarm_integration import (
+    SwarmCoordinationHooks, get_swarm_hooks, initialize_swarm,
+    InProcessMemoryBackend, RedisMemoryBackend, CLIMemoryBackend, SwarmWriteBuffer
+)
 
 
 class TestSwarmIntegrationBackwardCompatibility(unittest.TestCase):
@@ -103,7 +107,7 @@ class TestSwarmCoordinationHooks(unittest.TestCase):
         """Test successful hook execution."""
         mock_run.return_value = Mock(returncode=0, stdout='', stderr='')
 
-        hooks = SwarmCoordinationHooks(enabled=True)
+        hooks = SwarmCoordinationHooks(enabled=True, backend='cli')
         result = hooks._run_hook('test-hook', param1='value1')
 
         self.assertTrue(result)
@@ -114,7 +118,7 @@ class TestSwarmCoordinationHooks(unittest.TestCase):
         """Test hook execution failure handling."""
         mock_run.return_value = Mock(returncode=1, stdout='', stderr='Error')
 
-        hooks = SwarmCoordinationHooks(enabled=True)
+        hooks = SwarmCoordinationHooks(enabled=True, backend='cli')
         result = hooks._run_hook('test-hook', param1='value1')
 
         self.assertFalse(result)
@@ -125,12 +129,217 @@ class TestSwarmCoordinationHooks(unittest.TestCase):
         from subprocess import TimeoutExpired
         mock_run.side_effect = TimeoutExpired('cmd', 30)
 
-        hooks = SwarmCoordinationHooks(enabled=True)
+        hooks = SwarmCoordinationHooks(enabled=True, backend='cli')
         result = hooks._run_hook('test-hook')
 
         self.assertFalse(result)
 
 
+class TestSwarmBackends(unittest.TestCase):
+    """Test pluggable coordination backends."""
+
+    def test_memory_backend_is_default(self):
+        """Test that enabled hooks use the in-process backend by default."""
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop('SWARM_BACKEND', None)
+            hooks = SwarmCoordinationHooks(enabled=True)
+        self.assertIsInstance(hooks.backend, InProcessMemoryBackend)
+
+    @patch('subprocess.run')
+    def test_memory_backend_round_trip(self, mock_run):
+        """Test memory, dedup and rate limit hooks without any subprocess."""
+        hooks = SwarmCoordinationHooks(enabled=True, backend='memory')
+
+        hooks.memory_store('results', {'alerts': 3}, ttl=60, shared=True)
+        hooks.coordinate_rate_limit('twitter/search', {'remaining': 42})
+        hooks.coordinate_deduplication('abc123', {'url': 'test.com'})
+        task_id = hooks.pre_task("test task")
+        hooks.post_task(task_id, status='completed')
+        hooks.notify("done")
+
+        self.assertEqual(hooks.memory_retrieve('results', shared=True), {'alerts': 3})
+        self.assertEqual(hooks.get_rate_limit_state('twitter/search'), {'remaining': 42})
+        self.assertTrue(hooks.check_duplicate('abc123'))
+        self.assertFalse(hooks.check_duplicate('unseen'))
+        self.assertEqual([event[0] for event in hooks.backend.events], ['pre-task', 'post-task', 'notify'])
+        mock_run.assert_not_called()
+
+    def test_memory_backend_expires_entries(self):
+        """Test that expired memory entries are not returned."""
+        backend = InProcessMemoryBackend()
+        backend.store('key', 'value', ttl=0)
+        self.assertIsNone(backend.retrieve('key'))
+        self.assertEqual(len(backend), 0)
+
+    def test_memory_backend_sweeps_expired_entries(self):
+        """Test that expired entries are swept on later stores."""
+        backend = InProcessMemoryBackend()
+        backend.SWEEP_INTERVAL = 2
+        backend.store('old', 'value', ttl=0)
+        backend.store('new', 'value', ttl=60)
+        self.assertEqual(len(backend), 1)
+
+    def test_redis_backend_uses_pipeline(self):
+        """Test that Redis hooks are written in one pipeline round trip."""
+        client = MagicMock()
+        pipe = client.pipeline.return_value
+        backend = RedisMemoryBackend(client, 'test-session')
+        hooks = SwarmCoordinationHooks(enabled=True, backend=backend, write_behind=False)
+
+        hooks.memory_store('key', {'a': 1}, ttl=30, shared=True)
+        client.set.assert_called_once_with('swarm/shared/key', '{"a": 1}', ex=30)
+
+        client.exists.return_value = 1
+        self.assertTrue(hooks.check_duplicate('abc123'))
+        client.exists.assert_called_once_with('swarm/shared/dedup/abc123')
+
+        hooks.pre_task("test task", task_id='task-1')
+        pipe.hset.assert_called_once()
+        self.assertEqual(pipe.hset.call_args[0][0], 'swarm/sessions/test-session/tasks/task-1')
+        pipe.execute.assert_called_once()
+
+    def test_redis_unavailable_falls_back_to_memory(self):
+        """Test that an unreachable Redis falls back to in-process memory."""
+        # Patched rather than pointed at a closed port: other suites may replace
+        # the redis module with a mock whose connections always succeed
+        unreachable = Mock()
+        unreachable.from_url.return_value.ping.side_effect = ConnectionError("Connection refused")
+        with patch.dict(os.environ, {'SWARM_REDIS_URL': 'redis://127.0.0.1:1/0'}), \
+                patch('swarm_integration.redis', unreachable):
+            hooks = SwarmCoordinationHooks(enabled=True, backend='redis')
+        self.assertIsInstance(hooks.backend, InProcessMemoryBackend)
+        unreachable.from_url.assert_called_once_with('redis://127.0.0.1:1/0', decode_responses=True)
+
+    @patch('subprocess.run')
+    def test_cli_backend_retrieve_parses_json(self, mock_run):
+        """Test that the CLI backend keeps the claude-flow memory format."""
+        mock_run.return_value = Mock(returncode=0, stdout='{"remaining": 5}\n', stderr='')
+
+        hooks = SwarmCoordinationHooks(enabled=True, backend='cli')
+
+        self.assertIsInstance(hooks.backend, CLIMemoryBackend)
+        self.assertEqual(hooks.get_rate_limit_state('twitter'), {'remaining': 5})
+        self.assertIn('memory-retrieve --key swarm/shared/rate_limits/twitter', mock_run.call_args[0][0])
+
+
+class RecordingBackend(InProcessMemoryBackend):
+    """In-process backend that records batch calls."""
+
+    name = "recording"
+
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def store_many(self, items):
+        self.batches.append(dict(items))
+        return super().store_many(items)
+
+
+class TestSwarmWriteBehind(unittest.TestCase):
+    """Test write-behind batching of coordination traffic."""
+
+    def setUp(self):
+        self.backend = RecordingBackend()
+        self.hooks = SwarmCoordinationHooks(enabled=True, backend=self.backend, write_behind=True)
+        self.hooks.write_buffer.flush_interval = 60  # flush only when asked
+
+    def tearDown(self):
+        self.hooks.write_buffer.close()
+
+    def test_rate_limit_updates_coalesce(self):
+        """Test that only the latest rate-limit state per service is written."""
+        for remaining in (300, 299, 298):
+            self.hooks.coordinate_rate_limit('twitter/search', {'remaining': remaining})
+
+        self.assertEqual(self.hooks.flush(), 1)
+        self.assertEqual(len(self.backend.batches), 1)
+        self.assertEqual(self.hooks.write_buffer.stats['coalesced'], 2)
+        self.assertEqual(
+            json.loads(self.backend.retrieve('swarm/shared/rate_limits/twitter/search')),
+            {'remaining': 298}
+        )
+
+    def test_reads_see_unflushed_writes(self):
+        """Test that buffered writes are visible before they are flushed."""
+        self.hooks.coordinate_deduplication('abc123', {'url': 'test.com'})
+        self.hooks.coordinate_rate_limit('twitter/search', {'remaining': 7})
+
+        self.assertEqual(len(self.backend), 0)
+        self.assertTrue(self.hooks.check_duplicate('abc123'))
+        self.assertEqual(self.hooks.get_rate_limit_state('twitter/search'), {'remaining': 7})
+
+    def test_notifications_are_deferred(self):
+        """Test that notify is queued rather than sent immediately."""
+        self.hooks.notify("phase done")
+        self.assertEqual(len(self.backend.events), 0)
+
+        self.hooks.flush()
+        self.assertEqual([event[0] for event in self.backend.events], ['notify'])
+
+    def test_post_task_flushes_synchronously(self):
+        """Test that post_task writes pending entries before the post-task hook."""
+        task_id = self.hooks.pre_task("cycle")
+        self.hooks.memory_store('results', {'alerts': 1}, shared=True)
+        self.hooks.notify("halfway")
+
+        self.hooks.post_task(task_id)
+
+        self.assertEqual(self.hooks.write_buffer.pending_count(), 0)
+        self.assertIsNotNone(self.backend.retrieve('swarm/shared/results'))
+        self.assertEqual([event[0] for event in self.backend.events], ['pre-task', 'notify', 'post-task'])
+
+    def test_session_end_flushes(self):
+        """Test that session_end flushes and stops the background thread."""
+        self.hooks.memory_store('results', {'alerts': 2}, shared=True)
+
+        self.hooks.session_end()
+
+        self.assertIsNotNone(self.backend.retrieve('swarm/shared/results'))
+        self.assertEqual(self.backend.events[-1][0], 'session-end')
+
+    def test_background_flush_on_max_entries(self):
+        """Test that reaching max_entries wakes the background flusher."""
+        buffer = SwarmWriteBuffer(self.backend, flush_interval=60, max_entries=3)
+        flushed = threading.Event()
+        original_flush = buffer.flush
+
+        def flush():
+            count = original_flush()
+            if count:
+                flushed.set()
+            return count
+
+        buffer.flush = flush
+        for i in range(3):
+            buffer.store(f'key{i}', 'value', 60)
+
+        self.assertTrue(flushed.wait(timeout=5))
+        self.assertEqual(len(self.backend), 3)
+        buffer.close()
+
+    def test_memory_backend_defaults_to_direct_writes(self):
+        """Test that write-behind is off by default for the in-process backend."""
+        hooks = SwarmCoordinationHooks(enabled=True, backend='memory')
+        self.assertIsNone(hooks.write_buffer)
+
+    def test_redis_batches_use_one_pipeline(self):
+        """Test that a Redis flush writes all entries in a single pipeline."""
+        client = MagicMock()
+        pipe = client.pipeline.return_value
+        buffer = SwarmWriteBuffer(RedisMemoryBackend(client, 'test-session'), flush_interval=60)
+
+        buffer.store('a', '1', 60)
+        buffer.store('b', '2', 60)
+        buffer.hook('notify', {'message': 'done', 'level': 'info'})
+        buffer.flush()
+
+        self.assertEqual(pipe.set.call_count, 2)
+        pipe.rpush.assert_called_once()
+        client.set.assert_not_called()
+        buffer.close()
+
+
 class TestMainMonitorIntegration(unittest.TestCase):
     """Test swarm integration in main monitor."""
 
@@ -270,6 +479,8 @@ def run_tests():
     # Add test classes
     suite.addTests(loader.loadTestsFromTestCase(TestSwarmIntegrationBackwardCompatibility))
     suite.addTests(loader.loadTestsFromTestCase(TestSwarmCoordinationHooks))
+    suite.addTests(loader.loadTestsFromTestCase(TestSwarmBackends))
+    suite.addTests(loader.loadTestsFromTestCase(TestSwarmWriteBehind))
     suite.addTests(loader.loadTestsFromTestCase(TestMainMonitorIntegration))
     suite.addTests(loader.loadTestsFromTestCase(TestConfigurationValidation))
     suite.addTests(loader.loadTestsFromTestCase(TestEnvironmentTemplate))
@@ -4,6 +4,8 @@ Tests all endpoints with mocking, authentication, validation, and error handling
 Coverage target: >80% of api.py (264 statements)
 """
 
+import io
+import itertools
 import pytest
 import json
 import asyncio
@@ -12,17 +14,17 @@ from typing import Generator
 from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from starlette.testclient import TestClient
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 # Import the FastAPI app and dependencies
 from src.api import app, manager, ConnectionManager
 from src.models import User, Company, Alert, Feed, APIKey, MonitoringSession, SystemMetrics
 from src.schemas import (
-    UserCreate, CompanyCreate, AlertCreate, APIKeyCreate,
+    UserCreate, CompanyCreate, AlertCreate, AlertResponse, APIKeyCreate,
     Priority, UrgencyLevel, SourceType, AlertStatus
 )
-from src.database import DatabaseManager, CacheManager, Base
+from src.database import DatabaseManager, CacheManager, Base, ThreadedSession
 from src.auth import AuthManager, create_user, authenticate_user
 
 
@@ -59,16 +61,26 @@ def override_get_db(db_session: Session):
         finally:
             pass
 
+    async def _override_get_async_db():
+        yield ThreadedSession(db_session)
+
     app.dependency_overrides[DatabaseManager.get_db] = _override_get_db
+    app.dependency_overrides[DatabaseManager.get_async_db] = _override_get_async_db
     yield
     app.dependency_overrides.clear()
 
 
+_client_addresses = itertools.cycle(range(1, 255))
+
+
 @pytest.fixture
 def client(override_get_db):
     """Create a test client"""
-    # Use TestClient from starlette directly
-    return TestClient(app)
+    # Use TestClient from starlette directly; its default "testserver" host is
+    # not in ALLOWED_HOSTS, so requests go to localhost. A client address per
+    # test keeps the per-IP rate limit middleware from carrying across tests.
+    return TestClient(app, base_url="http://localhost",
+                      headers={"X-Forwarded-For": f"10.0.0.{next(_client_addresses)}"})
 
 
 @pytest.fixture
@@ -604,6 +616,17 @@ class TestAlerts:
             assert len(data) >= 1
             assert data[0]["title"] == "Test TGE Alert"
 
+    def test_list_alerts_matches_response_model(self, client: TestClient, test_alert: Alert, mock_cache):
+        """Test the projected payload is what AlertResponse would serialize, and is documented as such"""
+        with patch('src.api.check_rate_limit'):
+            response = client.get("/alerts")
+
+        assert response.status_code == 200
+        assert response.json() == [AlertResponse.model_validate(test_alert).model_dump(mode="json")]
+
+        schema = app.openapi()["paths"]["/alerts"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        assert schema["items"]["$ref"].endswith("/AlertResponse")
+
     def test_list_alerts_with_company_filter(self, client: TestClient, test_alert: Alert, test_company: Company, mock_cache):
         """Test filtering alerts by company"""
         with patch('src.api.check_rate_limit'):
@@ -785,6 +808,193 @@ class TestAlerts:
         assert len(data["errors"]) == 2
 
 
+class TestBulkAlertUpdate:
+    """Tests for the set-based PUT /alerts/bulk path"""
+
+    @pytest.fixture
+    def alerts(self, db_session: Session, test_company: Company, test_user: User):
+        alerts = [
+            Alert(title=f"Bulk Alert {i}", content="Content", source=SourceType.NEWS,
+                  confidence=0.8, company_id=test_company.id, user_id=test_user.id,
+                  urgency_level=UrgencyLevel.MEDIUM)
+            for i in range(3)
+        ]
+        db_session.add_all(alerts)
+        db_session.commit()
+        return alerts
+
+    @pytest.fixture
+    def statements(self):
+        """SQL statements sent to the test database during the test"""
+        executed = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            executed.append(statement)
+
+        event.listen(test_engine, "before_cursor_execute", record)
+        yield executed
+        event.remove(test_engine, "before_cursor_execute", record)
+
+    def bulk_update(self, client, auth_token, alert_ids, **values):
+        response = client.put(
+            "/alerts/bulk",
+            json={"alert_ids": alert_ids, **values},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    def current(self, db_session, alerts):
+        db_session.expire_all()
+        return [(alert.status, alert.urgency_level) for alert in alerts]
+
+    def test_single_update_statement(self, client: TestClient, auth_token: str, db_session: Session,
+                                     alerts, statements, mock_cache):
+        """Test every matching alert is changed by one UPDATE ... RETURNING"""
+        data = self.bulk_update(client, auth_token, [alert.id for alert in alerts],
+                                status="archived", urgency_level="low")
+
+        updates = [sql for sql in statements if sql.lstrip().upper().startswith("UPDATE ALERTS")]
+        assert data["success_count"] == 3
+        assert len(updates) == 1
+        assert "RETURNING" in updates[0].upper()
+        assert self.current(db_session, alerts) == [("archived", "low")] * 3
+
+    def test_missing_ids_reported(self, client: TestClient, auth_token: str, db_session: Session,
+                                  alerts, mock_cache):
+        """Test ids without an alert are listed as errors and the rest are updated"""
+        data = self.bulk_update(client, auth_token, [9999, alerts[0].id, 9998, alerts[0].id],
+                                status="false_positive")
+
+        assert data["success_count"] == 1
+        assert data["errors"] == [
+            {"alert_id": 9999, "error": "Alert not found"},
+            {"alert_id": 9998, "error": "Alert not found"},
+        ]
+        assert self.current(db_session, alerts) == [
+            ("false_positive", "medium"), ("active", "medium"), ("active", "medium")
+        ]
+
+    def test_fallback_without_returning(self, client: TestClient, auth_token: str, db_session: Session,
+                                        alerts, statements, mock_cache):
+        """Test dialects without UPDATE ... RETURNING select the ids, then update once"""
+        with patch.object(test_engine.dialect, 'update_returning', False):
+            data = self.bulk_update(client, auth_token, [alerts[0].id, alerts[2].id, 9999],
+                                    status="archived")
+
+        updates = [sql for sql in statements if sql.lstrip().upper().startswith("UPDATE ALERTS")]
+        assert data["success_count"] == 2
+        assert data["errors"] == [{"alert_id": 9999, "error": "Alert not found"}]
+        assert len(updates) == 1
+        assert "RETURNING" not in updates[0].upper()
+        assert self.current(db_session, alerts) == [
+            ("archived", "medium"), ("active", "medium"), ("archived", "medium")
+        ]
+
+
+class TestAlertExport:
+    """Tests for the streaming /alerts/export endpoint"""
+
+    @pytest.fixture
+    def export_alerts(self, db_session: Session, test_company: Company, test_user: User):
+        """Alerts with mixed sources and confidence; the export reads them in its own session"""
+        alerts = []
+        for i, (source, confidence) in enumerate([
+            (SourceType.NEWS, 0.9), (SourceType.TWITTER, 0.4),
+            (SourceType.TWITTER, 0.8), (SourceType.NEWS, 0.7),
+        ]):
+            alert = Alert(
+                title=f"Export Alert {i}",
+                content="TestCorp token launch",
+                source=source,
+                confidence=confidence,
+                company_id=test_company.id,
+                user_id=test_user.id,
+                keywords_matched=["TGE"],
+                urgency_level=UrgencyLevel.MEDIUM
+            )
+            db_session.add(alert)
+            alerts.append(alert)
+        db_session.commit()
+
+        with patch('src.api.SessionLocal', TestingSessionLocal), patch('src.api.check_rate_limit'):
+            yield alerts
+
+    @staticmethod
+    def ndjson(response):
+        return [json.loads(line) for line in response.text.splitlines()]
+
+    def test_export_ndjson_ordered_by_id(self, client: TestClient, export_alerts, mock_cache):
+        """Test the default export streams every alert as NDJSON in id order"""
+        response = client.get("/alerts/export", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert "alerts-export.ndjson" in response.headers["content-disposition"]
+        assert "content-encoding" not in response.headers
+        rows = self.ndjson(response)
+        assert [row["id"] for row in rows] == sorted(alert.id for alert in export_alerts)
+        assert rows[0]["company"]["name"] == "TestCorp"
+
+    def test_export_filters_and_cursor(self, client: TestClient, export_alerts, mock_cache):
+        """Test filters, the resume cursor and the row limit narrow the export"""
+        ids = [alert.id for alert in export_alerts]
+
+        twitter = self.ndjson(client.get("/alerts/export", params={"source": "twitter"}))
+        confident = self.ndjson(client.get("/alerts/export", params={"min_confidence": 0.75}))
+        resumed = self.ndjson(client.get("/alerts/export", params={"cursor": ids[1], "limit": 1}))
+
+        assert [row["id"] for row in twitter] == [ids[1], ids[2]]
+        assert [row["id"] for row in confident] == [ids[0], ids[2]]
+        assert [row["id"] for row in resumed] == [ids[2]]
+
+    def test_export_csv(self, client: TestClient, export_alerts, mock_cache):
+        """Test format=csv returns a header row and one flat row per alert"""
+        response = client.get("/alerts/export", params={"format": "csv"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/csv")
+        lines = response.text.splitlines()
+        assert lines[0].split(",")[:2] == ["id", "title"]
+        assert lines[0].endswith("company_name")
+        assert len(lines) == len(export_alerts) + 1
+        assert lines[1].endswith("TestCorp")
+
+    def test_export_gzip(self, client: TestClient, export_alerts, mock_cache):
+        """Test clients accepting gzip get a compressed stream"""
+        response = client.get("/alerts/export", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert len(self.ndjson(response)) == len(export_alerts)
+
+    def test_export_parquet(self, client: TestClient, export_alerts, mock_cache):
+        """Test format=parquet returns a readable Parquet file that is not gzipped again"""
+        pq = pytest.importorskip("pyarrow.parquet")
+
+        response = client.get("/alerts/export", params={"format": "parquet"},
+                              headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        table = pq.read_table(io.BytesIO(response.content))
+        assert table.column("id").to_pylist() == [alert.id for alert in export_alerts]
+
+    def test_export_parquet_without_pyarrow(self, client: TestClient, export_alerts, mock_cache):
+        """Test format=parquet is refused when pyarrow is not installed"""
+        with patch('src.api.PARQUET_AVAILABLE', False):
+            response = client.get("/alerts/export", params={"format": "parquet"})
+
+        assert response.status_code == 501
+        assert "pyarrow" in response.json()["detail"]
+
+    def test_export_invalid_format(self, client: TestClient, export_alerts, mock_cache):
+        """Test unknown formats are rejected by validation"""
+        response = client.get("/alerts/export", params={"format": "xml"})
+
+        assert response.status_code == 422
+
+
 # ============================================================================
 # Statistics Tests
 # ============================================================================
@@ -29,6 +29,10 @@ from src.auth import (
     RateLimiter,
     check_rate_limit,
     create_admin_user_if_not_exists,
+    invalidate_api_key,
+    invalidate_user,
+    PrincipalCache,
+    APIKeyUsageTracker,
     SECRET_KEY,
     ALGORITHM,
     ACCESS_TOKEN_EXPIRE_MINUTES
@@ -37,6 +41,16 @@ from src.models import User, APIKey
 from src.schemas import TokenData
 
 
+@pytest.fixture(autouse=True)
+def reset_principal_cache(monkeypatch):
+    """Isolate tests from principals and usage cached by earlier tests"""
+    import src.auth
+    src.auth.principal_cache.clear()
+    monkeypatch.setattr(src.auth, "api_key_usage", APIKeyUsageTracker())
+    yield
+    src.auth.principal_cache.clear()
+
+
 class TestAuthManager:
     """Test suite for AuthManager class"""
 
@@ -501,8 +515,7 @@ class TestAPIKeyManagement:
         result = verify_api_key(mock_db, api_key)
 
         assert result == mock_user
-        assert mock_api_key.last_used is not None
-        assert mock_api_key.usage_count == 1
+        # First use is flushed immediately; later uses are batched
         mock_db.commit.assert_called_once()
 
     def test_verify_api_key_not_found(self):
@@ -564,6 +577,121 @@ class TestAPIKeyManagement:
         assert result is None
 
 
+class TestPrincipalCache:
+    """Test suite for cached principal resolution and batched usage"""
+
+    def _mock_db_for_key(self, api_key):
+        mock_db = Mock(spec=Session)
+
+        mock_api_key = Mock(spec=APIKey)
+        mock_api_key.id = 7
+        mock_api_key.key_hash = AuthManager.hash_api_key(api_key)
+        mock_api_key.is_active = True
+        mock_api_key.expires_at = None
+        mock_api_key.user_id = 123
+
+        user = User(id=123, username="cached", email="cached@example.com",
+                    hashed_password="x", is_active=True, is_admin=False)
+
+        def query_side_effect(model):
+            mock_query = Mock()
+            if model == APIKey:
+                mock_query.filter.return_value.first.return_value = mock_api_key
+            elif model == User:
+                mock_query.filter.return_value.first.return_value = user
+            return mock_query
+
+        mock_db.query.side_effect = query_side_effect
+        mock_db.merge.side_effect = lambda obj, load=True: obj
+        return mock_db
+
+    def test_verify_api_key_cache_hit_skips_queries(self):
+        """Test that a cached API key principal skips both lookups"""
+        api_key = "cached_api_key"
+        mock_db = self._mock_db_for_key(api_key)
+
+        first = verify_api_key(mock_db, api_key)
+        queries_after_first = mock_db.query.call_count
+
+        second_db = Mock(spec=Session)
+        second_db.merge.side_effect = lambda obj, load=True: obj
+        second = verify_api_key(second_db, api_key)
+
+        assert first.id == second.id == 123
+        assert second.username == "cached"
+        assert queries_after_first >= 2
+        second_db.query.assert_not_called()
+        second_db.commit.assert_not_called()
+        second_db.merge.assert_called_once()
+
+    def test_invalidate_api_key_forces_lookup(self):
+        """Test that revoking an API key drops its cached principal"""
+        api_key = "revoked_api_key"
+        mock_db = self._mock_db_for_key(api_key)
+        verify_api_key(mock_db, api_key)
+
+        invalidate_api_key(AuthManager.hash_api_key(api_key), 7)
+
+        revoked_db = Mock(spec=Session)
+        revoked_db.query.return_value.filter.return_value.first.return_value = None
+        assert verify_api_key(revoked_db, api_key) is None
+        revoked_db.query.assert_called()
+
+    def test_invalidate_user_drops_token_principal(self):
+        """Test that user invalidation drops token-resolved principals"""
+        mock_db = Mock(spec=Session)
+        user = User(id=55, username="tokenuser", email="t@example.com",
+                    hashed_password="x", is_active=True, is_admin=False)
+        mock_db.query.return_value.filter.return_value.first.return_value = user
+        mock_db.merge.side_effect = lambda obj, load=True: obj
+
+        credentials = Mock()
+        credentials.credentials = AuthManager.create_access_token({"sub": "tokenuser", "user_id": 55})
+
+        get_current_user_from_token(credentials, mock_db)
+        get_current_user_from_token(credentials, mock_db)
+        assert mock_db.query.call_count == 1
+
+        invalidate_user(55)
+        get_current_user_from_token(credentials, mock_db)
+        assert mock_db.query.call_count == 2
+
+    def test_principal_cache_expires_entries(self):
+        """Test that principal cache entries expire after the TTL"""
+        cache = PrincipalCache(ttl=30)
+        cache.set("token:1", {"user": {"id": 1}})
+
+        with patch('src.auth.time.monotonic', return_value=10 ** 9):
+            assert cache.get("token:1") is None
+
+    def test_usage_tracker_batches_counts(self):
+        """Test that usage is accumulated and written in a single flush"""
+        tracker = APIKeyUsageTracker(flush_interval=60)
+        tracker.record(1)
+        tracker.record(1)
+        tracker.record(2)
+
+        mock_db = Mock(spec=Session)
+        flushed = tracker.flush(mock_db)
+
+        assert flushed == 2
+        assert mock_db.query.return_value.filter.return_value.update.call_count == 2
+        mock_db.commit.assert_called_once()
+        assert not tracker.is_due()
+
+    def test_usage_tracker_requeues_on_failure(self):
+        """Test that failed flushes keep pending counts for the next attempt"""
+        tracker = APIKeyUsageTracker(flush_interval=0)
+        tracker.record(1)
+
+        mock_db = Mock(spec=Session)
+        mock_db.commit.side_effect = Exception("database unavailable")
+
+        assert tracker.flush(mock_db) == 0
+        mock_db.rollback.assert_called_once()
+        assert tracker.is_due()
+
+
 class TestAuthDependencies:
     """Test suite for FastAPI authentication dependencies"""
 
@@ -9,6 +9,8 @@ import sys
 import os
 import json
 import hashlib
+import threading
+import time
 from datetime import datetime, timezone, timedelta
 
 # Add src to path
@@ -16,6 +18,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from news_scraper_optimized import OptimizedNewsScraper
 from twitter_monitor_optimized import OptimizedTwitterMonitor
+from cache_manager import IntelligentCacheManager, RedisCacheBackend, decode_payload
+from tests.fixtures.fake_redis import FakeRedis
 
 
 class TestNewsCacheManager(unittest.TestCase):
@@ -64,7 +68,8 @@ class TestNewsCacheManager(unittest.TestCase):
         """Test cache miss fetches new content"""
         url = "https://example.com/new-article"
 
-        with patch('news_scraper_optimized.Article') as mock_article_class:
+        with patch('news_scraper_optimized.Article') as mock_article_class, \
+                patch.object(self.scraper, '_download_html', return_value="<html></html>"):
             mock_article = Mock()
             # Content needs to be >30 chars per line AND >100 total to cache
             long_content = "This is new article content that is significantly longer than thirty characters per line and also exceeds one hundred characters total"
@@ -251,7 +256,8 @@ class TestCachePerformance(unittest.TestCase):
         urls = [f"https://example.com/article{i}" for i in range(10)]
 
         # First pass - all misses
-        with patch('news_scraper_optimized.Article') as mock_article_class:
+        with patch('news_scraper_optimized.Article') as mock_article_class, \
+                patch.object(self.scraper, '_download_html', return_value="<html></html>"):
             mock_article = Mock()
             # Content needs to be >30 chars per line AND >100 total to cache
             mock_article.text = "This is article content that is significantly longer than thirty characters per line and exceeds one hundred characters total to ensure caching works properly"
@@ -278,7 +284,8 @@ class TestCachePerformance(unittest.TestCase):
         """Test cache reduces API calls"""
         url = "https://example.com/article"
 
-        with patch('news_scraper_optimized.Article') as mock_article_class:
+        with patch('news_scraper_optimized.Article') as mock_article_class, \
+                patch.object(self.scraper, '_download_html', return_value="<html></html>") as mock_download:
             mock_article = Mock()
             # Content needs to be >30 chars per line to pass cleaning filter and >100 total to cache
             mock_article.text = "This is content that is longer than thirty characters per line and more than one hundred characters total to ensure caching"
@@ -295,6 +302,7 @@ class TestCachePerformance(unittest.TestCase):
             # Should only call once
             self.assertEqual(first_call_count, 1)
             self.assertEqual(second_call_count, 1)
+            self.assertEqual(mock_download.call_count, 1)
 
 
 class TestStateManagement(unittest.TestCase):
@@ -428,5 +436,307 @@ class TestCacheStrategies(unittest.TestCase):
         self.assertEqual(key1, key2)
 
 
+class TestIntelligentCacheManager(unittest.TestCase):
+    """Test size accounting, LRU eviction and tier budgets"""
+
+    KB = 1024
+
+    def make_cache(self, **kwargs):
+        kwargs.setdefault('tier_budgets', {'rss': 1.0, 'article_content': 1.0})
+        kwargs.setdefault('stripes', 1)
+        with patch('os.path.exists', return_value=False):
+            return IntelligentCacheManager(max_memory_mb=1, **kwargs)
+
+    def test_size_measured_once_per_insert(self):
+        """Test overwrites and evictions reuse the size recorded at insertion"""
+        cache = self.make_cache()
+        value = 'x' * 300 * self.KB
+
+        with patch.object(cache, '_estimate_size', wraps=cache._estimate_size) as estimate:
+            for i in range(6):
+                cache.set('rss', f'key_{i}', value)
+            cache.set('rss', 'key_5', value)
+
+        self.assertEqual(estimate.call_count, 7)
+        self.assertGreater(cache.get_stats()['total_evictions'], 0)
+
+    def test_least_recently_used_entry_evicted(self):
+        """Test eviction removes the entry accessed longest ago"""
+        cache = self.make_cache()
+
+        cache.set('rss', 'a', 'a', size=400 * self.KB)
+        cache.set('rss', 'b', 'b', size=400 * self.KB)
+        cache.get('rss', 'a')
+        cache.set('rss', 'c', 'c', size=400 * self.KB)
+
+        self.assertEqual(cache.get('rss', 'a'), 'a')
+        self.assertIsNone(cache.get('rss', 'b'))
+        self.assertEqual(cache.get('rss', 'c'), 'c')
+        self.assertEqual(cache.tiers['rss'].size_bytes, 800 * self.KB)
+
+    def test_tier_budgets_are_independent(self):
+        """Test filling one tier does not evict another"""
+        cache = self.make_cache()
+        cache.set('article_content', 'article', 'body', size=500 * self.KB)
+
+        for i in range(10):
+            cache.set('rss', f'feed_{i}', 'feed', size=300 * self.KB)
+
+        self.assertEqual(cache.get('article_content', 'article'), 'body')
+        self.assertLessEqual(cache.tiers['rss'].size_bytes, cache.tiers['rss'].max_bytes)
+
+    def test_oversized_entry_not_cached(self):
+        """Test values larger than the stripe budget are rejected"""
+        cache = self.make_cache()
+
+        self.assertFalse(cache.set('rss', 'huge', 'x', size=2 * 1024 * self.KB))
+        self.assertIsNone(cache.get('rss', 'huge'))
+
+    def test_oversized_overwrite_drops_old_value(self):
+        """Test replacing a key with a value too large to cache removes the old value"""
+        cache = self.make_cache()
+        cache.set('rss', 'k', 'old')
+
+        self.assertFalse(cache.set('rss', 'k', 'new', size=2 * 1024 * self.KB))
+        self.assertIsNone(cache.get('rss', 'k'))
+        self.assertEqual(cache.tiers['rss'].size_bytes, 0)
+
+    def test_concurrent_access_keeps_accounting(self):
+        """Test byte accounting stays exact under concurrent writers"""
+        cache = self.make_cache(stripes=4)
+
+        def worker(n):
+            for i in range(200):
+                cache.set('rss', f'key_{n}_{i % 50}', 'v' * (i % 7 + 1) * self.KB)
+                cache.get('rss', f'key_{n}_{(i * 3) % 50}')
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for stripe in cache.tiers['rss'].stripes:
+            self.assertEqual(stripe.size_bytes, sum(entry.size for entry in stripe.entries.values()))
+            self.assertLessEqual(stripe.size_bytes, stripe.max_bytes)
+
+
+class TestSharedCache(unittest.TestCase):
+    """Test the Redis L2 tier, single-flight fetches and negative caching"""
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        self.backend = RedisCacheBackend(self.redis)
+
+    def make_cache(self):
+        with patch('os.path.exists', return_value=False):
+            return IntelligentCacheManager(max_memory_mb=1, l2=self.backend)
+
+    def test_value_shared_between_processes(self):
+        """Test a value set by one manager is served to another from L2, then L1"""
+        writer, reader = self.make_cache(), self.make_cache()
+        writer.set('twitter_user', 'twitter_user_caldera', '123456')
+
+        self.assertEqual(reader.get('twitter_user', 'twitter_user_caldera'), '123456')
+        redis_gets = self.redis.calls['get']
+        self.assertEqual(reader.get('twitter_user', 'twitter_user_caldera'), '123456')
+
+        self.assertEqual(self.redis.calls['get'], redis_gets)
+        self.assertEqual(reader.get_stats()['l2_hits'], 1)
+
+    def test_large_values_compressed(self):
+        """Test big values are stored compressed and decode unchanged"""
+        feed = {'entries': [{'title': f'Entry {i}', 'summary': 'TGE announcement ' * 20} for i in range(50)]}
+        self.make_cache().set('rss', 'https://example.com/feed', feed)
+
+        (payload, _), = self.redis.data.values()
+        value, expires_at = decode_payload(payload)
+
+        self.assertLess(len(payload), len(json.dumps(feed)) // 4)
+        self.assertEqual(value, feed)
+        self.assertGreater(expires_at, time.time())
+
+    def test_concurrent_misses_fetch_once(self):
+        """Test ten threads missing on one key trigger a single fetch"""
+        cache = self.make_cache()
+        calls = []
+        start = threading.Barrier(10)
+        results = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {'title': 'Caldera TGE'}
+
+        def worker():
+            start.wait()
+            results.append(cache.get_or_fetch('article_content', 'https://example.com/a', fetch))
+
+        threads = [threading.Thread(target=worker) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual([value for value, _ in results], [{'title': 'Caldera TGE'}] * 10)
+        self.assertEqual(cache.get_stats()['coalesced'], 9)
+
+    def test_failed_fetch_cached_negatively(self):
+        """Test a failing URL is not refetched by this or other processes"""
+        cache, other = self.make_cache(), self.make_cache()
+        fetch = Mock(side_effect=IOError("404"))
+
+        self.assertEqual(cache.get_or_fetch('rss', 'https://dead.example.com/feed', fetch), (None, False))
+        self.assertEqual(cache.get_or_fetch('rss', 'https://dead.example.com/feed', fetch), (None, True))
+        self.assertEqual(other.get_or_fetch('rss', 'https://dead.example.com/feed', fetch), (None, True))
+
+        self.assertEqual(fetch.call_count, 1)
+        self.assertIsNone(cache.get('rss', 'https://dead.example.com/feed'))
+
+    def test_redis_outage_falls_back_to_l1(self):
+        """Test Redis errors are absorbed and L2 is bypassed for a while"""
+        cache = self.make_cache()
+        self.redis.fail = True
+
+        self.assertTrue(cache.set('rss', 'feed', {'entries': []}))
+        self.assertEqual(cache.get('rss', 'feed'), {'entries': []})
+        self.assertIsNone(cache.get('rss', 'other-feed'))
+
+        self.assertEqual(sum(self.redis.calls.values()), 1)
+
+    def test_unserializable_value_stays_local(self):
+        """Test values that cannot be encoded are kept in L1 only"""
+        cache = self.make_cache()
+        value = {'published': datetime(2025, 1, 1, tzinfo=timezone.utc)}
+
+        cache.set('rss', 'feed', value)
+
+        self.assertEqual(cache.get('rss', 'feed'), value)
+        self.assertEqual(self.redis.data, {})
+
+    def test_parsed_feed_not_shared_as_plain_dict(self):
+        """Test feedparser results keep attribute access instead of reading back from L2 as dicts"""
+        import feedparser
+        feed = feedparser.parse(
+            "<rss version='2.0'><channel><title>News</title><item><title>Caldera TGE</title>"
+            "<link>https://example.com/a</link><pubDate>Mon, 01 Jan 2024 12:00:00 GMT</pubDate>"
+            "</item></channel></rss>"
+        )
+        writer, reader = self.make_cache(), self.make_cache()
+
+        writer.set('rss', 'https://example.com/rss', feed)
+
+        self.assertEqual(writer.get('rss', 'https://example.com/rss').entries[0].link, "https://example.com/a")
+        self.assertEqual(self.redis.data, {})
+        self.assertIsNone(reader.get('rss', 'https://example.com/rss'))
+
+
+
+class TestStaleWhileRevalidate(unittest.TestCase):
+    """Test soft-TTL background refreshes and refresh failure handling"""
+
+    def make_cache(self, soft_ttl=0.05, **kwargs):
+        with patch('os.path.exists', return_value=False):
+            cache = IntelligentCacheManager(max_memory_mb=1, **kwargs)
+        cache.soft_ttls['rss'] = soft_ttl
+        return cache
+
+    def wait_for_refresh(self, cache, timeout=5):
+        deadline = time.time() + timeout
+        while cache._inflight and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertFalse(cache._inflight)
+
+    def test_stale_value_served_while_refreshing(self):
+        """Test a stale hit returns at once and a background fetch replaces it"""
+        cache = self.make_cache()
+        cache.get_or_fetch('rss', 'feed', lambda: 'v1')
+        time.sleep(0.06)
+        release = threading.Event()
+
+        def slow_fetch():
+            release.wait(5)
+            return 'v2'
+
+        started = time.time()
+        result = cache.get_or_fetch('rss', 'feed', slow_fetch)
+
+        self.assertEqual(result, ('v1', True))
+        self.assertLess(time.time() - started, 0.5)
+        release.set()
+        self.wait_for_refresh(cache)
+        self.assertEqual(cache.get('rss', 'feed'), 'v2')
+        self.assertEqual(cache.get_stats()['refreshes'], 1)
+
+    def test_one_refresh_per_key(self):
+        """Test concurrent stale hits start a single background refresh"""
+        cache = self.make_cache()
+        cache.get_or_fetch('rss', 'feed', lambda: 'v1')
+        time.sleep(0.06)
+        release = threading.Event()
+        fetch = Mock(side_effect=lambda: release.wait(5) and 'v2')
+
+        results = [cache.get_or_fetch('rss', 'feed', fetch) for _ in range(5)]
+        release.set()
+        self.wait_for_refresh(cache)
+
+        self.assertEqual(results, [('v1', True)] * 5)
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(cache.get_stats()['stale_hits'], 5)
+
+    def test_failed_refresh_keeps_last_good_value(self):
+        """Test a failing refresh keeps serving the cached value and backs off"""
+        cache = self.make_cache()
+        cache.get_or_fetch('rss', 'feed', lambda: 'v1')
+        time.sleep(0.06)
+        fetch = Mock(side_effect=IOError("503"))
+
+        self.assertEqual(cache.get_or_fetch('rss', 'feed', fetch), ('v1', True))
+        self.wait_for_refresh(cache)
+        self.assertEqual(cache.get_or_fetch('rss', 'feed', fetch), ('v1', True))
+        self.wait_for_refresh(cache)
+
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(cache.get('rss', 'feed'), 'v1')
+        self.assertEqual(cache.get_stats()['refresh_failures'], 1)
+        self.assertEqual(cache.get_stats()['fetch_failures'], 0)
+        self.assertEqual(cache._refresh_failures[('rss', 'feed')][0], 1)
+
+    def test_successful_refresh_clears_failures(self):
+        """Test a refresh that succeeds after failures resets the backoff"""
+        cache = self.make_cache()
+        cache.get_or_fetch('rss', 'feed', lambda: 'v1')
+        time.sleep(0.06)
+        cache._refresh_failures[('rss', 'feed')] = (3, 0.0)
+
+        cache.get_or_fetch('rss', 'feed', lambda: 'v2')
+        self.wait_for_refresh(cache)
+
+        self.assertEqual(cache.get('rss', 'feed'), 'v2')
+        self.assertNotIn(('rss', 'feed'), cache._refresh_failures)
+
+    def test_hard_ttl_fetches_in_foreground(self):
+        """Test entries past the tier TTL are refetched before returning"""
+        cache = self.make_cache(soft_ttl=0.02)
+        cache.ttls['rss'] = 0.05
+        cache.get_or_fetch('rss', 'feed', lambda: 'v1')
+        time.sleep(0.06)
+
+        self.assertEqual(cache.get_or_fetch('rss', 'feed', lambda: 'v2'), ('v2', False))
+
+    def test_entry_age_survives_l2(self):
+        """Test a value read back from L2 is refreshed once it is past its soft TTL"""
+        backend = RedisCacheBackend(FakeRedis())
+        writer = self.make_cache(l2=backend)
+        reader = self.make_cache(l2=backend)
+        writer.get_or_fetch('rss', 'feed', lambda: 'v1')
+        time.sleep(0.06)
+
+        self.assertEqual(reader.get_or_fetch('rss', 'feed', lambda: 'v2'), ('v1', True))
+        self.wait_for_refresh(reader)
+        self.assertEqual(reader.get_stats()['refreshes'], 1)
+
+
 if __name__ == '__main__':
     unittest.main()
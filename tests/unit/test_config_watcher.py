@@ -0,0 +1,196 @@
+"""
+Unit tests for hot-reloading companies and feeds (src/config_watcher.py)
+Tests the config_changes log written by the ORM listeners, incremental polling
+from the change watermark and applying updates to a running monitor
+"""
+
+from contextlib import contextmanager
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database import Base
+from src.models import Company, ConfigChange, Feed
+from src.config_watcher import ConfigWatcher
+from src.main_optimized import OptimizedCryptoTGEMonitor
+
+DEFAULT_COMPANIES = [{'name': 'Config Co', 'aliases': [], 'tokens': ['CFG'], 'priority': 'LOW'}]
+DEFAULT_FEEDS = ['https://config.example/rss']
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False},
+                           poolclass=StaticPool)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+
+    @contextmanager
+    def get_session():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    yield get_session
+    engine.dispose()
+
+
+def add(session_factory, *rows):
+    with session_factory() as db:
+        db.add_all(rows)
+        db.commit()
+
+
+def make_watcher(session_factory):
+    return ConfigWatcher(DEFAULT_COMPANIES, DEFAULT_FEEDS, session_factory=session_factory, poll_interval=60)
+
+
+class TestConfigChangeLog:
+    """Test suite for recording company and feed edits"""
+
+    def test_inserts_updates_and_deletes_recorded(self, session_factory):
+        """Test every edit that affects matching or fetching adds a change row"""
+        add(session_factory, Company(name="Caldera", tokens=["CAL"]), Feed(name="Feed", url="https://a.example/rss"))
+        with session_factory() as db:
+            company = db.query(Company).one()
+            company.aliases = ["Caldera Labs"]
+            db.delete(db.query(Feed).one())
+            db.commit()
+
+            changes = [(c.entity, c.action) for c in db.query(ConfigChange).order_by(ConfigChange.id)]
+
+        assert sorted(changes[:2]) == [('company', 'upsert'), ('feed', 'upsert')]
+        assert sorted(changes[2:]) == [('company', 'upsert'), ('feed', 'delete')]
+
+    def test_feed_statistics_not_recorded(self, session_factory):
+        """Test updating fetch statistics does not look like a config change"""
+        add(session_factory, Feed(name="Feed", url="https://a.example/rss"))
+        with session_factory() as db:
+            feed = db.query(Feed).one()
+            feed.success_count = 10
+            feed.articles_found = 4
+            db.commit()
+
+            assert db.query(ConfigChange).count() == 1
+
+
+class TestConfigWatcher:
+    """Test suite for polling the change log"""
+
+    def test_first_poll_loads_database(self, session_factory):
+        """Test the first poll replaces the config defaults with database rows"""
+        add(session_factory,
+            Company(name="Caldera", aliases=["Caldera Labs"], tokens=["CAL"], priority="HIGH"),
+            Feed(name="A", url="https://a.example/rss"),
+            Feed(name="Inactive", url="https://b.example/rss", is_active=False))
+        watcher = make_watcher(session_factory)
+
+        update = watcher.poll()
+
+        assert [c['name'] for c in update.companies] == ["Caldera"]
+        assert update.companies[0]['aliases'] == ["Caldera Labs"]
+        assert update.feeds == ["https://a.example/rss"]
+        assert update.changed_companies == {"Caldera", "Config Co"}
+        assert watcher.watermark == 3
+
+    def test_defaults_used_when_database_empty(self, session_factory):
+        """Test an unseeded database keeps the config companies and feeds"""
+        watcher = make_watcher(session_factory)
+
+        assert watcher.poll() is None
+        assert watcher.companies == DEFAULT_COMPANIES
+        assert watcher.feeds == DEFAULT_FEEDS
+
+    def test_changes_applied_incrementally(self, session_factory):
+        """Test only changes above the watermark are applied"""
+        add(session_factory, Company(name="Caldera", tokens=["CAL"]), Feed(name="A", url="https://a.example/rss"))
+        watcher = make_watcher(session_factory)
+        watcher.poll()
+
+        assert watcher.poll(force=True) is None
+
+        add(session_factory, Company(name="Fabric", tokens=["FAB"]), Feed(name="B", url="https://b.example/rss"))
+        with session_factory() as db:
+            db.query(Feed).filter(Feed.url == "https://a.example/rss").one().is_active = False
+            db.commit()
+        update = watcher.poll(force=True)
+
+        assert update.changed_companies == {"Fabric"}
+        assert [c['name'] for c in update.companies] == ["Caldera", "Fabric"]
+        assert update.added_feeds == ["https://b.example/rss"]
+        assert update.removed_feeds == ["https://a.example/rss"]
+
+    def test_edited_and_deleted_companies(self, session_factory):
+        """Test renamed aliases and deleted companies are reported"""
+        add(session_factory, Company(name="Caldera", tokens=["CAL"]), Company(name="Fabric", tokens=["FAB"]))
+        watcher = make_watcher(session_factory)
+        watcher.poll()
+
+        with session_factory() as db:
+            db.query(Company).filter(Company.name == "Caldera").one().aliases = ["Caldera Labs"]
+            db.delete(db.query(Company).filter(Company.name == "Fabric").one())
+            db.commit()
+        update = watcher.poll(force=True)
+
+        assert update.changed_companies == {"Caldera", "Fabric"}
+        assert update.companies == [{
+            'name': "Caldera", 'aliases': ["Caldera Labs"], 'tokens': ["CAL"], 'exclusions': [],
+            'priority': "MEDIUM", 'status': "active",
+        }]
+
+    def test_poll_interval_limits_queries(self, session_factory):
+        """Test polls within the interval do not query the database"""
+        watcher = make_watcher(session_factory)
+        watcher.poll()
+
+        add(session_factory, Company(name="Caldera", tokens=["CAL"]))
+
+        assert watcher.poll() is None
+        assert watcher.poll(force=True).changed_companies == {"Caldera", "Config Co"}
+
+
+class TestMonitorRefresh:
+    """Test suite for applying database edits to a running monitor"""
+
+    @pytest.fixture
+    def monitor(self, session_factory):
+        monitor = OptimizedCryptoTGEMonitor(swarm_enabled=False, lazy=True)
+        monitor.config_watcher = make_watcher(session_factory)
+        monitor.companies = DEFAULT_COMPANIES
+        monitor.compile_matching_patterns()
+        monitor.news_scraper = Mock(news_sources=list(DEFAULT_FEEDS))
+        monitor.twitter_monitor = Mock()
+        return monitor
+
+    def test_new_company_and_feed_applied(self, monitor, session_factory):
+        """Test a company and feed added through the database reach the scrapers"""
+        add(session_factory, Company(name="Caldera", tokens=["CAL"]), Feed(name="A", url="https://a.example/rss"))
+
+        assert monitor.refresh_config() is True
+
+        assert monitor.news_scraper.news_sources == ["https://a.example/rss"]
+        assert [c['name'] for c in monitor.companies] == ["Caldera"]
+        assert monitor.company_patterns["Caldera"].search("Caldera TGE is live")
+        monitor.news_scraper.update_companies.assert_called_once_with(monitor.companies)
+        monitor.twitter_monitor.update_companies.assert_called_once_with(monitor.companies)
+
+    def test_feed_only_change_keeps_matchers(self, monitor, session_factory):
+        """Test adding a feed does not rebuild company matching"""
+        add(session_factory, Feed(name="A", url="https://a.example/rss"))
+
+        assert monitor.refresh_config() is True
+
+        assert monitor.news_scraper.news_sources == ["https://a.example/rss"]
+        assert not monitor.news_scraper.update_companies.called
+
+    def test_database_errors_do_not_break_cycle(self, monitor):
+        """Test an unreachable database leaves the current config in place"""
+        monitor.config_watcher.session_factory = Mock(side_effect=RuntimeError("database down"))
+
+        assert monitor.refresh_config() is False
+        assert monitor.companies == DEFAULT_COMPANIES
@@ -0,0 +1,101 @@
+"""
+Unit tests for database configuration helpers (src/database.py)
+Tests async URL mapping and the threaded async session fallback
+"""
+
+import asyncio
+import pytest
+from sqlalchemy import create_engine, select, func
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database import Base, ThreadedSession, get_async_database_url
+from src.models import Company
+
+
+class TestAsyncDatabaseURL:
+    """Test suite for sync → async driver URL mapping"""
+
+    def test_postgresql_maps_to_asyncpg(self):
+        """Test PostgreSQL URLs use the asyncpg driver"""
+        url = get_async_database_url("postgresql://user:pass@db:5432/tge")
+        assert url == "postgresql+asyncpg://user:pass@db:5432/tge"
+
+    def test_postgres_alias_and_psycopg2_driver(self):
+        """Test postgres:// and explicit psycopg2 URLs are mapped"""
+        assert get_async_database_url("postgres://u:p@h/d") == "postgresql+asyncpg://u:p@h/d"
+        assert get_async_database_url("postgresql+psycopg2://u:p@h/d") == "postgresql+asyncpg://u:p@h/d"
+
+    def test_sslmode_translated_for_asyncpg(self):
+        """Test libpq sslmode is rewritten to asyncpg's ssl parameter"""
+        url = get_async_database_url("postgresql://u:p@h/d?sslmode=require")
+        assert url == "postgresql+asyncpg://u:p@h/d?ssl=require"
+
+    def test_sqlite_file_maps_to_aiosqlite(self):
+        """Test file-backed SQLite uses the aiosqlite driver"""
+        assert get_async_database_url("sqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+    def test_sqlite_memory_has_no_async_url(self):
+        """Test in-memory SQLite falls back to threaded sessions"""
+        assert get_async_database_url("sqlite:///:memory:") is None
+        assert get_async_database_url("sqlite://") is None
+
+    def test_unknown_dialect_has_no_async_url(self):
+        """Test unsupported dialects fall back to threaded sessions"""
+        assert get_async_database_url("mysql://u:p@h/d") is None
+
+
+class TestThreadedSession:
+    """Test suite for the threaded AsyncSession facade"""
+
+    @pytest.fixture
+    def sync_session(self):
+        engine = create_engine(
+            "sqlite:///:memory:",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        session.add_all([
+            Company(name="Alpha", priority="HIGH", status="active"),
+            Company(name="Beta", priority="LOW", status="active"),
+        ])
+        session.commit()
+        yield session
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+
+    def test_scalars_and_scalar(self, sync_session):
+        """Test scalars/scalar run queries and return buffered results"""
+        db = ThreadedSession(sync_session)
+
+        async def run():
+            names = (await db.scalars(select(Company.name).order_by(Company.name))).all()
+            count = await db.scalar(select(func.count(Company.id)))
+            return names, count
+
+        names, count = asyncio.run(run())
+
+        assert names == ["Alpha", "Beta"]
+        assert count == 2
+
+    def test_execute_returns_rows(self, sync_session):
+        """Test execute returns rows usable after the worker thread finishes"""
+        db = ThreadedSession(sync_session)
+
+        rows = asyncio.run(db.execute(
+            select(Company.status, func.count(Company.id)).group_by(Company.status)
+        )).all()
+
+        assert rows == [("active", 2)]
+
+    def test_get_by_primary_key(self, sync_session):
+        """Test get loads an instance by primary key"""
+        db = ThreadedSession(sync_session)
+        company_id = sync_session.scalar(select(Company.id).filter(Company.name == "Beta"))
+
+        company = asyncio.run(db.get(Company, company_id))
+
+        assert company.name == "Beta"
+        assert asyncio.run(db.get(Company, 999)) is None
@@ -0,0 +1,300 @@
+"""
+Unit tests for email rendering and delivery (src/email_notifier.py)
+Tests precompiled templates, per-alert fragment caching, SMTP session reuse,
+NOOP health checks, digest coalescing and delivery against a local aiosmtpd
+server when it is installed
+"""
+
+import os
+import smtplib
+import socket
+import sys
+import time
+from email import message_from_string, policy
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from config import EMAIL_CONFIG
+from email_notifier import CompiledTemplate, EmailNotifier, SMTPConnectionPool
+
+try:
+    from aiosmtpd.controller import Controller
+    from aiosmtpd.smtp import AuthResult
+    AIOSMTPD_AVAILABLE = True
+except ImportError:
+    AIOSMTPD_AVAILABLE = False
+
+
+TEST_EMAIL_CONFIG = {
+    'smtp_server': 'localhost',
+    'smtp_port': 2525,
+    'email_user': 'monitor@example.com',
+    'email_password': 'secret-password',
+    'recipient_email': 'alice@example.com, bob@example.com',
+    'smtp_starttls': False,
+    'smtp_noop_interval': 30,
+    'background_delivery': True,
+    'digest_window': 60,
+}
+
+
+class FakeSMTP:
+    """Records the SMTP calls made on each connection"""
+
+    instances = []
+
+    def __init__(self, host, port, timeout=None):
+        self.logins = 0
+        self.sent = []
+        self.noop_code = 250
+        self.disconnect_on_send = False
+        self.closed = False
+        FakeSMTP.instances.append(self)
+
+    def set_debuglevel(self, level):
+        pass
+
+    def ehlo(self):
+        return 250, b"localhost"
+
+    def starttls(self):
+        return 220, b"ready"
+
+    def login(self, user, password):
+        self.logins += 1
+
+    def noop(self):
+        return self.noop_code, b""
+
+    def sendmail(self, from_addr, to_addrs, message):
+        if self.disconnect_on_send:
+            raise smtplib.SMTPServerDisconnected("connection closed")
+        self.sent.append((from_addr, list(to_addrs), message))
+        return {}
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_smtp():
+    FakeSMTP.instances = []
+    with patch("email_notifier.smtplib.SMTP", FakeSMTP):
+        yield FakeSMTP
+
+
+def make_notifier(**overrides):
+    with patch.dict(EMAIL_CONFIG, {**TEST_EMAIL_CONFIG, **overrides}):
+        return EmailNotifier()
+
+
+def news_alert(title, company="Caldera"):
+    return {
+        'title': title,
+        'link': 'https://example.com/article',
+        'summary': f'{company} announces TGE',
+        'match_details': {'matched_companies': [company], 'confidence_score': 90},
+    }
+
+
+class TestEmailRendering:
+    """Test suite for template rendering and fragment caching"""
+
+    def test_compiled_template_matches_str_format(self):
+        """Test precompiled templates render like str.format"""
+        source = "{{literal}} <b>{name}</b> has {count} alerts"
+        fields = {'name': 'Caldera', 'count': 3}
+
+        assert CompiledTemplate(source).render(fields) == source.format(**fields)
+
+    def test_fields_are_sanitized_on_insertion(self):
+        """Test untrusted alert fields are escaped in the rendered body"""
+        notifier = make_notifier()
+        alert = news_alert('<script>alert(1)</script>Launch', company='<b>Evil</b>')
+        alert['link'] = 'https://example.com/a?x=1&y="2"'
+
+        body = notifier._generate_email_body([alert], [], {})
+
+        assert '<script>' not in body
+        assert '&lt;b&gt;Evil&lt;/b&gt;' in body
+        assert 'href="https://example.com/a?x=1&amp;y=&quot;2&quot;"' in body
+
+    def test_alert_fragments_are_cached(self):
+        """Test an unchanged alert is rendered once across digests"""
+        notifier = make_notifier()
+        alert = news_alert("First TGE")
+
+        with patch.object(notifier, "_render_news_item", wraps=notifier._render_news_item) as render:
+            first = notifier._generate_email_body([alert], [], {})
+            second = notifier._generate_email_body([alert, news_alert("Second TGE")], [], {})
+
+        assert render.call_count == 2
+        assert notifier._render_alert_fragment('news', alert) in first
+        assert notifier._render_alert_fragment('news', alert) in second
+
+    def test_digest_keeps_template_styles(self, fake_smtp):
+        """Test rendered digests are not run through whole-body sanitization"""
+        notifier = make_notifier(background_delivery=False)
+
+        notifier.send_tge_alert_email([news_alert("First TGE")], [])
+
+        _, _, message = fake_smtp.instances[0].sent[0]
+        html_part = message_from_string(message, policy=policy.default).get_body(('html',))
+        assert '<style>' in html_part.get_content()
+
+
+class TestSMTPConnectionPool:
+    """Test suite for SMTP session reuse"""
+
+    def _pool(self, **kwargs):
+        return SMTPConnectionPool("localhost", 2525, "monitor@example.com", "secret-password",
+                                  starttls=False, **kwargs)
+
+    def test_session_reused_across_sends(self, fake_smtp):
+        """Test the handshake and login run once for several messages"""
+        pool = self._pool()
+
+        for i in range(3):
+            pool.sendmail("monitor@example.com", ["alice@example.com"], f"message {i}")
+
+        assert len(fake_smtp.instances) == 1
+        assert fake_smtp.instances[0].logins == 1
+        assert len(fake_smtp.instances[0].sent) == 3
+        assert pool.stats['reused'] == 2
+
+    def test_failed_noop_reconnects(self, fake_smtp):
+        """Test an idle session that fails NOOP is replaced"""
+        pool = self._pool(noop_interval=0)
+        pool.sendmail("monitor@example.com", ["alice@example.com"], "first")
+        fake_smtp.instances[0].noop_code = 421
+
+        pool.sendmail("monitor@example.com", ["alice@example.com"], "second")
+
+        assert len(fake_smtp.instances) == 2
+        assert fake_smtp.instances[0].closed
+        assert fake_smtp.instances[1].sent[0][2] == "second"
+        assert pool.stats['noop_failures'] == 1
+
+    def test_disconnect_retries_on_fresh_session(self, fake_smtp):
+        """Test a session dropped by the server is reopened for the same message"""
+        pool = self._pool()
+        pool.sendmail("monitor@example.com", ["alice@example.com"], "first")
+        fake_smtp.instances[0].disconnect_on_send = True
+
+        pool.sendmail("monitor@example.com", ["alice@example.com"], "second")
+
+        assert len(fake_smtp.instances) == 2
+        assert fake_smtp.instances[1].sent[0][2] == "second"
+
+
+class TestBackgroundDelivery:
+    """Test suite for the background sender and digest coalescing"""
+
+    def test_alerts_coalesce_into_one_digest(self, fake_smtp):
+        """Test alerts within the digest window are sent as one email"""
+        notifier = make_notifier()
+
+        assert notifier.send_tge_alert_email([news_alert("First TGE")], [])
+        assert notifier.send_tge_alert_email([news_alert("Second TGE", "Fhenix")], [])
+        assert fake_smtp.instances == []
+
+        assert notifier.flush(timeout=5)
+        notifier.close()
+
+        sent = [message for smtp in fake_smtp.instances for message in smtp.sent]
+        assert len(sent) == 1
+        _, to_addrs, message = sent[0]
+        assert to_addrs == ["alice@example.com", "bob@example.com"]
+        assert "2 TGE Alerts" in message_from_string(message, policy=policy.default)["Subject"]
+        assert notifier.delivery.stats['digests_sent'] == 1
+
+    def test_digest_sent_when_window_elapses(self, fake_smtp):
+        """Test a pending digest is delivered without an explicit flush"""
+        notifier = make_notifier(digest_window=0.05)
+
+        notifier.send_tge_alert_email([news_alert("First TGE")], [])
+
+        deadline = time.monotonic() + 5
+        while notifier.delivery.stats['digests_sent'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        notifier.close()
+
+        assert notifier.delivery.stats['digests_sent'] == 1
+
+    def test_cycle_alerts_are_queued(self, fake_smtp):
+        """Test send_tge_alerts maps cycle alerts and returns without sending"""
+        notifier = make_notifier()
+        alerts = [
+            {'source': 'news', 'title': 'Caldera TGE', 'content': 'TGE next week',
+             'url': 'https://example.com/a', 'confidence': 0.9,
+             'analysis': {'matched_companies': ['Caldera'], 'matched_keywords': ['TGE']}},
+            {'source': 'twitter', 'content': '$ERA airdrop live', 'url': 'https://x.com/a/1',
+             'confidence': 0.8, 'analysis': {'matched_companies': ['Caldera']}},
+        ]
+
+        assert notifier.send_tge_alerts(alerts, high_priority_count=2)
+        assert notifier.delivery.pending == 2
+
+        notifier.close()
+
+        assert len(fake_smtp.instances[0].sent) == 1
+
+    def test_synchronous_delivery_when_background_disabled(self, fake_smtp):
+        """Test alerts are sent immediately with background delivery off"""
+        notifier = make_notifier(background_delivery=False)
+
+        assert notifier.send_tge_alert_email([news_alert("First TGE")], [])
+
+        assert notifier.delivery is None
+        assert len(fake_smtp.instances[0].sent) == 1
+
+
+@pytest.mark.skipif(not AIOSMTPD_AVAILABLE, reason="aiosmtpd not installed")
+class TestLocalSMTPServer:
+    """End-to-end delivery against a local aiosmtpd server"""
+
+    @pytest.fixture
+    def smtp_server(self):
+        class Handler:
+            def __init__(self):
+                self.envelopes = []
+                self.sessions = set()
+
+            async def handle_DATA(self, server, session, envelope):
+                self.envelopes.append(envelope)
+                self.sessions.add(id(session))
+                return "250 OK"
+
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+
+        handler = Handler()
+        controller = Controller(
+            handler,
+            hostname="127.0.0.1",
+            port=port,
+            authenticator=lambda *args: AuthResult(success=True),
+            auth_require_tls=False,
+        )
+        controller.start()
+        yield port, handler
+        controller.stop()
+
+    def test_emails_share_one_session(self, smtp_server):
+        """Test several emails reuse one authenticated session"""
+        port, handler = smtp_server
+        notifier = make_notifier(smtp_server="127.0.0.1", smtp_port=port)
+
+        notifier.send_tge_alert_email([news_alert("First TGE")], [])
+        notifier.flush(timeout=10)
+        notifier.send_tge_alert_email([news_alert("Second TGE")], [])
+        notifier.close(timeout=10)
+
+        assert len(handler.envelopes) == 2
+        assert len(handler.sessions) == 1
+        assert handler.envelopes[0].rcpt_tos == ["alice@example.com", "bob@example.com"]
+        assert notifier.pool.stats['connections'] == 1
@@ -0,0 +1,198 @@
+"""
+Unit tests for the real-time event broker (src/event_broker.py)
+Tests in-memory dispatch and cross-worker fan-out over Redis pub/sub
+"""
+
+import asyncio
+import json
+
+from src.event_broker import ALERTS_CHANNEL, InMemoryBroker, RedisBroker
+from src.websocket_service import MessageType, SubscriptionType, WebSocketManager, build_alert_event
+from tests.fixtures.websocket import FakeWebSocket, drain, make_alert, subscribe
+
+
+class FakePubSubHub:
+    """In-process stand-in for a Redis server's pub/sub"""
+
+    def __init__(self):
+        self.queues = []
+
+    def client(self):
+        return FakeRedisClient(self)
+
+
+class FakeRedisClient:
+    def __init__(self, hub):
+        self.hub = hub
+
+    async def publish(self, channel, data):
+        for channels, queue in self.hub.queues:
+            if channel in channels:
+                await queue.put({"type": "message", "channel": channel.encode(), "data": data})
+
+    def pubsub(self, **kwargs):
+        return FakePubSub(self.hub)
+
+    async def aclose(self):
+        pass
+
+
+class FakePubSub:
+    def __init__(self, hub):
+        self.hub = hub
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, *channels):
+        self.hub.queues.append((set(channels), self.queue))
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        pass
+
+
+class TestInMemoryBroker:
+    """Test suite for the single-process broker"""
+
+    def test_publish_dispatches_to_handlers(self):
+        """Test published events reach every handler on the channel"""
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        async def run():
+            broker = InMemoryBroker()
+            broker.subscribe("channel", handler)
+            broker.subscribe("other", handler)
+            await broker.publish("channel", {"n": 1})
+
+        asyncio.run(run())
+
+        assert received == [{"n": 1}]
+
+    def test_handler_errors_are_isolated(self):
+        """Test a failing handler does not stop delivery to the others"""
+        received = []
+
+        async def failing(event):
+            raise RuntimeError("boom")
+
+        async def handler(event):
+            received.append(event)
+
+        async def run():
+            broker = InMemoryBroker()
+            broker.subscribe("channel", failing)
+            broker.subscribe("channel", handler)
+            await broker.publish("channel", {"n": 1})
+            return broker
+
+        broker = asyncio.run(run())
+
+        assert received == [{"n": 1}]
+        assert broker.stats["handler_errors"] == 1
+
+
+class TestRedisBroker:
+    """Test suite for cross-worker fan-out"""
+
+    def test_alert_reaches_clients_on_every_worker(self):
+        """Test an alert published by one worker is delivered by all workers"""
+        async def run():
+            hub = FakePubSubHub()
+            workers = []
+            for _ in range(2):
+                manager = WebSocketManager()
+                broker = RedisBroker(client=hub.client())
+                broker.subscribe(ALERTS_CHANNEL, manager.deliver_alert_event)
+                await broker.start()
+                websocket = FakeWebSocket()
+                await subscribe(manager, websocket, SubscriptionType.ALL_ALERTS.value)
+                workers.append((broker, websocket))
+
+            publisher = workers[0][0]
+            await publisher.publish(ALERTS_CHANNEL, build_alert_event(make_alert(42)))
+            await drain()
+
+            for broker, _ in workers:
+                await broker.stop()
+            return [websocket for _, websocket in workers]
+
+        sockets = asyncio.run(run())
+
+        for websocket in sockets:
+            alerts = websocket.messages(MessageType.ALERT.value)
+            assert [alert["data"]["alert_id"] for alert in alerts] == [42]
+
+    def test_publish_without_listener_delivers_locally(self):
+        """Test events are still delivered locally before start() is called"""
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        async def run():
+            broker = RedisBroker(client=FakePubSubHub().client())
+            broker.subscribe(ALERTS_CHANNEL, handler)
+            await broker.publish(ALERTS_CHANNEL, {"n": 1})
+
+        asyncio.run(run())
+
+        assert received == [{"n": 1}]
+
+    def test_publisher_without_listener_reaches_other_workers(self):
+        """Test a process that never starts listening still fans out through Redis"""
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        async def run():
+            hub = FakePubSubHub()
+            subscriber = RedisBroker(client=hub.client())
+            subscriber.subscribe(ALERTS_CHANNEL, handler)
+            await subscriber.start()
+
+            # No handlers, so start() does not subscribe
+            publisher = RedisBroker(client=hub.client())
+            await publisher.start()
+            assert not publisher.listening
+
+            await publisher.publish(ALERTS_CHANNEL, {"n": 1})
+            await drain()
+            await subscriber.stop()
+
+        asyncio.run(run())
+
+        assert received == [{"n": 1}]
+
+    def test_publish_failure_delivers_locally(self):
+        """Test a Redis error falls back to this worker's handlers"""
+        received = []
+
+        async def handler(event):
+            received.append(event)
+
+        async def failing_publish(channel, data):
+            raise ConnectionError("redis down")
+
+        async def run():
+            client = FakePubSubHub().client()
+            client.publish = failing_publish
+            broker = RedisBroker(client=client)
+            broker.subscribe(ALERTS_CHANNEL, handler)
+            await broker.publish(ALERTS_CHANNEL, {"n": 1})
+
+        asyncio.run(run())
+
+        assert received == [{"n": 1}]
+
+    def test_events_round_trip_as_json(self):
+        """Test alert events survive JSON encoding through Redis"""
+        event = build_alert_event(make_alert(7))
+
+        assert json.loads(json.dumps(event)) == event
+        assert json.loads(event["message"])["data"]["alert_id"] == 7
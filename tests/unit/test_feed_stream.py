@@ -0,0 +1,179 @@
+"""
+Unit tests for incremental feed parsing (src/feed_stream.py)
+Tests RSS and Atom entry extraction, early cutoff after enough or already-known
+entries, the byte cap, the feedparser fallback for malformed documents and
+per-feed watermarks
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from feed_stream import FeedStream, FeedWatermark, parse_feed_date
+
+
+class FakeResponse:
+    """Streams a body in fixed-size chunks and records how much was read."""
+
+    def __init__(self, body: bytes, url="https://example.com/rss"):
+        self.body = body
+        self.url = url
+        self.sent = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            chunk = self.body[start:start + chunk_size]
+            self.sent += len(chunk)
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+def rss(count, description="Token launch news"):
+    items = ''.join(
+        f"<item><title>Article {i}</title><link>https://example.com/a/{i}</link>"
+        f"<guid isPermaLink=\"false\">id-{i}</guid><description>{description}</description>"
+        f"<pubDate>Mon, 01 Jan 2024 12:00:{i % 60:02d} GMT</pubDate></item>"
+        for i in range(count)
+    )
+    return (f"<?xml version=\"1.0\"?><rss version=\"2.0\"><channel><title>Example News</title>"
+            f"<link>https://example.com</link>{items}</channel></rss>").encode()
+
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Atom Blog</title>
+  <link rel="self" href="https://blog.example/atom.xml"/>
+  <entry>
+    <title>Caldera TGE</title>
+    <link rel="alternate" href="https://blog.example/caldera-tge"/>
+    <id>tag:blog.example,2024:1</id>
+    <published>2024-03-05T09:30:00Z</published>
+    <content type="html">&lt;p&gt;Caldera announces its token&lt;/p&gt;</content>
+  </entry>
+</feed>"""
+
+
+class TestFeedStream:
+    """Test suite for streaming feed parsing"""
+
+    def test_rss_entries(self):
+        """Test RSS items become feedparser-style entries"""
+        feed = FeedStream(FakeResponse(rss(3)), chunk_size=64)
+
+        entries = list(feed.entries())
+
+        assert feed.title == "Example News"
+        assert [e['link'] for e in entries] == [f"https://example.com/a/{i}" for i in range(3)]
+        assert entries[0]['title'] == "Article 0"
+        assert entries[0]['id'] == "id-0"
+        assert entries[0]['summary'] == "Token launch news"
+        assert entries[1]['published_parsed'] == time.struct_time((2024, 1, 1, 12, 0, 1, 0, 1, 0))
+        assert not feed.fallback
+
+    def test_atom_entries(self):
+        """Test Atom entries use the alternate link and published date"""
+        feed = FeedStream(FakeResponse(ATOM))
+
+        [entry] = list(feed.entries())
+
+        assert feed.title == "Atom Blog"
+        assert entry['link'] == "https://blog.example/caldera-tge"
+        assert entry['summary'] == "<p>Caldera announces its token</p>"
+        assert entry['published_parsed'][:6] == (2024, 3, 5, 9, 30, 0)
+
+    def test_stops_reading_after_max_entries(self):
+        """Test the rest of a large feed is never read"""
+        response = FakeResponse(rss(2000))
+        feed = FeedStream(response, chunk_size=1024)
+
+        entries = list(feed.entries(max_entries=10))
+
+        assert len(entries) == 10
+        assert response.sent < len(response.body) / 20
+        assert response.closed
+
+    def test_stops_at_run_of_known_entries(self):
+        """Test a run of already-seen entries ends the feed"""
+        seen = {f"https://example.com/a/{i}" for i in range(2, 100)}
+        feed = FeedStream(FakeResponse(rss(100)))
+
+        entries = list(feed.entries(is_known=lambda e: e['link'] in seen, known_run=3))
+
+        assert [e['link'] for e in entries] == ["https://example.com/a/0", "https://example.com/a/1"]
+        assert feed.entries_read == 5
+
+    def test_byte_cap_keeps_completed_entries(self):
+        """Test an oversized body is cut off and the complete entries kept"""
+        body = rss(500)
+        feed = FeedStream(FakeResponse(body), max_bytes=4096, chunk_size=1000)
+
+        entries = list(feed.entries(max_entries=1000))
+
+        assert feed.truncated
+        assert feed.bytes_read == 4096
+        assert 0 < len(entries) < 500
+        assert entries[-1]['link'].startswith("https://example.com/a/")
+
+    def test_malformed_feed_falls_back_to_feedparser(self):
+        """Test documents expat rejects are parsed by feedparser"""
+        body = rss(3, description="Launch&nbsp;news")
+        feed = FeedStream(FakeResponse(body))
+
+        entries = list(feed.entries())
+
+        assert feed.fallback
+        assert [e['link'] for e in entries] == [f"https://example.com/a/{i}" for i in range(3)]
+        assert feed.title == "Example News"
+
+    def test_parse_feed_date(self):
+        """Test RFC 822 and ISO 8601 dates are normalised to UTC"""
+        assert parse_feed_date("Tue, 02 Jan 2024 01:00:00 +0200")[:4] == (2024, 1, 1, 23)
+        assert parse_feed_date("2024-01-02T01:00:00+02:00")[:4] == (2024, 1, 1, 23)
+        assert parse_feed_date("not a date") is None
+
+
+def entry(i, published=None):
+    published = published if published is not None else 1_700_000_000 + i * 60
+    return {'id': f"id-{i}", 'link': f"https://example.com/a/{i}", 'published_parsed': time.gmtime(published)}
+
+
+class TestFeedWatermark:
+    """Test suite for per-feed watermarks"""
+
+    def test_new_entries_above_watermark(self):
+        """Test processed ids and entries behind the overlap window are known"""
+        watermark = FeedWatermark(overlap=3600)
+        for i in range(100, 110):
+            watermark.add(entry(i))
+
+        assert watermark.is_known(entry(105))
+        assert not watermark.is_known(entry(120))
+        # Published late, but within the overlap window
+        assert not watermark.is_known(entry(50))
+        assert watermark.is_known(entry(30))
+
+    def test_state_round_trip_drops_old_ids(self):
+        """Test the persisted state only keeps ids within the overlap window"""
+        watermark = FeedWatermark(overlap=600)
+        for i in range(0, 100):
+            watermark.add(entry(i))
+
+        state = FeedWatermark(watermark.to_dict(), overlap=600).to_dict()
+
+        assert state['published'] == 1_700_000_000 + 99 * 60
+        assert sorted(state['ids']) == sorted(f"id-{i}" for i in range(89, 100))
+
+    def test_undated_entries_known_by_id(self):
+        """Test entries without dates fall back to their ids"""
+        watermark = FeedWatermark()
+        watermark.add({'link': "https://example.com/undated"})
+
+        restored = FeedWatermark(watermark.to_dict())
+
+        assert restored.is_known({'link': "https://example.com/undated"})
+        assert not restored.is_known({'link': "https://example.com/other"})
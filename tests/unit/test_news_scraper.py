@@ -11,7 +11,7 @@ import json
 import time
 import hashlib
 from datetime import datetime, timezone, timedelta
-from concurrent.futures import TimeoutError as FuturesTimeoutError
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeoutError
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
@@ -108,6 +108,25 @@ class TestNewsScraper(unittest.TestCase):
 
         self.assertEqual(scraper.normalize_url(url3), scraper.normalize_url(url4))
 
+    def test_tracking_parameters_stripped(self):
+        """Test tracking parameters and AMP variants normalize to the same URL"""
+        scraper = OptimizedNewsScraper(
+            self.companies, self.keywords, self.news_sources
+        )
+
+        base = "https://news.example.com/2024/caldera-tge"
+        variants = [
+            f"{base}?utm_source=twitter&utm_medium=social",
+            f"{base}?fbclid=abc123#comments",
+            f"{base}/amp",
+            f"{base}?amp=1",
+            f"{base}?outputType=amp&gclid=xyz",
+        ]
+
+        for url in variants:
+            self.assertEqual(scraper.normalize_url(url), base)
+        self.assertEqual(scraper.normalize_url(f"{base}?page=2&utm_campaign=x"), f"{base}?page=2")
+
     def test_content_cleaning(self):
         """Test article content cleaning"""
         scraper = OptimizedNewsScraper(
@@ -218,14 +237,51 @@ class TestNewsScraper(unittest.TestCase):
         mock_article_class.return_value = mock_article
 
         url = "https://example.com/article"
-        content = scraper.fetch_article_content(url)
+        with patch.object(scraper, '_download_html', return_value="<html>page</html>") as mock_download:
+            content = scraper.fetch_article_content(url)
 
         self.assertEqual(content, long_article)
+        mock_download.assert_called_once_with(url)
+        mock_article.download.assert_called_once_with(input_html="<html>page</html>")
 
         # Check caching
         cache_key = hashlib.sha256(url.encode()).hexdigest()
         self.assertIn(cache_key, scraper.cache['articles'])
 
+    @patch('news_scraper_optimized.Article')
+    def test_canonical_link_reuses_cached_article(self, mock_article_class):
+        """Test a syndicated copy is resolved to its canonical article without extraction"""
+        scraper = OptimizedNewsScraper(
+            self.companies, self.keywords, self.news_sources
+        )
+        canonical = "https://origin.example.com/caldera-tge"
+        scraper.cache['articles'][hashlib.sha256(canonical.encode()).hexdigest()] = {
+            'content': 'Canonical content',
+            'cached_at': datetime.now(timezone.utc).isoformat()
+        }
+        html = f'<html><head><link rel="canonical" href="{canonical}"></head></html>'
+        mirror = "https://mirror.example.net/syndicated/caldera-tge"
+
+        with patch.object(scraper, '_download_html', return_value=html) as mock_download:
+            self.assertEqual(scraper.fetch_article_content(mirror), 'Canonical content')
+            # The alias is remembered, so the copy is not downloaded again
+            self.assertEqual(scraper.fetch_article_content(mirror), 'Canonical content')
+
+        mock_download.assert_called_once_with(mirror)
+        mock_article_class.assert_not_called()
+
+    def test_duplicate_content_detected(self):
+        """Test identical text under a second URL is flagged before scoring"""
+        scraper = OptimizedNewsScraper(
+            self.companies, self.keywords, self.news_sources
+        )
+        content = "Caldera announces its TGE with the CAL token launching next week."
+
+        self.assertFalse(scraper.is_duplicate_content("https://a.example/tge", content))
+        self.assertFalse(scraper.is_duplicate_content("https://a.example/tge", content))
+        self.assertTrue(scraper.is_duplicate_content("https://b.example/copy", "  " + content.upper()))
+        self.assertFalse(scraper.is_duplicate_content("https://b.example/other", "Different article text"))
+
     @patch('news_scraper_optimized.Article')
     def test_article_fetching_cache_hit(self, mock_article_class):
         """Test article content fetching uses cache"""
@@ -247,6 +303,40 @@ class TestNewsScraper(unittest.TestCase):
         self.assertEqual(content, 'Cached content')
         mock_article_class.assert_not_called()
 
+    @patch('news_scraper_optimized.Article')
+    def test_concurrent_fetches_share_one_extraction(self, mock_article_class):
+        """Test threads asking for the same article wait for a single download"""
+        scraper = OptimizedNewsScraper(
+            self.companies, self.keywords, self.news_sources
+        )
+        long_article = "Caldera TGE details " * 10
+        mock_article_class.return_value.text = long_article
+
+        def slow_download(url):
+            time.sleep(0.1)
+            return "<html>page</html>"
+
+        url = "https://example.com/concurrent"
+        with patch.object(scraper, '_download_html', side_effect=slow_download) as mock_download:
+            with ThreadPoolExecutor(max_workers=10) as pool:
+                results = list(pool.map(lambda _: scraper.fetch_article_content(url), range(10)))
+
+        self.assertEqual(results, [long_article.strip()] * 10)
+        mock_download.assert_called_once_with(url)
+
+    def test_failed_article_not_refetched(self):
+        """Test a failed extraction is remembered instead of retried by every caller"""
+        scraper = OptimizedNewsScraper(
+            self.companies, self.keywords, self.news_sources
+        )
+
+        url = "https://example.com/broken"
+        with patch.object(scraper, '_download_html', side_effect=ConnectionError("refused")) as mock_download:
+            self.assertIsNone(scraper.fetch_article_content(url))
+            self.assertIsNone(scraper.fetch_article_content(url))
+
+        mock_download.assert_called_once_with(url)
+
     def test_feed_prioritization(self):
         """Test feed prioritization based on performance"""
         scraper = OptimizedNewsScraper(
@@ -357,6 +447,104 @@ class TestNewsScraper(unittest.TestCase):
 
         self.assertIsInstance(articles, list)
 
+    def test_process_feed_streams_new_entries(self):
+        """Test a streamed feed is read only up to its already-seen entries"""
+        scraper = OptimizedNewsScraper(
+            self.companies, self.keywords, self.news_sources
+        )
+        items = ''.join(
+            f"<item><title>Caldera TGE update {i}</title><link>https://example.com/a/{i}</link>"
+            f"<description>Caldera token generation event</description></item>"
+            for i in range(200)
+        )
+        body = f"<rss><channel><title>Test Feed</title>{items}</channel></rss>".encode()
+        scraper.state['seen_urls'] = {f"https://example.com/a/{i}": "2024-01-01T00:00:00Z" for i in range(1, 200)}
+
+        mock_response = Mock()
+        mock_response.iter_content.side_effect = lambda size: (body[i:i + 512] for i in range(0, len(body), 512))
+
+        with patch.object(scraper.session, 'get', return_value=mock_response) as mock_get:
+            with patch.object(scraper, 'fetch_article_content', return_value="Full content about Caldera TGE") as mock_fetch:
+                articles = scraper.process_feed(self.news_sources[0])
+
+        self.assertTrue(mock_get.call_args.kwargs['stream'])
+        mock_fetch.assert_called_once_with("https://example.com/a/0")
+        mock_response.close.assert_called_once()
+        for article in articles:
+            self.assertEqual(article['feed_title'], "Test Feed")
+
+    def test_process_feed_uses_watermark(self):
+        """Test a second pass over a feed only processes entries above its watermark"""
+        scraper = OptimizedNewsScraper(
+            self.companies, self.keywords, self.news_sources
+        )
+
+        def feed_response(first, last):
+            items = ''.join(
+                f"<item><title>Market update {i}</title><link>https://example.com/a/{i}</link>"
+                f"<pubDate>Mon, 01 Jan 2024 {i:02d}:00:00 GMT</pubDate></item>"
+                for i in range(last, first - 1, -1)
+            )
+            body = f"<rss><channel><title>Test Feed</title>{items}</channel></rss>".encode()
+            response = Mock()
+            response.iter_content.return_value = [body]
+            return response
+
+        with patch.object(scraper.session, 'get', return_value=feed_response(0, 9)):
+            scraper.process_feed(self.news_sources[0])
+
+        # The feed is cached for its TTL; simulate that TTL running out
+        scraper.shared_cache.invalidate('rss', self.news_sources[0])
+        scraper.state['seen_urls'] = {}
+        with patch.object(scraper.session, 'get', return_value=feed_response(0, 12)):
+            with patch.object(scraper, 'normalize_url', side_effect=lambda url: url) as mock_normalize:
+                scraper.process_feed(self.news_sources[0])
+
+        processed = [call.args[0] for call in mock_normalize.call_args_list]
+        self.assertEqual(sorted(set(processed)), [f"https://example.com/a/{i}" for i in (10, 11, 12)])
+
+        feed_key = hashlib.md5(self.news_sources[0].encode()).hexdigest()
+        watermark = scraper.feed_stats[feed_key]['watermark']
+        self.assertEqual(watermark['published'], datetime(2024, 1, 1, 12, tzinfo=timezone.utc).timestamp())
+
+    def test_process_feed_downloads_once_within_ttl(self):
+        """Test a feed is downloaded once per cache TTL and failures count against it"""
+        scraper = OptimizedNewsScraper(
+            self.companies, self.keywords, self.news_sources
+        )
+        body = (b"<rss><channel><title>Test Feed</title><item><title>Market update</title>"
+                b"<link>https://example.com/a/1</link></item></channel></rss>")
+        response = Mock()
+        response.iter_content.return_value = [body]
+
+        with patch.object(scraper.session, 'get', return_value=response) as mock_get:
+            scraper.process_feed(self.news_sources[0])
+            scraper.process_feed(self.news_sources[0])
+        mock_get.assert_called_once()
+
+        broken_feed = "https://broken.example.com/feed"
+        with patch.object(scraper.session, 'get', side_effect=ConnectionError("refused")) as mock_get:
+            self.assertEqual(scraper.process_feed(broken_feed), [])
+            self.assertEqual(scraper.process_feed(broken_feed), [])
+        mock_get.assert_called_once()
+
+        feed_key = hashlib.md5(broken_feed.encode()).hexdigest()
+        self.assertEqual(scraper.feed_stats[feed_key]['failure_count'], 2)
+
+    def test_prune_seen_urls(self):
+        """Test seen URLs older than the safety-net horizon are dropped"""
+        scraper = OptimizedNewsScraper(
+            self.companies, self.keywords, self.news_sources
+        )
+        scraper.state['seen_urls'] = {
+            'https://example.com/old': (datetime.now(timezone.utc) - timedelta(days=30)).isoformat(),
+            'https://example.com/new': datetime.now(timezone.utc).isoformat(),
+        }
+
+        scraper.prune_seen_urls()
+
+        self.assertEqual(list(scraper.state['seen_urls']), ['https://example.com/new'])
+
     def test_state_persistence(self):
         """Test state saving and loading"""
         test_state = {
@@ -407,11 +595,7 @@ class TestCustomExtractors(unittest.TestCase):
         mock_soup.find_all.return_value = [mock_article]
         mock_soup_class.return_value = mock_soup
 
-        with patch.object(self.scraper.session, 'get') as mock_get:
-            mock_response = Mock()
-            mock_response.content = b"<html></html>"
-            mock_get.return_value = mock_response
-
+        with patch.object(self.scraper, '_download_html', return_value="<html></html>"):
             content = self.scraper._extract_medium_article("https://medium.com/article")
 
         # Should extract paragraphs
@@ -470,9 +654,7 @@ class TestEdgeCases(unittest.TestCase):
                         self.companies, self.keywords, self.news_sources
                     )
 
-        with patch('news_scraper_optimized.Article') as mock_article_class:
-            mock_article_class.side_effect = Exception("Timeout")
-
+        with patch.object(scraper, '_download_html', side_effect=Exception("Timeout")):
             content = scraper.fetch_article_content("https://slow-site.com/article")
 
         self.assertIsNone(content)
@@ -20,6 +20,7 @@ from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from typing import Dict, Any
 
 # Mock FastAPI before importing rate_limiting module
+_real_modules = {name: sys.modules.get(name) for name in ('fastapi', 'fastapi.responses')}
 sys.modules['fastapi'] = MagicMock()
 sys.modules['fastapi.responses'] = MagicMock()
 
@@ -38,6 +39,13 @@ from src.rate_limiting import (
     get_rate_limit_stats
 )
 
+# Put the real modules back so other test modules' FastAPI apps keep working
+for _name, _module in _real_modules.items():
+    if _module is None:
+        sys.modules.pop(_name, None)
+    else:
+        sys.modules[_name] = _module
+
 
 class MockRedis:
     """Mock Redis client for testing"""
@@ -0,0 +1,144 @@
+"""
+Unit tests for the compiled scoring rule pack (src/rule_pack.py)
+Tests sharing packs by content hash, immutability, keyword prefiltering and
+hot-reloading rule overrides from a JSON file
+"""
+
+import os
+import sys
+import json
+import re
+import dataclasses
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+import rule_pack
+from rule_pack import RulePackRef, get_rule_pack, reload_rules
+from enhanced_scoring import EnhancedTGEScoring
+
+COMPANIES = [
+    {'name': 'Caldera', 'aliases': ['Caldera Labs'], 'tokens': ['CAL'], 'priority': 'HIGH'},
+    {'name': 'Fabric', 'aliases': ['Fabric Protocol'], 'tokens': ['FAB'], 'priority': 'MEDIUM'},
+]
+KEYWORDS = ['TGE', 'token launch', 'airdrop', 'claim portal', '$TOKEN', 'cross-chain', 'q1 2025']
+
+
+@pytest.fixture
+def rules_file(tmp_path, monkeypatch):
+    """Point the rule pack at an override file and restore the config rules afterwards."""
+    path = tmp_path / "scoring_rules.json"
+    monkeypatch.setattr(rule_pack, 'RULES_FILE', str(path))
+    yield path
+    monkeypatch.setattr(rule_pack, 'RULES_FILE', '')
+    reload_rules()
+
+
+class TestRulePack:
+    """Test suite for compiling and sharing rule packs"""
+
+    def test_same_source_shares_one_pack(self):
+        """Test analyzers built from the same configuration share a compiled pack"""
+        first = get_rule_pack(COMPANIES, KEYWORDS)
+        second = get_rule_pack([dict(c) for c in COMPANIES], list(KEYWORDS))
+
+        assert first is second
+        assert RulePackRef(COMPANIES, KEYWORDS).get() is first
+
+    def test_version_tracks_content(self):
+        """Test a change to companies or keywords produces a new version"""
+        base = get_rule_pack(COMPANIES, KEYWORDS)
+        more_keywords = get_rule_pack(COMPANIES, KEYWORDS + ['mainnet'])
+        renamed = get_rule_pack([dict(COMPANIES[0], aliases=['Caldera XYZ'])], KEYWORDS)
+
+        assert len({base.version, more_keywords.version, renamed.version}) == 3
+
+    def test_pack_is_immutable(self):
+        """Test a shared pack cannot be modified by the analyzers using it"""
+        pack = get_rule_pack(COMPANIES, KEYWORDS)
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            pack.version = 'other'
+        with pytest.raises(TypeError):
+            pack.company_patterns['Caldera'] = re.compile('x')
+
+    def test_company_patterns_are_word_bounded(self):
+        """Test company patterns match names and aliases as whole words"""
+        pattern = get_rule_pack(COMPANIES, KEYWORDS).company_patterns['Caldera']
+
+        assert pattern.search("Check out Caldera Labs")
+        assert pattern.search("caldera is launching")
+        assert not pattern.search("Calderaish")
+
+    def test_pattern_matcher_crypto_context_ignores_case(self):
+        """Test OptimizedPatternMatcher finds crypto terms in mixed-case text as whole words"""
+        from optimizations import OptimizedPatternMatcher
+        matcher = OptimizedPatternMatcher(COMPANIES, KEYWORDS)
+
+        assert matcher.has_crypto_context('a', "Built on an Ethereum Layer 2 with DeFi")
+        assert matcher.has_crypto_context('b', "Blockchain Protocol news")
+        assert matcher.has_crypto_context('c', "Deploying a smart contract on layer2")
+        assert not matcher.has_crypto_context('d', "Cryptography and protocols class")
+
+    def test_match_keywords_agrees_with_full_scan(self):
+        """Test the leading-word prefilter finds exactly what scanning every keyword finds"""
+        pack = get_rule_pack(COMPANIES, KEYWORDS)
+        texts = [
+            "caldera tge is live, token launch today",
+            "claim portal opens for the cross-chain $token airdrop",
+            "tokens launched; airdrops soon; q1 2025 roadmap",
+            "cross chain portal claim",
+            "",
+        ]
+
+        for text in texts:
+            expected = [kw for kw in KEYWORDS
+                        if re.search(r'\b' + re.escape(kw.lower()) + r'\b', text)]
+            assert pack.match_keywords(text) == expected
+
+
+class TestRuleReload:
+    """Test suite for hot-reloading rule overrides"""
+
+    def test_override_file_swaps_pack(self, rules_file):
+        """Test changed rules are compiled into a new pack picked up by existing handles"""
+        ref = RulePackRef(COMPANIES, KEYWORDS)
+        before = ref.get()
+
+        rules_file.write_text(json.dumps({'tweet_exclusions': ['rumor']}))
+        reload_rules()
+        after = ref.get()
+
+        assert after is not before
+        assert after.version != before.version
+        assert after.tweet_exclusions == ('rumor',)
+        assert before.tweet_exclusions != ('rumor',)
+
+    def test_analyzers_use_reloaded_rules(self, rules_file):
+        """Test an analyzer scores with the new rules without being rebuilt"""
+        scorer = EnhancedTGEScoring()
+        assert scorer.get_source_reliability_score("https://example.org/post") == (0, "unknown")
+
+        rules_file.write_text(json.dumps({'source_tiers': [['tier_1', 15, ['example.org']]]}))
+        reload_rules()
+
+        assert scorer.get_source_reliability_score("https://example.org/post") == (15, "tier_1")
+
+    def test_unchanged_rules_keep_generation(self, rules_file):
+        """Test reloading identical rules does not invalidate compiled packs"""
+        rules_file.write_text(json.dumps({'tweet_exclusions': ['rumor']}))
+        generation = reload_rules()
+
+        assert reload_rules() == generation
+
+    def test_invalid_file_keeps_current_rules(self, rules_file):
+        """Test an unreadable override leaves the last good rules in place"""
+        rules_file.write_text(json.dumps({'tweet_exclusions': ['rumor'], 'unknown_section': []}))
+        reload_rules()
+        pack = get_rule_pack(COMPANIES, KEYWORDS)
+
+        rules_file.write_text("{not json")
+        reload_rules()
+
+        assert get_rule_pack(COMPANIES, KEYWORDS) is pack
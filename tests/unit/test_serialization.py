@@ -0,0 +1,199 @@
+"""
+Unit tests for fast JSON serialization helpers (src/serialization.py)
+Tests row projection, orjson encoding, NDJSON streaming and bulk export encoders
+"""
+
+import asyncio
+import csv
+import gzip
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.database import Base
+from src.models import Alert, Company
+from src.schemas import AlertResponse
+from src.serialization import (
+    EXPORT_FIELDS,
+    NDJSON_MEDIA_TYPE,
+    PARQUET_AVAILABLE,
+    alert_projection,
+    alert_row_to_dict,
+    alert_rows_to_dicts,
+    dumps,
+    gzip_chunks,
+    iter_csv_export,
+    iter_ndjson_export,
+    iter_parquet_export,
+    ndjson_response,
+)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    company = Company(name="Caldera", tokens=["ERA"], priority="HIGH", status="active")
+    session.add(company)
+    session.flush()
+    session.add_all([
+        Alert(title="Caldera TGE", content="TGE next week", source="news", confidence=0.9,
+              company_id=company.id, analysis_data={"scores": {"keyword": 0.8}},
+              urgency_level="high", status="active"),
+        Alert(title="Unlinked alert", content="No company", source="twitter", confidence=0.5,
+              urgency_level="low", status="active"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    Base.metadata.drop_all(bind=engine)
+
+
+class TestAlertProjection:
+    """Test suite for row → dict alert projection"""
+
+    def test_projection_matches_response_model(self, db_session):
+        """Test projected dicts match the AlertResponse JSON shape"""
+        rows = db_session.execute(alert_projection().order_by(Alert.id)).mappings().all()
+        projected = alert_rows_to_dicts(rows)
+
+        alerts = db_session.query(Alert).order_by(Alert.id).all()
+        expected = [json.loads(AlertResponse.from_orm(alert).model_dump_json()) for alert in alerts]
+
+        assert json.loads(dumps(projected)) == expected
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_encoded_projection_matches_response_model_json(self, db_session, use_orjson):
+        """Test encoded projections equal AlertResponse's JSON, including tz-aware datetimes"""
+        rows = db_session.execute(alert_projection().order_by(Alert.id)).mappings().all()
+        created = datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=timezone.utc)
+        updated = datetime(2025, 1, 2, 8, 4, 5, tzinfo=timezone(timedelta(hours=5)))
+        projected = [
+            dict(alert_row_to_dict(row), created_at=created, updated_at=updated)
+            for row in rows
+        ]
+
+        expected = [AlertResponse.model_validate(alert).model_dump(mode="json") for alert in projected]
+        assert expected[0]["created_at"] == "2025-01-02T03:04:05.678000Z"
+
+        if use_orjson:
+            encoded = dumps(projected)
+        else:
+            with patch("src.serialization.orjson", None):
+                encoded = dumps(projected)
+        assert json.loads(encoded) == expected
+
+    def test_projection_without_company(self, db_session):
+        """Test alerts without a company get company=None"""
+        rows = db_session.execute(
+            alert_projection().filter(Alert.company_id.is_(None))
+        ).mappings().all()
+
+        alert = alert_row_to_dict(rows[0])
+
+        assert alert["company"] is None
+        assert alert["title"] == "Unlinked alert"
+
+    def test_projection_normalizes_company_lists(self, db_session):
+        """Test NULL company list columns become empty lists"""
+        rows = db_session.execute(
+            alert_projection().filter(Alert.company_id.isnot(None))
+        ).mappings().all()
+
+        company = alert_row_to_dict(rows[0])["company"]
+
+        assert company["tokens"] == ["ERA"]
+        assert company["aliases"] == []
+        assert company["exclusions"] == []
+
+
+class TestEncoding:
+    """Test suite for JSON and NDJSON encoding"""
+
+    def test_dumps_handles_datetimes_and_int_keys(self):
+        """Test dumps encodes datetimes and non-string keys"""
+        payload = {"when": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc), 1: "one"}
+
+        decoded = json.loads(dumps(payload))
+
+        assert decoded["when"].startswith("2025-01-02T03:04:05")
+        assert decoded["1"] == "one"
+
+    def test_ndjson_response_streams_one_line_per_item(self):
+        """Test NDJSON responses emit one JSON document per line"""
+        response = ndjson_response([{"id": 1}, {"id": 2}])
+
+        async def collect():
+            return b"".join([chunk async for chunk in response.body_iterator])
+
+        body = asyncio.run(collect())
+
+        assert response.media_type == NDJSON_MEDIA_TYPE
+        assert [json.loads(line) for line in body.splitlines()] == [{"id": 1}, {"id": 2}]
+
+
+class TestExportEncoders:
+    """Test suite for streaming export encoders"""
+
+    def _rows(self, db_session):
+        return db_session.execute(alert_projection().order_by(Alert.id)).mappings().all()
+
+    def test_ndjson_export(self, db_session):
+        """Test NDJSON export emits one alert per line"""
+        body = b"".join(iter_ndjson_export(self._rows(db_session)))
+
+        alerts = [json.loads(line) for line in body.splitlines()]
+
+        assert [alert["title"] for alert in alerts] == ["Caldera TGE", "Unlinked alert"]
+        assert alerts[0]["company"]["name"] == "Caldera"
+
+    def test_csv_export_flattens_rows(self, db_session):
+        """Test CSV export has a header and JSON-encoded nested columns"""
+        body = b"".join(iter_csv_export(self._rows(db_session))).decode("utf-8")
+
+        records = list(csv.DictReader(io.StringIO(body)))
+
+        assert tuple(records[0].keys()) == EXPORT_FIELDS
+        assert records[0]["company_name"] == "Caldera"
+        assert json.loads(records[0]["analysis_data"]) == {"scores": {"keyword": 0.8}}
+        assert records[1]["company_name"] == ""
+
+    def test_csv_export_flushes_in_batches(self, db_session):
+        """Test CSV export yields a chunk per batch rather than one body"""
+        rows = self._rows(db_session)
+
+        with patch("src.serialization.EXPORT_BATCH_SIZE", 1):
+            chunks = list(iter_csv_export(rows))
+
+        assert len(chunks) == 2
+
+    @pytest.mark.skipif(not PARQUET_AVAILABLE, reason="pyarrow not installed")
+    def test_parquet_export_round_trip(self, db_session):
+        """Test Parquet export can be read back with the flat schema"""
+        import pyarrow.parquet
+
+        body = b"".join(iter_parquet_export(self._rows(db_session)))
+        table = pyarrow.parquet.read_table(io.BytesIO(body))
+
+        assert table.num_rows == 2
+        assert tuple(table.column_names) == EXPORT_FIELDS
+        assert table.column("company_name").to_pylist() == ["Caldera", None]
+
+    def test_gzip_chunks_round_trip(self):
+        """Test incremental gzip output decompresses to the original stream"""
+        chunks = [b"first line\n", b"second line\n", b""]
+
+        compressed = b"".join(gzip_chunks(chunks))
+
+        assert gzip.decompress(compressed) == b"first line\nsecond line\n"
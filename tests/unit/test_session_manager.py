@@ -0,0 +1,145 @@
+"""
+Unit tests for the shared scraper HTTP client (src/session_manager.py)
+Tests size-capped fetches, content-type rejection, compressed transfer
+accounting, per-host pool sizing and the HTTP/2 client path
+"""
+
+import gzip
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from session_manager import ContentRejected, SharedSessionManager
+
+PAGE = b"<html><body>" + b"<p>Caldera announces its TGE</p>" * 2000 + b"</body></html>"
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == '/pdf':
+            body, content_type, encoding = b"%PDF" * 1000, 'application/pdf', None
+        elif self.path == '/gzip':
+            body, content_type, encoding = gzip.compress(PAGE), 'text/html; charset=utf-8', 'gzip'
+        else:
+            body, content_type, encoding = PAGE, 'text/html; charset=utf-8', None
+        self.send_response(200)
+        self.send_header('Content-Type', content_type)
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def manager():
+    manager = SharedSessionManager(max_retries=0, http2=False)
+    yield manager
+    manager.close_all()
+
+
+class TestFetch:
+    """Test suite for SharedSessionManager.fetch"""
+
+    def test_fetch_html(self, manager, server_url):
+        """Test an HTML page is read in full and decoded"""
+        response = manager.fetch(f"{server_url}/page")
+
+        assert response.status_code == 200
+        assert response.content == PAGE
+        assert not response.truncated
+        assert response.text.startswith("<html><body><p>Caldera")
+
+    def test_body_capped(self, manager, server_url):
+        """Test bodies over max_bytes are cut off"""
+        response = manager.fetch(f"{server_url}/page", max_bytes=1000)
+
+        assert response.truncated
+        assert response.content == PAGE[:1000]
+        assert manager.get_metrics()['truncated_count'] == 1
+
+    def test_non_html_rejected(self, manager, server_url):
+        """Test responses with another content type are abandoned unread"""
+        with pytest.raises(ContentRejected):
+            manager.fetch(f"{server_url}/pdf")
+
+        assert manager.get_metrics()['rejected_count'] == 1
+        assert manager.fetch(f"{server_url}/pdf", accept=None).content.startswith(b"%PDF")
+
+    def test_compressed_transfer_counted(self, manager, server_url):
+        """Test wire bytes and decoded bytes are tracked separately"""
+        response = manager.fetch(f"{server_url}/gzip")
+
+        metrics = manager.get_metrics()
+        assert response.content == PAGE
+        assert metrics['bytes_decoded'] == len(PAGE)
+        assert metrics['bytes_received'] == len(gzip.compress(PAGE))
+        assert metrics['compression_ratio'] > 10
+
+
+class TestPooling:
+    """Test suite for per-host pools and the HTTP/2 client"""
+
+    def test_host_pool_sizes(self):
+        """Test hosts with overrides get their own adapter"""
+        manager = SharedSessionManager(pool_maxsize=2, host_pool_sizes={'medium.com': 8})
+        session = manager.get_session('article')
+
+        default = session.get_adapter('https://example.com/a')
+        medium = session.get_adapter('https://medium.com/@user/post')
+
+        assert default is not medium
+        assert default._pool_maxsize == 2
+        assert medium._pool_maxsize == 8
+
+    def test_http2_client_path(self):
+        """Test https fetches use the shared httpx client when enabled"""
+        def handler(request):
+            return httpx.Response(200, headers={'Content-Type': 'text/html'}, content=PAGE)
+
+        manager = SharedSessionManager(http2=True)
+        manager._http2_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        first = manager.fetch("https://example.com/a", max_bytes=500)
+        manager.fetch("https://example.com/b")
+
+        metrics = manager.get_metrics()
+        assert first.truncated and first.content == PAGE[:500]
+        assert metrics['total_requests'] == 2
+        assert metrics['connection_reuses'] == 1
+        manager.close_all()
+
+    def test_http2_errors_raised_as_requests_errors(self):
+        """Test callers only need to handle requests exceptions"""
+        def handler(request):
+            raise httpx.ConnectError("refused")
+
+        manager = SharedSessionManager(http2=True)
+        manager._http2_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(requests.ConnectionError):
+            manager.fetch("https://example.com/a")
+        assert manager.get_metrics()['error_count'] == 1
@@ -455,6 +455,78 @@ class TestTwitterListManagement(unittest.TestCase):
 
         self.assertEqual(list_id, 'new_list_123')
         mock_client.create_list.assert_called_once()
+        mock_client.get_me.assert_not_called()
+        self.assertEqual(monitor.state['list_members'], ["123", "456"])
+
+    def _monitor_with_list(self, mock_client_class, members):
+        mock_client = Mock()
+        mock_client_class.return_value = mock_client
+
+        with patch('os.path.exists', return_value=False):
+            monitor = OptimizedTwitterMonitor(
+                "bearer_token_" + "x" * 100, [{"name": "Test", "tokens": ["TST"]}], ["TGE"]
+            )
+        monitor.save_state = Mock()
+        monitor.state['list_id'] = 'list_123'
+        monitor.state['list_members'] = members
+        return monitor, mock_client
+
+    @patch('twitter_monitor_optimized.tweepy.Client')
+    def test_unchanged_membership_makes_no_calls(self, mock_client_class):
+        """Test an unchanged account set costs no list API calls"""
+        monitor, mock_client = self._monitor_with_list(mock_client_class, ["1", "2"])
+
+        list_id = monitor.create_or_update_list(["2", "1"])
+
+        self.assertEqual(list_id, 'list_123')
+        mock_client.add_list_member.assert_not_called()
+        mock_client.remove_list_member.assert_not_called()
+        mock_client.get_list_members.assert_not_called()
+
+    @patch('twitter_monitor_optimized.tweepy.Client')
+    def test_membership_delta_applied(self, mock_client_class):
+        """Test only added and removed accounts are sent"""
+        monitor, mock_client = self._monitor_with_list(mock_client_class, ["1", "2"])
+
+        monitor.create_or_update_list(["2", "3"])
+
+        mock_client.add_list_member.assert_called_once_with(id='list_123', user_id="3")
+        mock_client.remove_list_member.assert_called_once_with(id='list_123', user_id="1")
+        self.assertEqual(monitor.state['list_members'], ["2", "3"])
+
+    @patch('twitter_monitor_optimized.tweepy.Client')
+    def test_membership_snapshot_seeded_from_api(self, mock_client_class):
+        """Test a list without a snapshot is read once instead of re-adding everyone"""
+        monitor, mock_client = self._monitor_with_list(mock_client_class, None)
+        mock_client.get_list_members.return_value = Mock(
+            data=[Mock(id=1), Mock(id=2)], meta={'result_count': 2}
+        )
+
+        monitor.create_or_update_list(["1", "2", "3"])
+
+        mock_client.get_list_members.assert_called_once()
+        mock_client.add_list_member.assert_called_once_with(id='list_123', user_id="3")
+        self.assertEqual(monitor.state['list_members'], ["1", "2", "3"])
+
+    @patch('twitter_monitor_optimized.tweepy.Client')
+    def test_user_ids_refreshed_after_ttl(self, mock_client_class):
+        """Test persisted user IDs are looked up again once older than the TTL"""
+        monitor, mock_client = self._monitor_with_list(mock_client_class, [])
+        monitor.state['user_id_cache'] = {'caldera': 'old_id', 'fabric': 'fabric_id'}
+        monitor.state['user_id_resolved_at'] = {
+            'caldera': time.time() - monitor.cache_manager.ttls['twitter_user'] - 1,
+            'fabric': time.time()
+        }
+        mock_user = Mock(id='new_id')
+        mock_user.username = 'caldera'
+        mock_client.get_users.return_value = Mock(data=[mock_user])
+
+        user_map = monitor.batch_lookup_users(["@caldera", "@fabric"])
+        again = monitor.batch_lookup_users(["@caldera", "@fabric"])
+
+        mock_client.get_users.assert_called_once_with(usernames=['caldera'])
+        self.assertEqual(user_map, {'@caldera': 'new_id', '@fabric': 'fabric_id'})
+        self.assertEqual(again, user_map)
 
 
 class TestEdgeCases(unittest.TestCase):
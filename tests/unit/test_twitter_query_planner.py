@@ -0,0 +1,271 @@
+"""
+Unit tests for search query planning (src/twitter_query_planner.py)
+Tests query packing coverage, rotation across cycles, priority and hit-rate
+weighting, budgeting against the tracked search rate limit, since_id
+watermarks, pagination and concurrent execution
+"""
+
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import tweepy
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from twitter_monitor_optimized import OptimizedTwitterMonitor
+from twitter_query_planner import SEARCH_RATE_RESERVE, TWITTER_EPOCH_MS, TwitterQueryPlanner
+
+
+def make_companies(count, high=()):
+    return [
+        {
+            'name': f"Project {i}",
+            'aliases': [f"Project {i} Labs"],
+            'tokens': [f"P{i}"],
+            'priority': 'HIGH' if i in high else 'LOW',
+        }
+        for i in range(count)
+    ]
+
+
+def recent_tweet_id(offset=0):
+    return ((int(time.time() * 1000) - TWITTER_EPOCH_MS) << 22) + offset
+
+
+def make_tweet(tweet_id, text="Project 1 TGE is live"):
+    return SimpleNamespace(id=tweet_id, text=text, author_id="42",
+                           created_at=None, public_metrics={})
+
+
+def search_response(tweets, next_token=None):
+    meta = {'result_count': len(tweets)}
+    if next_token:
+        meta['next_token'] = next_token
+    return tweepy.Response(data=tweets or None, includes={}, errors=[], meta=meta)
+
+
+def covered_units(planned_queries):
+    return {unit.key for planned in planned_queries for unit in planned.units}
+
+
+class TestTwitterQueryPlanner:
+    """Test suite for packing and ranking search queries"""
+
+    def test_queries_cover_all_subjects_within_length_limit(self):
+        """Test an unlimited budget covers every company, alias and token"""
+        companies = make_companies(40)
+        planner = TwitterQueryPlanner(companies, max_query_length=512)
+
+        planned = planner.plan(budget=100)
+        queries = " ".join(p.query for p in planned)
+
+        assert covered_units(planned) == {unit.key for unit in planner.units}
+        assert all(len(p.query) <= 512 for p in planned)
+        for company in companies:
+            assert f'"{company["name"]}"' in queries
+            assert f'"{company["aliases"][0]}"' in queries
+            assert f'${company["tokens"][0]}' in queries
+        # 40 companies fit in far fewer queries than one per company
+        assert len(planned) < 15
+
+    def test_coverage_rotates_across_cycles(self):
+        """Test subjects skipped in one cycle are searched in the next ones"""
+        planner = TwitterQueryPlanner(make_companies(60), max_query_length=256)
+        seen = set()
+
+        for _ in range(10):
+            planned = planner.plan(budget=2)
+            assert len(planned) == 2
+            for query in planned:
+                planner.record_results(query, [])
+            seen |= covered_units(planned)
+
+        assert seen == {unit.key for unit in planner.units}
+
+    def test_high_priority_companies_searched_first(self):
+        """Test high-priority companies lead the first company query"""
+        planner = TwitterQueryPlanner(make_companies(60, high={50, 55}), max_query_length=256)
+
+        planned = planner.plan(budget=10)
+        first_companies = next(p for p in planned if p.group == 'companies')
+
+        assert {'company:Project 50', 'company:Project 55'} <= {unit.key for unit in first_companies.units}
+
+    def test_hit_rate_raises_unit_score(self):
+        """Test units whose queries found tweets outrank ones that did not"""
+        planner = TwitterQueryPlanner(make_companies(2), max_query_length=512)
+        planned = next(p for p in planner.plan(budget=10) if p.group == 'companies')
+
+        planner.record_results(planned, ["Project 1 announces TGE next week"])
+        planner.cycle += 1
+        scores = {unit.key: planner.unit_score(unit) for unit in planned.units}
+
+        assert scores['company:Project 1'] > scores['company:Project 0']
+
+    def test_state_round_trip(self):
+        """Test rotation statistics survive a restart"""
+        companies = make_companies(10)
+        planner = TwitterQueryPlanner(companies)
+        for query in planner.plan(budget=2):
+            planner.record_results(query, ["$P3 trading live"])
+
+        restored = TwitterQueryPlanner(companies, state=planner.to_state())
+
+        assert restored.cycle == planner.cycle
+        assert restored.stats == planner.stats
+
+
+class TestSearchBudget:
+    """Test suite for spending the search rate limit"""
+
+    def _monitor(self, tmp_path, client):
+        with patch('twitter_monitor_optimized.tweepy.Client', return_value=client):
+            monitor = OptimizedTwitterMonitor("test-bearer-token", make_companies(60), ["TGE"])
+        monitor.state_file = str(tmp_path / "twitter_state.json")
+        monitor.cache_file = str(tmp_path / "twitter_cache.json")
+        monitor.cache = {'tweets': {}, 'similar_tweets': {}}
+        monitor.query_planner.max_query_length = 256
+        return monitor
+
+    @patch('twitter_monitor_optimized.time.sleep')
+    def test_budget_limited_by_remaining_requests(self, mock_sleep, tmp_path):
+        """Test searches stop at the remaining rate-limit allowance"""
+        client = Mock()
+        client.search_recent_tweets.return_value = Mock(data=[])
+        monitor = self._monitor(tmp_path, client)
+        monitor.rate_limits['search'] = {
+            'limit': 60, 'remaining': SEARCH_RATE_RESERVE + 2, 'reset': time.time() + 600
+        }
+        cycle = monitor.query_planner.cycle
+
+        monitor.search_tge_tweets()
+
+        assert client.search_recent_tweets.call_count == 2
+        assert monitor.rate_limits['search']['remaining'] == SEARCH_RATE_RESERVE
+        assert monitor.state['query_planner']['cycle'] == cycle + 1
+
+    @patch('twitter_monitor_optimized.time.sleep')
+    def test_no_searches_when_window_exhausted(self, mock_sleep, tmp_path):
+        """Test an exhausted window skips searching until it resets"""
+        client = Mock()
+        monitor = self._monitor(tmp_path, client)
+        monitor.rate_limits['search'] = {'limit': 60, 'remaining': 0, 'reset': time.time() + 600}
+
+        assert monitor.search_tge_tweets() == []
+        assert not client.search_recent_tweets.called
+
+
+class TestIncrementalSearch:
+    """Test suite for since_id watermarks, pagination and concurrency"""
+
+    def _monitor(self, tmp_path, client, companies):
+        with patch('twitter_monitor_optimized.tweepy.Client', return_value=client):
+            monitor = OptimizedTwitterMonitor("test-bearer-token", companies, ["TGE"])
+        monitor.state_file = str(tmp_path / "twitter_state.json")
+        monitor.cache_file = str(tmp_path / "twitter_cache.json")
+        monitor.cache = {'tweets': {}, 'similar_tweets': {}}
+        monitor.state['since_ids'] = {}
+        monitor.query_planner = TwitterQueryPlanner(companies)
+        return monitor
+
+    def test_since_id_resumes_from_watermark(self, tmp_path):
+        """Test the newest seen tweet is persisted and passed on the next cycle"""
+        newest = recent_tweet_id(5)
+        client = Mock()
+        client.search_recent_tweets.return_value = search_response([make_tweet(newest), make_tweet(newest - 1)])
+        monitor = self._monitor(tmp_path, client, make_companies(2))
+
+        first = monitor.search_tge_tweets()
+        assert all(call.kwargs['since_id'] is None for call in client.search_recent_tweets.call_args_list)
+
+        client.search_recent_tweets.reset_mock()
+        client.search_recent_tweets.return_value = search_response([])
+        monitor.search_tge_tweets()
+
+        assert len(first) == 2
+        assert monitor.state['since_ids']['search_company:Project 0'] == newest
+        since_ids = {call.kwargs['query']: call.kwargs['since_id']
+                     for call in client.search_recent_tweets.call_args_list}
+        assert newest in since_ids.values()
+
+    def test_expired_watermark_is_ignored(self, tmp_path):
+        """Test watermarks older than the recent-search window are not sent"""
+        client = Mock()
+        client.search_recent_tweets.return_value = search_response([])
+        monitor = self._monitor(tmp_path, client, make_companies(1))
+        old_id = recent_tweet_id() - ((8 * 86400 * 1000) << 22)
+        for unit in monitor.query_planner.units:
+            monitor.state['since_ids'][f"search_{unit.key}"] = old_id
+
+        monitor.search_tge_tweets()
+
+        assert all(call.kwargs['since_id'] is None for call in client.search_recent_tweets.call_args_list)
+
+    @patch('twitter_monitor_optimized.SEARCH_MAX_PAGES', 3)
+    def test_pagination_follows_next_token(self, tmp_path):
+        """Test result pages are followed up to the per-query limit"""
+        base = recent_tweet_id()
+        pages = {
+            None: search_response([make_tweet(base + 3)], next_token="page2"),
+            "page2": search_response([make_tweet(base + 2)], next_token="page3"),
+            "page3": search_response([make_tweet(base + 1)], next_token="page4"),
+        }
+        client = Mock()
+        client.search_recent_tweets.side_effect = lambda **kwargs: pages[kwargs['next_token']]
+        monitor = self._monitor(tmp_path, client, make_companies(1))
+
+        with patch('twitter_monitor_optimized.SEARCH_QUERY_BUDGET', 1):
+            tweets = monitor.search_tge_tweets()
+
+        assert [tweet['id'] for tweet in tweets] == [base + 3, base + 2, base + 1]
+        assert client.search_recent_tweets.call_count == 3
+        # page4 was never read, so the watermark must not skip past it
+        assert monitor.state['since_ids'] == {}
+
+    def test_rate_limit_mid_pagination_keeps_watermark(self, tmp_path):
+        """Test a 429 on a later page leaves the watermark where the unread pages start"""
+        base = recent_tweet_id()
+        previous = base - 100
+        rate_limited = Mock(status_code=429, reason="Too Many Requests",
+                            headers={'x-rate-limit-remaining': '0'}, json=Mock(return_value={}))
+
+        def search(**kwargs):
+            if kwargs['next_token'] is None:
+                return search_response([make_tweet(base + 2), make_tweet(base + 1)], next_token="page2")
+            raise tweepy.TooManyRequests(rate_limited)
+
+        client = Mock()
+        client.search_recent_tweets.side_effect = search
+        monitor = self._monitor(tmp_path, client, make_companies(1))
+        for unit in monitor.query_planner.units:
+            monitor.state['since_ids'][f"search_{unit.key}"] = previous
+
+        with patch('twitter_monitor_optimized.SEARCH_QUERY_BUDGET', 1):
+            tweets = monitor.search_tge_tweets()
+
+        assert [tweet['id'] for tweet in tweets] == [base + 2, base + 1]
+        assert client.search_recent_tweets.call_count == 2
+        assert set(monitor.state['since_ids'].values()) == {previous}
+
+    def test_queries_run_concurrently(self, tmp_path):
+        """Test independent queries are in flight at the same time"""
+        barrier = threading.Barrier(3, timeout=5)
+        ids = iter(range(recent_tweet_id(), recent_tweet_id() + 100))
+
+        def search(**kwargs):
+            barrier.wait()
+            return search_response([make_tweet(next(ids))])
+
+        client = Mock()
+        client.search_recent_tweets.side_effect = search
+        monitor = self._monitor(tmp_path, client, make_companies(60))
+        monitor.query_planner.max_query_length = 256
+
+        with patch('twitter_monitor_optimized.SEARCH_QUERY_BUDGET', 3):
+            tweets = monitor.search_tge_tweets()
+
+        assert len(tweets) == 3
@@ -0,0 +1,138 @@
+"""
+Unit tests for filtered-stream ingestion (src/twitter_stream.py)
+Tests stream rule compilation, rule syncing, replay of a recorded stream
+through a local stand-in and reconnect backoff
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from twitter_monitor_optimized import OptimizedTwitterMonitor, pack_query_terms
+from twitter_stream import FilteredStream
+from tests.fixtures.sample_data import SAMPLE_COMPANIES
+from tests.fixtures.twitter_stream import LocalTwitterAPI
+
+
+def make_monitor(tmp_path, companies=SAMPLE_COMPANIES):
+    monitor = OptimizedTwitterMonitor("test-bearer-token", companies, ["TGE"])
+    monitor.cache_file = str(tmp_path / "twitter_cache.json")
+    monitor.cache = {'tweets': {}, 'similar_tweets': {}}
+    return monitor
+
+
+class TestStreamRules:
+    """Test suite for compiling search strategies into stream rules"""
+
+    def test_pack_query_terms_respects_length_limit(self):
+        """Test terms are packed into the fewest queries under the limit"""
+        terms = [f'"Company {i}"' for i in range(40)]
+
+        queries = pack_query_terms(terms, "lang:en", max_length=120)
+
+        assert all(len(query) <= 120 for query in queries)
+        packed = [term for query in queries for term in query.split(') ')[0].lstrip('(').split(' OR ')]
+        assert packed == terms
+        assert len(queries) == len(pack_query_terms(terms, "lang:en", max_length=120))
+        assert len(queries) < len(terms)
+
+    def test_rules_cover_every_company_and_token(self, tmp_path):
+        """Test stream rules include all companies, aliases and tokens"""
+        monitor = make_monitor(tmp_path)
+
+        rules = monitor.compile_stream_rules(max_rule_length=512)
+        values = " ".join(rule['value'] for rule in rules)
+
+        for company in SAMPLE_COMPANIES:
+            assert f'"{company["name"]}"' in values
+            for alias in company.get('aliases', []):
+                assert f'"{alias}"' in values
+            for token in company.get('tokens', []):
+                assert f'${token}' in values
+        assert all(len(rule['value']) <= 512 for rule in rules)
+        assert len({rule['tag'] for rule in rules}) == len(rules)
+
+    def test_rule_count_is_capped(self, tmp_path):
+        """Test rules beyond the tier limit are dropped"""
+        monitor = make_monitor(tmp_path)
+
+        rules = monitor.compile_stream_rules(max_rule_length=200, max_rules=3)
+
+        assert len(rules) == 3
+        assert rules[0]['tag'] == 'tge-companies-1'
+
+
+class TestFilteredStream:
+    """Test suite for the stream consumer against a local stand-in"""
+
+    def test_sync_rules_only_sends_changes(self):
+        """Test unchanged rules are kept and only the delta is sent"""
+        with LocalTwitterAPI() as api:
+            kept = api.add_rule('"Caldera" lang:en', 'tge-companies-1')
+            api.add_rule('"Removed" lang:en', 'tge-companies-2')
+            stream = FilteredStream("token", [
+                {'value': kept['value'], 'tag': 'tge-companies-1'},
+                {'value': '"Fabric" lang:en', 'tag': 'tge-companies-2'},
+            ], lambda tweet: None, api_base=api.api_base)
+
+            result = stream.sync_rules()
+            second = stream.sync_rules()
+
+        assert result == {'added': 1, 'deleted': 1}
+        assert second == {'added': 0, 'deleted': 0}
+        assert {rule['value'] for rule in api.rules} == {'"Caldera" lang:en', '"Fabric" lang:en'}
+
+    def test_replay_recorded_stream(self):
+        """Test tweets from a recorded stream are parsed and delivered"""
+        received = []
+        with LocalTwitterAPI() as api:
+            stream = FilteredStream("token", [], received.append, api_base=api.api_base)
+            stream.run(max_connections=1)
+
+        assert [tweet['id'] for tweet in received] == [
+            1790000000000000001, 1790000000000000002, 1790000000000000001
+        ]
+        assert received[0]['source'] == 'filtered_stream'
+        assert received[0]['created_at'].year == 2025
+        assert received[0]['matching_rules'] == ['tge-companies-1', 'tge-tokens-1']
+        assert stream.stats['keepalives'] == 2
+
+    def test_reconnects_after_rate_limit(self):
+        """Test a rate-limited connection is retried with backoff"""
+        received = []
+        with LocalTwitterAPI() as api:
+            api.stream_statuses = [429]
+            stream = FilteredStream("token", [], received.append, api_base=api.api_base)
+            stream.RATE_LIMIT_BACKOFF_START = 0.01
+
+            stream.run(max_connections=2)
+
+        assert api.stream_connections == 2
+        assert stream.stats['reconnects'] == 1
+        assert len(received) == 3
+
+    def test_backoff_schedule(self):
+        """Test backoff grows linearly for network errors and exponentially otherwise"""
+        stream = FilteredStream("token", [], lambda tweet: None, api_base="http://localhost")
+
+        assert [stream.backoff_delay('network', n) for n in (1, 2, 100)] == [0.25, 0.5, 16]
+        assert [stream.backoff_delay('http', n) for n in (1, 2, 20)] == [5, 10, 320]
+        assert stream.backoff_delay('rate_limit', 2) == 120
+
+
+class TestMonitorStream:
+    """Test suite for pushing streamed tweets into the monitor"""
+
+    def test_stream_skips_already_seen_tweets(self, tmp_path):
+        """Test the monitor forwards each tweet once and records it in the cache"""
+        monitor = make_monitor(tmp_path)
+        received = []
+
+        with LocalTwitterAPI() as api:
+            stream = monitor.create_filtered_stream(received.append, api_base=api.api_base)
+            stream.run(max_connections=1)
+
+        assert [tweet['id'] for tweet in received] == [1790000000000000001, 1790000000000000002]
+        assert 1790000000000000001 in monitor.cache['tweets']
+        assert {rule['value'] for rule in api.rules} == {rule['value'] for rule in stream.rules}
@@ -0,0 +1,170 @@
+"""
+Unit tests for WebSocket alert fan-out (src/websocket_service.py)
+Tests subscription indexing, single serialization per broadcast and
+bounded outbound queues for slow consumers
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from src import websocket_service
+from src.websocket_service import (
+    MessageType,
+    SubscriptionType,
+    WebSocketConnection,
+    WebSocketManager,
+)
+from tests.fixtures.websocket import FakeWebSocket, drain, make_alert, subscribe
+
+
+class TestSubscriptionIndex:
+    """Test suite for index-based recipient matching"""
+
+    def test_index_matches_linear_filter(self):
+        """Test indexed matching agrees with per-connection filtering"""
+        async def run():
+            manager = WebSocketManager()
+            connections = [
+                await subscribe(manager, FakeWebSocket(), SubscriptionType.ALL_ALERTS.value),
+                await subscribe(manager, FakeWebSocket(), SubscriptionType.HIGH_CONFIDENCE.value),
+                await subscribe(manager, FakeWebSocket(), SubscriptionType.COMPANY_SPECIFIC.value, companies=[7]),
+                await subscribe(manager, FakeWebSocket(), SubscriptionType.COMPANY_SPECIFIC.value, companies=[8]),
+                await subscribe(manager, FakeWebSocket(), SubscriptionType.SOURCE_SPECIFIC.value, sources=["twitter"]),
+                await subscribe(manager, FakeWebSocket(), SubscriptionType.ALL_ALERTS.value, confidence_threshold=0.95),
+                await manager.connect(FakeWebSocket()),
+            ]
+
+            alerts = [
+                make_alert(1, confidence=0.9, company_id=7, source="news"),
+                make_alert(2, confidence=0.5, company_id=8, source="twitter"),
+                make_alert(3, confidence=0.99, company_id=None, source="twitter"),
+            ]
+            for alert in alerts:
+                expected = {c for c in connections if c._should_send_alert(alert)}
+                assert manager.index.match_alert(alert) == expected
+            return connections
+
+        asyncio.run(run())
+
+    def test_unsubscribe_and_disconnect_update_index(self):
+        """Test unsubscribed and disconnected connections stop matching"""
+        async def run():
+            manager = WebSocketManager()
+            first = await subscribe(manager, FakeWebSocket(), SubscriptionType.ALL_ALERTS.value)
+            second = await subscribe(manager, FakeWebSocket(), SubscriptionType.ALL_ALERTS.value)
+
+            await manager.handle_subscription(first, {"type": SubscriptionType.ALL_ALERTS.value, "action": "unsubscribe"})
+            manager.disconnect(second)
+
+            return manager.index.match_alert(make_alert())
+
+        assert asyncio.run(run()) == set()
+
+
+class TestBroadcast:
+    """Test suite for alert and status fan-out"""
+
+    def test_alert_serialized_once(self):
+        """Test an alert is encoded once regardless of recipient count"""
+        async def run():
+            manager = WebSocketManager()
+            sockets = [FakeWebSocket() for _ in range(5)]
+            for websocket in sockets:
+                await subscribe(manager, websocket, SubscriptionType.ALL_ALERTS.value)
+
+            with patch.object(websocket_service, "encode_message",
+                              wraps=websocket_service.encode_message) as encode:
+                await manager.broadcast_alert(make_alert())
+                assert encode.call_count == 1
+
+            await drain()
+            return sockets
+
+        sockets = asyncio.run(run())
+        for websocket in sockets:
+            alerts = websocket.messages(MessageType.ALERT.value)
+            assert [alert["data"]["alert_id"] for alert in alerts] == [1]
+
+    def test_slow_consumer_does_not_block_others(self):
+        """Test a blocked client is dropped while others keep receiving alerts"""
+        async def run():
+            manager = WebSocketManager()
+            slow = FakeWebSocket()
+            fast = FakeWebSocket()
+            slow_connection = await subscribe(manager, slow, SubscriptionType.ALL_ALERTS.value)
+            await subscribe(manager, fast, SubscriptionType.ALL_ALERTS.value)
+            slow_connection.max_queue_size = 2
+            slow.block()
+
+            for alert_id in range(1, 6):
+                await manager.broadcast_alert(make_alert(alert_id))
+                await drain()
+
+            return manager, slow_connection, slow, fast
+
+        manager, slow_connection, slow, fast = asyncio.run(run())
+
+        assert len(fast.messages(MessageType.ALERT.value)) == 5
+        assert slow_connection not in manager.connections
+        assert manager.stats["slow_consumers_dropped"] == 1
+        assert slow.closed
+
+    def test_system_status_coalesces(self):
+        """Test undelivered status updates are replaced by the latest one"""
+        async def run():
+            manager = WebSocketManager()
+            websocket = FakeWebSocket()
+            connection = await subscribe(manager, websocket, SubscriptionType.SYSTEM_STATUS.value)
+            websocket.block()
+
+            for cycle in range(3):
+                await manager.broadcast_system_status({"cycle": cycle})
+
+            depth = connection.queue_depth
+            websocket.release()
+            await drain()
+            return depth, websocket
+
+        depth, websocket = asyncio.run(run())
+
+        assert depth == 1
+        assert [m["data"] for m in websocket.messages(MessageType.SYSTEM_STATUS.value)] == [{"cycle": 2}]
+
+    def test_failed_socket_is_disconnected(self):
+        """Test a send failure in the sender task removes the connection"""
+        async def run():
+            manager = WebSocketManager()
+            websocket = FakeWebSocket()
+            connection = await subscribe(manager, websocket, SubscriptionType.ALL_ALERTS.value)
+            websocket.fail = True
+
+            await manager.broadcast_alert(make_alert())
+            await drain()
+            return manager, connection
+
+        manager, connection = asyncio.run(run())
+
+        assert connection not in manager.connections
+        assert manager.stats["active_connections"] == 0
+
+
+class TestWebSocketConnection:
+    """Test suite for the per-connection outbound queue"""
+
+    def test_queue_rejects_when_full(self):
+        """Test queue_text refuses messages beyond the queue bound"""
+        connection = WebSocketConnection(FakeWebSocket(), max_queue_size=2)
+
+        assert connection.queue_text("a")
+        assert connection.queue_text("b")
+        assert not connection.queue_text("c")
+        assert connection.messages_dropped == 1
+
+    def test_coalesced_messages_do_not_take_slots(self):
+        """Test messages sharing a coalesce key occupy one queue slot"""
+        connection = WebSocketConnection(FakeWebSocket(), max_queue_size=2)
+
+        for i in range(10):
+            assert connection.queue_text(f"status {i}", coalesce_key="status")
+
+        assert connection.queue_depth == 1